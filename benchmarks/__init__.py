@@ -0,0 +1 @@
+"""Micro-benchmarks for the Kubiya Workflow SDK hot paths."""
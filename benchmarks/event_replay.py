@@ -0,0 +1,107 @@
+"""Benchmark event consumers offline by replaying a recorded event stream.
+
+Replays a stream recorded with ``record=`` (or a synthetic one with events
+arriving at ``--rate`` per second) through the sync client's stream handler
+with a ``ReplayAdapter``, then measures the async execution helpers that
+turn events into structured and log events.
+
+Usage:
+    python -m benchmarks.event_replay [--recording PATH] [--speed X] [--events N] [--rate R]
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from kubiya_workflow_sdk.client import KubiyaClient
+from kubiya_workflow_sdk.core.recording import Recording, ReplayAdapter
+from kubiya_workflow_sdk.execution import LogLevel, _format_log_event, _structure_event
+
+from .sse_decoder import build_stream
+
+
+def build_recording(events: int, rate: float) -> Recording:
+    """A synthetic recording with one event per chunk, arriving ``rate`` times a second."""
+    recording = Recording(metadata={"workflow": "synthetic", "events": events, "rate": rate})
+    stream = build_stream(events)
+    delay = 1 / rate if rate else 0.0
+    start = 0
+    while start < len(stream):
+        end = stream.find(b"\n\n", start) + 2 or len(stream)
+        recording.chunks.append((delay, stream[start:end]))
+        start = end
+    return recording
+
+
+def replay_stream(recording: Recording, speed: float) -> List[Dict[str, Any]]:
+    """Replay the recording through ``KubiyaClient._handle_stream``."""
+    client = KubiyaClient(api_key="replay", base_url="https://replay.invalid")
+    client.retry_policy.max_retries = 0
+    client.session.mount(client.base_url, ReplayAdapter(recording, speed=speed))
+    events = []
+    for item in client.make_request("POST", "/api/v1/workflow", data={}, stream=True):
+        if isinstance(item, str) and item[:1] == "{":
+            item = json.loads(item)
+        if isinstance(item, dict):
+            events.append(item)
+    return events
+
+
+def consume(events: List[Dict[str, Any]], func: Callable[[Dict[str, Any]], Any]) -> int:
+    for event in events:
+        func(event)
+    return len(events)
+
+
+def run(label: str, func: Callable[[], int], repeat: int) -> None:
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} {count:>8} events  {best * 1000:8.1f} ms  {count / best:12,.0f} events/sec")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recording", help="recording file to replay (default: synthetic stream)")
+    parser.add_argument("--save", help="write the synthetic recording to this path")
+    parser.add_argument("--speed", type=float, default=0, help="replay speed factor, 0 for as fast as possible")
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--rate", type=float, default=500, help="synthetic events per second")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.recording:
+        recording = Recording.load(args.recording)
+    else:
+        recording = build_recording(args.events, args.rate)
+        if args.save:
+            recording.save(args.save)
+    print(
+        f"recording: {recording.size / 1e6:.1f} MB in {len(recording.chunks)} chunks,"
+        f" {recording.duration:.1f}s at original speed"
+    )
+
+    start = time.perf_counter()
+    events = replay_stream(recording, args.speed)
+    elapsed = time.perf_counter() - start
+    print(f"{'replay (speed ' + str(args.speed) + ')':<28} {len(events):>8} events  {elapsed * 1000:8.1f} ms")
+
+    if args.speed:
+        # The timed replay above already measured the stream handler at that speed
+        return
+    run("_handle_stream", lambda: len(replay_stream(recording, 0)), args.repeat)
+    run("_structure_event", lambda: consume(events, lambda e: _structure_event(e, "bench")), args.repeat)
+    for level in LogLevel:
+        run(
+            f"_format_log_event ({level.value})",
+            lambda level=level: consume(events, lambda e: _format_log_event(e, level)),
+            args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark SSE stream decoding throughput.
+
+Builds a large synthetic workflow stream (the same shape the API sends with
+``native_sse=true``), splits it into network-sized chunks and measures how
+many events per second the decoder and the legacy-compatible sync stream
+handler can process.
+
+Usage:
+    python -m benchmarks.sse_decoder [--events N] [--chunk-size BYTES]
+"""
+
+import argparse
+import json
+import time
+from typing import List
+
+from kubiya_workflow_sdk.core.sse import SSEDecoder, iter_sse_events
+
+
+def build_stream(events: int) -> bytes:
+    """Build a recorded-style SSE stream with step, log and heartbeat events."""
+    parts: List[str] = []
+    for i in range(events):
+        if i % 50 == 0:
+            parts.append(": keep-alive\n\n")
+        if i % 10 == 0:
+            payload = {"type": "heartbeat", "ts": i}
+        elif i % 3 == 0:
+            payload = {
+                "type": "step_complete",
+                "step": f"step-{i}",
+                "status": "completed",
+                "output": "x" * 120,
+            }
+        else:
+            payload = {"type": "log", "step": f"step-{i}", "message": f"line {i} of output"}
+        parts.append(f"id: {i}\nevent: message\ndata: 2:{json.dumps(payload)}\n\n")
+    parts.append('event: end\ndata: d:{"finishReason":"stop"}\n\n')
+    return "".join(parts).encode("utf-8")
+
+
+def chunked(data: bytes, size: int) -> List[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def bench_line_based(chunks: List[bytes]) -> int:
+    """Previous approach: split lines, then json.loads + json.dumps per event."""
+    count = 0
+    pending = b""
+    for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            line = line.decode("utf-8")
+            if line.startswith("data: "):
+                data = line[6:]
+                if len(data) > 2 and data[1] == ":":
+                    json.dumps(json.loads(data[2:]))
+                count += 1
+    return count
+
+
+def bench_decoder(chunks: List[bytes]) -> int:
+    decoder = SSEDecoder()
+    count = 0
+    for chunk in chunks:
+        count += len(decoder.feed(chunk))
+    count += len(decoder.flush())
+    return count
+
+
+def bench_decode_and_parse(chunks: List[bytes]) -> int:
+    count = 0
+    for event in iter_sse_events(chunks):
+        event.json()
+        count += 1
+    return count
+
+
+def run(label: str, func, chunks: List[bytes], repeat: int) -> None:
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = func(chunks)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<24} {count:>8} events  {best * 1000:8.1f} ms  {count / best:12,.0f} events/sec")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=16 * 1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    stream = build_stream(args.events)
+    chunks = chunked(stream, args.chunk_size)
+    print(f"stream: {len(stream) / 1e6:.1f} MB in {len(chunks)} chunks of {args.chunk_size} bytes")
+
+    run("line-based + json", bench_line_based, chunks, args.repeat)
+    run("decode", bench_decoder, chunks, args.repeat)
+    run("decode + json", bench_decode_and_parse, chunks, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
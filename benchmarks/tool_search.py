@@ -0,0 +1,117 @@
+"""Benchmark tool search over a synthetic catalog.
+
+Builds a catalog of tools spread over many sources, indexes it with
+:class:`ToolSearchIndex` and measures query latency. For comparison the
+previous per-query Levenshtein scan is timed on a slice of the catalog and
+extrapolated to the full size.
+
+Usage:
+    python -m benchmarks.tool_search [--tools N] [--sources N] [--queries N]
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Tuple
+
+from kubiya_workflow_sdk.kubiya_services.search import ToolSearchIndex
+
+_VERBS = ["get", "list", "create", "delete", "describe", "restart", "scale", "deploy", "sync", "rotate"]
+_NOUNS = [
+    "pod", "deployment", "service", "bucket", "instance", "cluster", "secret", "user",
+    "ticket", "pipeline", "namespace", "volume", "certificate", "alert", "dashboard",
+]
+_VENDORS = ["kubectl", "aws", "gcp", "azure", "jira", "github", "slack", "terraform", "helm", "datadog"]
+_FILLER = (
+    "this tool uses the configured credentials to talk to the provider api and "
+    "returns a json document with the result of the operation including status"
+).split()
+
+_QUERIES = ["restart deployment", "kubectl pod", "list buckets", "rotat secret", "deploymnet", "jira ticket"]
+
+
+def build_catalog(tools: int, sources: int, seed: int = 0) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    rng = random.Random(seed)
+    catalog = [({"uuid": f"src-{i}", "name": f"source-{i}", "updated_at": "1"}, []) for i in range(sources)]
+    for i in range(tools):
+        vendor, verb, noun = rng.choice(_VENDORS), rng.choice(_VERBS), rng.choice(_NOUNS)
+        description = f"{verb.capitalize()} a {vendor} {noun}. " + " ".join(rng.sample(_FILLER, 12))
+        catalog[i % sources][1].append({
+            "name": f"{vendor}_{verb}_{noun}_{i}",
+            "description": description,
+            "args": [{"name": f"{noun}_name"}, {"name": "namespace"}],
+        })
+    return catalog
+
+
+def levenshtein(s1: str, s2: str) -> int:
+    """The distance function the previous search ran against every tool."""
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    if not s2:
+        return len(s1)
+    previous = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current = [i + 1]
+        for j, c2 in enumerate(s2):
+            current.append(min(previous[j + 1] + 1, current[j] + 1, previous[j] + (c1 != c2)))
+        previous = current
+    return previous[-1]
+
+
+def bench_levenshtein_scan(catalog, query: str) -> int:
+    query = query.lower()
+    matches = 0
+    for _, tools in catalog:
+        for tool in tools:
+            name, desc = tool["name"].lower(), tool["description"].lower()
+            if query in name or query in desc:
+                distance = 0
+            else:
+                distance = min(levenshtein(name, query), levenshtein(desc, query))
+            matches += distance <= len(query) // 2
+    return matches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tools", type=int, default=10_000)
+    parser.add_argument("--sources", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=1_000)
+    parser.add_argument("--scan-sample", type=int, default=500, help="tools timed for the Levenshtein scan")
+    args = parser.parse_args()
+
+    catalog = build_catalog(args.tools, args.sources)
+
+    start = time.perf_counter()
+    index = ToolSearchIndex()
+    for source, tools in catalog:
+        index.add_source(source, tools)
+    build = time.perf_counter() - start
+    print(f"index build              {len(index):>8} tools  {build * 1000:8.1f} ms")
+
+    source, tools = catalog[0]
+    start = time.perf_counter()
+    index.add_source({**source, "updated_at": "2"}, tools)
+    print(f"re-index one source      {len(tools):>8} tools  {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    latencies = []
+    for i in range(args.queries):
+        query = _QUERIES[i % len(_QUERIES)]
+        start = time.perf_counter()
+        index.search(query)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(f"indexed query            {args.queries:>8} queries  p50 {p50:6.2f} ms  p99 {p99:6.2f} ms")
+
+    sample = build_catalog(args.scan_sample, 1)
+    start = time.perf_counter()
+    bench_levenshtein_scan(sample, _QUERIES[0])
+    per_tool = (time.perf_counter() - start) / args.scan_sample
+    print(f"levenshtein scan (est.)  {args.tools:>8} tools  {per_tool * args.tools * 1000:8.1f} ms per query")
+
+
+if __name__ == "__main__":
+    main()
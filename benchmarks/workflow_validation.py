@@ -0,0 +1,128 @@
+"""Benchmark workflow validation on large generated workflows.
+
+Builds workflows of N steps with different dependency shapes (a chain
+declared in reverse so every ``depends`` is a forward reference, a fan-out
+and fan-in graph, and a graph whose last step closes a cycle) and measures
+how long ``validate_workflow`` takes on each. Tool steps with bounded
+services are also checked in fast mode, against the compiled manifest
+schema, and with ``jsonschema`` when it is installed.
+
+Usage:
+    python -m benchmarks.workflow_validation [--steps N]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from kubiya_workflow_sdk.manifest_schema import manifest_schema
+from kubiya_workflow_sdk.validation import validate, validate_workflow
+
+
+def _step(i: int, depends: List[int]) -> Dict[str, Any]:
+    step: Dict[str, Any] = {"name": f"step-{i}", "command": f"echo {i}"}
+    if depends:
+        step["depends"] = [f"step-{d}" for d in depends]
+    return step
+
+
+def build_reverse_chain(steps: int) -> Dict[str, Any]:
+    """Each step depends on the one declared after it."""
+    return {
+        "name": "reverse-chain",
+        "type": "graph",
+        "steps": [_step(i, [i + 1] if i < steps - 1 else []) for i in range(steps)],
+    }
+
+
+def build_fan(steps: int, width: int = 100) -> Dict[str, Any]:
+    """Layers of ``width`` steps, each depending on every step of a small window above."""
+    return {
+        "name": "fan",
+        "type": "graph",
+        "steps": [
+            _step(i, list(range(max(0, (i // width - 1) * width), i // width * width, width // 10 or 1)))
+            for i in range(steps)
+        ],
+    }
+
+
+def build_tools(steps: int) -> Dict[str, Any]:
+    """Tool steps with bounded services, as generated manifests have."""
+    return {
+        "name": "tools",
+        "steps": [
+            {
+                "name": f"step-{i}",
+                "executor": {
+                    "type": "tool",
+                    "config": {
+                        "tool_def": {
+                            "name": f"tool-{i}",
+                            "with_services": [
+                                {"name": "db", "image": "postgres:15", "exposed_ports": [5432]},
+                                {"name": "cache", "image": "redis:7", "exposed_ports": [6379]},
+                            ],
+                        }
+                    },
+                },
+                "retry": {"max_attempts": 3},
+            }
+            for i in range(steps)
+        ],
+    }
+
+
+def build_cycle(steps: int) -> Dict[str, Any]:
+    """A chain whose first step depends on the last one."""
+    workflow = build_reverse_chain(steps)
+    workflow["steps"][-1]["depends"] = ["step-0"]
+    return workflow
+
+
+def run(label: str, workflow: Dict[str, Any], repeat: int) -> None:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = validate_workflow(workflow)
+        best = min(best, time.perf_counter() - start)
+    edges = sum(len(deps) for deps in result.dependencies.values())
+    print(
+        f"{label:<16} {len(workflow['steps']):>8} steps {edges:>8} edges  {best * 1000:8.1f} ms"
+        f"  valid={result.valid} cycles={len(result.cycles)}"
+    )
+
+
+def run_schema(label: str, check: Callable[[Dict[str, Any]], Any], workflow: Dict[str, Any], repeat: int) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        check(workflow)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<16} {len(workflow['steps']):>8} steps  {best * 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run("reverse chain", build_reverse_chain(args.steps), args.repeat)
+    run("fan-out/fan-in", build_fan(args.steps), args.repeat)
+    run("cycle", build_cycle(args.steps), args.repeat)
+
+    workflow = build_tools(args.steps)
+    run("tool steps", workflow, args.repeat)
+    run_schema("fast mode", lambda w: validate(w, mode="fast"), workflow, args.repeat)
+    try:
+        import jsonschema
+    except ImportError:
+        return
+    validator = jsonschema.Draft202012Validator(manifest_schema())
+    run_schema("jsonschema", lambda w: list(validator.iter_errors(w)), workflow, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -75,6 +75,8 @@ from .execution import (
     # Validation
     validate_workflow_definition,
 )
+from .manifest_schema import ValidationIssue, manifest_schema
+from .validation import ValidationResult, validate_workflow
 
 # DSL - Primary interface
 from .dsl import (
@@ -98,6 +100,7 @@ from .dsl import (
 # Client functionality (legacy/raw interface)
 from .client import (
     KubiyaClient,
+    AsyncKubiyaClient,
     StreamingKubiyaClient,
     execute_workflow,
 )
@@ -222,6 +225,10 @@ __all__ = [
     "execute_workflow_events",
     "execute_workflow_raw",
     "validate_workflow_definition",
+    "validate_workflow",
+    "ValidationResult",
+    "ValidationIssue",
+    "manifest_schema",
     # DSL
     "workflow",
     "step",
@@ -236,6 +243,7 @@ __all__ = [
     "examples",
     # Client (legacy)
     "KubiyaClient",
+    "AsyncKubiyaClient",
     "StreamingKubiyaClient",
     "execute_workflow",
     # Tools
@@ -65,7 +65,8 @@ def mcp():
 @click.option("--stdio", is_flag=True, default=True, help="Use stdio transport (default)")
 @click.option("--api-key", envvar="KUBIYA_API_KEY", help="Kubiya API key")
 @click.option("--base-url", default="https://api.kubiya.ai", help="Kubiya API base URL")
-def server(stdio, api_key, base_url):
+@click.option("--no-metadata-cache", is_flag=True, help="Don't keep source metadata on disk across restarts")
+def server(stdio, api_key, base_url, no_metadata_cache):
     """Start the Kubiya MCP server for tool integration."""
     import subprocess
     import sys
@@ -74,6 +75,8 @@ def server(stdio, api_key, base_url):
         os.environ["KUBIYA_API_KEY"] = api_key
     if base_url:
         os.environ["KUBIYA_BASE_URL"] = base_url
+    if no_metadata_cache:
+        os.environ["KUBIYA_METADATA_CACHE"] = "false"
     
     # Run the MCP server
     cmd = [sys.executable, "-m", "kubiya_workflow_sdk.mcp.server"]
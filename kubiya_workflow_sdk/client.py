@@ -2,22 +2,37 @@
 
 import json
 import time
+import threading
 import logging
 import asyncio
 import aiohttp
-from typing import Dict, Any, Optional, Generator, Union, AsyncGenerator, List
+import httpx
+from typing import Dict, Any, Optional, Generator, Union, AsyncGenerator, List, Tuple, Callable, Awaitable
 from urllib.parse import urljoin
 import requests
 from requests.adapters import HTTPAdapter
+import urllib3
 from urllib3.util.retry import Retry
-import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .__version__ import __version__
 from kubiya_workflow_sdk.core.constants import WorkflowStatus
+from kubiya_workflow_sdk.core.cache import CacheEntry, ResponseCache
+from kubiya_workflow_sdk.core.ratelimit import RateLimiter
+from kubiya_workflow_sdk.core.results import ExecutionReducer
+from kubiya_workflow_sdk.core.retry import RequestRetryPolicy
+from kubiya_workflow_sdk.core.runner_health import evaluate_runner_health, required_components_from_env
+from kubiya_workflow_sdk.core.scheduler import RunnerLease, RunnerScheduler
+from kubiya_workflow_sdk.kubiya_services.metadata_cache import SourceMetadataCache
+from kubiya_workflow_sdk.validation import validate_workflow
+from kubiya_workflow_sdk.core.sse import SSEEvent, SSEResumeState
+from kubiya_workflow_sdk.core.types import ExecutionResult, StreamHandler
+from kubiya_workflow_sdk.core.recording import RecordTarget, StreamRecorder, as_recorder
+from kubiya_workflow_sdk.core.pipeline import ConsoleSink, EventPipeline, EventSink, StepTracker, Tap
 from kubiya_workflow_sdk.core.exceptions import (
     APIError as KubiyaAPIError,
     WorkflowExecutionError,
+    WorkflowValidationError,
     ConnectionError as KubiyaConnectionError,
     WorkflowTimeoutError as KubiyaTimeoutError,
     AuthenticationError as KubiyaAuthenticationError,
@@ -43,6 +58,99 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _connect_failed(error: Exception) -> bool:
+    """Whether a requests exception happened before the request reached the server."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, urllib3.exceptions.NewConnectionError)
+
+
+# Errors raised mid-stream when the connection drops and the stream can be resumed
+_SYNC_STREAM_ERRORS = (
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.ConnectionError,
+    urllib3.exceptions.ProtocolError,
+)
+_ASYNC_STREAM_ERRORS = (aiohttp.ClientPayloadError, aiohttp.ClientConnectionError)
+
+
+def _init_services(client: Any) -> None:
+    """Attach all platform services to a sync or async client."""
+    from kubiya_workflow_sdk.kubiya_services.services import (
+        WorkflowService,
+        WebhookService,
+        UserService,
+        TriggerService,
+        ToolService,
+        SourceService,
+        SecretService,
+        RunnerService,
+        ProjectService,
+        PolicyService,
+        KnowledgeService,
+        IntegrationService,
+        DocumentationService,
+        AuditService,
+        AgentService,
+        StacksService,
+    )
+
+    client.workflows = WorkflowService(client)
+    client.webhooks = WebhookService(client)
+    client.users = UserService(client)
+    client.triggers = TriggerService(client)
+    client.tools = ToolService(client)
+    client.sources = SourceService(client)
+    client.secrets = SecretService(client)
+    client.runners = RunnerService(client)
+    client.projects = ProjectService(client)
+    client.policies = PolicyService(client)
+    client.knowledge = KnowledgeService(client)
+    client.integrations = IntegrationService(client)
+    client.documentations = DocumentationService(client)
+    client.audit = AuditService(client)
+    client.agents = AgentService(client)
+    client.stacks = StacksService(client)
+
+
+def _response_from_cache(entry: CacheEntry) -> requests.Response:
+    """Build a requests response from a cached entry."""
+    response = requests.Response()
+    response.status_code = entry.status_code
+    response.headers.update(entry.headers)
+    response.headers["X-Kubiya-Cache"] = "hit"
+    response.url = entry.url
+    response._content = entry.content
+    response._content_consumed = True
+    return response
+
+
+def _legacy_stream_item(event: SSEEvent) -> Tuple[Optional[Union[str, Dict[str, Any]]], bool]:
+    """Map a decoded SSE event to the item yielded by string-based stream handlers.
+
+    Returns:
+        Tuple of (item to yield or None, whether the stream has ended)
+    """
+    if event.bare:
+        # Newline-delimited JSON outside SSE framing
+        parsed = event.json()
+        return (parsed if parsed is not None else event.data), False
+
+    if not event.data:
+        # Named event without payload, e.g. "event: end"
+        return f"event: {event.event}", event.event == "end"
+
+    if event.is_done:
+        return None, True
+
+    if event.json() is None:
+        # Not valid JSON, yield as is
+        return event.data, event.event == "end"
+
+    return event.payload, event.is_end
+
+
 class StreamingKubiyaClient:
     """Async streaming client for real-time workflow execution with the Kubiya API."""
 
@@ -55,7 +163,8 @@ class StreamingKubiyaClient:
         max_retries: int = 3,
         max_connections: int = 30,
         max_connections_per_host: int = 30,
-        org_name: Optional[str] = None
+        org_name: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         """Initialize the streaming Kubiya client.
 
@@ -68,6 +177,9 @@ class StreamingKubiyaClient:
             max_connections: # Maximum total simultaneous connections for aiohttp session
             max_connections_per_host: Maximum simultaneous connections per host
             org_name: Organization name for API calls
+            session: Existing session to send requests with (for example one
+                shared between clients, or a ``ReplaySession``); it is left
+                open when the client closes
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
@@ -77,9 +189,11 @@ class StreamingKubiyaClient:
         self.max_connections = max_connections
         self.max_connections_per_host = max_connections_per_host
         self.org_name = org_name
+        self.retry_policy = RequestRetryPolicy(max_retries=max_retries)
 
         self._connector = None
-        self._session = None
+        self._session = session
+        self._owns_session = session is None
 
         # Default headers - Use UserKey format for API key authentication
         self.headers = {
@@ -90,6 +204,22 @@ class StreamingKubiyaClient:
         }
 
     async def __aenter__(self):
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it (and its connection pool) on first use.
+
+        All executions of this client share one connection pool, so a
+        long-lived client can run many concurrent streams without per-call
+        setup; use it as an async context manager or call ``aclose()``.
+        """
+        if self._session is not None and (not self._session.closed or not self._owns_session):
+            return self._session
+
         # Create a connector with connection pooling
         self._connector = aiohttp.TCPConnector(
             limit=self.max_connections,
@@ -114,10 +244,12 @@ class StreamingKubiyaClient:
             headers=self.headers,
             raise_for_status=False  # Handle status codes manually
         )
-        return self
+        return self._session
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
+    async def aclose(self) -> None:
         """Close session and cleanup resources with proper error handling."""
+        if not self._owns_session:
+            return
 
         if self._session is not None:
             try:
@@ -139,17 +271,128 @@ class StreamingKubiyaClient:
                 self._connector = None
 
     async def execute_workflow_stream(
-        self, workflow: Dict[str, Any], params: Optional[Dict[str, Any]] = None
+        self, workflow: Dict[str, Any], params: Optional[Dict[str, Any]] = None, record: RecordTarget = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Execute a workflow with async streaming.
 
         Args:
             workflow: Workflow definition dictionary
             params: Workflow parameters
+            record: Record the raw event stream to a path, binary file or
+                ``StreamRecorder``
 
         Yields:
             Event dictionaries from the streaming response
 
+        Raises:
+            WorkflowExecutionError: If execution fails
+            KubiyaAPIError: For API errors
+        """
+        async for event in self.execute_workflow_events(workflow, params, record):
+            if event.event in ("end", "error"):
+                yield {"type": "event", "event_type": event.event}
+            if not event.data:
+                continue
+
+            event_data = event.json()
+            if isinstance(event_data, dict):
+                yield event_data
+            else:
+                # Yield raw data if it's not a JSON object
+                yield {"type": "raw_data", "data": event.data}
+
+    async def execute_workflow_with_logging(
+        self,
+        workflow: Dict[str, Any],
+        params: Optional[Dict[str, Any]] = None,
+        mode: str = "logging",
+        log_level: str = "normal",
+        validate: bool = True,
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+        sinks: Optional[List[EventSink]] = None,
+        record: RecordTarget = None,
+    ) -> AsyncGenerator[Union[str, Dict[str, Any]], None]:
+        """Execute a workflow in one of the enhanced execution modes.
+
+        The async counterpart of ``execute_workflow_with_logging``, running on
+        this client's shared connection pool:
+
+        - ``raw``: yields event payload strings as received;
+        - ``logging``: yields event dicts, rendered by a ``ConsoleSink``
+          unless other ``sinks`` are given;
+        - ``events``: yields event dicts with ``_elapsed_seconds`` and
+          ``_event_count`` added.
+
+        Sinks run on a background thread and never block the event loop's
+        stream reader for longer than it takes to queue an event.
+
+        Args:
+            workflow: Workflow definition dictionary
+            params: Workflow parameters
+            mode: Execution mode ("raw", "logging" or "events")
+            log_level: Verbosity of the default console sink
+            validate: Whether to validate the workflow before execution
+            on_event: Optional callback for each event dict
+            sinks: Event sinks (default: console sink in logging mode only)
+            record: Record the raw event stream to a path, binary file or
+                ``StreamRecorder``
+
+        Raises:
+            WorkflowValidationError: If validation fails
+            WorkflowExecutionError: If execution fails
+            KubiyaAPIError: For API errors
+        """
+        mode = getattr(mode, "value", mode)
+        if mode not in ("raw", "logging", "events"):
+            raise ValueError(f"Unknown execution mode: {mode}")
+        if validate:
+            errors = validate_workflow(workflow).errors
+            if errors:
+                error = WorkflowValidationError(f"Workflow validation failed: {'; '.join(errors)}", errors)
+                capture_exception(error, extra={"workflow_name": workflow.get("name"), "validation_errors": errors})
+                raise error
+        workflow = dict(workflow)
+
+        if mode == "raw":
+            async for event in self.execute_workflow_events(workflow, params, record):
+                item, _ = _legacy_stream_item(event)
+                if item is not None:
+                    yield item
+            return
+
+        if sinks is None:
+            sinks = [ConsoleSink(log_level)] if mode == "logging" else []
+        stages: List[Any] = [StepTracker()]
+        if on_event:
+            stages.append(Tap(on_event))
+
+        pipeline = EventPipeline(stages=stages, sinks=sinks)
+        events = self.execute_workflow_events(workflow, params, record)
+        async for event in pipeline.arun(events, workflow=workflow):
+            if event.data is None:
+                continue
+            if mode == "events":
+                yield {**event.data, "_elapsed_seconds": event.elapsed, "_event_count": event.index}
+            else:
+                yield event.data
+
+    async def execute_workflow_events(
+        self, workflow: Dict[str, Any], params: Optional[Dict[str, Any]] = None, record: RecordTarget = None
+    ) -> AsyncGenerator[SSEEvent, None]:
+        """Execute a workflow and yield typed SSE events.
+
+        The async counterpart of ``KubiyaClient.execute_workflow_events``;
+        JSON payloads are decoded lazily via ``SSEEvent.json()``.
+
+        Args:
+            workflow: Workflow definition dictionary
+            params: Workflow parameters
+            record: Record the raw event stream to a path, binary file or
+                ``StreamRecorder``
+
+        Yields:
+            Decoded SSE events until the workflow stream ends
+
         Raises:
             WorkflowExecutionError: If execution fails
             KubiyaAPIError: For API errors
@@ -172,89 +415,106 @@ class StreamingKubiyaClient:
             data={"workflow_name": workflow.get("name"), "runner": runner}
         )
 
-        try:
-            async with self._session.post(url, json=request_body) as response:
-                # Check for authentication errors
-                if response.status == 401:
-                    error = KubiyaAuthenticationError("Invalid API token or unauthorized access")
-                    capture_exception(error, extra={"api_url": str(response.url), "status_code": response.status})
-                    raise error
-
-                # Check for other errors
-                if response.status >= 400:
-                    error_text = await response.text()
-                    logger.error(f"API Error Response: {error_text}")
-                    error = KubiyaAPIError(
-                        f"API request failed: HTTP {response.status} - {error_text[:200]}",
-                        status_code=response.status,
-                        response_body=error_text,
-                    )
-                    capture_exception(error, extra={
-                        "request_body": request_body,
-                        "api_url": str(response.url),
-                        "status_code": response.status,
-                        "response_body": error_text
-                    })
-                    raise error
+        resume = SSEResumeState()
+        # One idempotency key per execution, reused when the stream is resumed
+        request_headers = self.retry_policy.prepare_headers("POST", {})
+        resume_headers: Dict[str, str] = {}
+        session = await self._get_session()
+        recorder = as_recorder(record, workflow=workflow.get("name"), runner=runner, endpoint=url)
 
+        try:
+            while True:
                 try:
-                    # Process the streaming response
-                    async for line in response.content:
-                        line = line.decode("utf-8").strip()
-
-                        if line.startswith("data: "):
-                            data = line[6:]  # Remove 'data: ' prefix
+                    async with session.post(
+                        url, json=request_body, headers={**request_headers, **resume_headers}
+                    ) as response:
+                        # Check for authentication errors
+                        if response.status == 401:
+                            error = KubiyaAuthenticationError("Invalid API token or unauthorized access")
+                            capture_exception(error, extra={"api_url": str(response.url), "status_code": response.status})
+                            raise error
+
+                        # Check for other errors
+                        if response.status >= 400:
+                            error_text = await response.text()
+                            logger.error(f"API Error Response: {error_text}")
+                            error = KubiyaAPIError(
+                                f"API request failed: HTTP {response.status} - {error_text[:200]}",
+                                status_code=response.status,
+                                response_body=error_text,
+                            )
+                            capture_exception(error, extra={
+                                "request_body": request_body,
+                                "api_url": str(response.url),
+                                "status_code": response.status,
+                                "response_body": error_text
+                            })
+                            raise error
+
+                        try:
+                            # Process the streaming response
+                            chunks = response.content.iter_any()
+                            if recorder is not None:
+                                chunks = recorder.awrap(chunks)
+                            async for event in resume.aevents(chunks):
+                                if event.event == "error":
+                                    error = WorkflowExecutionError("Streaming execution failed")
+                                    error_data = event.json()
+                                    if not isinstance(error_data, dict):
+                                        error_data = {"raw_data": event.data}
+                                    capture_exception(error, extra=error_data)
 
-                            if data.strip() == "[DONE]":
-                                break
+                                if event.is_done:
+                                    return
 
-                            try:
-                                event_data = json.loads(data)
-                                yield event_data
+                                yield event
 
                                 # Check for end events
-                                if event_data.get("end") or event_data.get("finishReason"):
-                                    break
-
-                            except json.JSONDecodeError:
-                                # Yield raw data if it's not JSON
-                                yield {"type": "raw_data", "data": data}
+                                if event.is_end:
+                                    return
+                            return
 
-                        elif line.startswith("event: "):
-                            event_type = line[7:].strip()
-                            if event_type in ["end", "error"]:
-                                if event_type == "error":
-                                    error = WorkflowExecutionError("Streaming execution failed")
-                                    try:
-                                        error_data = json.loads(data)
-                                    except json.JSONDecodeError:
-                                        error_data = {"raw_data": data}
-                                    capture_exception(error, extra=error_data)
-                                yield {"type": "event", "event_type": event_type}
-                                if event_type == "end":
-                                    break
-                except Exception as e:
-                    error = WorkflowExecutionError(f"Streaming execution failed: {str(e)}")
-                    capture_exception(error, extra={"workflow_name": workflow.get("name"), "runner": runner})
+                        except _ASYNC_STREAM_ERRORS as e:
+                            # Connection dropped mid-stream - resume below if the server sent event ids
+                            if not resume.can_reconnect():
+                                error = WorkflowExecutionError(f"Streaming execution failed: {str(e)}")
+                                capture_exception(error, extra={"workflow_name": workflow.get("name"), "runner": runner})
+                                raise error
+                            dropped: Exception = e
+                        except Exception as e:
+                            error = WorkflowExecutionError(f"Streaming execution failed: {str(e)}")
+                            capture_exception(error, extra={"workflow_name": workflow.get("name"), "runner": runner})
+                            raise error
+
+                except aiohttp.ClientError as e:
+                    if not (resume.reconnects and resume.can_reconnect()):
+                        error = KubiyaConnectionError(f"Failed to connect to Kubiya API: {str(e)}")
+                        capture_exception(error, extra={"api_url": url, "runner": runner})
+                        raise error
+                    dropped = e
+                except asyncio.TimeoutError:
+                    error = KubiyaTimeoutError(f"Request timed out after {self.timeout} seconds")
+                    capture_exception(error, extra={"timeout": self.timeout, "api_url": url})
                     raise error
-
-
-        except aiohttp.ClientError as e:
-            error = KubiyaConnectionError(f"Failed to connect to Kubiya API: {str(e)}")
-            capture_exception(error, extra={"api_url": url, "runner": runner})
-            raise error
-        except asyncio.TimeoutError:
-            error = KubiyaTimeoutError(f"Request timed out after {self.timeout} seconds")
-            capture_exception(error, extra={"timeout": self.timeout, "api_url": url})
-            raise error
-        except Exception as e:
-            if not isinstance(
-                e, (KubiyaAPIError, KubiyaAuthenticationError, KubiyaConnectionError, WorkflowExecutionError)
-            ):
-                error = WorkflowExecutionError(f"Streaming execution failed: {str(e)}")
-                capture_exception(error, extra={"workflow_name": workflow.get("name"), "runner": runner})
-                raise error
-            raise
+                except Exception as e:
+                    if not isinstance(
+                        e, (KubiyaAPIError, KubiyaAuthenticationError, KubiyaConnectionError, WorkflowExecutionError)
+                    ):
+                        error = WorkflowExecutionError(f"Streaming execution failed: {str(e)}")
+                        capture_exception(error, extra={"workflow_name": workflow.get("name"), "runner": runner})
+                        raise error
+                    raise
+
+                delay = resume.next_delay()
+                logger.warning(
+                    f"Stream connection lost ({dropped}), resuming from event "
+                    f"{resume.last_event_id} in {delay:.1f}s (attempt {resume.reconnects})"
+                )
+                await asyncio.sleep(delay)
+                resume_headers = resume.headers()
+        finally:
+            if recorder is not None:
+                recorder.close()
 
 
 class KubiyaClient:
@@ -285,6 +545,11 @@ class KubiyaClient:
         timeout: int = 300,
         max_retries: int = 3,
         org_name: Optional[str] = None,
+        retry_policy: Optional[RequestRetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        metadata_cache: Optional[SourceMetadataCache] = None,
+        runner_scheduler: Optional[RunnerScheduler] = None,
     ):
         """
         Initialize Kubiya client
@@ -296,6 +561,16 @@ class KubiyaClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             org_name: Organization name for API calls
+            retry_policy: Retry policy for API requests. Defaults to a
+                ``RequestRetryPolicy`` with ``max_retries`` and its own retry budget.
+            rate_limiter: Client-wide rate and concurrency limiter every request
+                passes through. Defaults to an adaptive limiter without a rate cap.
+            response_cache: Opt-in cache for GET responses of read-mostly endpoints
+            metadata_cache: Persistent cache of source metadata, used by
+                ``sources.list(full=True)`` and the ``tools`` catalog to skip
+                unchanged sources across processes
+            runner_scheduler: Picks the runner of each workflow submission that
+                doesn't name one; ``runner`` is used when no runner is eligible
 
         Raises:
             ConfigurationError: If configuration is invalid
@@ -307,17 +582,19 @@ class KubiyaClient:
         self.timeout = timeout
         self.org_name = org_name
 
-        # Create session with retry logic
+        # Retries are handled per request by the retry policy, not by urllib3,
+        # so non-idempotent calls are never replayed after a server error
+        self.retry_policy = retry_policy or RequestRetryPolicy(max_retries=max_retries)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.response_cache = response_cache
+        self.metadata_cache = metadata_cache
+        self.runner_scheduler = runner_scheduler
         self.session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter()
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        self._health_session: Optional[requests.Session] = None
+        self._health_session_lock = threading.Lock()
 
         # Set default headers - Use UserKey format for API key authentication
         self.session.headers.update({
@@ -327,41 +604,7 @@ class KubiyaClient:
         })
 
         # Initialize all services
-        from kubiya_workflow_sdk.kubiya_services.services import (
-            WorkflowService,
-            WebhookService,
-            UserService,
-            TriggerService,
-            ToolService,
-            SourceService,
-            SecretService,
-            RunnerService,
-            ProjectService,
-            PolicyService,
-            KnowledgeService,
-            IntegrationService,
-            DocumentationService,
-            AuditService,
-            AgentService,
-            StacksService,
-        )
-
-        self.workflows = WorkflowService(self)
-        self.webhooks = WebhookService(self)
-        self.users = UserService(self)
-        self.triggers = TriggerService(self)
-        self.tools = ToolService(self)
-        self.sources = SourceService(self)
-        self.secrets = SecretService(self)
-        self.runners = RunnerService(self)
-        self.projects = ProjectService(self)
-        self.policies = PolicyService(self)
-        self.knowledge = KnowledgeService(self)
-        self.integrations = IntegrationService(self)
-        self.documentations = DocumentationService(self)
-        self.audit = AuditService(self)
-        self.agents = AgentService(self)
-        self.stacks = StacksService(self)
+        _init_services(self)
 
     def make_request(
         self,
@@ -370,6 +613,7 @@ class KubiyaClient:
         data: Optional[Dict[str, Any]] = None,
         stream: bool = False,
         base_url: Optional[str] = None,
+        record: RecordTarget = None,
         **kwargs,
     ) -> Union[requests.Response, Generator[str, None, None]]:
         """Make an HTTP request to the Kubiya API.
@@ -380,6 +624,8 @@ class KubiyaClient:
             data: Request data
             stream: Whether to stream the response
             base_url: Base URL for API request. If None, uses the client's base URL.
+            record: Record the raw stream to a path, binary file or
+                ``StreamRecorder`` (streaming only)
             **kwargs: Additional request arguments
 
         Returns:
@@ -400,16 +646,100 @@ class KubiyaClient:
         if stream:
             headers["Accept"] = "text/event-stream"
 
+        if self.response_cache is not None and not stream:
+            return self._cached_request(method, url, data, headers, **kwargs)
+
+        # One idempotency key per logical request, reused when a stream is resumed
+        headers = self.retry_policy.prepare_headers(method, headers)
+        response = self._send(method, url, data, stream, headers, **kwargs)
+        if not stream:
+            return response
+
+        def reconnect(resume_headers: Dict[str, str]) -> requests.Response:
+            return self._send(method, url, data, True, {**headers, **resume_headers}, **kwargs)
+
+        recorder = as_recorder(record, method=method, endpoint=endpoint)
+        return self._handle_stream(response, reconnect=reconnect, recorder=recorder)
+
+    def _cached_request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        **kwargs,
+    ) -> requests.Response:
+        """Serve GET requests through the response cache and invalidate it on mutations."""
+        cache = self.response_cache
+
+        if method.upper() != "GET":
+            try:
+                return self._send(method, url, data, False, headers, **kwargs)
+            finally:
+                # Even a failed mutation may have changed the resource
+                cache.invalidate(url)
+
+        if data is not None or cache.ttl_for(url) is None:
+            return self._send(method, url, data, False, headers, **kwargs)
+
+        key = cache.key(url, kwargs.get("params"))
+        entry = cache.get(key)
+        if entry is not None:
+            # "Cache-Control: no-cache" asks for revalidation even of a fresh entry
+            if entry.fresh and "no-cache" not in headers.get("Cache-Control", ""):
+                return _response_from_cache(entry)
+            headers = {**headers, **entry.validators()}
+
+        response = self._send(method, url, data, False, headers, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            cache.revalidated(key)
+            return _response_from_cache(entry)
+
+        cache.store(key, url, response.status_code, response.headers, response.content)
+        return response
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        stream: bool,
+        headers: Dict[str, str],
+        **kwargs,
+    ) -> requests.Response:
+        """Send a request, retrying per the retry policy, and map failures to SDK exceptions."""
+        policy = self.retry_policy
+        headers = policy.prepare_headers(method, headers)
+        policy.record_request()
+        attempt = 0
+
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data,
-                timeout=self.timeout,
-                stream=stream,
-                headers=headers,
-                **kwargs,
-            )
+            while True:
+                try:
+                    with self.rate_limiter.limit() as permit:
+                        response = self.session.request(
+                            method=method,
+                            url=url,
+                            json=data,
+                            timeout=self.timeout,
+                            stream=stream,
+                            headers=headers,
+                            **kwargs,
+                        )
+                        permit.status_code = response.status_code
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    if not policy.should_retry(method, attempt, connect_failed=_connect_failed(e), error=True):
+                        raise
+                    delay = policy.backoff(attempt)
+                else:
+                    if not policy.should_retry(method, attempt, status_code=response.status_code):
+                        break
+                    delay = policy.backoff(attempt, response.headers.get("Retry-After"))
+                    response.close()
+
+                attempt += 1
+                logger.debug(f"Retrying {method} {url} in {delay:.2f}s (attempt {attempt})")
+                time.sleep(delay)
 
             # Check for authentication errors
             if response.status_code == 401:
@@ -439,8 +769,6 @@ class KubiyaClient:
                         "response_body": error_data
                     })
                     raise error
-            else:
-                return self._handle_stream(response)
             return response
 
         except requests.exceptions.Timeout:
@@ -458,112 +786,119 @@ class KubiyaClient:
                 raise error
             raise
 
-    def _handle_stream(self, response: requests.Response) -> Generator[str, None, None]:
-        """Handle Server-Sent Events (SSE) stream with proper heartbeat handling.
+    def _handle_stream(
+        self,
+        response: requests.Response,
+        reconnect: Optional[Callable[[Dict[str, str]], requests.Response]] = None,
+        recorder: Optional[StreamRecorder] = None,
+    ) -> Generator[Union[str, Dict[str, Any]], None, None]:
+        """Handle Server-Sent Events (SSE) stream.
 
         Args:
             response: Streaming response object
+            reconnect: Callable re-issuing the request with extra headers, used
+                to resume the stream with ``Last-Event-ID`` after a dropped connection
+            recorder: Recorder capturing the raw stream
 
         Yields:
-            Event data strings
+            Event data strings (JSON payloads are passed through without re-encoding)
 
         Raises:
             WorkflowExecutionError: For execution errors in the stream
         """
         try:
-            workflow_ended = False
-
-            for line in response.iter_lines():
-                if line:
-                    if isinstance(line, bytes):
-                        line = line.decode("utf-8")
-
-                    if line.startswith("data: "):
-                        data = line[6:]  # Remove 'data: ' prefix
-                        if data.strip() == "[DONE]":
-                            return
-
-                        # Handle Kubiya's custom format within SSE data
-                        # Format is like "2:{json}" or "d:{json}"
-                        if data and len(data) > 2 and data[1] == ":":
-                            prefix = data[0]
-                            json_data = data[2:]
-
-                            try:
-                                event_data = json.loads(json_data)
-
-                                # Check for end events
-                                if (
-                                    prefix == "d"
-                                    or event_data.get("end")
-                                    or event_data.get("finishReason")
-                                ):
-                                    workflow_ended = True
-                                elif event_data.get("type") == "heartbeat":
-                                    last_heartbeat = time.time()
-
-                                # Yield the parsed JSON data
-                                yield json.dumps(event_data)
-                            except json.JSONDecodeError:
-                                # If it's not valid JSON, yield as is
-                                yield data
-                        else:
-                            # Standard format, try to parse
-                            try:
-                                event_data = json.loads(data)
-                                if event_data.get("end") or event_data.get("finishReason"):
-                                    workflow_ended = True
-                                elif event_data.get("type") == "heartbeat":
-                                    last_heartbeat = time.time()
-                            except json.JSONDecodeError:
-                                pass
-
-                            yield data
-
-                        # If workflow ended, stop processing
-                        if workflow_ended:
-                            return
-
-                elif line and line.startswith("retry:"):
-                    # Handle SSE retry directive
-                    yield line
-                elif line and line.startswith("event:"):
-                    # Handle SSE event type
-                    event_type = line[6:].strip()
-                    if event_type in ["end", "error"]:
-                        yield line
-                        # Don't immediately close on error events - wait for explicit end
-                    else:
-                        yield line
-                try:
-                    yield json.loads(line)
-                except json.JSONDecodeError:
-                    # If line is not valid JSON, yield it as a string
-                    yield line
+            for event in self._iter_events(response, reconnect, recorder):
+                item, ended = _legacy_stream_item(event)
+                if item is not None:
+                    yield item
+                if ended:
+                    return
 
         except Exception as e:
             error = WorkflowExecutionError(f"Error processing stream: {str(e)}")
             capture_exception(error)
             raise error
+
+    def _iter_events(
+        self,
+        response: requests.Response,
+        reconnect: Optional[Callable[[Dict[str, str]], requests.Response]] = None,
+        recorder: Optional[StreamRecorder] = None,
+    ) -> Generator[SSEEvent, None, None]:
+        """Decode a streaming response into typed SSE events.
+
+        If the connection drops after the server has sent event ids and a
+        ``reconnect`` callable is given, the stream is resumed transparently
+        with ``Last-Event-ID`` and replayed events are skipped. With a
+        ``recorder``, the raw bytes of every connection are recorded.
+        """
+        resume = SSEResumeState()
+        try:
+            while True:
+                try:
+                    chunks = response.iter_content(chunk_size=None)
+                    if recorder is not None:
+                        chunks = recorder.wrap(chunks)
+                    yield from resume.events(chunks)
+                    return
+                except _SYNC_STREAM_ERRORS as e:
+                    response.close()
+                    error: Exception = e
+
+                while True:
+                    if reconnect is None or not resume.can_reconnect():
+                        raise error
+                    delay = resume.next_delay()
+                    logger.warning(
+                        f"Stream connection lost ({error}), resuming from event "
+                        f"{resume.last_event_id} in {delay:.1f}s (attempt {resume.reconnects})"
+                    )
+                    time.sleep(delay)
+                    try:
+                        response = reconnect(resume.headers())
+                    except (KubiyaConnectionError, KubiyaTimeoutError) as e:
+                        error = e
+                        continue
+                    if response.status_code >= 400:
+                        response.close()
+                        error = KubiyaAPIError(
+                            f"Stream resume failed: HTTP {response.status_code}",
+                            status_code=response.status_code,
+                        )
+                        continue
+                    add_breadcrumb(
+                        crumb={"message": "Resumed event stream", "category": "workflow_execution"},
+                        hint={"category": "workflow_execution"},
+                        data={"last_event_id": resume.last_event_id, "reconnects": resume.reconnects},
+                    )
+                    break
         finally:
             response.close()
+            if recorder is not None:
+                recorder.close()
 
     def execute_workflow(
         self,
         workflow_definition: Union[Dict[str, Any], str],
         parameters: Optional[Dict[str, Any]] = None,
         stream: bool = True,
-    ) -> Union[Dict[str, Any], Generator[str, None, None]]:
+        handler: Optional[StreamHandler] = None,
+        record: RecordTarget = None,
+    ) -> Union[ExecutionResult, Generator[str, None, None]]:
         """Execute a workflow.
 
         Args:
             workflow_definition: Workflow definition (dict or JSON string)
             parameters: Workflow parameters
             stream: Whether to stream the response
+            handler: Stream handler called as steps start, produce output
+                and finish, and when the workflow completes
+            record: Record the raw event stream to a path, binary file or
+                ``StreamRecorder`` (see ``core.recording``)
 
         Returns:
             For streaming: Generator yielding event data
-            For non-streaming: Final response data
+            For non-streaming: ExecutionResult folded from the event stream
 
         Raises:
             WorkflowExecutionError: If execution fails
@@ -588,32 +923,166 @@ class KubiyaClient:
         if parameters:
             workflow_definition["parameters"] = parameters
 
-        # Use the runner from the workflow definition if specified, otherwise use default
-        runner = workflow_definition.pop('runner', self.runner)
+        # Use the runner from the workflow definition if specified, otherwise
+        # let the scheduler pick one, falling back to the default runner
+        lease = self.lease_runner(workflow_definition)
+        runner = lease.runner if lease else workflow_definition.pop('runner', self.runner)
         # Prepare request body - workflow fields at top level
         request_body = {**workflow_definition}  # Spread workflow fields at top level
 
-        logger.info("Executing workflow...")
+        logger.info(f"Executing workflow on runner {runner}...")
         logger.debug(f"Request body: {json.dumps(request_body, indent=2)}")
 
-        # Execute the workflow
-        endpoint = f"/api/v1/workflow?runner={runner}&operation=execute_workflow"
-        if stream:
-            # Add native_sse=true for standard SSE format when streaming
-            endpoint += "&native_sse=true"
+        # Execute the workflow; the events are streamed in standard SSE format
+        # even without streaming, to be folded into the result
+        endpoint = f"/api/v1/workflow?runner={runner}&operation=execute_workflow&native_sse=true"
 
-        response = self.make_request(
-            method="POST", endpoint=endpoint, data=request_body, stream=stream
-        )
+        try:
+            response = self.make_request(
+                method="POST",
+                endpoint=endpoint,
+                data=request_body,
+                stream=True,
+                record=as_recorder(record, workflow=workflow_definition.get('name'), runner=runner),
+            )
+        except Exception:
+            if lease:
+                lease.release(failed=True)
+            raise
 
-        if stream:
-            return response
-        else:
-            # For non-streaming, collect all data
-            result = []
-            for event in response:
-                result.append(event)
-            return {"events": result}
+        if lease:
+            lease.submitted()
+            response = lease.wrap(response)
+
+        if not stream or handler is not None:
+            reducer = ExecutionReducer(
+                workflow_definition.get('name', ''), handlers=[handler] if handler else ()
+            )
+            if not stream:
+                return reducer.fold(response)
+            response = reducer.wrap(response)
+        return response
+
+    def lease_runner(self, workflow_definition: Dict[str, Any]) -> Optional[RunnerLease]:
+        """Claim a runner from the scheduler for a workflow that doesn't name one.
+
+        Returns:
+            Lease on the selected runner, or None when the workflow names its
+            runner or the client has no scheduler
+        """
+        if self.runner_scheduler is None or workflow_definition.get('runner'):
+            return None
+        workflow_definition.pop('runner', None)
+        return self.runner_scheduler.lease(workflow_definition.get('name'), default=self.runner)
+
+    def stream_events(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Generator[SSEEvent, None, None]:
+        """Open a streaming endpoint and yield typed SSE events.
+
+        The request is sent when iteration starts. Dropped connections are
+        resumed with ``Last-Event-ID`` once the server has sent event ids.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            data: Request data
+            **kwargs: Additional request arguments
+
+        Yields:
+            Decoded SSE events until the server closes the stream
+
+        Raises:
+            KubiyaAPIError: If the server answers with an error status
+        """
+        url = urljoin(self.base_url, endpoint)
+        headers = {"Accept": "text/event-stream", **kwargs.pop("headers", {})}
+        # One idempotency key per logical request, reused when the stream is resumed
+        headers = self.retry_policy.prepare_headers(method, headers)
+
+        response = self._send(method, url, data, True, headers, **kwargs)
+        if response.status_code >= 400:
+            error_text = response.text
+            response.close()
+            error = KubiyaAPIError(
+                f"API request failed: HTTP {response.status_code} - {error_text[:200]}",
+                status_code=response.status_code,
+                response_body=error_text,
+            )
+            capture_exception(error, extra={"api_url": url, "status_code": response.status_code})
+            raise error
+
+        def reconnect(resume_headers: Dict[str, str]) -> requests.Response:
+            return self._send(method, url, data, True, {**headers, **resume_headers}, **kwargs)
+
+        yield from self._iter_events(response, reconnect)
+
+    def execute_workflow_events(
+        self,
+        workflow_definition: Dict[str, Any],
+        parameters: Optional[Dict[str, Any]] = None,
+        record: RecordTarget = None,
+    ) -> Generator[SSEEvent, None, None]:
+        """Execute a workflow and yield typed SSE events.
+
+        Unlike ``execute_workflow(stream=True)``, events are yielded as
+        :class:`SSEEvent` objects carrying their ``event`` type and ``id``;
+        JSON payloads are decoded lazily via ``SSEEvent.json()``.
+
+        Args:
+            workflow_definition: Workflow definition dictionary
+            parameters: Workflow parameters
+            record: Record the raw event stream to a path, binary file or
+                ``StreamRecorder``
+
+        Yields:
+            Decoded SSE events until the workflow stream ends
+
+        Raises:
+            WorkflowExecutionError: If execution fails
+            KubiyaAPIError: For API errors
+        """
+        runner = workflow_definition.pop("runner", self.runner)
+        request_body = {**workflow_definition}
+        if parameters:
+            request_body["parameters"] = parameters
+
+        endpoint = f"/api/v1/workflow?runner={runner}&operation=execute_workflow&native_sse=true"
+        url = urljoin(self.base_url, endpoint)
+        # One idempotency key per execution, reused when the stream is resumed
+        headers = self.retry_policy.prepare_headers("POST", {"Accept": "text/event-stream"})
+
+        response = self._send("POST", url, request_body, True, headers)
+        if response.status_code >= 400:
+            error_text = response.text
+            response.close()
+            error = KubiyaAPIError(
+                f"API request failed: HTTP {response.status_code} - {error_text[:200]}",
+                status_code=response.status_code,
+                response_body=error_text,
+            )
+            capture_exception(error, extra={"api_url": url, "status_code": response.status_code})
+            raise error
+
+        def reconnect(resume_headers: Dict[str, str]) -> requests.Response:
+            return self._send("POST", url, request_body, True, {**headers, **resume_headers})
+
+        recorder = as_recorder(record, workflow=workflow_definition.get("name"), runner=runner, endpoint=endpoint)
+        try:
+            for event in self._iter_events(response, reconnect, recorder):
+                if event.is_done:
+                    return
+                yield event
+                if event.is_end:
+                    return
+        except (requests.exceptions.RequestException, KubiyaAPIError, KubiyaConnectionError, KubiyaTimeoutError) as e:
+            error = WorkflowExecutionError(f"Error processing stream: {str(e)}")
+            capture_exception(error)
+            raise error
 
     # ============= NEW PLATFORM CAPABILITIES =============
 
@@ -670,6 +1139,53 @@ class KubiyaClient:
         )
         return response.json()
 
+    def fetch_runner_health(self, runner_name: str, timeout: float = 5) -> Dict[str, Any]:
+        """Fetch a runner's health over the client's pooled health-check session.
+
+        Unlike ``get_runner_health`` this bypasses the response cache and the
+        request retry policy: health checks use a short timeout and their own
+        connection pool, retrying only 5xx errors.
+
+        Args:
+            runner_name: Name of the runner to check
+            timeout: Request timeout in seconds
+
+        Returns:
+            Decoded health response
+
+        Raises:
+            requests.RequestException: If the health check fails
+        """
+        with self.rate_limiter.limit() as permit:
+            response = self._get_health_session().get(
+                urljoin(self.base_url, f"/api/v3/runners/{runner_name}/health"),
+                timeout=timeout,
+            )
+            permit.status_code = response.status_code
+        response.raise_for_status()
+        return response.json()
+
+    def _get_health_session(self) -> requests.Session:
+        """Long-lived session for runner health checks, created on first use."""
+        with self._health_session_lock:
+            if self._health_session is None:
+                session = requests.Session()
+                session.headers.update(self.session.headers)
+                adapter = HTTPAdapter(
+                    pool_maxsize=20,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.5,
+                        status_forcelist=[500, 502, 503, 504],
+                        allowed_methods=["GET"],
+                        raise_on_status=False,
+                    ),
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._health_session = session
+            return self._health_session
+
     def get_runners_with_health(
         self, 
         check_health: bool = True,
@@ -703,112 +1219,26 @@ class KubiyaClient:
                 for runner in runners
             ]
         
-        # Check if we need to filter by components from environment
-        env_components = {}
-        if os.environ.get("KUBIYA_REQUIRED_AGENT_MANAGER_VERSION"):
-            env_components["agent-manager"] = os.environ["KUBIYA_REQUIRED_AGENT_MANAGER_VERSION"]
-        if os.environ.get("KUBIYA_REQUIRED_TOOL_MANAGER_VERSION"):
-            env_components["tool-manager"] = os.environ["KUBIYA_REQUIRED_TOOL_MANAGER_VERSION"]
-        
-        # Merge with provided requirements
-        if required_components:
-            env_components.update(required_components)
-        required_components = env_components if env_components else required_components
-        
-        # Function to check health for a single runner
+        required_components = required_components_from_env(required_components)
+
         def check_runner_health(runner):
             runner_name = runner.get("name")
             if not runner_name:
                 return runner
-            
-            # Create a copy without capabilities
-            runner_copy = {k: v for k, v in runner.items() if k != 'capabilities'}
-            
             try:
-                # Use a separate session with timeout for health checks
-                health_session = requests.Session()
-                health_session.headers.update(self.session.headers)
-                health_session.timeout = health_timeout
-                
-                # Get health status with retries
-                retry_strategy = Retry(
-                    total=3,
-                    backoff_factor=0.5,
-                    status_forcelist=[500, 502, 503, 504],
-                    allowed_methods=["GET"]
-                )
-                adapter = HTTPAdapter(max_retries=retry_strategy)
-                health_session.mount("http://", adapter)
-                health_session.mount("https://", adapter)
-                
-                response = health_session.get(
-                    urljoin(self.base_url, f"/api/v3/runners/{runner_name}/health"),
-                    timeout=health_timeout
-                )
-                response.raise_for_status()
-                health_data = response.json()
-                
-                runner_copy["health"] = health_data
-                runner_copy["health_status"] = health_data.get("status", "unknown")
-                runner_copy["is_healthy"] = health_data.get("health") == "true"
-                
+                health = self.fetch_runner_health(runner_name, timeout=health_timeout)
             except Exception as e:
                 logger.warning(f"Failed to fetch health for runner {runner_name}: {e}")
-                # Return error status if health check fails
-                runner_copy["health"] = {
-                    "health": "false",
-                    "status": "error",
-                    "error": str(e),
-                    "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                    "checks": []
-                }
-                runner_copy["health_status"] = "error"
-                runner_copy["is_healthy"] = False
-
+                runner_copy = evaluate_runner_health(runner, error=e, required_components=required_components)
                 capture_exception(e, extra={"response": runner_copy})
+                return runner_copy
+            return evaluate_runner_health(runner, health, required_components=required_components)
 
-            # Check component requirements if specified
-            if required_components and runner_copy.get("is_healthy"):
-                meets_requirements = True
-                component_versions = {}
-                
-                for check in runner_copy.get("health", {}).get("checks", []):
-                    component_name = check.get("name")
-                    component_version = check.get("version")
-                    component_status = check.get("status")
-                    
-                    if component_name:
-                        component_versions[component_name] = {
-                            "version": component_version,
-                            "status": component_status,
-                            "metadata": check.get("metadata", {})
-                        }
-                    
-                    # Check if this component has a requirement
-                    if component_name in required_components:
-                        required_version = required_components[component_name]
-                        
-                        # Component must be healthy
-                        if component_status != "ok":
-                            meets_requirements = False
-                            break
-                        
-                        # Check version if specified
-                        if required_version and component_version != required_version:
-                            meets_requirements = False
-                            break
-                
-                runner_copy["component_versions"] = component_versions
-                runner_copy["meets_requirements"] = meets_requirements
-            else:
-                runner_copy["meets_requirements"] = not required_components
-            
-            return runner_copy
-        
         # Use ThreadPoolExecutor for parallel health checks
         enriched_runners = []
         
-        with ThreadPoolExecutor(max_workers=min(max_workers, len(runners))) as executor:
+        max_workers = min(max_workers, len(runners), self.rate_limiter.concurrency_limit)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
             # Submit all health check tasks
             future_to_runner = {
                 executor.submit(check_runner_health, runner): runner 
@@ -950,8 +1380,9 @@ class KubiyaClient:
         )
         
         # Execute and stream
-        async for event in streaming_client.execute_workflow_stream(workflow_definition, parameters):
-            yield event
+        async with streaming_client:
+            async for event in streaming_client.execute_workflow_stream(workflow_definition, parameters):
+                yield event
 
     def create_agent(
         self,
@@ -1062,6 +1493,304 @@ class KubiyaClient:
             return response.json()
 
 
+class AsyncKubiyaClient:
+    """
+    Async client for interacting with Kubiya API
+
+    All requests share one long-lived httpx connection pool with HTTP keep-alive
+    (and HTTP/2 when ``h2`` is installed), so many concurrent service calls can
+    run on a single event loop without a thread per request. Services are
+    attached exactly like on ``KubiyaClient`` and expose async request helpers
+    (``_aget``, ``_apost``, ``_aput``, ``_adelete``, ``_apatch``).
+
+    Example:
+        async with AsyncKubiyaClient(api_key="your-api-key") as client:
+            response = await client.make_request("GET", "/api/v1/agents")
+            agents = response.json()
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.kubiya.ai",
+        runner: str = "kubiya-hosted",
+        timeout: int = 300,
+        max_retries: int = 3,
+        org_name: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry_policy: Optional[RequestRetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize async Kubiya client
+
+        Args:
+            api_key: Kubiya API key
+            base_url: Base URL for the Kubiya API
+            runner: Kubiya runner instance name
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of connection retry attempts
+            org_name: Organization name for API calls
+            max_connections: Maximum total connections in the pool
+            max_keepalive_connections: Maximum idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept alive
+            http2: Negotiate HTTP/2 when the ``h2`` package is available
+            transport: Custom httpx transport (mainly for testing)
+            retry_policy: Retry policy for API requests. Defaults to a
+                ``RequestRetryPolicy`` with ``max_retries`` and its own retry budget.
+            rate_limiter: Client-wide rate and concurrency limiter every request
+                passes through. Defaults to an adaptive limiter without a rate cap.
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.runner = runner
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.org_name = org_name
+        self.retry_policy = retry_policy or RequestRetryPolicy(max_retries=max_retries)
+        self.rate_limiter = rate_limiter or RateLimiter()
+
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("HTTP/2 requested but 'h2' is not installed, falling back to HTTP/1.1")
+                http2 = False
+        self.http2 = http2
+
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._transport = transport
+        self._http: Optional[httpx.AsyncClient] = None
+
+        # Default headers - Use UserKey format for API key authentication
+        self.headers = {
+            "Authorization": f"UserKey {api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": f"kubiya_workflow_sdk@{__version__}"
+        }
+
+        # Initialize all services
+        _init_services(self)
+
+    async def __aenter__(self):
+        self._get_http_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared pooled HTTP client, creating it on first use."""
+        if self._http is None or self._http.is_closed:
+            transport = self._transport or httpx.AsyncHTTPTransport(
+                retries=self.max_retries,  # Connection-level retries only, safe for POST
+                limits=self._limits,
+                http2=self.http2,
+            )
+            self._http = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=httpx.Timeout(self.timeout, connect=30),
+                transport=transport,
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        if self._http is not None:
+            try:
+                await self._http.aclose()
+            except Exception:
+                pass  # Ignore errors during cleanup
+            finally:
+                self._http = None
+
+    async def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        base_url: Optional[str] = None,
+        **kwargs,
+    ) -> Union[httpx.Response, AsyncGenerator[str, None]]:
+        """Make an HTTP request to the Kubiya API.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            data: Request data
+            stream: Whether to stream the response
+            base_url: Base URL for API request. If None, uses the client's base URL.
+            **kwargs: Additional request arguments
+
+        Returns:
+            Response object or async generator for streaming responses
+
+        Raises:
+            KubiyaAPIError: For API errors
+            KubiyaConnectionError: For connection errors
+            KubiyaTimeoutError: For timeout errors
+            KubiyaAuthenticationError: For authentication errors
+        """
+        base_url = base_url or self.base_url
+        url = urljoin(base_url, endpoint)
+
+        headers = kwargs.pop("headers", None) or {}
+        if stream:
+            headers["Accept"] = "text/event-stream"
+
+        http = self._get_http_client()
+        policy = self.retry_policy
+        headers = policy.prepare_headers(method, headers)
+        policy.record_request()
+        attempt = 0
+
+        try:
+            while True:
+                request = http.build_request(method=method, url=url, json=data, headers=headers, **kwargs)
+                try:
+                    async with self.rate_limiter.alimit() as permit:
+                        response = await http.send(request, stream=stream)
+                        permit.status_code = response.status_code
+                except httpx.TransportError as e:
+                    connect_failed = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                    if not policy.should_retry(method, attempt, connect_failed=connect_failed, error=True):
+                        raise
+                    delay = policy.backoff(attempt)
+                else:
+                    if not policy.should_retry(method, attempt, status_code=response.status_code):
+                        break
+                    delay = policy.backoff(attempt, response.headers.get("Retry-After"))
+                    await response.aclose()
+
+                attempt += 1
+                logger.debug(f"Retrying {method} {url} in {delay:.2f}s (attempt {attempt})")
+                await asyncio.sleep(delay)
+
+            # Check for authentication errors
+            if response.status_code == 401:
+                await response.aclose()
+                error = KubiyaAuthenticationError("Invalid API token or unauthorized access")
+                capture_exception(error, extra={"api_url": str(response.url), "status_code": response.status_code})
+                raise error
+
+            if stream:
+                async def reconnect(resume_headers: Dict[str, str]) -> httpx.Response:
+                    retry_request = http.build_request(
+                        method=method, url=url, json=data, headers={**headers, **resume_headers}, **kwargs
+                    )
+                    return await http.send(retry_request, stream=True)
+
+                return self._handle_stream(response, reconnect=reconnect)
+
+            if response.is_error:
+                error_data = {}
+                try:
+                    error_data = response.json()
+                except Exception:
+                    pass
+                error = KubiyaAPIError(
+                    f"API request failed: HTTP {response.status_code} {error_data}",
+                    status_code=response.status_code,
+                    response_body=json.dumps(error_data) if error_data else None,
+                )
+                capture_exception(error, extra={
+                    "request_body": data,
+                    "api_url": url,
+                    "status_code": response.status_code,
+                    "response_body": error_data
+                })
+                raise error
+            return response
+
+        except httpx.TimeoutException:
+            error = KubiyaTimeoutError(f"Request timed out after {self.timeout} seconds")
+            capture_exception(error, extra={"timeout": self.timeout, "api_url": url})
+            raise error
+        except httpx.TransportError as e:
+            error = KubiyaConnectionError(f"Failed to connect to Kubiya API: {str(e)}")
+            capture_exception(error, extra={"api_url": url})
+            raise error
+        except httpx.HTTPError as e:
+            error = KubiyaAPIError(f"Request failed: {str(e)}")
+            capture_exception(error)
+            raise error
+
+    async def _handle_stream(
+        self,
+        response: httpx.Response,
+        reconnect: Optional[Callable[[Dict[str, str]], Awaitable[httpx.Response]]] = None,
+    ) -> AsyncGenerator[Union[str, Dict[str, Any]], None]:
+        """Handle Server-Sent Events (SSE) stream.
+
+        If the connection drops after the server has sent event ids, the stream
+        is resumed through ``reconnect`` with ``Last-Event-ID`` and replayed
+        events are skipped.
+
+        Args:
+            response: Streaming response object
+            reconnect: Coroutine function re-issuing the request with extra headers
+
+        Yields:
+            Event data strings (JSON payloads are passed through without re-encoding)
+
+        Raises:
+            WorkflowExecutionError: For execution errors in the stream
+        """
+        resume = SSEResumeState()
+        try:
+            while True:
+                try:
+                    async for event in resume.aevents(response.aiter_bytes()):
+                        item, ended = _legacy_stream_item(event)
+                        if item is not None:
+                            yield item
+                        if ended:
+                            return
+                    return
+                except httpx.TransportError as e:
+                    await response.aclose()
+                    error: Exception = e
+
+                while True:
+                    if reconnect is None or not resume.can_reconnect():
+                        raise error
+                    delay = resume.next_delay()
+                    logger.warning(
+                        f"Stream connection lost ({error}), resuming from event "
+                        f"{resume.last_event_id} in {delay:.1f}s (attempt {resume.reconnects})"
+                    )
+                    await asyncio.sleep(delay)
+                    try:
+                        response = await reconnect(resume.headers())
+                    except httpx.TransportError as e:
+                        error = e
+                        continue
+                    if response.is_error:
+                        await response.aclose()
+                        error = KubiyaAPIError(
+                            f"Stream resume failed: HTTP {response.status_code}",
+                            status_code=response.status_code,
+                        )
+                        continue
+                    break
+
+        except (httpx.HTTPError, KubiyaAPIError) as e:
+            error = WorkflowExecutionError(f"Error processing stream: {str(e)}")
+            capture_exception(error)
+            raise error
+        finally:
+            await response.aclose()
+
+
 # Convenience function for simple workflow execution
 def execute_workflow(
     workflow_definition: Union[Dict[str, Any], str],
@@ -1070,7 +1799,8 @@ def execute_workflow(
     base_url: str = "https://api.kubiya.ai",
     runner: str = "kubiya-hosted",
     stream: bool = True,
-) -> Union[Dict[str, Any], Generator[str, None, None]]:
+    record: RecordTarget = None,
+) -> Union[ExecutionResult, Generator[str, None, None]]:
     """Execute a workflow using the Kubiya API.
 
     This is a convenience function that creates a client and executes the workflow.
@@ -1082,10 +1812,12 @@ def execute_workflow(
         base_url: Base URL for the Kubiya API
         runner: Kubiya runner instance name
         stream: Whether to stream the response
+        record: Record the raw event stream to a path, binary file or
+            ``StreamRecorder``
 
     Returns:
         For streaming: Generator yielding event data
-        For non-streaming: Final response data
+        For non-streaming: ExecutionResult folded from the event stream
 
     Example:
         >>> from kubiya_workflow_sdk import execute_workflow
@@ -1096,5 +1828,5 @@ def execute_workflow(
     client = KubiyaClient(api_key=api_key, base_url=base_url, runner=runner)
 
     return client.execute_workflow(
-        workflow_definition=workflow_definition, parameters=parameters, stream=stream
+        workflow_definition=workflow_definition, parameters=parameters, stream=stream, record=record
     )
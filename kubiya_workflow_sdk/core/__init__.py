@@ -63,6 +63,63 @@ from .constants import (
     NotificationChannel,
 )
 
+from .cache import (
+    CacheEntry,
+    ResponseCache,
+)
+
+from .ratelimit import (
+    TokenBucket,
+    AIMDLimiter,
+    RateLimiter,
+)
+
+from .retry import (
+    RequestRetryPolicy,
+    RetryBudget,
+)
+
+from .runner_health import (
+    RunnerHealthMonitor,
+    evaluate_runner_health,
+)
+
+from .scheduler import (
+    RunnerLease,
+    RunnerScheduler,
+)
+
+from .results import (
+    ExecutionReducer,
+)
+
+from .pipeline import (
+    ExecutionEvent,
+    EventPipeline,
+    EventSink,
+    StepTracker,
+    TypeFilter,
+    Tap,
+    ConsoleSink,
+    JSONLinesSink,
+    MetricsSink,
+)
+
+from .recording import (
+    Recording,
+    StreamRecorder,
+    ReplayAdapter,
+    ReplaySession,
+)
+
+from .sse import (
+    SSEEvent,
+    SSEDecoder,
+    SSEResumeState,
+    iter_sse_events,
+    aiter_sse_events,
+)
+
 from .exceptions import (
     # Base exception
     KubiyaSDKError,
@@ -164,6 +221,45 @@ __all__ = [
     "ToolType",
     "QueuePriority",
     "NotificationChannel",
+    # Response cache
+    "CacheEntry",
+    "ResponseCache",
+    # Rate limiting
+    "TokenBucket",
+    "AIMDLimiter",
+    "RateLimiter",
+    # Retries
+    "RequestRetryPolicy",
+    "RetryBudget",
+    # Runner health
+    "RunnerHealthMonitor",
+    "evaluate_runner_health",
+    # Runner scheduling
+    "RunnerLease",
+    "RunnerScheduler",
+    # Execution results
+    "ExecutionReducer",
+    # Event pipeline
+    "ExecutionEvent",
+    "EventPipeline",
+    "EventSink",
+    "StepTracker",
+    "TypeFilter",
+    "Tap",
+    "ConsoleSink",
+    "JSONLinesSink",
+    "MetricsSink",
+    # Stream recording and replay
+    "Recording",
+    "StreamRecorder",
+    "ReplayAdapter",
+    "ReplaySession",
+    # Streaming
+    "SSEEvent",
+    "SSEDecoder",
+    "SSEResumeState",
+    "iter_sse_events",
+    "aiter_sse_events",
     # Exceptions
     "KubiyaSDKError",
     "WorkflowError",
@@ -0,0 +1,204 @@
+"""HTTP response cache for read-mostly Kubiya API endpoints.
+
+The cache is opt-in and sits inside the client's ``make_request``. Only GET
+requests to endpoints with a configured TTL are cached. While an entry is
+fresh it is served locally. Once it expires, a conditional request
+(``If-None-Match`` / ``If-Modified-Since``) revalidates it, and a
+``304 Not Modified`` answer re-arms it without re-downloading the body. Any
+mutating request to a resource drops the cached entries for that resource and
+its parent collection.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlencode, urlsplit
+
+
+# Default TTLs in seconds, matched against the request path
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "/api/v1/sources": 60,
+    "/api/v1/sources/*/metadata": 300,
+    "/api/v1/agents": 30,
+    "/api/v1/runners": 30,
+    "/api/v3/runners": 30,
+    "/api/v1/integrations": 300,
+    "/api/v2/integrations": 300,
+}
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body plus the metadata needed to revalidate it."""
+
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    ttl: float
+    stored_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() - self.stored_at < self.ttl
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if "ETag" in self.headers:
+            headers["If-None-Match"] = self.headers["ETag"]
+        if "Last-Modified" in self.headers:
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+
+class ResponseCache:
+    """Thread-safe TTL cache with ETag revalidation and byte-size LRU eviction.
+
+    Args:
+        ttls: Mapping of path patterns (``fnmatch`` syntax) to TTL seconds.
+            Paths that match no pattern are not cached.
+        max_bytes: Total size of cached bodies before least recently used
+            entries are evicted
+        max_entry_bytes: Bodies larger than this are never cached
+
+    Example:
+        client = KubiyaClient(api_key="...", response_cache=ResponseCache())
+        client.response_cache.stats()
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_bytes: int = 32 * 1024 * 1024,
+        max_entry_bytes: int = 4 * 1024 * 1024,
+    ) -> None:
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidations": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Cache key for a GET request."""
+        if not params:
+            return url
+        query = urlencode(sorted((k, str(v)) for k, v in params.items() if v is not None))
+        return f"{url}{'&' if '?' in url else '?'}{query}" if query else url
+
+    def ttl_for(self, url: str) -> Optional[float]:
+        """TTL configured for a URL's path, or None if it is not cacheable."""
+        path = urlsplit(url).path.rstrip("/") or "/"
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return None
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for ``key`` (fresh or stale) and count a hit or miss.
+
+        A stale entry is returned so its validators can be used; it only
+        counts as a hit if a later :meth:`revalidated` call confirms it.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.fresh:
+                self._stats["misses"] += 1
+            else:
+                self._stats["hits"] += 1
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(
+        self, key: str, url: str, status_code: int, headers: Mapping[str, str], content: bytes
+    ) -> Optional[CacheEntry]:
+        """Cache a successful response; returns the entry or None if not cacheable."""
+        ttl = self.ttl_for(url)
+        if ttl is None or ttl <= 0 or status_code != 200:
+            return None
+        if len(content) > self.max_entry_bytes or "no-store" in headers.get("Cache-Control", ""):
+            return None
+
+        kept = {name: headers[name] for name in ("ETag", "Last-Modified", "Content-Type") if name in headers}
+        entry = CacheEntry(url=url, status_code=status_code, headers=kept, content=content, ttl=ttl)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._stats["evictions"] += 1
+        return entry
+
+    def revalidated(self, key: str) -> Optional[CacheEntry]:
+        """Re-arm an entry after a ``304 Not Modified`` response."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.stored_at = time.monotonic()
+                self._entries.move_to_end(key)
+                self._stats["revalidations"] += 1
+            return entry
+
+    def invalidate(self, url: str) -> int:
+        """Drop entries for the resource at ``url``, its children and its parents.
+
+        Returns:
+            Number of entries removed
+        """
+        path = urlsplit(url).path.rstrip("/")
+        removed = 0
+        with self._lock:
+            for key in list(self._entries):
+                entry_path = urlsplit(key).path.rstrip("/")
+                if _same_resource(path, entry_path):
+                    self._bytes -= self._entries.pop(key).size
+                    removed += 1
+            self._stats["invalidations"] += removed
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hit_ratio": (self._stats["hits"] / lookups) if lookups else 0.0,
+            }
+
+
+def _same_resource(a: str, b: str) -> bool:
+    """Whether one path equals the other or is a path-segment prefix of it."""
+    if a == b:
+        return True
+    shorter, longer = (a, b) if len(a) < len(b) else (b, a)
+    return longer.startswith(shorter + "/")
+
+
+__all__ = ["DEFAULT_CACHE_TTLS", "CacheEntry", "ResponseCache"]
@@ -0,0 +1,705 @@
+"""Event pipeline for workflow execution streams.
+
+Stream items (``SSEEvent`` objects, JSON strings or dicts) are parsed once
+into :class:`ExecutionEvent` objects, pass through stages and are handed to
+sinks:
+
+- parse: done by the pipeline, exactly once per item;
+- enrich / filter: stages are callables taking an event and returning it
+  (possibly enriched) or None to drop it;
+- sink: :class:`EventSink` objects rendering, storing or measuring events.
+
+Sinks run on a background thread fed through a bounded queue, so a slow
+terminal, file or metrics backend doesn't hold up the stream reader.
+
+Example:
+    metrics = MetricsSink()
+    pipeline = EventPipeline(
+        stages=[StepTracker(), TypeFilter(exclude={"heartbeat"})],
+        sinks=[ConsoleSink("normal"), JSONLinesSink("events.jsonl"), metrics],
+    )
+    for event in pipeline.run(client.execute_workflow_events(workflow), workflow=workflow):
+        ...
+    print(metrics.snapshot())
+"""
+
+import asyncio
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from collections import Counter
+from functools import cached_property
+from typing import IO, Any, AsyncGenerator, AsyncIterable, Callable, Dict, Generator, Iterable, List, Optional, Set, Union
+
+from .sse import SSEEvent
+
+logger = logging.getLogger(__name__)
+
+Stage = Callable[["ExecutionEvent"], Optional["ExecutionEvent"]]
+
+OVERFLOW_POLICIES = ("block", "drop")
+
+_VERBOSE_LEVELS = ("verbose", "debug")
+
+
+class ExecutionEvent:
+    """One parsed stream event.
+
+    Attributes:
+        index: Position in the stream, starting at 1
+        elapsed: Seconds since the pipeline started
+        raw: The event's JSON payload or raw text, None for dict items
+        data: Decoded JSON object, or None if the item isn't one
+        type: Event type (the ``type`` field, or the SSE event name)
+        step: Name of the step the event belongs to, set by ``StepTracker``
+        extra: Free-form data added by enrichment stages
+    """
+
+    def __init__(
+        self,
+        index: int,
+        elapsed: float,
+        raw: Optional[str],
+        data: Optional[Dict[str, Any]],
+        type: str,
+        step: Optional[str] = None,
+    ):
+        self.index = index
+        self.elapsed = elapsed
+        self.raw = raw
+        self.data = data
+        self.type = type
+        self.step = step
+        self.extra: Dict[str, Any] = {}
+
+    @property
+    def is_end(self) -> bool:
+        """Whether the event ends the workflow stream."""
+        data = self.data
+        if data is None:
+            return self.type == "end"
+        return bool(data.get("end") or data.get("finishReason"))
+
+    @property
+    def output(self) -> Optional[str]:
+        output = self.data.get("output") if self.data is not None else None
+        return output if isinstance(output, str) else None
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Lines of the event's output, split once and shared by all sinks."""
+        output = self.output
+        return output.split("\n") if output else []
+
+    def json(self) -> str:
+        """The event as JSON, reusing the raw payload when there is one."""
+        if self.raw is not None and self.data is not None:
+            return self.raw
+        return json.dumps(self.data if self.data is not None else self.raw, default=str)
+
+    def __repr__(self) -> str:
+        return f"ExecutionEvent(index={self.index}, type={self.type!r}, step={self.step!r})"
+
+
+def parse_event(item: Any, index: int, elapsed: float) -> Optional[ExecutionEvent]:
+    """Parse a stream item; returns None for items that carry no event ([DONE])."""
+    if isinstance(item, SSEEvent):
+        if not item.data:
+            return ExecutionEvent(index, elapsed, f"event: {item.event}", None, item.event)
+        if item.is_done:
+            return None
+        parsed = item.json()
+        if isinstance(parsed, dict):
+            return ExecutionEvent(index, elapsed, item.payload, parsed, parsed.get("type", "unknown"))
+        return ExecutionEvent(index, elapsed, item.data, None, item.event)
+    if isinstance(item, dict):
+        return ExecutionEvent(index, elapsed, None, item, item.get("type", "unknown"))
+    if isinstance(item, bytes):
+        item = item.decode("utf-8", errors="replace")
+    raw = str(item)
+    if raw[:1] == "{":
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError:
+            parsed = None
+        if isinstance(parsed, dict):
+            return ExecutionEvent(index, elapsed, raw, parsed, parsed.get("type", "unknown"))
+    return ExecutionEvent(index, elapsed, raw, None, "raw")
+
+
+class EventSink:
+    """Base class of pipeline sinks; all methods are optional.
+
+    The pipeline calls them in order from its sink thread: ``start`` once
+    before the first event, ``handle`` per event, ``finish`` once the stream
+    ended (with the error that ended it, if any) and then ``close``.
+    """
+
+    def start(self, workflow: Optional[Dict[str, Any]]) -> None:
+        pass
+
+    def handle(self, event: ExecutionEvent) -> None:
+        pass
+
+    def finish(self, error: Optional[BaseException]) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class EventPipeline:
+    """Parses stream items once, runs them through stages and feeds sinks.
+
+    A pipeline processes a single execution stream.
+
+    Args:
+        stages: Enrichment and filter stages, run in order on the reader side
+        sinks: Sinks receiving the events that pass all stages
+        background: Run sinks on a background thread (otherwise inline)
+        buffer_size: Maximum number of events waiting for the sinks
+        overflow: What the reader does when the buffer is full: "block"
+            until there is room, or "drop" the event for the sinks
+            (counted in ``dropped``)
+    """
+
+    def __init__(
+        self,
+        stages: Iterable[Stage] = (),
+        sinks: Iterable[EventSink] = (),
+        background: bool = True,
+        buffer_size: int = 1024,
+        overflow: str = "block",
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {', '.join(OVERFLOW_POLICIES)}")
+        self.stages: List[Stage] = list(stages)
+        self.sinks: List[EventSink] = list(sinks)
+        self.background = background and bool(self.sinks)
+        self.overflow = overflow
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, buffer_size))
+        self._thread: Optional[threading.Thread] = None
+        self._started = time.monotonic()
+        self._count = 0
+        self._closed = False
+
+    def process(self, item: Any) -> Optional[ExecutionEvent]:
+        """Parse an item, run the stages and hand the event to the sinks.
+
+        Returns:
+            The event, or None if it carried no event or a stage dropped it
+        """
+        event = self._prepare(item)
+        if event is not None:
+            self._submit("handle", event, droppable=True)
+        return event
+
+    def run(
+        self, items: Iterable[Any], workflow: Optional[Dict[str, Any]] = None
+    ) -> Generator[ExecutionEvent, None, None]:
+        """Process a stream, yielding its events until the workflow ends.
+
+        The sinks are started before the first item and finished and closed
+        once the stream ends, fails or the generator is closed; ``items`` is
+        closed too if it is a generator.
+        """
+        self._started = time.monotonic()
+        self._submit("start", workflow)
+        error: Optional[BaseException] = None
+        try:
+            for item in items:
+                event = self.process(item)
+                if event is None:
+                    continue
+                yield event
+                if event.is_end:
+                    break
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            close = getattr(items, "close", None)
+            if close is not None:
+                close()
+            self._submit("finish", error)
+            self.close()
+
+    async def arun(
+        self, items: AsyncIterable[Any], workflow: Optional[Dict[str, Any]] = None
+    ) -> AsyncGenerator[ExecutionEvent, None]:
+        """Async version of ``run`` for async streams.
+
+        When the sink buffer is full, the "block" overflow policy waits for
+        room in an executor thread instead of blocking the event loop.
+        """
+        self._started = time.monotonic()
+        await self._asubmit("start", workflow)
+        error: Optional[BaseException] = None
+        try:
+            async for item in items:
+                event = self._prepare(item)
+                if event is None:
+                    continue
+                await self._asubmit("handle", event, droppable=True)
+                yield event
+                if event.is_end:
+                    break
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            aclose = getattr(items, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            await self._asubmit("finish", error)
+            await self.aclose()
+
+    def close(self) -> None:
+        """Wait for the sinks to handle all queued events, then close them."""
+        if self._closed:
+            return
+        self._closed = True
+        self._submit("close")
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+
+    async def aclose(self) -> None:
+        """Async version of ``close``; waits for the sinks in an executor thread."""
+        if self._thread is None:
+            self.close()
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def __enter__(self) -> "EventPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # Private helpers
+
+    def _prepare(self, item: Any) -> Optional[ExecutionEvent]:
+        self._count += 1
+        event = parse_event(item, self._count, time.monotonic() - self._started)
+        for stage in self.stages:
+            if event is None:
+                return None
+            event = stage(event)
+        return event
+
+    def _submit(self, method: str, *args: Any, droppable: bool = False, wait: bool = True) -> Optional[tuple]:
+        """Queue a sink call; returns it instead of waiting for room if ``wait`` is false."""
+        if not self.sinks:
+            return None
+        if not self.background:
+            self._dispatch(method, args)
+            return None
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._work, name="event-pipeline", daemon=True)
+            self._thread.start()
+        task = (method, args)
+        try:
+            self._queue.put_nowait(task)
+        except queue.Full:
+            if droppable and self.overflow == "drop":
+                self.dropped += 1
+            elif wait:
+                self._queue.put(task)
+            else:
+                return task
+        return None
+
+    async def _asubmit(self, method: str, *args: Any, droppable: bool = False) -> None:
+        task = self._submit(method, *args, droppable=droppable, wait=False)
+        if task is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._queue.put, task)
+
+    def _work(self) -> None:
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+            self._dispatch(*task)
+
+    def _dispatch(self, method: str, args: tuple) -> None:
+        for sink in self.sinks:
+            try:
+                getattr(sink, method)(*args)
+            except Exception:
+                logger.exception(f"Event sink {type(sink).__name__}.{method} failed")
+
+
+# Stages
+
+class StepTracker:
+    """Stage tracking step states and tagging events with their step.
+
+    Output events without a step of their own are attributed to the step
+    that most recently started.
+    """
+
+    def __init__(self):
+        self.states: Dict[str, str] = {}
+        self.current: Optional[str] = None
+
+    def __call__(self, event: ExecutionEvent) -> ExecutionEvent:
+        data = event.data
+        if data is None:
+            return event
+        step = data.get("step")
+        name = step.get("name") if isinstance(step, dict) else data.get("step_name")
+        if event.type == "step_running" and name:
+            self.states[name] = "running"
+            self.current = name
+        elif event.type == "step_finished" and name:
+            self.states[name] = "finished"
+            if self.current == name:
+                self.current = None
+        event.step = name or self.current
+        return event
+
+
+class TypeFilter:
+    """Stage dropping events by type.
+
+    Args:
+        include: Only keep events of these types
+        exclude: Drop events of these types
+    """
+
+    def __init__(self, include: Optional[Set[str]] = None, exclude: Optional[Set[str]] = None):
+        self.include = set(include) if include is not None else None
+        self.exclude = set(exclude or ())
+
+    def __call__(self, event: ExecutionEvent) -> Optional[ExecutionEvent]:
+        if event.type in self.exclude or (self.include is not None and event.type not in self.include):
+            return None
+        return event
+
+
+class Tap:
+    """Stage calling a function with each JSON event's data, inline on the reader side."""
+
+    def __init__(self, callback: Callable[[Dict[str, Any]], None]):
+        self.callback = callback
+
+    def __call__(self, event: ExecutionEvent) -> ExecutionEvent:
+        if event.data is not None:
+            self.callback(event.data)
+        return event
+
+
+# Sinks
+
+class ConsoleSink(EventSink):
+    """Renders an execution as human-readable progress lines.
+
+    Args:
+        log_level: "minimal", "normal", "verbose" or "debug"
+        stream: Text stream to write to (standard output by default)
+    """
+
+    def __init__(self, log_level: str = "normal", stream: Optional[IO[str]] = None):
+        self.log_level = getattr(log_level, "value", log_level)
+        self.stream = stream
+        self.events = 0
+        self.steps: Dict[str, str] = {}
+        self.warnings: List[str] = []
+        self._started = time.monotonic()
+        self._last_heartbeat: Optional[float] = None
+
+    def write(self, text: str = "") -> None:
+        print(text, file=self.stream if self.stream is not None else sys.stdout)
+
+    def start(self, workflow: Optional[Dict[str, Any]]) -> None:
+        self._started = time.monotonic()
+        if workflow is None:
+            return
+        self.write(f"🚀 Executing Workflow: {workflow.get('name', 'unknown')}")
+        self.write("=" * 60)
+        try:
+            self._describe_services(workflow.get("steps", []))
+        except Exception as e:
+            if self.log_level in _VERBOSE_LEVELS:
+                self.write(f"⚠️  Could not analyze services: {str(e)}")
+                self.write()
+
+    def handle(self, event: ExecutionEvent) -> None:
+        self.events += 1
+        level = self.log_level
+        prefix = f"[{event.elapsed:6.1f}s]"
+        data = event.data
+
+        if data is None:
+            if level == "debug" and event.raw and "retry" not in event.raw:
+                self.write(f"{prefix} 📡 Raw: {event.raw}")
+            return
+
+        event_type = event.type
+        if event_type == "heartbeat":
+            self._last_heartbeat = time.monotonic()
+            if level in _VERBOSE_LEVELS:
+                self.write(f"{prefix} 💓 Heartbeat")
+        elif event_type == "step_running":
+            name = (data.get("step") or {}).get("name", "unknown")
+            self.steps[name] = "running"
+            self.write(f"{prefix} 🚀 Starting: {name}")
+        elif event_type == "step_finished":
+            name = (data.get("step") or {}).get("name", "unknown")
+            self.steps[name] = "finished"
+            self.write(f"{prefix} ✅ Completed: {name}")
+        elif "output" in data:
+            self._render_output(event, prefix)
+        elif "error" in data:
+            self.write(f"{prefix} ❌ ERROR: {data['error']}")
+        elif event.is_end:
+            self.write(f"{prefix} 🏁 Workflow ended")
+
+    def finish(self, error: Optional[BaseException]) -> None:
+        if error is not None:
+            self._describe_error(error)
+
+        total_time = time.monotonic() - self._started
+        self.write()
+        self.write("=" * 60)
+        self.write("🎉 Workflow Execution Complete")
+        self.write("=" * 60)
+        self.write("📊 Summary:")
+        self.write(f"   • Total time: {total_time:.1f} seconds")
+        self.write(f"   • Total events: {self.events}")
+        self.write(f"   • Steps processed: {len(self.steps)}")
+        if self._last_heartbeat is not None:
+            self.write(f"   • Last heartbeat: {time.monotonic() - self._last_heartbeat:.1f} seconds ago")
+
+        if self.steps and self.log_level != "minimal":
+            self.write("\n📋 Step Results:")
+            for name, state in self.steps.items():
+                icon = "✅" if state == "finished" else "🔄" if state == "running" else "❓"
+                self.write(f"   {icon} {name}: {state}")
+
+    # Private helpers
+
+    def _render_output(self, event: ExecutionEvent, prefix: str) -> None:
+        output = event.output
+        if output is None:
+            return
+        level = self.log_level
+        if level == "minimal":
+            # Only show key results
+            lowered = output.lower()
+            if any(keyword in lowered for keyword in ("✅", "❌", "error", "failed", "success")):
+                preview = " ".join(event.lines[:2]).strip()
+                if len(preview) > 80:
+                    preview = preview[:80] + "..."
+                self.write(f"{prefix} 📤 {preview}")
+        elif level == "normal":
+            # Show relevant output
+            for line in event.lines[:3]:
+                line = line.strip()
+                if line and any(k in line for k in ("🚀", "✅", "❌", "🔗", "service", "endpoint")):
+                    self.write(f"{prefix} 📤 {line}")
+        else:
+            for line in event.lines[:5]:
+                line = line.strip()
+                if line:
+                    self.write(f"{prefix} 📤 {line}")
+
+    def _describe_services(self, steps: List[Dict[str, Any]]) -> None:
+        self.write(f"📋 Steps: {len(steps)}")
+        services = set()
+        endpoints: Dict[str, str] = {}
+        for step in steps:
+            executor = step.get("executor", {})
+            if executor.get("type") != "tool":
+                continue
+            tool_def = executor.get("config", {}).get("tool_def", {})
+            for index, service in enumerate(tool_def.get("with_services", [])):
+                name = service.get("name", f"service-{index}")
+                image = service.get("image", "unknown")
+                if ":" not in image and not image.endswith(":latest"):
+                    self.warnings.append(f"Service '{name}' image '{image}' should include a tag")
+                ports = service.get("exposed_ports", [])
+                endpoints[name] = f"{name}-svc:{ports[0]}" if ports else f"{name}-svc"
+                services.add(f"{name} ({image}) -> {endpoints[name]}")
+
+        if services:
+            self.write(f"🔗 Bounded Services: {len(services)}")
+            for service in sorted(services):
+                self.write(f"   • {service}")
+            if self.log_level in _VERBOSE_LEVELS:
+                self.write("\n🌐 Service Endpoints:")
+                for name, endpoint in endpoints.items():
+                    self.write(f"   • {name} -> {endpoint}")
+
+        if self.warnings:
+            self.write("\n⚠️  Validation Warnings:")
+            for warning in self.warnings:
+                self.write(f"   • {warning}")
+        self.write()
+
+    def _describe_error(self, error: BaseException) -> None:
+        self.write("\n❌ WORKFLOW EXECUTION ERROR")
+        self.write("=" * 60)
+
+        # Check for common error types and provide specific guidance
+        message = str(error)
+        lowered = message.lower()
+        guide = next(
+            (guide for guide in _ERROR_GUIDES if any(all(k in lowered for k in keys) for keys in guide[0])),
+            None,
+        )
+        if guide is not None:
+            _, title, lines = guide
+            self.write(title)
+            for line in lines:
+                self.write(line)
+            self.write()
+            if title.startswith("⏰") and self.warnings:
+                self.write("💡 Consider these validation warnings that might be related:")
+                for warning in self.warnings:
+                    self.write(f"   • {warning}")
+                self.write()
+            self.write(f"📋 Error Details: {message}")
+        else:
+            self.write("🔍 General Execution Error")
+            self.write(f"📋 Error Details: {message}")
+            if self.warnings:
+                self.write("\n💡 There were validation warnings that might be related:")
+                for warning in self.warnings:
+                    self.write(f"   • {warning}")
+
+        self.write("\n🛠️  Troubleshooting Tips:")
+        self.write("   1. Check your workflow definition syntax")
+        self.write("   2. Validate service configurations")
+        self.write("   3. Ensure API key is valid and has permissions")
+        self.write("   4. Try with a simpler workflow first")
+        self.write("   5. Check network connectivity")
+
+
+# Guidance for common execution errors: (keyword sets, any of which must all be
+# found in the message; title; lines)
+_ERROR_GUIDES = (
+    ((("validation", "servicespec"),), "🔍 Service Validation Error Detected!", (
+        "   This error occurred while validating bounded services.",
+        "   Common issues:",
+        "   • Service name contains invalid characters",
+        "   • Service image missing tag (e.g., use 'redis:7-alpine' not 'redis')",
+        "   • Invalid port numbers (must be 1-65535)",
+        "   • Duplicate service names",
+    )),
+    ((("validation", "volume"),), "🔍 Volume Validation Error Detected!", (
+        "   This error occurred while validating volume mounts.",
+        "   Common issues:",
+        "   • Paths must be absolute (start with '/')",
+        "   • Empty path strings",
+    )),
+    ((("validation", "tool"),), "🔍 Tool Validation Error Detected!", (
+        "   This error occurred while validating tool definitions.",
+        "   Common issues:",
+        "   • Tool name or description is empty",
+        "   • Invalid tool type (must be docker, shell, python, etc.)",
+        "   • Docker tools missing image specification",
+        "   • Invalid arguments structure",
+    )),
+    ((("unauthorized",), ("authentication",)), "🔑 Authentication Error!", (
+        "   Please check your API key:",
+        "   • Ensure KUBIYA_API_KEY is set correctly",
+        "   • Verify the API key hasn't expired",
+        "   • Check your organization permissions",
+    )),
+    ((("timeout",),), "⏰ Timeout Error!", (
+        "   The workflow execution timed out.",
+        "   This can happen when:",
+        "   • Services take too long to start up",
+        "   • Network connectivity issues",
+        "   • Heavy resource usage",
+    )),
+)
+
+
+class JSONLinesSink(EventSink):
+    """Writes each event as one JSON line.
+
+    Lines look like ``{"index": 3, "elapsed": 1.25, "event": {...}}``; the
+    event's raw JSON payload is written as received, not re-serialized.
+
+    Args:
+        target: File path (opened on start, appended to) or an open text file
+    """
+
+    def __init__(self, target: Union[str, IO[str]]):
+        self.target = target
+        self._file: Optional[IO[str]] = None
+        self._owned = False
+
+    def start(self, workflow: Optional[Dict[str, Any]]) -> None:
+        if self._file is None:
+            if isinstance(self.target, str):
+                self._file = open(self.target, "a", encoding="utf-8")
+                self._owned = True
+            else:
+                self._file = self.target
+
+    def handle(self, event: ExecutionEvent) -> None:
+        if self._file is None:
+            self.start(None)
+        self._file.write(f'{{"index": {event.index}, "elapsed": {event.elapsed:.6f}, "event": {event.json()}}}\n')
+
+    def finish(self, error: Optional[BaseException]) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None and self._owned:
+            self._file.close()
+        self._file = None
+
+
+class MetricsSink(EventSink):
+    """Counts events by type, output lines, errors and step durations."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._types: Counter = Counter()
+        self._output_lines = 0
+        self._errors = 0
+        self._step_started: Dict[str, float] = {}
+        self._step_durations: Dict[str, float] = {}
+        self._first: Optional[float] = None
+        self._last: Optional[float] = None
+
+    def handle(self, event: ExecutionEvent) -> None:
+        data = event.data or {}
+        step = data.get("step")
+        name = step.get("name") if isinstance(step, dict) else None
+        with self._lock:
+            self._types[event.type] += 1
+            if self._first is None:
+                self._first = event.elapsed
+            self._last = event.elapsed
+            self._output_lines += len(event.lines)
+            if data.get("error"):
+                self._errors += 1
+            if name and event.type == "step_running":
+                self._step_started[name] = event.elapsed
+            elif name and event.type == "step_finished" and name in self._step_started:
+                self._step_durations[name] = event.elapsed - self._step_started[name]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current metrics."""
+        with self._lock:
+            events = sum(self._types.values())
+            span = (self._last - self._first) if self._first is not None else 0.0
+            return {
+                "events": events,
+                "events_by_type": dict(self._types),
+                "events_per_second": events / span if span > 0 else None,
+                "output_lines": self._output_lines,
+                "errors": self._errors,
+                "step_durations": dict(self._step_durations),
+            }
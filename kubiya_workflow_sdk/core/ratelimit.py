@@ -0,0 +1,287 @@
+"""Client-side rate limiting and adaptive concurrency control.
+
+A single :class:`RateLimiter` is owned by each client and shared by every
+request it sends, including the worker pools of bulk service operations, so
+parallel callers are coordinated instead of each picking their own fan-out.
+It combines a token bucket (requests per second) with an AIMD concurrency
+limit that shrinks multiplicatively when the API answers 429/503 and grows
+back additively while requests succeed.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, FrozenSet, Iterator, Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket with reservation semantics.
+
+    :meth:`reserve` always takes a token and returns how long the caller must
+    wait before using it, which works the same for threads and coroutines.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return the delay in seconds before it may be used."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class AIMDLimiter:
+    """Concurrency limit adjusted by additive-increase / multiplicative-decrease.
+
+    Each successful request raises the limit by ``increase / limit`` (about
+    ``increase`` per full window of requests); an overload signal multiplies
+    it by ``decrease``. Usable from threads and coroutines at the same time.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.in_flight = 0
+        self.waiting = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    def try_acquire(self) -> bool:
+        with self._cond:
+            if self.in_flight < self.limit:
+                self.in_flight += 1
+                return True
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block until a slot is free; returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self.waiting += 1
+            try:
+                while self.in_flight >= self.limit:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    # Bounded wait so slots freed from an event loop are picked up too
+                    self._cond.wait(0.05 if remaining is None else min(remaining, 0.05))
+                self.in_flight += 1
+                return True
+            finally:
+                self.waiting -= 1
+
+    async def aacquire(self) -> None:
+        """Wait for a slot without blocking the event loop."""
+        if self.try_acquire():
+            return
+        delay = 0.001
+        with self._cond:
+            self.waiting += 1
+        try:
+            while not self.try_acquire():
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.05)
+        finally:
+            with self._cond:
+                self.waiting -= 1
+
+    def release(self, overloaded: bool = False, success: bool = True) -> None:
+        """Free a slot and adapt the limit to the outcome of the request."""
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            if overloaded:
+                self._limit = max(float(self.min_limit), self._limit * self.decrease)
+            elif success:
+                self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+            self._cond.notify_all()
+
+
+class RateLimiter:
+    """Client-wide request governor: token bucket plus AIMD concurrency limit.
+
+    Args:
+        rate: Sustained requests per second, or None for no rate limit
+        burst: Token bucket capacity (defaults to ``rate``)
+        initial_concurrency: Starting concurrency limit
+        min_concurrency: Lower bound for the concurrency limit
+        max_concurrency: Upper bound for the concurrency limit
+        overload_statuses: Response statuses that trigger a back-off; other
+            server errors (5xx) hold the limits where they are
+
+    Example:
+        limiter = RateLimiter(rate=20, max_concurrency=16)
+        client = KubiyaClient(api_key="...", rate_limiter=limiter)
+        limiter.metrics()
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        initial_concurrency: int = 16,
+        min_concurrency: int = 1,
+        max_concurrency: int = 64,
+        overload_statuses: FrozenSet[int] = frozenset({429, 503}),
+    ) -> None:
+        self.max_rate = rate
+        self.min_rate = rate / 10.0 if rate else None
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.concurrency = AIMDLimiter(initial_concurrency, min_concurrency, max_concurrency)
+        self.overload_statuses = overload_statuses
+        self._lock = threading.Lock()
+        self._waiting_for_tokens = 0
+        self._requests = 0
+        self._throttled = 0
+        self._errors = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current concurrency limit; bulk operations size their worker pools from it."""
+        return self.concurrency.limit
+
+    def _reserve_token(self) -> float:
+        if self.bucket is None:
+            return 0.0
+        return self.bucket.reserve()
+
+    def acquire(self) -> None:
+        """Block until the request may be sent."""
+        delay = self._reserve_token()
+        if delay > 0:
+            with self._lock:
+                self._waiting_for_tokens += 1
+            try:
+                time.sleep(delay)
+            finally:
+                with self._lock:
+                    self._waiting_for_tokens -= 1
+        self.concurrency.acquire()
+
+    async def aacquire(self) -> None:
+        """Wait until the request may be sent without blocking the event loop."""
+        delay = self._reserve_token()
+        if delay > 0:
+            with self._lock:
+                self._waiting_for_tokens += 1
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                with self._lock:
+                    self._waiting_for_tokens -= 1
+        await self.concurrency.aacquire()
+
+    def release(self, status_code: Optional[int] = None) -> None:
+        """Release a slot acquired for a request.
+
+        Args:
+            status_code: Response status, or None if the request failed without one
+        """
+        overloaded = status_code in self.overload_statuses
+        # A struggling backend must not earn more concurrency or rate
+        failed = status_code is None or status_code >= 500
+        with self._lock:
+            self._requests += 1
+            if overloaded:
+                self._throttled += 1
+            elif failed:
+                self._errors += 1
+        self.concurrency.release(overloaded=overloaded, success=not failed)
+
+        if self.bucket is not None:
+            if overloaded:
+                self.bucket.set_rate(max(self.min_rate, self.bucket.rate * 0.5))
+            elif not failed and self.bucket.rate < self.max_rate:
+                self.bucket.set_rate(min(self.max_rate, self.bucket.rate + self.max_rate * 0.05))
+
+    @contextmanager
+    def limit(self) -> Iterator["_Permit"]:
+        """Hold a slot for the duration of the block.
+
+        Set ``permit.status_code`` inside the block to report the outcome.
+        """
+        self.acquire()
+        permit = _Permit()
+        try:
+            yield permit
+        finally:
+            self.release(permit.status_code)
+
+    @asynccontextmanager
+    async def alimit(self) -> AsyncIterator["_Permit"]:
+        """Async variant of :meth:`limit`."""
+        await self.aacquire()
+        permit = _Permit()
+        try:
+            yield permit
+        finally:
+            self.release(permit.status_code)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of current limits, queue depths and counters."""
+        with self._lock:
+            counters = {
+                "requests": self._requests,
+                "throttled": self._throttled,
+                "errors": self._errors,
+                "waiting_for_tokens": self._waiting_for_tokens,
+            }
+        return {
+            "rate": self.bucket.rate if self.bucket else None,
+            "tokens": round(self.bucket.tokens, 3) if self.bucket else None,
+            "concurrency_limit": self.concurrency.limit,
+            "in_flight": self.concurrency.in_flight,
+            "waiting_for_slot": self.concurrency.waiting,
+            **counters,
+        }
+
+
+class _Permit:
+    """Outcome holder for :meth:`RateLimiter.limit`."""
+
+    __slots__ = ("status_code",)
+
+    def __init__(self) -> None:
+        self.status_code: Optional[int] = None
+
+
+__all__ = ["TokenBucket", "AIMDLimiter", "RateLimiter"]
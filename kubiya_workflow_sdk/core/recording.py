@@ -0,0 +1,387 @@
+"""Recording and replay of raw workflow event streams.
+
+A :class:`StreamRecorder` captures the raw SSE bytes of an execution stream
+as they arrive from the network, with the time between chunks, and writes
+them to a compact file. A :class:`Recording` loaded from that file can be
+replayed, at the original speed, faster or as fast as possible, through the
+same decoding code the clients use:
+
+- :class:`ReplayAdapter` is a ``requests`` transport adapter for
+  :class:`KubiyaClient` (mount it on ``client.session``);
+- :class:`ReplaySession` stands in for the aiohttp session of a
+  :class:`StreamingKubiyaClient` (pass it as ``session``).
+
+File format (``.gz`` paths are gzip-compressed): the magic bytes ``KSSE``
+and a version byte, the length (uint32, little-endian) and UTF-8 JSON of
+the metadata, then one record per chunk: the delay since the previous chunk
+in microseconds and the chunk length as unsigned LEB128 varints, followed by
+the chunk bytes.
+
+Example:
+    for event in client.execute_workflow(workflow, record="run.ksse"):
+        ...
+
+    client = KubiyaClient(api_key="replay")
+    client.session.mount(client.base_url, ReplayAdapter(Recording.load("run.ksse"), speed=10))
+    for event in client.execute_workflow(workflow):
+        ...
+"""
+
+import asyncio
+import gzip
+import io
+import json
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import IO, Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+RECORDING_MAGIC = b"KSSE"
+RECORDING_VERSION = 1
+
+_HEADER = struct.Struct("<I")
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _open(target: Union[str, IO[bytes]], mode: str) -> Tuple[IO[bytes], bool]:
+    """Open a path (gzip for ``.gz``) or pass an open binary file through; returns (file, owned)."""
+    if not isinstance(target, str):
+        return target, False
+    if target.endswith(".gz"):
+        return gzip.open(target, mode), True
+    return open(target, mode), True
+
+
+@dataclass
+class Recording:
+    """A recorded event stream.
+
+    Attributes:
+        chunks: (delay in seconds since the previous chunk, bytes) pairs
+        metadata: Free-form metadata, e.g. the workflow name and endpoint
+    """
+
+    chunks: List[Tuple[float, bytes]] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Time the stream took to arrive, in seconds."""
+        return sum(delay for delay, _ in self.chunks)
+
+    @property
+    def size(self) -> int:
+        """Number of recorded bytes."""
+        return sum(len(chunk) for _, chunk in self.chunks)
+
+    @property
+    def data(self) -> bytes:
+        """The whole stream."""
+        return b"".join(chunk for _, chunk in self.chunks)
+
+    def iter_chunks(self, speed: Optional[float] = 1.0, sleep: Callable[[float], Any] = time.sleep) -> Iterator[bytes]:
+        """Yield the chunks with their recorded timing.
+
+        Args:
+            speed: Replay speed factor (2.0 is twice as fast); 0 or None
+                replays as fast as possible
+            sleep: Function used to wait between chunks
+        """
+        for delay, chunk in self.chunks:
+            if speed and delay:
+                sleep(delay / speed)
+            yield chunk
+
+    async def aiter_chunks(self, speed: Optional[float] = 1.0) -> AsyncIterator[bytes]:
+        """Async version of ``iter_chunks``."""
+        for delay, chunk in self.chunks:
+            if speed and delay:
+                await asyncio.sleep(delay / speed)
+            else:
+                # Still let other tasks run between chunks
+                await asyncio.sleep(0)
+            yield chunk
+
+    def save(self, target: Union[str, IO[bytes]]) -> None:
+        """Write the recording to a path or binary file."""
+        with StreamRecorder(target, metadata=self.metadata) as recorder:
+            for delay, chunk in self.chunks:
+                recorder.write(delay, chunk)
+
+    @classmethod
+    def load(cls, source: Union[str, IO[bytes]]) -> "Recording":
+        """Read a recording from a path or binary file.
+
+        Raises:
+            ValueError: If the data isn't a recording of a supported version
+        """
+        file, owned = _open(source, "rb")
+        try:
+            data = file.read()
+        finally:
+            if owned:
+                file.close()
+        return cls.from_bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Recording":
+        """Decode a recording from its file contents."""
+        if data[:4] != RECORDING_MAGIC or len(data) < 9:
+            raise ValueError("Not an event stream recording")
+        if data[4] != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version: {data[4]}")
+        (length,) = _HEADER.unpack_from(data, 5)
+        pos = 9 + length
+        recording = cls(metadata=json.loads(data[9:pos].decode("utf-8")))
+        chunks = recording.chunks
+        end = len(data)
+        while pos < end:
+            delay, pos = _read_varint(data, pos)
+            size, pos = _read_varint(data, pos)
+            chunks.append((delay / 1e6, data[pos : pos + size]))
+            pos += size
+        return recording
+
+
+class StreamRecorder:
+    """Records the raw chunks of one event stream.
+
+    Chunks are written as they pass through, so a recording of a stream
+    that failed halfway is still readable. The file is opened with the
+    first chunk and the recorder is closed when the stream it records ends;
+    the chunks stay available in ``recording``.
+
+    Args:
+        target: Path (``.gz`` for gzip) or binary file to write to, or None
+            to only keep the recording in memory
+        metadata: Free-form metadata stored in the file header
+        clock: Monotonic clock used to time the chunks
+    """
+
+    def __init__(
+        self,
+        target: Union[str, IO[bytes], None] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.recording = Recording(metadata=dict(metadata or {}))
+        self.target = target
+        self.clock = clock
+        self.closed = False
+        self._last: Optional[float] = None
+        self._file: Optional[IO[bytes]] = None
+        self._owned = False
+        self._buffer = bytearray()
+
+    def record(self, chunk: bytes) -> None:
+        """Record a chunk arriving now."""
+        now = self.clock()
+        delay = now - self._last if self._last is not None else 0.0
+        self._last = now
+        self.write(delay, chunk)
+
+    def write(self, delay: float, chunk: bytes) -> None:
+        """Record a chunk arriving ``delay`` seconds after the previous one."""
+        micros = max(0, round(delay * 1e6))
+        self.recording.chunks.append((micros / 1e6, chunk))
+        if self.target is None:
+            return
+        buffer = self._buffer
+        if self._file is None:
+            self._open()
+        _write_varint(buffer, micros)
+        _write_varint(buffer, len(chunk))
+        buffer += chunk
+        self._file.write(buffer)
+        buffer.clear()
+
+    def wrap(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Record chunks as they are read from an iterator, timed from the first read."""
+        if self._last is None:
+            self._last = self.clock()
+        for chunk in chunks:
+            self.record(chunk)
+            yield chunk
+
+    async def awrap(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        """Record chunks as they are read from an async iterator, timed from the first read."""
+        if self._last is None:
+            self._last = self.clock()
+        async for chunk in chunks:
+            self.record(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        """Finish the file; closes it if the recorder opened it."""
+        if self.closed:
+            return
+        self.closed = True
+        if self.target is None:
+            return
+        if self._file is None:
+            # Empty stream: still write a valid recording
+            self._open()
+            self._file.write(self._buffer)
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def _open(self) -> None:
+        """Open the target on first use and queue the header."""
+        self._file, self._owned = _open(self.target, "wb")
+        meta = json.dumps(self.recording.metadata, default=str).encode("utf-8")
+        self._buffer += RECORDING_MAGIC + bytes((RECORDING_VERSION,)) + _HEADER.pack(len(meta)) + meta
+
+    def __enter__(self) -> "StreamRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+RecordTarget = Union[str, IO[bytes], StreamRecorder, None]
+
+
+def as_recorder(record: RecordTarget, **metadata: Any) -> Optional[StreamRecorder]:
+    """Recorder for a ``record`` argument: a path, a binary file or a recorder."""
+    if record is None:
+        return None
+    if not isinstance(record, StreamRecorder):
+        return StreamRecorder(record, metadata=metadata)
+    for key, value in metadata.items():
+        record.recording.metadata.setdefault(key, value)
+    return record
+
+
+# Replay transports
+
+class _ReplayBody(io.RawIOBase):
+    """Response body streaming recorded chunks, for ``Response.iter_content``."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+
+    def readable(self) -> bool:
+        return True
+
+    def stream(self, amt: Optional[int] = None, decode_content: bool = True) -> Iterator[bytes]:
+        yield from self._chunks
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        if amt is None or amt < 0:
+            return b"".join(self._chunks)
+        return next(self._chunks, b"")
+
+    def release_conn(self) -> None:
+        pass
+
+
+class ReplayAdapter(BaseAdapter):
+    """``requests`` transport adapter answering every request with a recording.
+
+    Args:
+        recording: Stream to replay
+        speed: Replay speed factor; 0 or None for as fast as possible
+        status_code: Status of the replayed responses
+        sleep: Function used to wait between chunks
+    """
+
+    def __init__(
+        self,
+        recording: Recording,
+        speed: Optional[float] = 1.0,
+        status_code: int = 200,
+        sleep: Callable[[float], Any] = time.sleep,
+    ):
+        super().__init__()
+        self.recording = recording
+        self.speed = speed
+        self.status_code = status_code
+        self.sleep = sleep
+        self.requests: List[requests.PreparedRequest] = []
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, **kwargs: Any) -> requests.Response:
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict({"Content-Type": "text/event-stream"})
+        response.url = request.url
+        response.request = request
+        response.reason = "OK" if self.status_code < 400 else "Replayed error"
+        response.raw = _ReplayBody(self.recording.iter_chunks(self.speed, self.sleep))
+        if not stream:
+            _ = response.content  # read the whole body, as requests does
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class _ReplayContent:
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    def iter_any(self) -> AsyncIterator[bytes]:
+        return self._chunks
+
+
+class _ReplayResponse:
+    def __init__(self, session: "ReplaySession", url: str):
+        self.status = session.status
+        self.url = url
+        self.content = _ReplayContent(session.recording.aiter_chunks(session.speed))
+
+    async def text(self) -> str:
+        return b"".join([chunk async for chunk in self.content.iter_any()]).decode("utf-8", "replace")
+
+    async def __aenter__(self) -> "_ReplayResponse":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+
+class ReplaySession:
+    """Stand-in for the aiohttp session of ``StreamingKubiyaClient`` replaying a recording.
+
+    Args:
+        recording: Stream to replay
+        speed: Replay speed factor; 0 or None for as fast as possible
+        status: Status of the replayed responses
+    """
+
+    def __init__(self, recording: Recording, speed: Optional[float] = 1.0, status: int = 200):
+        self.recording = recording
+        self.speed = speed
+        self.status = status
+        self.closed = False
+        self.requests: List[Dict[str, Any]] = []
+
+    def post(self, url: str, **kwargs: Any) -> _ReplayResponse:
+        self.requests.append({"method": "POST", "url": url, **kwargs})
+        return _ReplayResponse(self, url)
+
+    async def close(self) -> None:
+        self.closed = True
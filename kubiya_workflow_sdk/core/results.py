@@ -0,0 +1,269 @@
+"""Fold workflow stream events into a typed ``ExecutionResult``.
+
+``ExecutionReducer`` consumes the events of one workflow execution as they
+arrive, whether they are decoded dicts, JSON strings or ``SSEEvent`` objects,
+and keeps a live ``ExecutionResult`` up to date. Each event costs O(1):
+steps are indexed by name, and step output is collected in chunks that are
+joined once, when the step ends. Registered ``StreamHandler`` objects are
+called as steps start, produce output and finish, and when the workflow
+completes.
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional
+
+from .constants import StepStatus, WorkflowStatus
+from .sse import SSEEvent
+from .types import ExecutionResult, StepResult, StreamHandler
+
+logger = logging.getLogger(__name__)
+
+# Event types that end a workflow, by the status they end it with
+TERMINAL_EVENT_STATUSES: Dict[str, WorkflowStatus] = {
+    "workflow_complete": WorkflowStatus.COMPLETED,
+    "workflow_completed": WorkflowStatus.COMPLETED,
+    "workflow_failed": WorkflowStatus.FAILED,
+    "workflow_cancelled": WorkflowStatus.CANCELLED,
+    "execution_failed": WorkflowStatus.FAILED,
+    "execution_error": WorkflowStatus.FAILED,
+}
+
+# Step event types, by the status they move the step to
+_STEP_EVENT_STATUSES: Dict[str, StepStatus] = {
+    "step_running": StepStatus.RUNNING,
+    "step_started": StepStatus.RUNNING,
+    "step_finished": StepStatus.COMPLETED,
+    "step_completed": StepStatus.COMPLETED,
+    "step_failed": StepStatus.FAILED,
+    "step_skipped": StepStatus.SKIPPED,
+}
+
+# Step status values reported by the server, mapped to step statuses
+_STEP_STATUS_VALUES: Dict[str, StepStatus] = {
+    "running": StepStatus.RUNNING,
+    "finished": StepStatus.COMPLETED,
+    "completed": StepStatus.COMPLETED,
+    "success": StepStatus.COMPLETED,
+    "succeeded": StepStatus.COMPLETED,
+    "failed": StepStatus.FAILED,
+    "error": StepStatus.FAILED,
+    "cancelled": StepStatus.CANCELLED,
+    "canceled": StepStatus.CANCELLED,
+    "skipped": StepStatus.SKIPPED,
+    "timeout": StepStatus.TIMEOUT,
+}
+
+
+def decode_event(event: Any) -> Any:
+    """Decode a stream item to a dict when it carries JSON, else return it unchanged."""
+    if isinstance(event, SSEEvent):
+        parsed = event.json()
+        return parsed if parsed is not None else event.data
+    if isinstance(event, (str, bytes)) and event[:1] in ("{", "[", b"{", b"["):
+        try:
+            return json.loads(event)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            pass
+    return event
+
+
+class ExecutionReducer:
+    """Builds an ``ExecutionResult`` incrementally from a workflow's events.
+
+    Example:
+        reducer = ExecutionReducer("deploy", handlers=[my_handler])
+        for event in client.execute_workflow(workflow):
+            reducer.add(event)
+            print(reducer.result.steps_completed, "/", reducer.result.steps_total)
+        result = reducer.finish()
+
+    Args:
+        workflow_name: Name of the executed workflow
+        execution_id: Execution ID, if known before the first event
+        handlers: Stream handlers called as the execution progresses; a
+            handler may implement only some of the callbacks
+        clock: Returns the current time (for tests)
+    """
+
+    def __init__(
+        self,
+        workflow_name: str = "",
+        execution_id: str = "",
+        handlers: Iterable[StreamHandler] = (),
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        self._clock = clock
+        self.handlers: List[StreamHandler] = list(handlers)
+        self.result = ExecutionResult(
+            execution_id=execution_id,
+            workflow_name=workflow_name,
+            status=WorkflowStatus.RUNNING,
+            start_time=clock(),
+            metadata={"events": 0},
+        )
+        self._steps: Dict[str, StepResult] = {}
+        self._output: Dict[str, List[str]] = {}
+        self._current_step: Optional[str] = None
+        self._finished = False
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def step(self, name: str) -> Optional[StepResult]:
+        """Result of a step by name, or None if it hasn't started."""
+        return self._steps.get(name)
+
+    def output(self, name: str) -> str:
+        """Output a step has produced so far."""
+        return "".join(self._output.get(name, ()))
+
+    def add(self, event: Any) -> None:
+        """Fold one stream event into the result."""
+        result = self.result
+        result.metadata["events"] += 1
+        event = decode_event(event)
+        if not isinstance(event, dict):
+            return
+
+        if not result.execution_id:
+            result.execution_id = event.get("execution_id") or event.get("executionId") or ""
+
+        event_type = event.get("type")
+        step_data = event.get("step") if isinstance(event.get("step"), dict) else None
+        step_name = (step_data or {}).get("name") or event.get("step_name")
+
+        if event_type in _STEP_EVENT_STATUSES and step_name:
+            status = _STEP_EVENT_STATUSES[event_type]
+            reported = (step_data or {}).get("status")
+            if status != StepStatus.RUNNING and isinstance(reported, str):
+                status = _STEP_STATUS_VALUES.get(reported.lower(), status)
+            if status == StepStatus.RUNNING:
+                self._start_step(step_name)
+            else:
+                self._end_step(step_name, status, step_data or {}, event)
+
+        output = event.get("output")
+        if isinstance(output, str) and output and event_type not in _STEP_EVENT_STATUSES:
+            self._add_output(step_name or self._current_step, output)
+
+        error = event.get("error")
+        if error and event_type not in _STEP_EVENT_STATUSES:
+            result.errors.append(error if isinstance(error, str) else json.dumps(error, default=str))
+
+        terminal = TERMINAL_EVENT_STATUSES.get(event_type)
+        if terminal is not None:
+            result.status = terminal
+            if isinstance(event.get("outputs"), dict):
+                result.outputs.update(event["outputs"])
+        elif event_type in ("error", "execution_error") and result.status == WorkflowStatus.RUNNING:
+            result.status = WorkflowStatus.FAILED
+
+    def finish(self, error: Optional[BaseException] = None) -> ExecutionResult:
+        """Close the result once the stream ended; repeated calls return it unchanged.
+
+        A workflow without a terminal event is completed, unless errors were
+        seen (or ``error`` is given), in which case it failed.
+        """
+        result = self.result
+        if self._finished:
+            return result
+        self._finished = True
+        if error is not None:
+            result.errors.append(str(error))
+            result.status = WorkflowStatus.FAILED
+        if not result.is_finished:
+            result.status = WorkflowStatus.FAILED if result.errors else WorkflowStatus.COMPLETED
+
+        for name, step in self._steps.items():
+            if not step.is_finished:
+                # The stream ended without a final event for this step
+                step.status = StepStatus.FAILED if result.status != WorkflowStatus.COMPLETED else StepStatus.COMPLETED
+                self._close_step(name, step)
+
+        result.end_time = self._clock()
+        result.duration_seconds = (result.end_time - result.start_time).total_seconds()
+        self._dispatch("on_workflow_complete", result)
+        return result
+
+    def wrap(self, events: Iterable[Any]) -> Generator[Any, None, None]:
+        """Yield ``events`` unchanged while folding them, finishing when they end."""
+        try:
+            for event in events:
+                self.add(event)
+                yield event
+        except GeneratorExit:
+            raise
+        except Exception as e:
+            self.finish(e)
+            raise
+        self.finish()
+
+    def fold(self, events: Iterable[Any]) -> ExecutionResult:
+        """Consume ``events`` and return the finished result."""
+        for _ in self.wrap(events):
+            pass
+        return self.result
+
+    # Private helpers
+
+    def _start_step(self, name: str) -> StepResult:
+        step = self._steps.get(name)
+        if step is None:
+            step = StepResult(step_name=name, status=StepStatus.RUNNING, start_time=self._clock())
+            self._steps[name] = step
+            self.result.steps.append(step)
+        elif step.is_finished:
+            # Started again, e.g. a retry
+            step.retry_count += 1
+            step.status = StepStatus.RUNNING
+            step.end_time = None
+        self._current_step = name
+        self._dispatch("on_step_start", name)
+        return step
+
+    def _end_step(self, name: str, status: StepStatus, step_data: Dict[str, Any], event: Dict[str, Any]) -> None:
+        step = self._steps.get(name) or self._start_step(name)
+        step.status = status
+        output = step_data.get("output") if "output" in step_data else event.get("output")
+        if isinstance(output, str) and output:
+            self._output.setdefault(name, []).append(output)
+        elif output is not None and not isinstance(output, str):
+            step.outputs["output"] = output
+        if isinstance(step_data.get("outputs"), dict):
+            step.outputs.update(step_data["outputs"])
+        error = step_data.get("error") or event.get("error")
+        if error:
+            step.error = error if isinstance(error, str) else json.dumps(error, default=str)
+        self._close_step(name, step)
+        if self._current_step == name:
+            self._current_step = None
+        self._dispatch("on_step_complete", name, step)
+
+    def _close_step(self, name: str, step: StepResult) -> None:
+        step.end_time = self._clock()
+        step.duration_seconds = (step.end_time - step.start_time).total_seconds()
+        chunks = self._output.pop(name, None)
+        if chunks:
+            step.outputs["output"] = "".join(chunks)
+
+    def _add_output(self, name: Optional[str], output: str) -> None:
+        if name is None:
+            self.result.metadata.setdefault("output", []).append(output)
+            return
+        if name not in self._steps:
+            self._start_step(name)
+        self._output.setdefault(name, []).append(output)
+        self._dispatch("on_step_output", name, output)
+
+    def _dispatch(self, callback: str, *args: Any) -> None:
+        for handler in self.handlers:
+            method = getattr(handler, callback, None)
+            if method is None:
+                continue
+            try:
+                method(*args)
+            except Exception:
+                logger.exception(f"Stream handler {callback} failed")
@@ -0,0 +1,174 @@
+"""HTTP request retry policy for the Kubiya API clients.
+
+Retries are decided per request rather than by the transport so that
+non-idempotent operations (e.g. executing a workflow) are never replayed
+after the server may already have acted on them.
+"""
+
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Deque, Dict, FrozenSet, Optional
+
+from .constants import MAX_RETRIES, RETRY_BACKOFF_BASE
+
+
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+
+class RetryBudget:
+    """Caps retries to a fraction of recent requests.
+
+    Within a sliding ``window`` (seconds), retries are allowed while their
+    count stays below ``max(min_retries, ratio * requests)``. During a
+    brownout this stops retries from multiplying the load on the API.
+    Thread-safe; one budget is shared by every request of a client.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0) -> None:
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._requests and self._requests[0] < cutoff:
+            self._requests.popleft()
+        while self._retries and self._retries[0] < cutoff:
+            self._retries.popleft()
+
+    def record_request(self) -> None:
+        """Record an original (non-retry) request."""
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """Reserve one retry; returns False when the budget is exhausted."""
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            allowed = max(self.min_retries, int(self.ratio * len(self._requests)))
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+    @property
+    def available(self) -> int:
+        """Retries currently available in the window."""
+        with self._lock:
+            self._expire(time.monotonic())
+            allowed = max(self.min_retries, int(self.ratio * len(self._requests)))
+            return max(0, allowed - len(self._retries))
+
+
+@dataclass
+class RequestRetryPolicy:
+    """Decides whether and when an HTTP request is retried.
+
+    Idempotent methods are retried on any status in ``retry_statuses`` and on
+    connection errors. Other methods (POST, PATCH) are only retried when the
+    server cannot have processed the request: on ``non_idempotent_statuses``
+    (throttling / unavailable) or when the connection was never established.
+    Mutating requests carry an ``Idempotency-Key`` header that stays the same
+    across retries so a server that honours it can de-duplicate them.
+
+    Backoff is exponential with full jitter and a ``Retry-After`` response
+    header takes precedence when present.
+    """
+
+    max_retries: int = MAX_RETRIES
+    backoff_initial: float = 0.25
+    backoff_multiplier: float = RETRY_BACKOFF_BASE
+    backoff_max: float = 10.0
+    retry_after_max: float = 60.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    non_idempotent_statuses: FrozenSet[int] = frozenset({429, 503})
+    idempotency_header: Optional[str] = "Idempotency-Key"
+    budget: Optional[RetryBudget] = field(default_factory=RetryBudget)
+
+    def is_idempotent(self, method: str) -> bool:
+        return method.upper() in IDEMPOTENT_METHODS
+
+    def prepare_headers(self, method: str, headers: Dict[str, str]) -> Dict[str, str]:
+        """Return request headers with an idempotency key added for mutating calls."""
+        if (
+            self.idempotency_header
+            and not self.is_idempotent(method)
+            and self.idempotency_header not in headers
+        ):
+            headers = {**headers, self.idempotency_header: str(uuid.uuid4())}
+        return headers
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        status_code: Optional[int] = None,
+        connect_failed: bool = False,
+        error: bool = False,
+    ) -> bool:
+        """Whether attempt number ``attempt`` (0-based) may be retried.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Number of retries already made
+            status_code: Response status, if a response was received
+            connect_failed: The connection was never established
+            error: The request failed without a response
+
+        Reserves a retry from the budget when the answer is yes.
+        """
+        if attempt >= self.max_retries:
+            return False
+
+        if status_code is not None:
+            if status_code not in self.retry_statuses:
+                return False
+            retryable = self.is_idempotent(method) or status_code in self.non_idempotent_statuses
+        else:
+            retryable = connect_failed or (error and self.is_idempotent(method))
+
+        if not retryable:
+            return False
+        return self.budget is None or self.budget.try_acquire()
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Delay in seconds before retry number ``attempt`` (0-based)."""
+        delay = _parse_retry_after(retry_after)
+        if delay is not None:
+            return min(delay, self.retry_after_max)
+        ceiling = min(self.backoff_max, self.backoff_initial * (self.backoff_multiplier ** attempt))
+        return random.uniform(0, ceiling)
+
+    def record_request(self) -> None:
+        """Count an original request towards the retry budget."""
+        if self.budget is not None:
+            self.budget.record_request()
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+__all__ = ["IDEMPOTENT_METHODS", "RetryBudget", "RequestRetryPolicy"]
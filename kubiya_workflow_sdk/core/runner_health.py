@@ -0,0 +1,362 @@
+"""Runner health evaluation and a background health monitor.
+
+``evaluate_runner_health`` turns a runner and its ``/health`` response into
+the enriched runner record returned by ``KubiyaClient.get_runners_with_health``
+(health status, component versions, whether component requirements are met).
+
+``RunnerHealthMonitor`` keeps those records in memory and refreshes them on a
+background thread. Health checks go over the client's pooled health session
+and a long-lived worker pool, and each refresh is scheduled with jitter so
+many monitors don't poll in lockstep. Readers get the last snapshot without
+any network calls, and subscribers are notified when a runner's health
+changes.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from kubiya_workflow_sdk.client import KubiyaClient
+
+logger = logging.getLogger(__name__)
+
+# Environment variables pinning component versions, by component name
+COMPONENT_VERSION_ENV_VARS: Dict[str, str] = {
+    "agent-manager": "KUBIYA_REQUIRED_AGENT_MANAGER_VERSION",
+    "tool-manager": "KUBIYA_REQUIRED_TOOL_MANAGER_VERSION",
+}
+
+# Fields whose change is reported to subscribers
+_STATE_FIELDS = ("health_status", "is_healthy", "meets_requirements", "component_versions")
+
+RunnerChangeCallback = Callable[[str, Optional[Dict[str, Any]], Optional[Dict[str, Any]]], None]
+
+
+def required_components_from_env(
+    required_components: Optional[Dict[str, Optional[str]]] = None,
+) -> Optional[Dict[str, Optional[str]]]:
+    """Component requirements from the environment, overridden by explicit ones."""
+    components = {
+        name: os.environ[var] for name, var in COMPONENT_VERSION_ENV_VARS.items() if os.environ.get(var)
+    }
+    if required_components:
+        components.update(required_components)
+    return components or required_components
+
+
+def evaluate_runner_health(
+    runner: Dict[str, Any],
+    health: Optional[Dict[str, Any]] = None,
+    error: Optional[Exception] = None,
+    required_components: Optional[Dict[str, Optional[str]]] = None,
+) -> Dict[str, Any]:
+    """Enrich a runner with its health response (or the error fetching it).
+
+    Args:
+        runner: Runner record from the runners list
+        health: Decoded health response
+        error: Error raised fetching the health response
+        required_components: Component names mapped to the required version
+            (None accepts any version)
+
+    Returns:
+        Copy of the runner with ``health``, ``health_status``, ``is_healthy``,
+        ``meets_requirements`` and, for healthy runners with requirements,
+        ``component_versions``
+    """
+    runner_copy = {k: v for k, v in runner.items() if k != "capabilities"}
+
+    if error is not None or health is None:
+        runner_copy["health"] = {
+            "health": "false",
+            "status": "error",
+            "error": str(error) if error is not None else "no health data",
+            "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "checks": [],
+        }
+        runner_copy["health_status"] = "error"
+        runner_copy["is_healthy"] = False
+    else:
+        runner_copy["health"] = health
+        runner_copy["health_status"] = health.get("status", "unknown")
+        runner_copy["is_healthy"] = health.get("health") == "true"
+
+    if required_components and runner_copy.get("is_healthy"):
+        meets_requirements = True
+        component_versions = {}
+
+        for check in runner_copy.get("health", {}).get("checks", []):
+            component_name = check.get("name")
+            component_version = check.get("version")
+            component_status = check.get("status")
+
+            if component_name:
+                component_versions[component_name] = {
+                    "version": component_version,
+                    "status": component_status,
+                    "metadata": check.get("metadata", {})
+                }
+
+            # Check if this component has a requirement
+            if component_name in required_components:
+                required_version = required_components[component_name]
+
+                # Component must be healthy
+                if component_status != "ok":
+                    meets_requirements = False
+                    break
+
+                # Check version if specified
+                if required_version and component_version != required_version:
+                    meets_requirements = False
+                    break
+
+        runner_copy["component_versions"] = component_versions
+        runner_copy["meets_requirements"] = meets_requirements
+    else:
+        runner_copy["meets_requirements"] = not required_components
+
+    return runner_copy
+
+
+class RunnerHealthMonitor:
+    """Keeps runner health in memory, refreshed in the background.
+
+    Example:
+        monitor = RunnerHealthMonitor(client, interval=30).start()
+        monitor.subscribe(lambda name, old, new: print(name, new and new["health_status"]))
+        healthy = [r for r in monitor.snapshot() if r["is_healthy"]]
+        monitor.stop()
+
+    Args:
+        client: Client used to list runners and check their health
+        interval: Seconds between refreshes
+        jitter: Fraction of ``interval`` each wait is randomly shortened or
+            lengthened by
+        required_components: Component requirements runners are evaluated
+            against; ``KUBIYA_REQUIRED_*_VERSION`` environment variables apply
+            as in ``get_runners_with_health``
+        max_workers: Maximum number of concurrent health checks
+        health_timeout: Timeout of each health check in seconds
+    """
+
+    def __init__(
+        self,
+        client: "KubiyaClient",
+        interval: float = 30.0,
+        jitter: float = 0.1,
+        required_components: Optional[Dict[str, Optional[str]]] = None,
+        max_workers: int = 10,
+        health_timeout: int = 5,
+    ):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.client = client
+        self.interval = interval
+        self.jitter = min(max(jitter, 0.0), 1.0)
+        self.required_components = required_components_from_env(required_components)
+        self.max_workers = max_workers
+        self.health_timeout = health_timeout
+
+        self.last_refresh: Optional[float] = None
+        self.last_error: Optional[Exception] = None
+
+        # name -> (runner, health, error) as last fetched, and the evaluated records
+        self._raw: Dict[str, tuple] = {}
+        self._runners: Dict[str, Dict[str, Any]] = {}
+        self._snapshot: List[Dict[str, Any]] = []
+        self._subscribers: List[RunnerChangeCallback] = []
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "RunnerHealthMonitor":
+        """Start refreshing in the background; the first refresh starts immediately."""
+        if self.running:
+            return self
+        self._stop = threading.Event()
+        # The thread only holds a weak reference, so an abandoned monitor stops
+        self._thread = threading.Thread(
+            target=self._run, args=(weakref.ref(self), self._stop), name="runner-health-monitor", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background refresh and release the worker pool."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+        with self._refresh_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def __enter__(self) -> "RunnerHealthMonitor":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def subscribe(self, callback: RunnerChangeCallback) -> Callable[[], None]:
+        """Call ``callback(name, previous, current)`` whenever a runner's health changes.
+
+        ``previous`` is None for a new runner and ``current`` is None for a
+        removed one. Callbacks run on the refreshing thread.
+
+        Returns:
+            Function that removes the subscription
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def snapshot(
+        self,
+        required_components: Optional[Dict[str, Optional[str]]] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Runners with their last known health, sorted by name.
+
+        Never makes a health call once the first refresh completed. Before
+        that, it waits up to ``timeout`` seconds for the background refresh,
+        or refreshes synchronously when the monitor isn't running.
+
+        Args:
+            required_components: Evaluate against these requirements (plus
+                the environment's) instead of the monitor's own, from the
+                cached health data
+            timeout: Maximum seconds to wait for the first refresh
+
+        Returns:
+            Runner records as returned by ``get_runners_with_health``
+        """
+        if not self._ready.is_set():
+            if self.running:
+                self._ready.wait(timeout)
+            else:
+                self.refresh()
+
+        if required_components is not None:
+            required_components = required_components_from_env(required_components)
+        if required_components is None or required_components == self.required_components:
+            with self._lock:
+                return list(self._snapshot)
+
+        with self._lock:
+            raw = list(self._raw.values())
+        return sorted(
+            (evaluate_runner_health(runner, health, error, required_components) for runner, health, error in raw),
+            key=lambda r: r.get("name", ""),
+        )
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Last known health record of one runner."""
+        with self._lock:
+            return self._runners.get(name)
+
+    def refresh(self) -> List[Dict[str, Any]]:
+        """Fetch the runner list and every runner's health now.
+
+        A failure to list runners keeps the previous snapshot and is recorded
+        in ``last_error``.
+
+        Returns:
+            The new snapshot
+        """
+        with self._refresh_lock:
+            try:
+                runners = [runner for runner in self.client.get_runners() if runner.get("name")]
+            except Exception as e:
+                logger.warning(f"Failed to list runners for health refresh: {e}")
+                self.last_error = e
+                self._ready.set()
+                with self._lock:
+                    return list(self._snapshot)
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.max_workers), thread_name_prefix="runner-health"
+                )
+            results = list(self._executor.map(self._fetch, runners))
+            self.last_error = None
+            self._apply(results)
+            self.last_refresh = time.time()
+            self._ready.set()
+            with self._lock:
+                return list(self._snapshot)
+
+    # Private helpers
+
+    def _fetch(self, runner: Dict[str, Any]) -> tuple:
+        try:
+            return runner, self.client.fetch_runner_health(runner["name"], self.health_timeout), None
+        except Exception as e:
+            logger.warning(f"Failed to fetch health for runner {runner['name']}: {e}")
+            return runner, None, e
+
+    def _apply(self, results: List[tuple]) -> None:
+        """Replace the snapshot and notify subscribers of changed runners."""
+        raw = {runner["name"]: (runner, health, error) for runner, health, error in results}
+        runners = {
+            name: evaluate_runner_health(runner, health, error, self.required_components)
+            for name, (runner, health, error) in raw.items()
+        }
+        with self._lock:
+            previous = self._runners
+            self._raw = raw
+            self._runners = runners
+            self._snapshot = [runners[name] for name in sorted(runners)]
+            subscribers = list(self._subscribers)
+
+        if not subscribers:
+            return
+        for name in sorted(set(previous) | set(runners)):
+            before, after = previous.get(name), runners.get(name)
+            if before is not None and after is not None and all(
+                before.get(field) == after.get(field) for field in _STATE_FIELDS
+            ):
+                continue
+            for callback in subscribers:
+                try:
+                    callback(name, before, after)
+                except Exception:
+                    logger.exception(f"Runner health subscriber failed for runner {name}")
+
+    def _next_delay(self) -> float:
+        return self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    @staticmethod
+    def _run(ref: "weakref.ref[RunnerHealthMonitor]", stop: threading.Event) -> None:
+        while not stop.is_set():
+            monitor = ref()
+            if monitor is None:
+                return
+            try:
+                monitor.refresh()
+            except Exception:
+                logger.exception("Runner health refresh failed")
+            delay = monitor._next_delay()
+            del monitor
+            if stop.wait(delay):
+                return
@@ -0,0 +1,225 @@
+"""Runner selection for workflow submissions.
+
+``RunnerScheduler`` picks the runner each workflow is submitted to. It only
+considers runners that are healthy and meet the component requirements
+(from a ``RunnerHealthMonitor`` snapshot, or a fixed list of names), and
+ranks them by the number of workflows it currently has in flight on each
+and an exponentially weighted average of their submission latency.
+
+Policies:
+
+- ``least_loaded``: the runner with the lowest cost, where cost is
+  ``(in_flight + 1) * latency``.
+- ``power_of_two``: the cheaper of two randomly sampled runners. Nearly as
+  balanced as ``least_loaded``, without every client herding onto the same
+  runner.
+- ``sticky``: the same runner for the same workflow name (rendezvous
+  hashing), so only workflows of a runner that goes away move elsewhere.
+  Submissions without a name fall back to ``power_of_two``.
+"""
+
+import hashlib
+import logging
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from kubiya_workflow_sdk.core.runner_health import RunnerHealthMonitor
+
+logger = logging.getLogger(__name__)
+
+SCHEDULING_POLICIES = ("least_loaded", "power_of_two", "sticky")
+
+
+class _RunnerStats:
+    __slots__ = ("in_flight", "latency", "submissions", "failures")
+
+    def __init__(self):
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        self.submissions = 0
+        self.failures = 0
+
+
+class RunnerLease:
+    """One submission's claim on a runner, counted as in flight until released.
+
+    Call ``submitted()`` once the submission request was answered to record
+    its latency, and ``release()`` once the workflow finished. ``wrap()``
+    does the latter for a stream of events.
+    """
+
+    def __init__(self, scheduler: "RunnerScheduler", runner: str):
+        self.runner = runner
+        self._scheduler = scheduler
+        self._started = time.monotonic()
+        self._released = False
+
+    def submitted(self) -> None:
+        """Record the time from acquiring the lease to the submission response."""
+        self._scheduler.record_latency(self.runner, time.monotonic() - self._started)
+
+    def release(self, failed: bool = False) -> None:
+        """Stop counting the workflow as in flight; repeated calls are ignored."""
+        if self._released:
+            return
+        self._released = True
+        self._scheduler._release(self.runner, failed)
+
+    def wrap(self, events: Iterable[Any]) -> Generator[Any, None, None]:
+        """Yield ``events`` and release the lease once they end, fail or are closed."""
+        failed = True
+        try:
+            yield from events
+            failed = False
+        except GeneratorExit:
+            failed = False
+            raise
+        finally:
+            self.release(failed)
+
+
+class RunnerScheduler:
+    """Picks a runner per workflow submission.
+
+    Example:
+        monitor = RunnerHealthMonitor(client).start()
+        client = KubiyaClient(api_key=key, runner_scheduler=RunnerScheduler(monitor))
+        client.execute_workflow(workflow)  # submitted to the best runner
+
+    Args:
+        monitor: Health monitor providing healthy runners
+        runners: Fixed runner names to schedule over when there is no monitor
+        policy: "least_loaded", "power_of_two" or "sticky"
+        required_components: Component requirements a runner must meet
+            (evaluated on the monitor's cached health)
+        latency_alpha: Weight of the newest sample in the latency average
+        failure_penalty: Latency in seconds recorded for a failed submission
+        seed: Seed for the random choices, for reproducible tests
+    """
+
+    def __init__(
+        self,
+        monitor: Optional["RunnerHealthMonitor"] = None,
+        runners: Optional[Iterable[str]] = None,
+        policy: str = "power_of_two",
+        required_components: Optional[Dict[str, Optional[str]]] = None,
+        latency_alpha: float = 0.3,
+        failure_penalty: float = 5.0,
+        seed: Optional[int] = None,
+    ):
+        if policy not in SCHEDULING_POLICIES:
+            raise ValueError(f"policy must be one of {', '.join(SCHEDULING_POLICIES)}")
+        if monitor is None and not runners:
+            raise ValueError("Either a health monitor or a list of runners is required")
+        self.monitor = monitor
+        self.runners = list(runners or [])
+        self.policy = policy
+        self.required_components = required_components
+        self.latency_alpha = latency_alpha
+        self.failure_penalty = failure_penalty
+        self._random = random.Random(seed)
+        self._stats: Dict[str, _RunnerStats] = {}
+        self._lock = threading.Lock()
+
+    def candidates(self) -> List[str]:
+        """Runners currently eligible for submissions."""
+        if self.monitor is None:
+            return list(self.runners)
+        snapshot = self.monitor.snapshot(required_components=self.required_components)
+        allowed = set(self.runners)
+        return [
+            runner["name"] for runner in snapshot
+            if runner.get("is_healthy") and runner.get("meets_requirements")
+            and (not allowed or runner["name"] in allowed)
+        ]
+
+    def select(self, workflow_name: Optional[str] = None) -> Optional[str]:
+        """Best runner for a submission, or None if no runner is eligible."""
+        candidates = self.candidates()
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            return candidates[0]
+        with self._lock:
+            if self.policy == "sticky" and workflow_name:
+                return max(candidates, key=lambda runner: _rendezvous_weight(workflow_name, runner))
+            if self.policy == "least_loaded":
+                return min(candidates, key=self._rank_key())
+            pair = self._random.sample(candidates, 2)
+            return min(pair, key=self._rank_key())
+
+    def lease(self, workflow_name: Optional[str] = None, default: Optional[str] = None) -> RunnerLease:
+        """Select a runner and count a submission to it as in flight.
+
+        Args:
+            workflow_name: Name of the workflow, used by the sticky policy
+            default: Runner to use when no runner is eligible
+
+        Raises:
+            ValueError: If no runner is eligible and there is no default
+        """
+        runner = self.select(workflow_name)
+        if runner is None:
+            if default is None:
+                raise ValueError("No healthy runner meets the scheduling requirements")
+            logger.warning(f"No eligible runner for workflow {workflow_name!r}, using {default}")
+            runner = default
+        with self._lock:
+            stats = self._stats.setdefault(runner, _RunnerStats())
+            stats.in_flight += 1
+            stats.submissions += 1
+        return RunnerLease(self, runner)
+
+    def record_latency(self, runner: str, seconds: float) -> None:
+        """Add a submission latency sample to a runner's moving average."""
+        with self._lock:
+            stats = self._stats.setdefault(runner, _RunnerStats())
+            if stats.latency is None:
+                stats.latency = seconds
+            else:
+                stats.latency += self.latency_alpha * (seconds - stats.latency)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """In-flight count, average latency, submissions and failures per runner."""
+        with self._lock:
+            return {
+                runner: {
+                    "in_flight": stats.in_flight,
+                    "latency": stats.latency,
+                    "submissions": stats.submissions,
+                    "failures": stats.failures,
+                }
+                for runner, stats in self._stats.items()
+            }
+
+    # Private helpers
+
+    def _release(self, runner: str, failed: bool) -> None:
+        if failed:
+            self.record_latency(runner, self.failure_penalty)
+        with self._lock:
+            stats = self._stats.setdefault(runner, _RunnerStats())
+            stats.in_flight = max(0, stats.in_flight - 1)
+            if failed:
+                stats.failures += 1
+
+    def _rank_key(self):
+        """Sort key by cost, with runners without samples assumed as fast as the fastest one."""
+        known = [s.latency for s in self._stats.values() if s.latency is not None]
+        optimistic = min(known) if known else 0.0
+
+        def key(runner: str):
+            stats = self._stats.get(runner)
+            in_flight = stats.in_flight if stats else 0
+            latency = stats.latency if stats and stats.latency is not None else optimistic
+            return (in_flight + 1) * latency, in_flight
+
+        return key
+
+
+def _rendezvous_weight(key: str, runner: str) -> int:
+    digest = hashlib.blake2b(f"{key}\0{runner}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
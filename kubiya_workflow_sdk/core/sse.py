@@ -0,0 +1,297 @@
+"""Incremental Server-Sent Events (SSE) decoding.
+
+The decoder works directly on raw byte chunks as they arrive from the network,
+so events split across chunk boundaries, multi-line ``data:`` fields and
+``id:``/``event:`` association are all handled in one place. Both the sync
+(requests) and async (aiohttp/httpx) streaming paths feed it and receive the
+same typed :class:`SSEEvent` objects.
+"""
+
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+from .constants import SSE_MAX_RECONNECTS, SSE_RECONNECT_DELAY
+
+
+_JSON_STARTS = ("{", "[")
+
+_UNPARSED = object()
+_json_decode = json.JSONDecoder().decode
+
+
+@dataclass
+class SSEEvent:
+    """A single dispatched SSE event."""
+
+    data: str
+    event: str = "message"
+    id: Optional[str] = None
+    bare: bool = False
+    _parsed: Any = field(default=_UNPARSED, init=False, repr=False, compare=False)
+
+    @property
+    def prefix(self) -> Optional[str]:
+        """Kubiya stream prefix for payloads like ``2:{json}`` or ``d:{json}``."""
+        data = self.data
+        if len(data) > 2 and data[1] == ":":
+            return data[0]
+        return None
+
+    @property
+    def payload(self) -> str:
+        """Event data without the Kubiya stream prefix."""
+        return self.data[2:] if self.prefix else self.data
+
+    def json(self) -> Any:
+        """Return the JSON-decoded payload, or None if it is not valid JSON.
+
+        The payload is parsed at most once per event; the result is cached.
+        """
+        if self._parsed is _UNPARSED:
+            try:
+                data = self.data
+                self._parsed = _json_decode(data[2:] if len(data) > 2 and data[1] == ":" else data)
+            except (json.JSONDecodeError, ValueError):
+                self._parsed = None
+        return self._parsed
+
+    @property
+    def is_done(self) -> bool:
+        """Whether this is the ``[DONE]`` stream terminator."""
+        return self.data.strip() == "[DONE]"
+
+    @property
+    def is_end(self) -> bool:
+        """Whether this event marks the end of a workflow stream."""
+        if self.event == "end" or self.prefix == "d":
+            return True
+        parsed = self.json()
+        return isinstance(parsed, dict) and bool(parsed.get("end") or parsed.get("finishReason"))
+
+
+class SSEDecoder:
+    """Incremental SSE decoder operating on raw byte buffers.
+
+    Feed it chunks in arrival order; each call returns the events completed by
+    that chunk. Bytes of an incomplete line stay buffered until the next chunk,
+    and the complete lines of each chunk are decoded from UTF-8 in one pass.
+
+    ``last_event_id`` and ``retry`` keep the most recent values seen on the
+    stream (for reconnection), while ``SSEEvent.id`` is only set on events
+    that carried their own ``id:`` field.
+
+    Lines that start with ``{`` or ``[`` outside an event block are emitted
+    immediately as ``bare`` events so newline-delimited JSON responses keep
+    working through the same code path.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._data: List[str] = []
+        self._event_type = ""
+        self._event_id: Optional[str] = None
+        self.last_event_id: Optional[str] = None
+        self.retry: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """Decode a chunk of bytes and return the events it completes."""
+        buffer = self._buffer
+        last_newline = chunk.rfind(b"\n")
+        if last_newline < 0:
+            # No complete line yet - just accumulate
+            buffer += chunk
+            return []
+
+        # Only complete lines are decoded; a newline byte can never be part of a
+        # multi-byte UTF-8 sequence, so cutting there is always safe.
+        if buffer:
+            buffer += chunk[: last_newline + 1]
+            text = buffer.decode("utf-8", "replace")
+            buffer.clear()
+        else:
+            text = chunk[: last_newline + 1].decode("utf-8", "replace")
+        buffer += chunk[last_newline + 1 :]
+        return self._process_text(text)
+
+    def flush(self) -> List[SSEEvent]:
+        """Process any trailing partial line and pending event at end of stream."""
+        events: List[SSEEvent] = []
+        if self._buffer:
+            text = self._buffer.decode("utf-8", "replace")
+            self._buffer.clear()
+            events.extend(self._process_text(text + "\n"))
+        event = self._dispatch()
+        if event is not None:
+            events.append(event)
+        return events
+
+    def _process_text(self, text: str) -> List[SSEEvent]:
+        events: List[SSEEvent] = []
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        lines = text.split("\n")
+        lines.pop()  # Always empty: text ends with a newline
+
+        for line in lines:
+            if not line:
+                event = self._dispatch()
+                if event is not None:
+                    events.append(event)
+                continue
+
+            # Fast path for the overwhelmingly common field
+            if line.startswith("data:"):
+                self._data.append(line[6:] if line.startswith("data: ") else line[5:])
+                continue
+
+            first = line[0]
+            if first == ":":
+                continue  # Comment / keep-alive
+
+            if first in _JSON_STARTS and not self._data and not self._event_type:
+                events.append(SSEEvent(data=line, bare=True))
+                continue
+
+            name, sep, value = line.partition(":")
+            if sep and value.startswith(" "):
+                value = value[1:]
+
+            if name == "data":
+                self._data.append(value)
+            elif name == "event":
+                self._event_type = value
+            elif name == "id":
+                if "\0" not in value:
+                    self._event_id = value
+                    self.last_event_id = value
+            elif name == "retry":
+                if value.isdigit():
+                    self.retry = int(value)
+        return events
+
+    def _dispatch(self) -> Optional[SSEEvent]:
+        if not self._data and not self._event_type:
+            self._event_id = None
+            return None
+
+        event = SSEEvent(
+            data="\n".join(self._data),
+            event=self._event_type or "message",
+            id=self._event_id,
+        )
+        self._data = []
+        self._event_type = ""
+        self._event_id = None
+        return event
+
+
+def iter_sse_events(
+    chunks: Iterable[bytes], decoder: Optional[SSEDecoder] = None
+) -> Iterator[SSEEvent]:
+    """Decode an iterable of byte chunks into SSE events."""
+    decoder = decoder or SSEDecoder()
+    for chunk in chunks:
+        if chunk:
+            yield from decoder.feed(chunk)
+    yield from decoder.flush()
+
+
+async def aiter_sse_events(
+    chunks: AsyncIterable[bytes], decoder: Optional[SSEDecoder] = None
+) -> AsyncIterator[SSEEvent]:
+    """Decode an async iterable of byte chunks into SSE events."""
+    decoder = decoder or SSEDecoder()
+    async for chunk in chunks:
+        if chunk:
+            for event in decoder.feed(chunk):
+                yield event
+    for event in decoder.flush():
+        yield event
+
+
+class SSEResumeState:
+    """Reconnection state for a logical SSE stream spanning several connections.
+
+    Tracks the last ``id:`` and ``retry:`` values seen across connections and
+    drops events whose id was already delivered, so a stream resumed with
+    ``Last-Event-ID`` never yields the same event twice.
+
+    A stream is only resumable once the server has sent an event id; without
+    one a reconnect would re-submit the original request instead of resuming.
+    """
+
+    def __init__(
+        self,
+        max_reconnects: int = SSE_MAX_RECONNECTS,
+        reconnect_delay: float = SSE_RECONNECT_DELAY,
+        max_seen_ids: int = 10000,
+    ) -> None:
+        self.max_reconnects = max_reconnects
+        self.reconnect_delay = reconnect_delay
+        self.max_seen_ids = max_seen_ids
+        self.last_event_id: Optional[str] = None
+        self.retry: Optional[int] = None
+        self.reconnects = 0
+        self._attempts = 0
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+
+    def _decoder(self) -> SSEDecoder:
+        # Partial data from a dropped connection is discarded with its decoder
+        decoder = SSEDecoder()
+        decoder.last_event_id = self.last_event_id
+        decoder.retry = self.retry
+        return decoder
+
+    def _accept(self, event: SSEEvent, decoder: SSEDecoder) -> bool:
+        self.last_event_id = decoder.last_event_id
+        self.retry = decoder.retry
+        if event.id is None or event.bare:
+            self._attempts = 0
+            return True
+        if event.id in self._seen:
+            return False
+        self._seen[event.id] = None
+        if len(self._seen) > self.max_seen_ids:
+            self._seen.popitem(last=False)
+        self._attempts = 0
+        return True
+
+    def events(self, chunks: Iterable[bytes]) -> Iterator[SSEEvent]:
+        """Decode one connection's byte chunks, skipping replayed events."""
+        decoder = self._decoder()
+        for event in iter_sse_events(chunks, decoder):
+            if self._accept(event, decoder):
+                yield event
+
+    async def aevents(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[SSEEvent]:
+        """Async variant of :meth:`events`."""
+        decoder = self._decoder()
+        async for event in aiter_sse_events(chunks, decoder):
+            if self._accept(event, decoder):
+                yield event
+
+    def can_reconnect(self) -> bool:
+        """Whether a dropped connection may be resumed."""
+        return self.last_event_id is not None and self._attempts < self.max_reconnects
+
+    def next_delay(self) -> float:
+        """Record a reconnect attempt and return the delay before it, in seconds.
+
+        The server's ``retry:`` directive takes precedence over the default.
+        """
+        self._attempts += 1
+        self.reconnects += 1
+        if self.retry is not None:
+            return self.retry / 1000.0
+        return float(self.reconnect_delay)
+
+    def headers(self) -> Dict[str, str]:
+        """Request headers for resuming the stream."""
+        if self.last_event_id is None:
+            return {}
+        return {"Last-Event-ID": self.last_event_id}
+
+
+__all__ = ["SSEEvent", "SSEDecoder", "SSEResumeState", "iter_sse_events", "aiter_sse_events"]
@@ -15,6 +15,7 @@ from enum import Enum
 import yaml
 import json
 from kubiya_workflow_sdk.dsl.step import Step
+from kubiya_workflow_sdk.validation import validate_workflow
 
 
 class WorkflowType(str, Enum):
@@ -263,48 +264,8 @@ print("Hello from script")
         return json.dumps(self.data, indent=indent)
 
     def validate(self) -> Dict[str, Any]:
-        """Basic validation."""
-        errors = []
-        warnings = []
-
-        if not self.data.get("name"):
-            errors.append("Workflow name is required")
-
-        if not self.data.get("steps"):
-            errors.append("At least one step is required")
-
-        # Check step names
-        step_names = [s.get("name") for s in self.data.get("steps", [])]
-        if len(step_names) != len(set(step_names)):
-            errors.append("Duplicate step names found")
-
-        # Check dependencies in chain mode
-        if self._current_type == WorkflowType.CHAIN:
-            for step in self.data.get("steps", []):
-                if step.get("depends"):
-                    warnings.append(
-                        f"Step '{step['name']}' has explicit dependencies in chain mode"
-                    )
-
-        # Validate step structure
-        for i, step in enumerate(self.data.get("steps", [])):
-            if not step.get("name"):
-                errors.append(f"Step {i+1} is missing a name")
-
-            # Must have command, run, or type
-            if not any([step.get("command"), step.get("run"), step.get("type")]):
-                errors.append(f"Step '{step.get('name', i+1)}' needs 'command', 'run', or 'type'")
-
-            # Validate retry configuration if present
-            if retry := step.get("retry"):
-                if not isinstance(retry, dict):
-                    errors.append(f"Step '{step.get('name', i+1)}': retry must be a dictionary")
-                elif "max_attempts" in retry and not isinstance(retry["max_attempts"], int):
-                    errors.append(
-                        f"Step '{step.get('name', i+1)}': retry.max_attempts must be an integer"
-                    )
-
-        return {"valid": len(errors) == 0, "errors": errors, "warnings": warnings}
+        """Validate the workflow, including its dependency graph."""
+        return validate_workflow(self.data, workflow_type=self._current_type.value).to_dict()
 
 
 # Convenience functions
@@ -1,14 +1,18 @@
 """Enhanced workflow execution with logging and validation."""
 
 import json
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional, Generator, Union, Callable, List, AsyncGenerator
 from enum import Enum
 import traceback
 import uuid
 
-from .client import execute_workflow as _execute_workflow_raw
+from .client import KubiyaClient, StreamingKubiyaClient, execute_workflow as _execute_workflow_raw
+from .core.pipeline import ConsoleSink, EventPipeline, EventSink, StepTracker, Tap
+from .core.recording import RecordTarget
 from .core.exceptions import WorkflowValidationError
+from .validation import validate_workflow
 
 # Optional Sentry integration
 try:
@@ -50,115 +54,10 @@ def validate_workflow_definition(workflow: Dict[str, Any]) -> List[str]:
         workflow: Workflow definition to validate
 
     Returns:
-        List of validation errors (empty if valid)
+        List of validation errors (empty if valid); see ``validate_workflow``
+        for the full result including warnings and the dependency graph
     """
-    errors = []
-
-    # Basic structure validation
-    if not isinstance(workflow, dict):
-        errors.append("Workflow definition must be a dictionary")
-        return errors
-
-    # Required fields
-    if "name" not in workflow:
-        errors.append("Workflow must have a 'name' field")
-    elif not workflow["name"] or not workflow["name"].strip():
-        errors.append("Workflow name cannot be empty")
-
-    if "steps" not in workflow:
-        errors.append("Workflow must have a 'steps' field")
-    elif not isinstance(workflow["steps"], list):
-        errors.append("Workflow 'steps' must be a list")
-    elif len(workflow["steps"]) == 0:
-        errors.append("Workflow must have at least one step")
-
-    # Validate steps
-    step_names = set()
-    for i, step in enumerate(workflow.get("steps", [])):
-        if not isinstance(step, dict):
-            errors.append(f"Step {i} must be a dictionary")
-            continue
-
-        # Step name validation
-        if "name" not in step:
-            errors.append(f"Step {i} must have a 'name' field")
-        else:
-            step_name = step["name"]
-            if not step_name or not step_name.strip():
-                errors.append(f"Step {i} name cannot be empty")
-            elif step_name in step_names:
-                errors.append(f"Duplicate step name '{step_name}' found")
-            step_names.add(step_name)
-
-        # Executor validation
-        if "executor" in step:
-            executor = step["executor"]
-            if not isinstance(executor, dict):
-                errors.append(f"Step {i} executor must be a dictionary")
-            elif "type" not in executor:
-                errors.append(f"Step {i} executor must have a 'type' field")
-            elif executor["type"] == "tool" and "config" in executor:
-                config = executor["config"]
-                if "tool_def" in config:
-                    tool_def = config["tool_def"]
-
-                    # Validate bounded services if present
-                    if "with_services" in tool_def:
-                        services = tool_def["with_services"]
-                        if not isinstance(services, list):
-                            errors.append(f"Step {i} tool_def with_services must be a list")
-                        else:
-                            service_names = set()
-                            for j, service in enumerate(services):
-                                if not isinstance(service, dict):
-                                    errors.append(f"Step {i} service {j} must be a dictionary")
-                                    continue
-
-                                # Required service fields
-                                if "name" not in service:
-                                    errors.append(f"Step {i} service {j} must have a 'name' field")
-                                elif service["name"] in service_names:
-                                    errors.append(
-                                        f"Step {i} has duplicate service name '{service['name']}'"
-                                    )
-                                else:
-                                    service_names.add(service["name"])
-
-                                if "image" not in service:
-                                    errors.append(
-                                        f"Step {i} service {j} must have an 'image' field"
-                                    )
-
-                                # Validate ports
-                                if "exposed_ports" in service:
-                                    ports = service["exposed_ports"]
-                                    if not isinstance(ports, list):
-                                        errors.append(
-                                            f"Step {i} service {j} exposed_ports must be a list"
-                                        )
-                                    else:
-                                        for port in ports:
-                                            if (
-                                                not isinstance(port, int)
-                                                or port < 1
-                                                or port > 65535
-                                            ):
-                                                errors.append(
-                                                    f"Step {i} service {j} invalid port: {port}"
-                                                )
-
-        # Dependencies validation
-        if "depends" in step:
-            depends = step["depends"]
-            if isinstance(depends, str):
-                if depends not in step_names and depends != step.get("name"):
-                    errors.append(f"Step {i} depends on unknown step '{depends}'")
-            elif isinstance(depends, list):
-                for dep in depends:
-                    if dep not in step_names and dep != step.get("name"):
-                        errors.append(f"Step {i} depends on unknown step '{dep}'")
-
-    return errors
+    return validate_workflow(workflow).errors
 
 
 def execute_workflow_with_logging(
@@ -170,9 +69,16 @@ def execute_workflow_with_logging(
     on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
     parameters: Optional[Dict[str, Any]] = None,
     base_url: str = "https://api.kubiya.ai",
+    sinks: Optional[List[EventSink]] = None,
+    record: RecordTarget = None,
 ) -> Union[Generator[str, None, None], Generator[Dict[str, Any], None, None]]:
     """Execute workflow with enhanced logging and validation.
 
+    In LOGGING and EVENTS modes, the stream runs through an
+    :class:`EventPipeline`: events are parsed once and yielded as dicts,
+    while sinks (console rendering, JSON lines files, metrics) handle them
+    on a background thread.
+
     Args:
         workflow_definition: Workflow definition (dict or JSON string)
         api_key: Kubiya API key
@@ -182,9 +88,13 @@ def execute_workflow_with_logging(
         on_event: Optional callback for each event
         parameters: Workflow parameters
         base_url: Base URL for the Kubiya API
+        sinks: Event sinks; defaults to a ``ConsoleSink`` in LOGGING mode and
+            to none in EVENTS mode
+        record: Record the raw event stream to a path, binary file or
+            ``StreamRecorder`` (see ``core.recording``)
 
     Returns:
-        Generator yielding events based on mode
+        Generator yielding raw event strings (RAW) or event dicts
 
     Raises:
         WorkflowValidationError: If validation fails
@@ -195,7 +105,7 @@ def execute_workflow_with_logging(
         try:
             workflow_definition = json.loads(workflow_definition)
         except json.JSONDecodeError as e:
-            error = WorkflowValidationError(f"Invalid workflow JSON: {str(e)}")
+            error = WorkflowValidationError(f"Invalid workflow JSON: {str(e)}", [str(e)])
             capture_exception(error, extra={"workflow_json": workflow_definition[:1000]})
             raise error
     
@@ -215,7 +125,7 @@ def execute_workflow_with_logging(
     if validate:
         errors = validate_workflow_definition(workflow_definition)
         if errors:
-            error = WorkflowValidationError(f"Workflow validation failed: {'; '.join(errors)}")
+            error = WorkflowValidationError(f"Workflow validation failed: {'; '.join(errors)}", errors)
             capture_exception(error, extra={
                 "workflow_name": workflow_definition.get("name", "unknown"),
                 "validation_errors": errors
@@ -230,299 +140,28 @@ def execute_workflow_with_logging(
             parameters=parameters,
             base_url=base_url,
             stream=True,
+            record=record,
         )
         return
 
-    # Enhanced modes with event processing
-    start_time = datetime.now()
-    event_count = 0
-    step_states = {}
-    workflow_ended = False
-    last_heartbeat = None
-    validation_warnings = []
-
-    # Pre-execution validation and setup
-    if mode == ExecutionMode.LOGGING:
-        workflow_name = workflow_definition.get("name", "unknown")
-        print(f"🚀 Executing Workflow: {workflow_name}")
-        print("=" * 60)
-
-        # Validate bounded services format and show warnings
-        try:
-            steps = workflow_definition.get("steps", [])
-            print(f"📋 Steps: {len(steps)}")
-
-            # Show services and validate them
-            services = set()
-            service_endpoints = {}
-            for step_idx, step in enumerate(steps):
-                executor = step.get("executor", {})
-                if executor.get("type") == "tool":
-                    tool_def = executor.get("config", {}).get("tool_def", {})
-                    step_services = tool_def.get("with_services", [])
-
-                    for service_idx, service in enumerate(step_services):
-                        service_name = service.get("name", f"service-{service_idx}")
-                        service_image = service.get("image", "unknown")
-
-                        # Check for common validation issues and warn
-                        if ":" not in service_image and not service_image.endswith(":latest"):
-                            validation_warnings.append(
-                                f"Service '{service_name}' image '{service_image}' should include a tag"
-                            )
-
-                        # Track service endpoints
-                        ports = service.get("exposed_ports", [])
-                        if ports:
-                            endpoint = f"{service_name}-svc:{ports[0]}"
-                            service_endpoints[service_name] = endpoint
-                            services.add(f"{service_name} ({service_image}) -> {endpoint}")
-                        else:
-                            service_endpoints[service_name] = f"{service_name}-svc"
-                            services.add(f"{service_name} ({service_image}) -> {service_name}-svc")
-
-            if services:
-                print(f"🔗 Bounded Services: {len(services)}")
-                for service in sorted(services):
-                    print(f"   • {service}")
-
-                if log_level in [LogLevel.VERBOSE, LogLevel.DEBUG]:
-                    print(f"\n🌐 Service Endpoints:")
-                    for service_name, endpoint in service_endpoints.items():
-                        print(f"   • {service_name} -> {endpoint}")
-
-            # Show validation warnings
-            if validation_warnings:
-                print(f"\n⚠️  Validation Warnings:")
-                for warning in validation_warnings:
-                    print(f"   • {warning}")
-
-            print()
-
-        except Exception as e:
-            if log_level in [LogLevel.VERBOSE, LogLevel.DEBUG]:
-                print(f"⚠️  Could not analyze services: {str(e)}")
-                print()
-
-    try:
-        # Execute workflow with comprehensive error handling
-        for event in _execute_workflow_raw(
-            workflow_definition=workflow_definition,
-            api_key=api_key,
-            parameters=parameters,
-            base_url=base_url,
-            stream=True,
-        ):
-            event_count += 1
-            current_time = datetime.now()
-            elapsed = (current_time - start_time).total_seconds()
-
-            # Parse event
-            event_data = None
-            try:
-                event_data = json.loads(event)
-            except json.JSONDecodeError:
-                if mode == ExecutionMode.LOGGING and log_level == LogLevel.DEBUG:
-                    if "retry" not in event:
-                        print(f"[{elapsed:6.1f}s] 📡 Raw: {event}")
+    # Enhanced modes: each event is parsed once and rendered by the sinks
+    if sinks is None:
+        sinks = [ConsoleSink(log_level)] if mode == ExecutionMode.LOGGING else []
+    stages = [StepTracker()]
+    if on_event:
+        stages.append(Tap(on_event))
+
+    client = KubiyaClient(api_key=api_key, base_url=base_url)
+    events = client.execute_workflow_events(dict(workflow_definition), parameters=parameters, record=record)
+    with EventPipeline(stages=stages, sinks=sinks) as pipeline:
+        for event in pipeline.run(events, workflow=workflow_definition):
+            if event.data is None:
                 continue
-
-            # Call user callback if provided
-            if on_event and event_data:
-                on_event(event_data)
-
-            # Handle different event types
-            event_type = event_data.get("type", "unknown")
-
-            if event_type == "heartbeat":
-                last_heartbeat = current_time
-                if mode == ExecutionMode.LOGGING and log_level in [
-                    LogLevel.VERBOSE,
-                    LogLevel.DEBUG,
-                ]:
-                    print(f"[{elapsed:6.1f}s] 💓 Heartbeat")
-
-            elif event_type == "step_running":
-                step_data = event_data.get("step", {})
-                step_name = step_data.get("name", "unknown")
-                step_states[step_name] = "running"
-
-                if mode == ExecutionMode.LOGGING:
-                    print(f"[{elapsed:6.1f}s] 🚀 Starting: {step_name}")
-
-            elif event_type == "step_finished":
-                step_data = event_data.get("step", {})
-                step_name = step_data.get("name", "unknown")
-                step_states[step_name] = "finished"
-
-                if mode == ExecutionMode.LOGGING:
-                    print(f"[{elapsed:6.1f}s] ✅ Completed: {step_name}")
-
-            elif "output" in event_data:
-                output = event_data["output"]
-                if mode == ExecutionMode.LOGGING:
-                    # Filter and format output based on log level
-                    if log_level == LogLevel.MINIMAL:
-                        # Only show key results
-                        if any(
-                            keyword in output.lower()
-                            for keyword in ["✅", "❌", "error", "failed", "success"]
-                        ):
-                            lines = output.split("\n")[:2]
-                            preview = " ".join(lines).strip()
-                            if len(preview) > 80:
-                                preview = preview[:80] + "..."
-                            print(f"[{elapsed:6.1f}s] 📤 {preview}")
-                    elif log_level == LogLevel.NORMAL:
-                        # Show relevant output
-                        lines = output.split("\n")
-                        for line in lines[:3]:
-                            line = line.strip()
-                            if line and any(
-                                keyword in line
-                                for keyword in ["🚀", "✅", "❌", "🔗", "service", "endpoint"]
-                            ):
-                                print(f"[{elapsed:6.1f}s] 📤 {line}")
-                    elif log_level in [LogLevel.VERBOSE, LogLevel.DEBUG]:
-                        # Show more detailed output
-                        lines = output.split("\n")[:5]
-                        for line in lines:
-                            line = line.strip()
-                            if line:
-                                print(f"[{elapsed:6.1f}s] 📤 {line}")
-
-            elif "error" in event_data:
-                error = event_data["error"]
-                if mode == ExecutionMode.LOGGING:
-                    print(f"[{elapsed:6.1f}s] ❌ ERROR: {error}")
-
-            elif event_data.get("end") or event_data.get("finishReason"):
-                workflow_ended = True
-                if mode == ExecutionMode.LOGGING:
-                    print(f"[{elapsed:6.1f}s] 🏁 Workflow ended")
-
-            # Yield based on mode
             if mode == ExecutionMode.EVENTS:
                 # Add timing information to event
-                event_data["_elapsed_seconds"] = elapsed
-                event_data["_event_count"] = event_count
-                yield event_data
-            elif mode == ExecutionMode.LOGGING:
-                # For logging mode, we mainly print but can still yield raw data
-                yield event
-
-            # Check if workflow ended
-            if workflow_ended:
-                break
-
-    except Exception as e:
-        # Enhanced error handling with helpful feedback
-        if mode == ExecutionMode.LOGGING:
-            print(f"\n❌ WORKFLOW EXECUTION ERROR")
-            print("=" * 60)
-
-            # Check for common error types and provide specific guidance
-            error_str = str(e).lower()
-
-            if "validation" in error_str and "servicespec" in error_str:
-                print("🔍 Service Validation Error Detected!")
-                print("   This error occurred while validating bounded services.")
-                print("   Common issues:")
-                print("   • Service name contains invalid characters")
-                print("   • Service image missing tag (e.g., use 'redis:7-alpine' not 'redis')")
-                print("   • Invalid port numbers (must be 1-65535)")
-                print("   • Duplicate service names")
-                print()
-                print(f"📋 Error Details: {str(e)}")
-
-            elif "validation" in error_str and "volume" in error_str:
-                print("🔍 Volume Validation Error Detected!")
-                print("   This error occurred while validating volume mounts.")
-                print("   Common issues:")
-                print("   • Paths must be absolute (start with '/')")
-                print("   • Empty path strings")
-                print()
-                print(f"📋 Error Details: {str(e)}")
-
-            elif "validation" in error_str and "tool" in error_str:
-                print("🔍 Tool Validation Error Detected!")
-                print("   This error occurred while validating tool definitions.")
-                print("   Common issues:")
-                print("   • Tool name or description is empty")
-                print("   • Invalid tool type (must be docker, shell, python, etc.)")
-                print("   • Docker tools missing image specification")
-                print("   • Invalid arguments structure")
-                print()
-                print(f"📋 Error Details: {str(e)}")
-
-            elif "unauthorized" in error_str or "authentication" in error_str:
-                print("🔑 Authentication Error!")
-                print("   Please check your API key:")
-                print("   • Ensure KUBIYA_API_KEY is set correctly")
-                print("   • Verify the API key hasn't expired")
-                print("   • Check your organization permissions")
-                print()
-                print(f"📋 Error Details: {str(e)}")
-
-            elif "timeout" in error_str:
-                print("⏰ Timeout Error!")
-                print("   The workflow execution timed out.")
-                print("   This can happen when:")
-                print("   • Services take too long to start up")
-                print("   • Network connectivity issues")
-                print("   • Heavy resource usage")
-                print()
-                if validation_warnings:
-                    print("💡 Consider these validation warnings that might be related:")
-                    for warning in validation_warnings:
-                        print(f"   • {warning}")
-                print()
-                print(f"📋 Error Details: {str(e)}")
-
+                yield {**event.data, "_elapsed_seconds": event.elapsed, "_event_count": event.index}
             else:
-                print("🔍 General Execution Error")
-                print(f"📋 Error Details: {str(e)}")
-
-                if validation_warnings:
-                    print("\n💡 There were validation warnings that might be related:")
-                    for warning in validation_warnings:
-                        print(f"   • {warning}")
-
-            print("\n🛠️  Troubleshooting Tips:")
-            print("   1. Check your workflow definition syntax")
-            print("   2. Validate service configurations")
-            print("   3. Ensure API key is valid and has permissions")
-            print("   4. Try with a simpler workflow first")
-            print("   5. Check network connectivity")
-
-        # Re-raise the exception for the caller to handle
-        raise
-
-    finally:
-        # Summary for logging mode
-        if mode == ExecutionMode.LOGGING:
-            total_time = (datetime.now() - start_time).total_seconds()
-            print()
-            print("=" * 60)
-            print("🎉 Workflow Execution Complete")
-            print("=" * 60)
-            print(f"📊 Summary:")
-            print(f"   • Total time: {total_time:.1f} seconds")
-            print(f"   • Total events: {event_count}")
-            print(f"   • Steps processed: {len(step_states)}")
-
-            if last_heartbeat:
-                heartbeat_age = (datetime.now() - last_heartbeat).total_seconds()
-                print(f"   • Last heartbeat: {heartbeat_age:.1f} seconds ago")
-
-            # Show step states
-            if step_states and log_level in [LogLevel.NORMAL, LogLevel.VERBOSE, LogLevel.DEBUG]:
-                print(f"\n📋 Step Results:")
-                for step_name, state in step_states.items():
-                    status_icon = (
-                        "✅" if state == "finished" else "🔄" if state == "running" else "❓"
-                    )
-                    print(f"   {status_icon} {step_name}: {state}")
+                yield event.data
 
 
 # Convenience functions for different modes
@@ -531,7 +170,7 @@ def execute_workflow_logged(
     api_key: str,
     log_level: LogLevel = LogLevel.NORMAL,
     **kwargs,
-) -> Generator[str, None, None]:
+) -> Generator[Dict[str, Any], None, None]:
     """Execute workflow with logging output."""
     return execute_workflow_with_logging(
         workflow_definition=workflow_definition,
@@ -574,6 +213,8 @@ async def execute_workflow_with_validation(
     log_level: LogLevel = LogLevel.NORMAL,
     api_token: Optional[str] = None,
     base_url: str = "https://api.kubiya.ai",
+    client: Optional[StreamingKubiyaClient] = None,
+    record: RecordTarget = None,
 ) -> AsyncGenerator[Dict[str, Any], None]:
     """
     Execute a workflow with validation and streaming feedback.
@@ -589,11 +230,17 @@ async def execute_workflow_with_validation(
         log_level: Logging verbosity level
         api_token: Kubiya API token
         base_url: Kubiya API base URL
+        client: Streaming client to execute with, sharing its connection
+            pool across executions (``api_token`` and ``base_url`` are then
+            ignored)
+        record: Record the raw event stream to a path, binary file or
+            ``StreamRecorder``
 
     Yields:
         Execution events with validation and progress information
     """
     execution_id = str(uuid.uuid4())
+    started = time.monotonic()
 
     try:
         # Emit start event
@@ -605,22 +252,8 @@ async def execute_workflow_with_validation(
             "parameters": parameters,
         }
 
-        # Try to validate workflow if validation is available
-        try:
-            from .validation import validate_workflow
-
-            validation_result = validate_workflow(workflow_def)
-        except ImportError:
-            # Basic validation if the validation module isn't available
-            validation_result = type(
-                "ValidationResult",
-                (),
-                {
-                    "valid": bool(workflow_def.get("steps")),
-                    "errors": [] if workflow_def.get("steps") else ["No steps defined"],
-                    "warnings": [],
-                },
-            )()
+        # Validate workflow
+        validation_result = validate_workflow(workflow_def)
 
         if not validation_result.valid:
             yield {
@@ -652,7 +285,7 @@ async def execute_workflow_with_validation(
         current_step = 0
 
         # Execute workflow
-        if not api_token:
+        if client is None and not api_token:
             yield {
                 "type": "execution_failed",
                 "execution_id": execution_id,
@@ -674,36 +307,21 @@ async def execute_workflow_with_validation(
             }
             return
 
-        # Real execution via Kubiya API
-        try:
-            from .client import StreamingKubiyaClient
-        except ImportError:
-            yield {
-                "type": "execution_failed",
-                "execution_id": execution_id,
-                "timestamp": datetime.now().isoformat(),
-                "error": "Kubiya client not available",
-                "details": "StreamingKubiyaClient could not be imported",
-                "help": {
-                    "message": "Ensure the Kubiya Workflow SDK is properly installed",
-                    "install_command": "pip install kubiya-workflow-sdk",
-                },
-            }
-
-            yield {
-                "type": "workflow_failed",
-                "execution_id": execution_id,
-                "timestamp": datetime.now().isoformat(),
-                "error": "Client dependency not available",
-            }
-            return
-
-        client = StreamingKubiyaClient(api_token=api_token, base_url=base_url)
+        # Real execution via Kubiya API, on a client of our own if none was given
+        owned = client is None
+        if owned:
+            client = StreamingKubiyaClient(api_key=api_token, base_url=base_url)
 
+        outputs: Dict[str, Any] = {}
         try:
             async for event in client.execute_workflow_stream(
-                workflow=workflow_def, params=parameters
+                workflow=dict(workflow_def), params=parameters, record=record
             ):
+                if isinstance(event, dict) and event.get("type") == "step_finished":
+                    step = event.get("step") or {}
+                    if step.get("name") and step.get("output") is not None:
+                        outputs[step["name"]] = step["output"]
+
                 # Transform and forward events
                 if mode == ExecutionMode.RAW:
                     yield event
@@ -741,8 +359,8 @@ async def execute_workflow_with_validation(
                 "type": "workflow_completed",
                 "execution_id": execution_id,
                 "timestamp": datetime.now().isoformat(),
-                "outputs": {},  # Would extract from final event
-                "duration_seconds": 0,  # Would calculate from start time
+                "outputs": outputs,
+                "duration_seconds": time.monotonic() - started,
             }
 
         except Exception as e:
@@ -770,6 +388,10 @@ async def execute_workflow_with_validation(
                 "error": str(e),
             }
 
+        finally:
+            if owned:
+                await client.aclose()
+
     except Exception as e:
         yield {
             "type": "unexpected_error",
@@ -788,27 +410,87 @@ async def execute_workflow_with_validation(
 
 
 def _structure_event(raw_event: Dict[str, Any], execution_id: str) -> Optional[Dict[str, Any]]:
-    """Structure raw events into standardized format."""
-    # This would parse raw Kubiya API events and structure them
-    # For now, return a basic structured event
-    return {
-        "type": "raw_event",
+    """Structure raw events into standardized format.
+
+    Step events become ``step_started``, ``step_completed`` or
+    ``step_failed``, output becomes ``step_output`` and errors become
+    ``execution_error``; heartbeats are dropped and anything else is passed
+    on as a ``raw_event``.
+    """
+    event_type = raw_event.get("type")
+    if event_type == "heartbeat":
+        return None
+
+    structured: Dict[str, Any] = {
         "execution_id": execution_id,
         "timestamp": datetime.now().isoformat(),
-        "data": raw_event,
     }
+    step = raw_event.get("step")
+    if isinstance(step, dict) and event_type in ("step_running", "step_finished"):
+        structured["step"] = step.get("name")
+        if event_type == "step_running":
+            structured["type"] = "step_started"
+        elif step.get("status") in ("failed", "error") or step.get("error"):
+            structured["type"] = "step_failed"
+            structured["error"] = step.get("error")
+        else:
+            structured["type"] = "step_completed"
+            structured["output"] = step.get("output")
+        return structured
+
+    if "output" in raw_event:
+        structured["type"] = "step_output"
+        structured["output"] = raw_event["output"]
+    elif "error" in raw_event:
+        structured["type"] = "execution_error"
+        structured["error"] = raw_event["error"]
+    else:
+        structured["type"] = "raw_event"
+        structured["data"] = raw_event
+    return structured
 
 
 def _format_log_event(raw_event: Dict[str, Any], log_level: LogLevel) -> Optional[Dict[str, Any]]:
-    """Format events for logging output."""
-    # This would format events based on log level
-    # For now, return a basic log event
-    if log_level in [LogLevel.VERBOSE, LogLevel.DEBUG]:
-        return {
-            "type": "log_event",
-            "timestamp": datetime.now().isoformat(),
-            "level": "info",
-            "message": f"Event: {raw_event.get('type', 'unknown')}",
-            "data": raw_event if log_level == LogLevel.DEBUG else None,
-        }
-    return None
+    """Format events for logging output.
+
+    Follows the ``ConsoleSink`` rules: step transitions and errors are always
+    logged, output at the level's detail and heartbeats only when verbose.
+    The raw event is attached in debug mode.
+    """
+    level = "info"
+    event_type = raw_event.get("type")
+    step = raw_event.get("step") if isinstance(raw_event.get("step"), dict) else {}
+    if event_type == "heartbeat":
+        if log_level not in (LogLevel.VERBOSE, LogLevel.DEBUG):
+            return None
+        message = "Heartbeat"
+    elif event_type == "step_running":
+        message = f"Starting: {step.get('name', 'unknown')}"
+    elif event_type == "step_finished":
+        message = f"Completed: {step.get('name', 'unknown')}"
+    elif isinstance(raw_event.get("output"), str):
+        lines = [line.strip() for line in raw_event["output"].split("\n")[:5] if line.strip()]
+        if log_level == LogLevel.MINIMAL:
+            lines = [line for line in lines[:2] if any(k in line.lower() for k in ("✅", "❌", "error", "failed", "success"))]
+        elif log_level == LogLevel.NORMAL:
+            lines = [line for line in lines[:3] if any(k in line for k in ("🚀", "✅", "❌", "🔗", "service", "endpoint"))]
+        if not lines:
+            return None
+        message = "\n".join(lines)
+    elif "error" in raw_event:
+        level = "error"
+        message = f"ERROR: {raw_event['error']}"
+    elif raw_event.get("end") or raw_event.get("finishReason"):
+        message = "Workflow ended"
+    elif log_level in (LogLevel.VERBOSE, LogLevel.DEBUG):
+        message = f"Event: {event_type or 'unknown'}"
+    else:
+        return None
+
+    return {
+        "type": "log_event",
+        "timestamp": datetime.now().isoformat(),
+        "level": level,
+        "message": message,
+        "data": raw_event if log_level == LogLevel.DEBUG else None,
+    }
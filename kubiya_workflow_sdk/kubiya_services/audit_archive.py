@@ -0,0 +1,370 @@
+"""
+Local, time-partitioned archive of audit log items
+"""
+import json
+import logging
+import math
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, UTC
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialized within the process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+WRITER_LOCK_FILE = ".writer.lock"
+_MANIFEST_VERSION = 1
+_UNDATED_PARTITION = "undated"
+
+# Partition-level value sets kept in the manifest for pruning
+_INDEXED_FIELDS = ("category_type", "action_type", "resource_type")
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    """Parse an RFC3339 timestamp into epoch seconds"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.timestamp()
+
+
+def _overlap_horizon(cursor_time: float, overlap_seconds: float) -> float:
+    """Start of the overlap before the cursor, rounded down to the whole second syncs resume from"""
+    return float(math.floor(cursor_time - overlap_seconds))
+
+
+def _event_key(item: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Identity of an audit event, by ID when the server provides one"""
+    for field in ('id', 'audit_id', 'event_id'):
+        if item.get(field):
+            return (field, item[field])
+    return (
+        item.get('timestamp'),
+        item.get('category_type'),
+        item.get('category_name'),
+        item.get('resource_type'),
+        item.get('action_type'),
+        item.get('session_id'),
+    )
+
+
+def _searchable_text(item: Any) -> str:
+    """Lowercased string and number values of an item, joined for substring search"""
+    parts: List[str] = []
+    stack = [item]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            parts.append(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif value is not None and not isinstance(value, bool):
+            parts.append(str(value))
+    return "\n".join(parts).lower()
+
+
+class AuditArchive:
+    """
+    Append-only mirror of audit items in daily JSONL partitions
+
+    Items are stored one JSON object per line in ``<path>/<YYYY-MM-DD>.jsonl``
+    by the UTC day of their timestamp. ``manifest.json`` records the sync
+    cursor, the keys of the items at the cursor boundary (so overlapping
+    syncs never store an item twice) and, per partition, the item count,
+    time range, committed byte size and the values of a few indexed fields.
+    Queries use the manifest to skip partitions that cannot match and never
+    touch the network, and only read the bytes it committed, so they never
+    see a line a concurrent writer is still appending. Writers hold an
+    exclusive lock file; a writer reloads the manifest and truncates bytes
+    written after it, or removes partitions it doesn't list (an interrupted
+    sync), before appending.
+
+    Args:
+        path: Archive directory, created if missing
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._manifest = self._load_manifest()
+        self._boundary_keys = {key for key, _ in self._manifest["boundary"]}
+
+    @property
+    def cursor(self) -> Optional[str]:
+        """Timestamp of the newest archived item, or None if the archive is empty"""
+        return self._manifest["cursor"]
+
+    def resume_from(self, overlap_seconds: float = 5.0) -> Optional[str]:
+        """Start time for the next sync: the cursor minus an overlap for late writes"""
+        cursor_time = _parse_timestamp(self.cursor)
+        if cursor_time is None:
+            return None
+        return datetime.fromtimestamp(_overlap_horizon(cursor_time, overlap_seconds), UTC).strftime(
+            '%Y-%m-%dT%H:%M:%SZ'
+        )
+
+    def __len__(self) -> int:
+        return sum(p["count"] for p in self._manifest["partitions"].values())
+
+    def partitions(self) -> Dict[str, Dict[str, Any]]:
+        """Manifest entries of all partitions, keyed by day"""
+        return {day: dict(info) for day, info in sorted(self._manifest["partitions"].items())}
+
+    def append(self, items: Iterable[Dict[str, Any]], overlap_seconds: float = 5.0) -> int:
+        """
+        Add items to the archive, skipping ones already stored at the cursor boundary
+
+        Args:
+            items: Audit items, in any order
+            overlap_seconds: Width of the boundary before the cursor whose
+                item keys are remembered for de-duplication
+
+        Returns:
+            Number of items written
+        """
+        with self._lock, self._writer_lock():
+            # Another writer may have committed since this archive was opened
+            self._manifest = self._load_manifest()
+            self._boundary_keys = {key for key, _ in self._manifest["boundary"]}
+            self._recover()
+            manifest = self._manifest
+            cursor_time = _parse_timestamp(manifest["cursor"])
+            batches: Dict[str, List[str]] = {}
+            new_keys: List[Tuple[Tuple[Any, ...], float]] = []
+            written = 0
+
+            for item in items:
+                key = _event_key(item)
+                if key in self._boundary_keys:
+                    continue
+                self._boundary_keys.add(key)
+                item_time = _parse_timestamp(item.get('timestamp'))
+                day = (
+                    datetime.fromtimestamp(item_time, UTC).strftime('%Y-%m-%d')
+                    if item_time is not None else _UNDATED_PARTITION
+                )
+                batches.setdefault(day, []).append(json.dumps(item, separators=(",", ":"), ensure_ascii=False, default=str))
+                self._update_partition(day, item, item_time)
+                if item_time is not None:
+                    new_keys.append((key, item_time))
+                    if cursor_time is None or item_time > cursor_time:
+                        cursor_time = item_time
+                        manifest["cursor"] = item['timestamp']
+                written += 1
+
+            for day, lines in batches.items():
+                info = manifest["partitions"][day]
+                data = ("\n".join(lines) + "\n").encode("utf-8")
+                with open(self._partition_path(day), "ab") as f:
+                    # Commit exactly what is written after the committed bytes
+                    offset = f.tell()
+                    if offset > info["bytes"]:
+                        f.truncate(info["bytes"])
+                        offset = info["bytes"]
+                    f.write(data)
+                info["bytes"] = offset + len(data)
+
+            if written:
+                self._retain_boundary(new_keys, cursor_time, overlap_seconds)
+                self._save_manifest()
+            return written
+
+    def query(
+        self,
+        text: Optional[str] = None,
+        category_type: Optional[str] = None,
+        category_name: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        action_type: Optional[str] = None,
+        session_id: Optional[str] = None,
+        status: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Filter archived items without contacting the API
+
+        Args:
+            text: Case-insensitive text to find in the item's values
+            category_type: Filter by category type
+            category_name: Filter by category name
+            resource_type: Filter by resource type
+            action_type: Filter by action type
+            session_id: Filter by session ID
+            status: Filter by status ('success' or 'failed')
+            start_time: Start time in RFC3339 format
+            end_time: End time in RFC3339 format
+            limit: Maximum number of items to return
+
+        Yields:
+            Matching items, oldest partition first
+        """
+        if status and status not in ['success', 'failed']:
+            raise ValueError("Status must be 'success' or 'failed'")
+
+        start = _parse_timestamp(start_time)
+        end = _parse_timestamp(end_time)
+        start_day = datetime.fromtimestamp(start, UTC).strftime('%Y-%m-%d') if start is not None else None
+        end_day = datetime.fromtimestamp(end, UTC).strftime('%Y-%m-%d') if end is not None else None
+        equals = {
+            name: value for name, value in (
+                ("category_type", category_type),
+                ("category_name", category_name),
+                ("resource_type", resource_type),
+                ("action_type", action_type),
+                ("session_id", session_id),
+            ) if value
+        }
+        needle = text.lower() if text else None
+        # Needles without characters JSON escapes can be checked on the raw line
+        raw_needle = needle if needle and needle.isprintable() and '"' not in needle and '\\' not in needle else None
+
+        count = 0
+        for day, info in self.partitions().items():
+            if day != _UNDATED_PARTITION:
+                if start_day and day < start_day or end_day and day > end_day:
+                    continue
+            if any(
+                name in equals and equals[name] not in info.get(name, [])
+                for name in _INDEXED_FIELDS
+            ):
+                continue
+
+            for line in self._read_partition(day, info["bytes"]):
+                # Cheap pre-check on the raw line before decoding it
+                if raw_needle and raw_needle not in line.lower():
+                    continue
+                item = json.loads(line)
+                if any(item.get(name) != value for name, value in equals.items()):
+                    continue
+                if start is not None or end is not None:
+                    item_time = _parse_timestamp(item.get('timestamp'))
+                    if item_time is None or (start is not None and item_time < start) or (
+                            end is not None and item_time > end):
+                        continue
+                if status and item.get('action_successful') is not (status == 'success'):
+                    continue
+                if needle and needle not in _searchable_text(item):
+                    continue
+                yield item
+                count += 1
+                if limit and count >= limit:
+                    return
+
+    # Private helpers
+
+    def _partition_path(self, day: str) -> str:
+        return os.path.join(self.path, f"{day}.jsonl")
+
+    def _update_partition(self, day: str, item: Dict[str, Any], item_time: Optional[float]) -> None:
+        info = self._manifest["partitions"].setdefault(
+            day, {"count": 0, "bytes": 0, "min_timestamp": None, "max_timestamp": None}
+        )
+        info["count"] += 1
+        timestamp = item.get('timestamp')
+        if item_time is not None:
+            if info["min_timestamp"] is None or item_time < _parse_timestamp(info["min_timestamp"]):
+                info["min_timestamp"] = timestamp
+            if info["max_timestamp"] is None or item_time > _parse_timestamp(info["max_timestamp"]):
+                info["max_timestamp"] = timestamp
+        for name in _INDEXED_FIELDS:
+            value = item.get(name)
+            if isinstance(value, str):
+                values = info.setdefault(name, [])
+                if value not in values:
+                    values.append(value)
+
+    def _retain_boundary(
+        self, new_keys: List[Tuple[Tuple[Any, ...], float]], cursor_time: Optional[float], overlap_seconds: float
+    ) -> None:
+        """Keep only the keys of items close enough to the cursor to be fetched again"""
+        if cursor_time is None:
+            return
+        # The same horizon resume_from starts the next sync at
+        horizon = _overlap_horizon(cursor_time, overlap_seconds)
+        previous = self._manifest["boundary"]
+        retained = [(key, ts) for key, ts in previous if ts >= horizon]
+        retained.extend((key, ts) for key, ts in new_keys if ts >= horizon)
+        self._manifest["boundary"] = retained
+        self._boundary_keys = {key for key, _ in retained}
+
+    def _read_partition(self, day: str, committed_bytes: int) -> Iterator[str]:
+        """Committed lines of a partition; bytes beyond the manifest are ignored"""
+        try:
+            with open(self._partition_path(day), "rb") as f:
+                data = f.read(committed_bytes)
+        except FileNotFoundError:
+            logger.warning(f"Audit archive partition {day} is missing")
+            return
+        for line in data.decode("utf-8").splitlines():
+            if line:
+                yield line
+
+    @contextmanager
+    def _writer_lock(self) -> Iterator[None]:
+        """Exclusive lock file serializing writers across processes"""
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.path, WRITER_LOCK_FILE), "a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _recover(self) -> None:
+        """Truncate partitions to the sizes recorded by the last committed manifest
+
+        Only called while holding the writer lock: beyond the manifest there
+        can then only be leftovers of an interrupted writer, including
+        partitions it created that no manifest lists yet.
+        """
+        partitions = self._manifest["partitions"]
+        for name in os.listdir(self.path):
+            day, ext = os.path.splitext(name)
+            if ext == ".jsonl" and day not in partitions:
+                logger.info(f"Removing uncommitted audit archive partition {day}")
+                os.remove(os.path.join(self.path, name))
+        for day, info in partitions.items():
+            file_path = self._partition_path(day)
+            if os.path.exists(file_path) and os.path.getsize(file_path) > info["bytes"]:
+                logger.info(f"Truncating uncommitted data in audit archive partition {day}")
+                with open(file_path, "r+b") as f:
+                    f.truncate(info["bytes"])
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        manifest_path = os.path.join(self.path, MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") != _MANIFEST_VERSION:
+                raise ValueError(f"Unsupported audit archive version: {manifest.get('version')}")
+            manifest["boundary"] = [(tuple(key), ts) for key, ts in manifest.get("boundary", [])]
+            return manifest
+        return {"version": _MANIFEST_VERSION, "cursor": None, "partitions": {}, "boundary": []}
+
+    def _save_manifest(self) -> None:
+        """Atomically replace the manifest"""
+        manifest_path = os.path.join(self.path, MANIFEST_FILE)
+        tmp_path = manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, separators=(",", ":"), default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, manifest_path)
@@ -332,3 +332,8 @@ class AgentNotFoundError(NotFoundError):
 class AgentValidationError(ValidationError):
     """Agent validation errors"""
     pass
+
+
+class AgentConflictError(AgentError):
+    """Agent was modified concurrently and the change could not be applied"""
+    pass
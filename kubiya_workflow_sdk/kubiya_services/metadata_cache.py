@@ -0,0 +1,142 @@
+"""
+Persistent on-disk cache for source metadata
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "kubiya")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS source_metadata (
+    namespace TEXT NOT NULL,
+    uuid TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (namespace, uuid)
+)
+"""
+
+
+class SourceMetadataCache:
+    """
+    SQLite-backed cache of source metadata keyed by source UUID and ``updated_at``.
+
+    Metadata stays valid for as long as the source's ``updated_at`` does not
+    change, so a new process can rebuild the tool catalog from disk and only
+    re-fetch the sources that changed since the last run. Entries are
+    namespaced per API endpoint and credentials so several orgs or users can
+    share one cache file. Safe to use from several threads and processes.
+
+    Args:
+        path: Database file path. Defaults to ``$KUBIYA_CACHE_DIR/source_metadata.db``
+            (``~/.cache/kubiya`` when the variable is unset).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            cache_dir = os.environ.get("KUBIYA_CACHE_DIR", DEFAULT_CACHE_DIR)
+            os.makedirs(cache_dir, exist_ok=True)
+            path = os.path.join(cache_dir, "source_metadata.db")
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        with self._lock, self._conn:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+
+    @staticmethod
+    def namespace_for(base_url: str, api_key: str) -> str:
+        """Derive a namespace from the API endpoint and credentials without storing the key"""
+        return hashlib.sha256(f"{base_url}\0{api_key}".encode("utf-8")).hexdigest()[:32]
+
+    def get_many(
+        self, namespace: str, uuids: Iterable[str]
+    ) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """
+        Load cached metadata for several sources
+
+        Args:
+            namespace: Cache namespace
+            uuids: Source UUIDs to look up
+
+        Returns:
+            Mapping of UUID to (cached updated_at, metadata) for the UUIDs found
+        """
+        uuids = list(uuids)
+        results: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(uuids), 500):
+            batch = uuids[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT uuid, updated_at, metadata FROM source_metadata "
+                    f"WHERE namespace = ? AND uuid IN ({placeholders})",
+                    [namespace, *batch],
+                ).fetchall()
+            for uuid, updated_at, metadata in rows:
+                try:
+                    results[uuid] = (updated_at, json.loads(metadata))
+                except ValueError:
+                    logger.debug(f"Ignoring corrupt cache entry for source {uuid}")
+        return results
+
+    def put(self, namespace: str, uuid: str, updated_at: str, metadata: Dict[str, Any]) -> None:
+        """Store metadata for a source version"""
+        self.put_many(namespace, [(uuid, updated_at, metadata)])
+
+    def put_many(self, namespace: str, entries: Iterable[Tuple[str, str, Dict[str, Any]]]) -> None:
+        """Store metadata for several source versions in one transaction"""
+        now = time.time()
+        rows = [
+            (namespace, uuid, updated_at or "", json.dumps(metadata, separators=(",", ":")), now)
+            for uuid, updated_at, metadata in entries
+        ]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO source_metadata (namespace, uuid, updated_at, metadata, stored_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def prune(self, namespace: str, keep_uuids: Iterable[str]) -> int:
+        """
+        Remove entries for sources that no longer exist
+
+        Returns:
+            Number of removed entries
+        """
+        keep = set(keep_uuids)
+        with self._lock:
+            cached = [row[0] for row in self._conn.execute(
+                "SELECT uuid FROM source_metadata WHERE namespace = ?", (namespace,)
+            )]
+        stale = [(namespace, uuid) for uuid in cached if uuid not in keep]
+        if stale:
+            with self._lock, self._conn:
+                self._conn.executemany("DELETE FROM source_metadata WHERE namespace = ? AND uuid = ?", stale)
+        return len(stale)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Remove all entries, or only those of one namespace"""
+        with self._lock, self._conn:
+            if namespace is None:
+                self._conn.execute("DELETE FROM source_metadata")
+            else:
+                self._conn.execute("DELETE FROM source_metadata WHERE namespace = ?", (namespace,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
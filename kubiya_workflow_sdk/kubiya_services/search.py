@@ -0,0 +1,213 @@
+"""
+In-memory search index over the tool catalog
+"""
+import heapq
+import math
+import re
+import threading
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset({"a", "an", "and", "the", "of", "to", "in", "for", "on", "with", "is", "by", "or"})
+
+# Field weights applied to term frequencies
+_NAME_WEIGHT = 3.0
+_ARG_WEIGHT = 0.5
+_DESCRIPTION_WEIGHT = 1.0
+
+# Query term expansion weights
+_PREFIX_WEIGHT = 0.8
+_MAX_EXPANSIONS = 5
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric tokens, dropping stopwords"""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def _trigrams(term: str) -> Set[str]:
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ToolSearchIndex:
+    """
+    BM25-ranked inverted index over tools, grouped by source
+
+    Tools are indexed by name, description and argument names. Query terms
+    that are not in the vocabulary are expanded to vocabulary terms they
+    prefix and, failing that, to terms with similar character trigrams, so
+    partial words and typos still match. Sources can be added, replaced and
+    removed individually, so the index is built once and kept up to date by
+    re-indexing only changed sources.
+
+    Args:
+        k1: BM25 term frequency saturation
+        b: BM25 document length normalization
+        fuzzy_threshold: Minimum trigram Jaccard similarity for fuzzy matches
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, fuzzy_threshold: float = 0.35):
+        self.k1 = k1
+        self.b = b
+        self.fuzzy_threshold = fuzzy_threshold
+
+        self._lock = threading.RLock()
+        self._next_id = 0
+        self._docs: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        self._doc_terms: Dict[int, Counter] = {}
+        self._doc_len: Dict[int, float] = {}
+        self._total_len = 0.0
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._vocab: List[str] = []
+        self._trigram_index: Dict[str, Set[str]] = defaultdict(set)
+        self._source_docs: Dict[str, List[int]] = {}
+        self.source_versions: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add_source(self, source: Dict[str, Any], tools: Iterable[Dict[str, Any]]) -> None:
+        """
+        Index (or re-index) the tools of a source
+
+        Args:
+            source: Source object; ``uuid`` identifies it and ``updated_at`` is recorded
+            tools: Tools of the source, including inline tools
+        """
+        source_uuid = source.get("uuid") or source.get("name") or ""
+        with self._lock:
+            self.remove_source(source_uuid)
+            doc_ids = []
+            for tool in tools:
+                doc_id = self._next_id
+                self._next_id += 1
+                self._add_doc(doc_id, tool, source)
+                doc_ids.append(doc_id)
+            self._source_docs[source_uuid] = doc_ids
+            self.source_versions[source_uuid] = source.get("updated_at") or ""
+
+    def remove_source(self, source_uuid: str) -> None:
+        """Remove all tools of a source from the index"""
+        with self._lock:
+            for doc_id in self._source_docs.pop(source_uuid, []):
+                self._remove_doc(doc_id)
+            self.source_versions.pop(source_uuid, None)
+
+    def _add_doc(self, doc_id: int, tool: Dict[str, Any], source: Dict[str, Any]) -> None:
+        terms: Counter = Counter()
+        for token in tokenize(tool.get("name") or ""):
+            terms[token] += _NAME_WEIGHT
+        for token in tokenize(tool.get("description") or ""):
+            terms[token] += _DESCRIPTION_WEIGHT
+        for arg in tool.get("args") or []:
+            if isinstance(arg, dict):
+                for token in tokenize(arg.get("name") or ""):
+                    terms[token] += _ARG_WEIGHT
+
+        self._docs[doc_id] = (tool, source)
+        self._doc_terms[doc_id] = terms
+        length = sum(terms.values())
+        self._doc_len[doc_id] = length
+        self._total_len += length
+
+        for term, tf in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                insort(self._vocab, term)
+                for gram in _trigrams(term):
+                    self._trigram_index[gram].add(term)
+            postings[doc_id] = tf
+
+    def _remove_doc(self, doc_id: int) -> None:
+        self._docs.pop(doc_id, None)
+        self._total_len -= self._doc_len.pop(doc_id, 0.0)
+        for term in self._doc_terms.pop(doc_id, ()):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+                del self._vocab[bisect_left(self._vocab, term)]
+                for gram in _trigrams(term):
+                    terms = self._trigram_index.get(gram)
+                    if terms is not None:
+                        terms.discard(term)
+                        if not terms:
+                            del self._trigram_index[gram]
+
+    def _expand(self, token: str) -> List[Tuple[str, float]]:
+        """Map a query token to (vocabulary term, weight) pairs"""
+        if token in self._postings:
+            return [(token, 1.0)]
+
+        # Prefix matches, e.g. "kube" -> "kubectl"
+        expansions = []
+        i = bisect_left(self._vocab, token)
+        while i < len(self._vocab) and len(expansions) < _MAX_EXPANSIONS and self._vocab[i].startswith(token):
+            expansions.append((self._vocab[i], _PREFIX_WEIGHT))
+            i += 1
+        if expansions:
+            return expansions
+
+        # Fuzzy matches by trigram overlap, e.g. "deploymnet" -> "deployment"
+        grams = _trigrams(token)
+        shared: Counter = Counter()
+        for gram in grams:
+            for term in self._trigram_index.get(gram, ()):
+                shared[term] += 1
+        candidates = []
+        for term, overlap in shared.items():
+            similarity = overlap / (len(grams) + len(term) + 1 - overlap)
+            if similarity >= self.fuzzy_threshold:
+                candidates.append((term, similarity))
+        return heapq.nlargest(_MAX_EXPANSIONS, candidates, key=lambda c: c[1])
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Rank tools against a query
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+
+        Returns:
+            List of ``{"tool", "source", "score", "distance"}`` dicts, best first.
+            ``distance`` is 0 when every query term matched exactly and counts
+            the terms that only matched by prefix or fuzzily otherwise.
+        """
+        with self._lock:
+            tokens = tokenize(query)
+            if not tokens or not self._docs:
+                return []
+
+            n_docs = len(self._docs)
+            avg_len = self._total_len / n_docs if n_docs else 1.0
+            scores: Dict[int, float] = defaultdict(float)
+            inexact: Dict[int, int] = defaultdict(int)
+
+            for token in tokens:
+                for term, weight in self._expand(token):
+                    postings = self._postings[term]
+                    idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for doc_id, tf in postings.items():
+                        norm = self.k1 * (1 - self.b + self.b * self._doc_len[doc_id] / avg_len)
+                        scores[doc_id] += weight * idf * tf * (self.k1 + 1) / (tf + norm)
+                        if weight < 1.0:
+                            inexact[doc_id] += 1
+
+            best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            results = []
+            for doc_id, score in best:
+                tool, source = self._docs[doc_id]
+                results.append({
+                    "tool": tool,
+                    "source": source,
+                    "score": round(score, 4),
+                    "distance": min(inexact.get(doc_id, 0), len(tokens)),
+                })
+            return results
@@ -1,16 +1,32 @@
 """
 Agent service for managing Kubiya agents
 """
+import concurrent.futures
+import copy
+import functools
 import logging
-from typing import Optional, Dict, Any, List
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Optional, Dict, Any, List, Callable, Generator, Iterable, Set, Union
 
 from kubiya_workflow_sdk import capture_exception
 from kubiya_workflow_sdk.kubiya_services.constants import Endpoints
-from kubiya_workflow_sdk.kubiya_services.exceptions import AgentError, ValidationError
+from kubiya_workflow_sdk.kubiya_services.exceptions import AgentConflictError, AgentError, ValidationError
 from kubiya_workflow_sdk.kubiya_services.services.base import BaseService
 
 logger = logging.getLogger(__name__)
 
+# Fields never sent back in an agent update
+_EXCLUDED_UPDATE_FIELDS = ("id", "uuid", "desc", "metadata")
+
+# list() sort names mapped to agent fields
+_AGENT_SORT_FIELDS = {"name": "name", "created": "created_at", "updated": "updated_at"}
+
+# Statuses signalling that the agent changed since it was read
+_CONFLICT_STATUSES = (409, 412)
+
 
 class _Access:
     """Service for managing agent access control"""
@@ -380,17 +396,17 @@ class _Prompt:
             Dictionary containing operation result
         """
         try:
-            current_agent = self.agent_service.get(agent_uuid)
-            current_instructions = current_agent.get("ai_instructions", "")
-
             new_content = self._get_content(content, file_path, url)
 
-            if current_instructions:
-                combined_instructions = f"{current_instructions}\n\n{new_content}"
-            else:
-                combined_instructions = new_content
+            def append_instructions(agent: Dict[str, Any]) -> None:
+                current_instructions = agent.get("ai_instructions", "")
+                if current_instructions:
+                    agent["ai_instructions"] = f"{current_instructions}\n\n{new_content}"
+                else:
+                    agent["ai_instructions"] = new_content
 
-            return self.agent_service.edit(agent_uuid, ai_instructions=combined_instructions)
+            # Read and write in one conditional round-trip so concurrent appends are not lost
+            return self.agent_service._modify(agent_uuid, [append_instructions])
         except Exception as e:
             error = AgentError(f"Failed to append AI instructions for agent {agent_uuid}: {str(e)}")
             capture_exception(error)
@@ -645,40 +661,7 @@ class AgentService(BaseService):
             Dictionary containing agents list and metadata
         """
         try:
-            # Get agents from API
-            endpoint = self._format_endpoint(Endpoints.AGENTS_LIST)
-            agents = self._get(endpoint).json()
-
-            # Apply filtering if requested
-            if filter_term:
-                filter_lower = filter_term.lower()
-                filtered = []
-                for agent in agents:
-                    if (filter_lower in agent.get('name', '').lower() or
-                            filter_lower in agent.get('description', '').lower() or
-                            filter_lower in agent.get('instruction_type', '').lower() or
-                            filter_lower in agent.get('llm_model', '').lower()):
-                        filtered.append(agent)
-                        continue
-
-                    # Check sources, integrations
-                    for integration in agent.get('integrations', []):
-                        if filter_lower in integration.lower():
-                            filtered.append(agent)
-                            break
-
-                agents = filtered
-
-            # Apply active filter if requested
-            if show_active:
-                # Filter based on agent status - this logic would need to be implemented
-                # based on your specific criteria for "active" agents
-                active_agents = []
-                for agent in agents:
-                    # Example criteria - adjust based on your requirements
-                    if agent.get('runners') and len(agent.get('sources', [])) > 0:
-                        active_agents.append(agent)
-                agents = active_agents
+            agents = list(self.iter_agents(filter_term=filter_term, show_active=show_active))
 
             # Apply sorting
             if sort_by == "name":
@@ -694,11 +677,67 @@ class AgentService(BaseService):
 
             return agents
 
+        except AgentError:
+            raise
         except Exception as e:
             error = AgentError(f"Failed to list agents: {str(e)}")
             capture_exception(error)
             raise error
 
+    def iter_agents(
+        self,
+        page_size: int = 100,
+        filter_term: str = "",
+        sort_by: Optional[str] = None,
+        show_active: bool = False
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Iterate over agents page by page, fetching the next page while the
+        current one is consumed.
+
+        The page size, filter term and sort order are sent to the server.
+        Agents are also matched against ``filter_term`` locally, so the
+        results are the same whether or not the server applies the filter.
+        Servers that ignore pagination return everything in the first
+        response, which is then streamed from memory. Stop iterating to
+        avoid downloading further pages.
+
+        Args:
+            page_size: Number of agents requested per page
+            filter_term: Filter agents by name, description, instruction type,
+                model or integration (partial, case-insensitive)
+            sort_by: Sort field forwarded to the server (name, created, updated);
+                the order of the results is the server's
+            show_active: Only yield agents with runners and sources
+
+        Yields:
+            Agent objects
+        """
+        endpoint = self._format_endpoint(Endpoints.AGENTS_LIST)
+        needle = filter_term.lower() if filter_term else ""
+        params: Dict[str, Any] = {}
+        if filter_term:
+            params["search"] = filter_term
+        if sort_by:
+            params["sort_by"] = _AGENT_SORT_FIELDS.get(sort_by, sort_by)
+
+        agents = self.paginate(
+            endpoint, params=params, style="offset", page_size=page_size, extract=_agents_from_response
+        )
+        try:
+            for agent in agents:
+                if needle and needle not in _agent_search_text(agent):
+                    continue
+                if show_active and not (agent.get('runners') and agent.get('sources')):
+                    continue
+                yield agent
+        except Exception as e:
+            error = AgentError(f"Failed to list agents: {str(e)}")
+            capture_exception(error)
+            raise error
+        finally:
+            agents.close()
+
     def get(self, agent_uuid: str) -> Dict[str, Any]:
         """
         Get detailed information about a specific agent.
@@ -873,89 +912,170 @@ class AgentService(BaseService):
             **kwargs: Additional fields to update
 
         Returns:
-            Dictionary containing updated agent details
-        """
+            Dictionary containing updated agent details. If the edit leaves the
+            agent as it is, nothing is written and the agent as read is returned
+        """
+        changes = {
+            "name": name,
+            "description": description,
+            "llm_model": llm_model,
+            "ai_instructions": ai_instructions,
+            "add_sources": add_sources,
+            "remove_sources": remove_sources,
+            "add_secrets": add_secrets,
+            "remove_secrets": remove_secrets,
+            "add_env_vars": add_env_vars,
+            "remove_env_vars": remove_env_vars,
+            "add_integrations": add_integrations,
+            "remove_integrations": remove_integrations,
+            "add_tools": add_tools,
+            "remove_tools": remove_tools,
+            "add_allowed_users": add_allowed_users,
+            "remove_allowed_users": remove_allowed_users,
+            "add_allowed_groups": add_allowed_groups,
+            "remove_allowed_groups": remove_allowed_groups,
+            "runners": runners,
+            **kwargs,
+        }
         try:
-            # Get current agent state
-            current_agent = self.get(agent_uuid)
+            return self._modify(agent_uuid, [functools.partial(self._apply_edit, changes=changes)])
 
-            # Update basic fields if provided
-            if name is not None:
-                current_agent["name"] = name
-            if description is not None:
-                current_agent["description"] = description
-            if llm_model is not None:
-                current_agent["llm_model"] = llm_model
-            if ai_instructions is not None:
-                current_agent["ai_instructions"] = ai_instructions
-            if runners is not None:
-                current_agent["runners"] = runners
+        except AgentConflictError:
+            raise
+        except Exception as e:
+            error = AgentError(f"Failed to edit agent {agent_uuid}: {str(e)}")
+            capture_exception(error)
+            raise error
 
-            # Handle list additions and removals
-            self._update_list_field(current_agent, "sources", add_sources, remove_sources)
-            self._update_list_field(current_agent, "secrets", add_secrets, remove_secrets)
-            self._update_list_field(current_agent, "integrations", add_integrations, remove_integrations)
-            self._update_list_field(current_agent, "tools", add_tools, remove_tools)
-            self._update_list_field(current_agent, "allowed_users", add_allowed_users, remove_allowed_users)
-            self._update_list_field(current_agent, "allowed_groups", add_allowed_groups, remove_allowed_groups)
+    def bulk_edit(
+        self,
+        selector: Union[str, Iterable[str], Dict[str, Any], Callable[[Dict[str, Any]], bool]],
+        changes: Dict[str, Any],
+        concurrency: int = 8,
+        dry_run: bool = False,
+        max_attempts: int = 3
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Apply the same changes to many agents concurrently.
 
-            # Handle environment variables
-            if add_env_vars or remove_env_vars:
-                env_vars = current_agent.get("environment_variables", {})
-                if env_vars is None:
-                    env_vars = {}
+        Agents are selected from ``list()`` unless explicit UUIDs are given.
+        Edits run on up to ``concurrency`` threads; the client's rate limiter
+        paces the requests. Each agent is written with the same conditional
+        read-modify-write as ``edit()``, and agents that would not change are
+        not written.
 
-                if add_env_vars:
-                    env_vars.update(add_env_vars)
+        Args:
+            selector: Which agents to edit: a filter term as accepted by
+                ``list()``, an iterable of agent UUIDs, a dict of field values
+                to match (list fields match if they contain the value), or a
+                predicate called with each agent
+            changes: Keyword arguments accepted by ``edit()``
+            concurrency: Maximum number of agents edited in parallel
+            dry_run: Only compute what would change, without writing
+            max_attempts: Attempts per agent when a concurrent modification is detected
+
+        Yields:
+            Per-agent results as they complete, containing:
+            - uuid, name: The agent
+            - status: 'updated', 'unchanged' (nothing written), 'planned' (dry run) or 'failed'
+            - changes: Field differences as {field: {"from": old, "to": new}}
+            - error: Error message for failed agents
+
+        Example:
+            for result in client.agents.bulk_edit({"llm_model": "claude-4-sonnet"}, {"llm_model": "claude-4-opus"}):
+                print(result["name"], result["status"])
+        """
+        if not changes:
+            raise ValidationError("No changes given")
 
-                if remove_env_vars:
-                    for key in remove_env_vars:
-                        env_vars.pop(key, None)
+        try:
+            agents = self._select_agents(selector)
+        except ValidationError:
+            raise
+        except Exception as e:
+            error = AgentError(f"Failed to select agents for bulk edit: {str(e)}")
+            capture_exception(error)
+            raise error
 
-                current_agent["environment_variables"] = env_vars
+        if not agents:
+            return
 
-            # Ensure environment_variables is not None to avoid 500 errors
-            if current_agent.get("environment_variables") is None:
-                current_agent["environment_variables"] = {}
-
-            # Create complete update payload matching
-            # Exclude problematic fields like "id", "desc", "uuid", "metadata"
-            update_data = {
-                "name": current_agent.get("name"),
-                "description": current_agent.get("description"),
-                "instruction_type": current_agent.get("instruction_type"),
-                "llm_model": current_agent.get("llm_model"),
-                "sources": current_agent.get("sources", []),
-                "environment_variables": current_agent.get("environment_variables", {}),
-                "secrets": current_agent.get("secrets", []),
-                "allowed_groups": current_agent.get("allowed_groups", []),
-                "allowed_users": current_agent.get("allowed_users", []),
-                "owners": current_agent.get("owners", []),
-                "runners": current_agent.get("runners", []),
-                "is_debug_mode": current_agent.get("is_debug_mode", False),
-                "ai_instructions": current_agent.get("ai_instructions", ""),
-                "image": current_agent.get("image", ""),
-                "managed_by": current_agent.get("managed_by", ""),
-                "integrations": current_agent.get("integrations", []),
-                "links": current_agent.get("links", []),
-                "tools": current_agent.get("tools", []),
-                "tasks": current_agent.get("tasks", []),
-                "tags": current_agent.get("tags", [])
-            }
+        workers = self._max_workers(min(max(1, concurrency), len(agents)))
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [executor.submit(self._bulk_edit_one, agent, changes, dry_run, max_attempts) for agent in agents]
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-            # Apply any additional kwargs to the update data
-            for key, value in kwargs.items():
-                if key not in ["id", "uuid", "desc", "metadata"]:  # Exclude problematic fields
-                    update_data[key] = value
+    def _select_agents(
+        self,
+        selector: Union[str, Iterable[str], Dict[str, Any], Callable[[Dict[str, Any]], bool]]
+    ) -> List[Dict[str, Any]]:
+        """Resolve a bulk edit selector to agent objects (or UUID-only stubs)"""
+        if isinstance(selector, str):
+            return self.list(filter_term=selector, limit=0)
+        if isinstance(selector, dict):
+            wanted = selector
+
+            def selector(agent: Dict[str, Any]) -> bool:
+                return all(_field_matches(agent.get(k), v) for k, v in wanted.items())
+
+        if callable(selector):
+            return [agent for agent in self.list(limit=0) if selector(agent)]
+        uuids = list(dict.fromkeys(selector))
+        if not all(isinstance(uuid, str) for uuid in uuids):
+            raise ValidationError("Selector must be a filter term, UUIDs, a field dict or a predicate")
+        return [{"uuid": uuid} for uuid in uuids]
+
+    def _bulk_edit_one(
+        self, agent: Dict[str, Any], changes: Dict[str, Any], dry_run: bool, max_attempts: int
+    ) -> Dict[str, Any]:
+        """Edit (or plan the edit of) one agent for ``bulk_edit`` without raising"""
+        agent_uuid = agent.get("uuid")
+        result: Dict[str, Any] = {"uuid": agent_uuid, "name": agent.get("name"), "changes": {}}
 
-            # Update the agent using PUT with complete payload
-            endpoint = self._format_endpoint(Endpoints.AGENT_UPDATE, agent_uuid=agent_uuid)
-            return self._put(endpoint, data=update_data).json()
+        def apply(current: Dict[str, Any]) -> Set[str]:
+            before = copy.deepcopy(self._update_payload(current, set()))
+            extra_fields = self._apply_edit(current, changes)
+            result["changes"] = _payload_diff(before, self._update_payload(current, extra_fields))
+            result["name"] = current.get("name")
+            return extra_fields
 
+        try:
+            if dry_run:
+                current = agent if "name" in agent else self.get(agent_uuid)
+                apply(copy.deepcopy(current))
+                result["status"] = "planned" if result["changes"] else "unchanged"
+            else:
+                self._modify(agent_uuid, [apply], max_attempts=max_attempts)
+                result["status"] = "updated" if result["changes"] else "unchanged"
         except Exception as e:
-            error = AgentError(f"Failed to edit agent {agent_uuid}: {str(e)}")
-            capture_exception(error)
-            raise error
+            result["status"] = "failed"
+            result["error"] = str(e)
+            logger.warning(f"Bulk edit of agent {agent_uuid} failed: {e}")
+        return result
+
+    def batch(self, max_attempts: int = 3, max_concurrent: int = 8) -> "AgentBatch":
+        """
+        Start a batch of agent changes that are applied with one read and one write per agent.
+
+        Args:
+            max_attempts: Attempts per agent when a concurrent modification is detected
+            max_concurrent: Maximum number of agents written in parallel
+
+        Returns:
+            AgentBatch collecting the changes until ``commit()``
+
+        Example:
+            with client.agents.batch() as batch:
+                batch.edit(agent_uuid, add_allowed_users=["alice"], add_env_vars={"LOG_LEVEL": "debug"})
+                batch.edit(agent_uuid, add_tools=["kubectl"])
+                batch.edit(other_uuid, llm_model="gpt-4o")
+            batch.result
+        """
+        return AgentBatch(self, max_attempts=max_attempts, max_concurrent=max_concurrent)
 
     def model(self, agent_uuid: str, llm_model: str) -> Dict[str, Any]:
         """
@@ -1008,6 +1128,9 @@ class AgentService(BaseService):
         remove_items: Optional[List[str]]
     ) -> None:
         """Update a list field by adding and removing items."""
+        if not add_items and not remove_items:
+            return
+
         current_list = data.get(field_name, [])
 
         if add_items:
@@ -1021,3 +1144,267 @@ class AgentService(BaseService):
             current_list = [item for item in current_list if item not in remove_items]
 
         data[field_name] = current_list
+
+    def _apply_edit(self, agent: Dict[str, Any], changes: Dict[str, Any]) -> Set[str]:
+        """
+        Apply ``edit()`` keyword arguments to an agent object in place
+
+        Returns:
+            Names of additional fields set from extra keyword arguments
+        """
+        changes = dict(changes)
+        for field in ("name", "description", "llm_model", "ai_instructions", "runners"):
+            value = changes.pop(field, None)
+            if value is not None:
+                agent[field] = value
+
+        for field in ("sources", "secrets", "integrations", "tools", "allowed_users", "allowed_groups"):
+            self._update_list_field(agent, field, changes.pop(f"add_{field}", None), changes.pop(f"remove_{field}", None))
+
+        add_env_vars = changes.pop("add_env_vars", None)
+        remove_env_vars = changes.pop("remove_env_vars", None)
+        if add_env_vars or remove_env_vars:
+            env_vars = agent.get("environment_variables") or {}
+            if add_env_vars:
+                env_vars.update(add_env_vars)
+            for key in remove_env_vars or []:
+                env_vars.pop(key, None)
+            agent["environment_variables"] = env_vars
+
+        extra_fields = set()
+        for key, value in changes.items():
+            if key not in _EXCLUDED_UPDATE_FIELDS:
+                agent[key] = value
+                extra_fields.add(key)
+        return extra_fields
+
+    def _update_payload(self, agent: Dict[str, Any], extra_fields: Set[str]) -> Dict[str, Any]:
+        """Build the complete PUT payload for an agent"""
+        # Exclude problematic fields like "id", "desc", "uuid", "metadata"
+        update_data = {
+            "name": agent.get("name"),
+            "description": agent.get("description"),
+            "instruction_type": agent.get("instruction_type"),
+            "llm_model": agent.get("llm_model"),
+            "sources": agent.get("sources", []),
+            # Ensure environment_variables is not None to avoid 500 errors
+            "environment_variables": agent.get("environment_variables") or {},
+            "secrets": agent.get("secrets", []),
+            "allowed_groups": agent.get("allowed_groups", []),
+            "allowed_users": agent.get("allowed_users", []),
+            "owners": agent.get("owners", []),
+            "runners": agent.get("runners", []),
+            "is_debug_mode": agent.get("is_debug_mode", False),
+            "ai_instructions": agent.get("ai_instructions", ""),
+            "image": agent.get("image", ""),
+            "managed_by": agent.get("managed_by", ""),
+            "integrations": agent.get("integrations", []),
+            "links": agent.get("links", []),
+            "tools": agent.get("tools", []),
+            "tasks": agent.get("tasks", []),
+            "tags": agent.get("tags", [])
+        }
+        for key in extra_fields:
+            update_data[key] = agent[key]
+        return update_data
+
+    def _modify(
+        self,
+        agent_uuid: str,
+        operations: List[Callable[[Dict[str, Any]], Optional[Set[str]]]],
+        max_attempts: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Read an agent once, apply operations to it and write it once
+
+        The write is conditional on the version that was read (``If-Match``
+        with the ETag, or ``If-Unmodified-Since`` from ``updated_at``). If the
+        server reports a concurrent modification (409/412), the agent is read
+        again and the operations are re-applied.
+
+        Raises:
+            AgentConflictError: If the agent kept changing for ``max_attempts`` attempts
+        """
+        get_endpoint = self._format_endpoint(Endpoints.AGENT_GET, agent_uuid=agent_uuid)
+        update_endpoint = self._format_endpoint(Endpoints.AGENT_UPDATE, agent_uuid=agent_uuid)
+
+        for attempt in range(max_attempts):
+            response = self._get(get_endpoint, headers={"Cache-Control": "no-cache"})
+            agent = response.json()
+            original = copy.deepcopy(agent)
+
+            extra_fields: Set[str] = set()
+            for operation in operations:
+                extra_fields |= operation(agent) or set()
+
+            if agent == original:
+                # Nothing to change; skip the write and return the agent as read
+                return agent
+
+            headers = _precondition_headers(response.headers.get("ETag"), agent.get("updated_at"))
+            try:
+                return self._put(update_endpoint, data=self._update_payload(agent, extra_fields), headers=headers).json()
+            except Exception as e:
+                if getattr(e, "status_code", None) not in _CONFLICT_STATUSES:
+                    raise
+                logger.info(f"Agent {agent_uuid} was modified concurrently, retrying (attempt {attempt + 1})")
+                time.sleep(random.uniform(0, 0.1 * 2 ** attempt))
+
+        error = AgentConflictError(
+            f"Agent {agent_uuid} was modified concurrently {max_attempts} times; changes not applied"
+        )
+        capture_exception(error)
+        raise error
+
+
+class AgentBatch:
+    """
+    Collects changes for one or many agents and applies them together
+
+    Every agent in the batch is read once, all of its queued changes are
+    applied in order, and it is written once. Agents are committed in
+    parallel, and each write is retried from a fresh read when the server
+    reports a concurrent modification. Used as a context manager, the batch
+    commits on a clean exit and stores the outcome in ``result``.
+
+    Args:
+        agent_service: AgentService used for the requests
+        max_attempts: Attempts per agent when a concurrent modification is detected
+        max_concurrent: Maximum number of agents written in parallel
+    """
+
+    def __init__(self, agent_service: AgentService, max_attempts: int = 3, max_concurrent: int = 8):
+        self.agent_service = agent_service
+        self.max_attempts = max_attempts
+        self.max_concurrent = max_concurrent
+        self.result: Optional[Dict[str, Any]] = None
+        self._operations: Dict[str, List[Callable[[Dict[str, Any]], Optional[Set[str]]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def __enter__(self) -> "AgentBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self._operations = {}
+
+    def edit(self, agent_uuid: str, **changes) -> "AgentBatch":
+        """
+        Queue changes for an agent
+
+        Args:
+            agent_uuid: UUID of the agent
+            **changes: Keyword arguments accepted by ``AgentService.edit``
+
+        Returns:
+            The batch, for chaining
+        """
+        if not changes:
+            raise ValidationError("No changes given")
+        operation = functools.partial(self.agent_service._apply_edit, changes=changes)
+        self._operations.setdefault(agent_uuid, []).append(operation)
+        return self
+
+    def update(self, agent_uuid: str, operation: Callable[[Dict[str, Any]], None]) -> "AgentBatch":
+        """
+        Queue a function that modifies the agent object in place
+
+        Use this for changes that depend on the current state, e.g. appending
+        to the AI instructions. The function runs again on each retry.
+
+        Returns:
+            The batch, for chaining
+        """
+        self._operations.setdefault(agent_uuid, []).append(operation)
+        return self
+
+    def commit(self) -> Dict[str, Any]:
+        """
+        Apply all queued changes
+
+        Returns:
+            Dictionary containing:
+            - updated: Updated agent objects keyed by UUID (as read, for agents
+              the changes left as they were, which are not written)
+            - failed: Error messages keyed by UUID
+            - success: Whether every agent was updated
+        """
+        operations, self._operations = self._operations, {}
+        updated: Dict[str, Any] = {}
+        failed: Dict[str, str] = {}
+
+        if operations:
+            workers = self.agent_service._max_workers(min(self.max_concurrent, len(operations)))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self.agent_service._modify, agent_uuid, ops, self.max_attempts): agent_uuid
+                    for agent_uuid, ops in operations.items()
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    agent_uuid = futures[future]
+                    try:
+                        updated[agent_uuid] = future.result()
+                    except Exception as e:
+                        failed[agent_uuid] = str(e)
+                        logger.warning(f"Failed to update agent {agent_uuid}: {e}")
+
+        self.result = {"updated": updated, "failed": failed, "success": not failed}
+        return self.result
+
+
+def _agents_from_response(result: Any) -> List[Dict[str, Any]]:
+    """Agents of a list response, whether a plain list or wrapped in an object"""
+    if isinstance(result, dict) and isinstance(result.get("agents"), list):
+        return result["agents"]
+    if isinstance(result, list):
+        return result
+    if isinstance(result, dict):
+        return result.get("items") or result.get("data") or []
+    return []
+
+
+def _agent_search_text(agent: Dict[str, Any]) -> str:
+    """Lowercased text a filter term is matched against, computed once per agent"""
+    parts = [
+        agent.get('name') or '',
+        agent.get('description') or '',
+        agent.get('instruction_type') or '',
+        agent.get('llm_model') or '',
+    ]
+    parts.extend(integration for integration in agent.get('integrations') or [] if isinstance(integration, str))
+    return "\n".join(parts).lower()
+
+
+def _field_matches(value: Any, expected: Any) -> bool:
+    """Selector match: equality, or membership for list fields"""
+    if isinstance(value, list) and not isinstance(expected, list):
+        return expected in value
+    return value == expected
+
+
+def _payload_diff(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Fields that differ between two update payloads"""
+    return {
+        key: {"from": before.get(key), "to": after.get(key)}
+        for key in sorted(set(before) | set(after))
+        if before.get(key) != after.get(key)
+    }
+
+
+def _precondition_headers(etag: Optional[str], updated_at: Optional[str]) -> Dict[str, str]:
+    """Conditional request headers pinning a write to the version that was read"""
+    if etag:
+        return {"If-Match": etag}
+    if updated_at:
+        try:
+            modified = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
+        except ValueError:
+            return {}
+        if modified.tzinfo is None:
+            modified = modified.replace(tzinfo=timezone.utc)
+        return {"If-Unmodified-Since": format_datetime(modified.astimezone(timezone.utc), usegmt=True)}
+    return {}
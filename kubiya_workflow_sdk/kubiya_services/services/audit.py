@@ -1,12 +1,21 @@
 """
 Audit service for managing audit logs and monitoring
 """
+import concurrent.futures
 import json
 import logging
-from typing import Optional, Dict, Any, Union, Generator, List
+import time
+from collections import OrderedDict, deque
+from typing import Optional, Deque, Dict, Any, Union, Generator, List, Tuple
 from datetime import datetime, timedelta, UTC
 
 from kubiya_workflow_sdk import capture_exception
+from kubiya_workflow_sdk.kubiya_services.audit_archive import (
+    AuditArchive,
+    _event_key,
+    _parse_timestamp,
+    _searchable_text,
+)
 from kubiya_workflow_sdk.kubiya_services.constants import Endpoints
 from kubiya_workflow_sdk.kubiya_services.exceptions import AuditError
 from kubiya_workflow_sdk.kubiya_services.services.base import BaseService
@@ -16,6 +25,8 @@ logger = logging.getLogger(__name__)
 
 class AuditService(BaseService):
     """Service for managing audit logs and monitoring"""
+    # Server support for the stream endpoint; None until the first attempt
+    _audit_stream_supported: Optional[bool] = None
 
     def list(
         self,
@@ -122,9 +133,23 @@ class AuditService(BaseService):
         start_time: Optional[str] = None,
         timeout_minutes: Optional[int] = None,
         verbose: bool = True,
+        page_size: int = 100,
+        poll_interval: float = 3.0,
+        min_poll_interval: float = 0.5,
+        max_poll_interval: float = 30.0,
+        overlap_seconds: float = 5.0,
+        use_stream: Optional[bool] = None,
     ) -> Generator[Dict[str, Any], None, None]:
         """
-        Stream audit logs in real-time using polling.
+        Stream audit logs in real-time.
+
+        Uses the server's audit stream endpoint when it is available and falls
+        back to polling otherwise. Each poll pages through every item newer
+        than the last one seen, so bursts larger than a page are not lost.
+        Polls re-read a short overlap before the cursor to pick up late
+        writes, and duplicates are dropped with a set of recent event keys
+        that is bounded to a time window behind the cursor. The poll interval
+        shrinks while events arrive and grows while the log is idle.
 
         Args:
             category_type: Filter by category type
@@ -135,6 +160,13 @@ class AuditService(BaseService):
             start_time: Start time in RFC3339 format (default: 5 minutes ago)
             timeout_minutes: Auto-stop streaming after specified minutes
             verbose: Include verbose logging information
+            page_size: Number of items requested per page when polling
+            poll_interval: Initial seconds between polls
+            min_poll_interval: Lower bound for the adaptive poll interval
+            max_poll_interval: Upper bound for the adaptive poll interval
+            overlap_seconds: How far before the cursor each poll starts
+            use_stream: Force (True) or disable (False) the stream endpoint;
+                by default it is tried once and remembered if unsupported
 
         Yields:
             Dict[str, Any]: Individual audit log entries as they arrive
@@ -142,8 +174,6 @@ class AuditService(BaseService):
         Raises:
             AuditError: If the audit stream fails to start
         """
-        import time
-
         try:
             # Set default start time if not provided (5 minutes ago)
             if not start_time:
@@ -153,112 +183,33 @@ class AuditService(BaseService):
             if start_time:
                 self._validate_time_format(start_time)
 
-            # Track processed events to avoid duplicates
-            processed_events = set()
-            latest_timestamp = start_time
-            poll_count = 0
-            poll_interval = 3
-            start_poll_time = datetime.now(UTC)
+            filters = {
+                "category_type": category_type,
+                "category_name": category_name,
+                "resource_type": resource_type,
+                "action_type": action_type,
+                "session_id": session_id,
+            }
+            cursor = _AuditCursor(start_time, window=max(60.0, overlap_seconds * 4))
 
             # Calculate end time if timeout is specified
-            end_time = None
+            deadline = None
             if timeout_minutes:
-                end_time = datetime.now(UTC) + timedelta(minutes=timeout_minutes)
+                deadline = time.monotonic() + timeout_minutes * 60
 
             if verbose:
                 logger.info(f"Initial timestamp filter: {start_time}")
 
-            while True:
-                # Check timeout
-                if end_time and datetime.now(UTC) >= end_time:
-                    if verbose:
-                        logger.info(f"Streaming stopped after timeout ({timeout_minutes} minutes)")
-                    break
-
-                poll_count += 1
-
-                # Build query parameters for current poll
-                query = self._build_audit_query(
-                    category_type=category_type,
-                    category_name=category_name,
-                    resource_type=resource_type,
-                    action_type=action_type,
-                    session_id=session_id,
-                    start_time=latest_timestamp,
-                    page=1,
-                    page_size=50,
-                    sort_direction="desc"
-                )
-
-                if verbose or poll_count % 10 == 0:
-                    logger.info(f"Poll attempt #{poll_count} - timestamp filter: {latest_timestamp}")
+            if use_stream or (use_stream is None and self._audit_stream_supported is not False):
+                yield from self._stream_audit_items(filters, cursor, deadline, verbose)
 
-                try:
-                    # Poll for new audit items using regular list endpoint
-                    endpoint = self._build_audit_endpoint(Endpoints.AUDIT_LIST, query)
-                    response = self._get(endpoint=endpoint)
-
-                    # Parse response
-                    if hasattr(response, 'json'):
-                        try:
-                            result = response.json()
-                        except:
-                            if verbose:
-                                logger.error("Failed to parse audit response during streaming")
-                            time.sleep(poll_interval)
-                            continue
-                    else:
-                        result = response
-
-                    # Extract items
-                    if isinstance(result, dict) and 'items' in result:
-                        audit_items = result['items']
-                    elif isinstance(result, list):
-                        audit_items = result
-                    else:
-                        audit_items = []
-
-                    if verbose and len(audit_items) > 0:
-                        logger.info(f"Found {len(audit_items)} events in poll #{poll_count}")
-
-                    # Process items if any found
-                    if audit_items:
-                        for item in audit_items:
-                            # Create event key to avoid duplicates
-                            event_key = f"{item.get('timestamp', '')}-{item.get('category_type', '')}-{item.get('category_name', '')}-{item.get('action_type', '')}"
-
-                            # Skip if we've already processed this event
-                            if event_key in processed_events:
-                                continue
-
-                            # Mark this event as processed
-                            processed_events.add(event_key)
-
-                            # Update latest timestamp if newer
-                            item_timestamp = item.get('timestamp', '')
-                            if item_timestamp > latest_timestamp:
-                                latest_timestamp = item_timestamp
-                                if verbose:
-                                    logger.info(f"Updated timestamp filter to: {latest_timestamp}")
-
-                            # Yield the audit event
-                            yield item
-
-                    elif verbose and poll_count % 5 == 0:
-                        # Show periodic "no events" message in verbose mode
-                        elapsed = datetime.now(UTC) - start_poll_time
-                        logger.info(f"No new events found after {elapsed.total_seconds():.0f}s")
-
-                except Exception as poll_error:
-                    # Only show polling errors in verbose mode
-                    if verbose:
-                        logger.error(f"Error polling for audit items: {poll_error}")
-                    # Continue polling even if one poll fails
-                    time.sleep(poll_interval)
-                    continue
+            yield from self._poll_audit_items(
+                filters, cursor, deadline, verbose, page_size,
+                poll_interval, min_poll_interval, max_poll_interval, overlap_seconds,
+            )
 
-                # Wait for next poll
-                time.sleep(poll_interval)
+            if verbose and timeout_minutes:
+                logger.info(f"Streaming stopped after timeout ({timeout_minutes} minutes)")
 
         except KeyboardInterrupt:
             if verbose:
@@ -269,6 +220,296 @@ class AuditService(BaseService):
             capture_exception(error)
             raise error
 
+    def _stream_audit_items(
+        self,
+        filters: Dict[str, Any],
+        cursor: "_AuditCursor",
+        deadline: Optional[float],
+        verbose: bool,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Yield items from the stream endpoint until it ends, fails or the deadline passes"""
+        query = self._build_audit_query(**filters, start_time=cursor.timestamp, sort_direction="asc")
+        endpoint = self._build_audit_endpoint(Endpoints.AUDIT_STREAM, query)
+        try:
+            for event in self.client.stream_events("GET", endpoint):
+                self._audit_stream_supported = True
+                payload = event.json()
+                items = payload.get("items") if isinstance(payload, dict) and "items" in payload else [payload]
+                for item in items:
+                    if isinstance(item, dict) and cursor.accept(item):
+                        yield item
+                if deadline is not None and time.monotonic() >= deadline:
+                    return
+        except Exception as e:
+            if getattr(e, "status_code", None) in (404, 405, 501):
+                self._audit_stream_supported = False
+                if verbose:
+                    logger.info("Audit stream endpoint not available, polling instead")
+            elif verbose:
+                logger.warning(f"Audit stream interrupted, polling instead: {e}")
+
+    def _poll_audit_items(
+        self,
+        filters: Dict[str, Any],
+        cursor: "_AuditCursor",
+        deadline: Optional[float],
+        verbose: bool,
+        page_size: int,
+        interval: float,
+        min_interval: float,
+        max_interval: float,
+        overlap_seconds: float,
+        max_pages: int = 50,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Poll the list endpoint, paging through everything after the cursor"""
+        poll_count = 0
+        while deadline is None or time.monotonic() < deadline:
+            poll_count += 1
+            query_start = cursor.query_start(overlap_seconds)
+            if verbose or poll_count % 10 == 0:
+                logger.info(f"Poll attempt #{poll_count} - timestamp filter: {query_start}")
+
+            new_items = 0
+            backlog = False
+            try:
+                for page in range(1, max_pages + 1):
+                    query = self._build_audit_query(
+                        **filters,
+                        start_time=query_start,
+                        page=page,
+                        page_size=page_size,
+                        sort_direction="asc",
+                    )
+                    endpoint = self._build_audit_endpoint(Endpoints.AUDIT_LIST, query)
+                    result = self._get(endpoint=endpoint).json()
+                    audit_items = self._handle_list_response(result) if isinstance(result, (dict, list)) else []
+
+                    for item in audit_items:
+                        if cursor.accept(item):
+                            new_items += 1
+                            yield item
+
+                    if len(audit_items) < page_size:
+                        break
+                else:
+                    # More pages remain; continue from the advanced cursor right away
+                    backlog = True
+
+                if backlog:
+                    interval = 0.0
+                elif new_items:
+                    interval = max(min_interval, interval / 2)
+                else:
+                    interval = min(max_interval, max(min_interval, interval * 1.5))
+
+                if verbose and new_items:
+                    logger.info(f"Found {new_items} new events in poll #{poll_count}")
+
+            except Exception as poll_error:
+                # Only show polling errors in verbose mode
+                if verbose:
+                    logger.error(f"Error polling for audit items: {poll_error}")
+                # Continue polling even if one poll fails, backing off
+                interval = min(max_interval, max(min_interval, interval * 2))
+
+            # Wait for next poll
+            if deadline is not None:
+                interval = min(interval, max(0.0, deadline - time.monotonic()))
+            if interval > 0:
+                time.sleep(interval)
+
+    def query(
+        self,
+        text: Optional[str] = None,
+        category_type: Optional[str] = None,
+        category_name: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        action_type: Optional[str] = None,
+        session_id: Optional[str] = None,
+        status: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_direction: str = "desc",
+        page_size: int = 100,
+        prefetch: int = 2,
+        max_pages: Optional[int] = None,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Iterate over all audit items matching a query, across pages.
+
+        Filters, the time window, text and status are sent to the API. While
+        the caller consumes one page, up to ``prefetch`` following pages are
+        fetched concurrently. Text and status are re-checked client-side in
+        case the server ignores them, matching against the item's string
+        fields.
+
+        Args:
+            text: Text to search for in audit logs
+            category_type: Filter by category type
+            category_name: Filter by category name
+            resource_type: Filter by resource type
+            action_type: Filter by action type
+            session_id: Filter by session ID
+            status: Filter by status ('success', 'failed', or None)
+            start_time: Start time in RFC3339 format (default: 24 hours ago)
+            end_time: End time in RFC3339 format
+            filters: Additional server-side filter fields
+            sort_direction: Sort direction ('asc' or 'desc')
+            page_size: Number of items per page
+            prefetch: Number of pages fetched ahead of the caller
+            max_pages: Stop after this many pages
+
+        Yields:
+            Dict[str, Any]: Matching audit log entries
+
+        Raises:
+            AuditError: If a page cannot be fetched
+            ValueError: If a time or the status is invalid
+        """
+        if not start_time:
+            start_time = (datetime.now(UTC) - timedelta(hours=24)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        self._validate_time_format(start_time)
+        if end_time:
+            self._validate_time_format(end_time)
+        if status and status not in ['success', 'failed']:
+            raise ValueError("Status must be 'success' or 'failed'")
+
+        query = self._build_audit_query(
+            category_type=category_type,
+            category_name=category_name,
+            resource_type=resource_type,
+            action_type=action_type,
+            session_id=session_id,
+            start_time=start_time,
+            end_time=end_time,
+            page_size=page_size,
+            sort_direction=sort_direction
+        )
+        if filters:
+            query["filter"].update(filters)
+        if text:
+            query['search_text'] = text
+        if status:
+            query['status_filter'] = status
+
+        needle = text.lower() if text else None
+        try:
+            for items in self._iter_audit_pages(query, prefetch, max_pages):
+                for item in items:
+                    if needle and needle not in _searchable_text(item):
+                        continue
+                    if status and item.get('action_successful') is not (status == 'success'):
+                        continue
+                    yield item
+        except (AuditError, ValueError):
+            raise
+        except Exception as e:
+            error = AuditError(f"Failed to query audit logs: {str(e)}")
+            capture_exception(error)
+            raise error
+
+    def _iter_audit_pages(
+        self,
+        query: Dict[str, Any],
+        prefetch: int,
+        max_pages: Optional[int] = None,
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """Yield pages of items in order while the following pages are fetched concurrently"""
+        page_size = query["page_size"]
+        first_page = query.get("page", 1)
+        last_page = first_page + max_pages - 1 if max_pages else None
+
+        def fetch(page: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+            endpoint = self._build_audit_endpoint(Endpoints.AUDIT_LIST, {**query, "page": page})
+            result = self._get(endpoint=endpoint).json()
+            total_pages = None
+            if isinstance(result, dict) and isinstance(result.get("pagination"), dict):
+                pagination = result["pagination"]
+                total_pages = pagination.get("total_pages") or pagination.get("pages")
+            return self._handle_list_response(result), total_pages
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers(max(1, prefetch)))
+        pending: Deque[concurrent.futures.Future] = deque()
+        next_page = first_page
+        try:
+            while True:
+                while len(pending) <= prefetch and (last_page is None or next_page <= last_page):
+                    pending.append(executor.submit(fetch, next_page))
+                    next_page += 1
+                if not pending:
+                    return
+
+                items, total_pages = pending.popleft().result()
+                if total_pages:
+                    bound = int(total_pages)
+                    last_page = bound if last_page is None else min(last_page, bound)
+                yield items
+                if len(items) < page_size:
+                    return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def sync_to(
+        self,
+        path: str,
+        start_time: Optional[str] = None,
+        page_size: int = 500,
+        prefetch: int = 2,
+        overlap_seconds: float = 5.0,
+    ) -> Dict[str, Any]:
+        """
+        Incrementally mirror audit items into a local archive.
+
+        The first sync downloads everything since ``start_time``; later syncs
+        only fetch items from the archive's cursor onwards (minus a short
+        overlap for late writes, de-duplicated on append). Query the result
+        offline with ``AuditArchive(path).query(...)``.
+
+        Args:
+            path: Archive directory
+            start_time: Start time in RFC3339 format for an empty archive
+                (default: 30 days ago)
+            page_size: Number of items per page
+            prefetch: Number of pages fetched ahead while writing
+            overlap_seconds: How far before the cursor the sync starts
+
+        Returns:
+            Dictionary with the number of items fetched and written, the new
+            cursor and the total archive size
+
+        Raises:
+            AuditError: If the sync fails
+        """
+        try:
+            archive = AuditArchive(path)
+            since = archive.resume_from(overlap_seconds) or start_time or (
+                datetime.now(UTC) - timedelta(days=30)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+            fetched = 0
+            written = 0
+            query = self._build_audit_query(start_time=since, page_size=page_size, sort_direction="asc")
+            for items in self._iter_audit_pages(query, prefetch):
+                fetched += len(items)
+                # Each page is committed on its own, so an interrupted sync resumes where it stopped
+                written += archive.append(items, overlap_seconds=overlap_seconds)
+
+            logger.info(f"Audit sync from {since}: fetched {fetched}, stored {written} new items")
+            return {
+                "fetched": fetched,
+                "written": written,
+                "cursor": archive.cursor,
+                "total": len(archive),
+                "path": path,
+            }
+
+        except Exception as e:
+            if isinstance(e, (AuditError, ValueError)):
+                raise e
+            error = AuditError(f"Failed to sync audit logs: {str(e)}")
+            capture_exception(error)
+            raise error
+
     def describe(
         self,
         audit_id: str,
@@ -312,39 +553,24 @@ class AuditService(BaseService):
                 # If direct GET fails, try searching through recent items
                 logger.warning(f"Direct audit get failed, searching through recent items: {direct_get_error}")
 
-                # Search through recent items (last 7 days)
+                # Search recent items (last 7 days), asking the API to filter by ID
                 search_start_time = (datetime.now(UTC) - timedelta(days=7)).strftime('%Y-%m-%dT%H:%M:%SZ')
-
-                query = self._build_audit_query(
+                matches = self.query(
                     start_time=search_start_time,
-                    page=1,
-                    page_size=1000,  # Large page size to search more items
-                    sort_direction="desc"
+                    filters={"id": audit_id},
+                    page_size=100,
+                    max_pages=10,
                 )
-
-                endpoint = self._build_audit_endpoint(Endpoints.AUDIT_LIST, query)
-                response = self._get(endpoint=endpoint)
-
-                if hasattr(response, 'json'):
-                    try:
-                        search_result = response.json()
-                    except:
-                        error = AuditError("Failed to parse audit search response")
-                        capture_exception(error)
-                        raise error
-                else:
-                    search_result = response
-
-                # Search for the item with matching ID
-                items = search_result.get('items', []) if isinstance(search_result, dict) else search_result
-
-                for item in items:
-                    # Check various potential ID fields
-                    if (item.get('id') == audit_id or
-                            item.get('audit_id') == audit_id or
-                            item.get('event_id') == audit_id or
-                            str(item.get('timestamp')) == audit_id):
-                        return item
+                try:
+                    for item in matches:
+                        # Check various potential ID fields
+                        if (item.get('id') == audit_id or
+                                item.get('audit_id') == audit_id or
+                                item.get('event_id') == audit_id or
+                                str(item.get('timestamp')) == audit_id):
+                            return item
+                finally:
+                    matches.close()
 
                 # If not found
                 error = AuditError(f"Audit event with ID '{audit_id}' not found")
@@ -536,15 +762,7 @@ class AuditService(BaseService):
     def _filter_items_by_text(self, items: List[Dict[str, Any]], text: str) -> List[Dict[str, Any]]:
         """Filter items by text search (case-insensitive)"""
         text_lower = text.lower()
-        filtered_items = []
-
-        for item in items:
-            # Search in all string fields of the item
-            item_str = json.dumps(item, default=str).lower()
-            if text_lower in item_str:
-                filtered_items.append(item)
-
-        return filtered_items
+        return [item for item in items if text_lower in _searchable_text(item)]
 
     def _filter_items_by_status(self, items: List[Dict[str, Any]], status: str) -> List[Dict[str, Any]]:
         """Filter items by success/failure status"""
@@ -591,3 +809,53 @@ class AuditService(BaseService):
             return f"{base_endpoint}?{query_string}"
         else:
             return base_endpoint
+
+
+class _AuditCursor:
+    """
+    High-water mark of a stream plus the keys of recently yielded events
+
+    Keys are forgotten once their timestamp falls more than ``window`` seconds
+    behind the high-water mark (or the set exceeds ``max_keys``), which keeps
+    memory bounded on long-running tails while still covering the overlap
+    that polls re-read.
+    """
+
+    def __init__(self, start_time: str, window: float = 60.0, max_keys: int = 10000):
+        self.timestamp = start_time
+        self.window = window
+        self.max_keys = max_keys
+        self._high_water = _parse_timestamp(start_time) or 0.0
+        self._recent: "OrderedDict[Tuple[Any, ...], float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def accept(self, item: Dict[str, Any]) -> bool:
+        """Record an item; returns False if it was already yielded"""
+        key = _event_key(item)
+        if key in self._recent:
+            return False
+
+        item_time = _parse_timestamp(item.get('timestamp'))
+        if item_time is None:
+            item_time = self._high_water
+        elif item_time > self._high_water:
+            self._high_water = item_time
+            self.timestamp = item['timestamp']
+        self._recent[key] = item_time
+
+        horizon = self._high_water - self.window
+        while self._recent:
+            oldest = next(iter(self._recent.values()))
+            if oldest >= horizon and len(self._recent) <= self.max_keys:
+                break
+            self._recent.popitem(last=False)
+        return True
+
+    def query_start(self, overlap_seconds: float) -> str:
+        """Lower timestamp bound for the next poll"""
+        if not self._recent:
+            return self.timestamp
+        start = datetime.fromtimestamp(self._high_water - overlap_seconds, UTC)
+        return start.strftime('%Y-%m-%dT%H:%M:%SZ')
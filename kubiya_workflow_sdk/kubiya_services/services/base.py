@@ -1,24 +1,31 @@
 """
 Base service class for all Kubiya SDK services
 """
-
+import asyncio
+import concurrent.futures
+import logging
 from abc import ABC
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from collections import deque
+from typing import (
+    TYPE_CHECKING, Any, AsyncGenerator, Callable, Deque, Dict, Generator, List, Optional, Tuple, Union
+)
 from kubiya_workflow_sdk.kubiya_services.exceptions import KubiyaAPIError, ValidationError
 
 if TYPE_CHECKING:
-    from kubiya_workflow_sdk import KubiyaClient
+    from kubiya_workflow_sdk import KubiyaClient, AsyncKubiyaClient
+
+logger = logging.getLogger(__name__)
 
 
 class BaseService(ABC):
     """Base class for all service classes"""
     
-    def __init__(self, client: 'KubiyaClient'):
+    def __init__(self, client: Union['KubiyaClient', 'AsyncKubiyaClient']):
         """
         Initialize base service
         
         Args:
-            client: KubiyaClient instance
+            client: KubiyaClient or AsyncKubiyaClient instance
         """
         self.client = client
     
@@ -47,6 +54,140 @@ class BaseService(ABC):
         except KeyError as e:
             raise ValidationError(f"Missing parameter for endpoint: {e}")
     
+    def _max_workers(self, requested: int) -> int:
+        """Cap a bulk operation's worker count at the client's current concurrency limit"""
+        limiter = getattr(self.client, "rate_limiter", None)
+        if limiter is None:
+            return max(1, requested)
+        return max(1, min(requested, limiter.concurrency_limit))
+
+    def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        style: str = "page",
+        page_size: int = 100,
+        page_param: Optional[str] = None,
+        size_param: str = "limit",
+        method: str = "GET",
+        extract: Optional[Callable[[Any], List[Any]]] = None,
+        prefetch: int = 1,
+        max_pages: Optional[int] = None,
+    ) -> Generator[Any, None, None]:
+        """
+        Iterate over the items of a paginated list endpoint
+
+        Supports page-numbered (``page=1, 2, ...``), offset (``offset=0,
+        page_size, ...``) and cursor-based endpoints. While the caller
+        consumes one page, up to ``prefetch`` following pages are fetched in
+        the background (a cursor endpoint can only fetch the next one).
+        Prefetching starts once the first page has shown that the server
+        pages, so an endpoint returning its whole list is fetched once.
+        Only the pages in flight are held in memory, and breaking out of the
+        loop cancels pages that have not started yet.
+
+        Iteration ends on an empty or short page, when the reported total
+        number of pages is reached, when a cursor endpoint returns no next
+        cursor, or when the server ignores pagination and repeats the first
+        page (logged as a warning, since the listing may be incomplete).
+
+        Args:
+            endpoint: List endpoint
+            params: Additional query parameters (request body for POST)
+            style: Pagination style: "page", "offset" or "cursor"
+            page_size: Number of items requested per page
+            page_param: Name of the page, offset or cursor parameter
+                (defaults to the style name)
+            size_param: Name of the page size parameter
+            method: HTTP method, "GET" or "POST"
+            extract: Returns the items of a decoded response
+                (defaults to the "items"/"data" list or the response itself)
+            prefetch: Number of pages fetched ahead of the caller (0 disables)
+            max_pages: Maximum number of pages to fetch
+
+        Yields:
+            Items in server order
+        """
+        walker = _PageWalker(style, params, page_size, page_param, size_param, max_pages)
+        extract = extract or self._handle_list_response
+
+        def fetch(query: Dict[str, Any]) -> Tuple[List[Any], Any]:
+            if method.upper() == "POST":
+                result = self._post(endpoint, data=query, stream=False).json()
+            else:
+                result = self._get(endpoint, params=query).json()
+            return extract(result), result
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers(max(1, prefetch)))
+        pending: Deque[concurrent.futures.Future] = deque()
+        try:
+            while True:
+                while len(pending) <= walker.prefetch_depth(prefetch) and walker.can_request():
+                    pending.append(executor.submit(fetch, walker.next_request()))
+                if not pending:
+                    return
+                items, result = pending.popleft().result()
+                more = walker.page_received(items, result)
+                # Start the next pages (for a cursor endpoint, the next one) before yielding
+                while more and len(pending) < prefetch and walker.can_request():
+                    pending.append(executor.submit(fetch, walker.next_request()))
+                yield from items
+                if not more:
+                    return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def apaginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        style: str = "page",
+        page_size: int = 100,
+        page_param: Optional[str] = None,
+        size_param: str = "limit",
+        method: str = "GET",
+        extract: Optional[Callable[[Any], List[Any]]] = None,
+        prefetch: int = 1,
+        max_pages: Optional[int] = None,
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Async counterpart of ``paginate`` for services bound to an AsyncKubiyaClient
+
+        Prefetched pages are fetched as tasks on the running event loop and
+        cancelled when the generator is closed. Use
+        ``contextlib.aclosing`` when breaking out of the loop early so the
+        pending requests are cancelled right away.
+        """
+        walker = _PageWalker(style, params, page_size, page_param, size_param, max_pages)
+        extract = extract or self._handle_list_response
+
+        async def fetch(query: Dict[str, Any]) -> Tuple[List[Any], Any]:
+            if method.upper() == "POST":
+                response = await self._apost(endpoint, data=query)
+            else:
+                response = await self._aget(endpoint, params=query)
+            result = response.json()
+            return extract(result), result
+
+        pending: Deque[asyncio.Task] = deque()
+        try:
+            while True:
+                while len(pending) <= walker.prefetch_depth(prefetch) and walker.can_request():
+                    pending.append(asyncio.ensure_future(fetch(walker.next_request())))
+                if not pending:
+                    return
+                items, result = await pending.popleft()
+                more = walker.page_received(items, result)
+                while more and len(pending) < prefetch and walker.can_request():
+                    pending.append(asyncio.ensure_future(fetch(walker.next_request())))
+                for item in items:
+                    yield item
+                if not more:
+                    return
+        finally:
+            for task in pending:
+                task.cancel()
+
     def _stream_request(self, method: str, endpoint: str, **kwargs):
         """Make streaming request"""
         return self.client.make_request(method=method, endpoint=endpoint, stream=True, **kwargs)
@@ -70,3 +211,144 @@ class BaseService(ABC):
     def _patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None, **kwargs):
         """Make PATCH request"""
         return self.client.make_request(method="PATCH", endpoint=endpoint, data=data, **kwargs)
+
+    # Async counterparts, available when the service is bound to an AsyncKubiyaClient
+
+    async def _astream_request(self, method: str, endpoint: str, **kwargs):
+        """Make async streaming request"""
+        return await self.client.make_request(method=method, endpoint=endpoint, stream=True, **kwargs)
+
+    async def _aget(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs):
+        """Make async GET request"""
+        return await self.client.make_request(method="GET", endpoint=endpoint, params=params, **kwargs)
+
+    async def _apost(self, endpoint: str, data: Optional[Dict[str, Any]] = None, **kwargs):
+        """Make async POST request"""
+        return await self.client.make_request(method="POST", endpoint=endpoint, data=data, **kwargs)
+
+    async def _aput(self, endpoint: str, data: Optional[Dict[str, Any]] = None, **kwargs):
+        """Make async PUT request"""
+        return await self.client.make_request(method="PUT", endpoint=endpoint, data=data, **kwargs)
+
+    async def _adelete(self, endpoint: str, **kwargs):
+        """Make async DELETE request"""
+        return await self.client.make_request(method="DELETE", endpoint=endpoint, **kwargs)
+
+    async def _apatch(self, endpoint: str, data: Optional[Dict[str, Any]] = None, **kwargs):
+        """Make async PATCH request"""
+        return await self.client.make_request(method="PATCH", endpoint=endpoint, data=data, **kwargs)
+
+
+_PAGINATION_STYLES = ("page", "offset", "cursor")
+
+# Response fields that may carry the cursor of the next page
+_NEXT_CURSOR_FIELDS = ("next_cursor", "next_page_token", "cursor")
+
+
+class _PageWalker:
+    """Request parameters and stop conditions of one paginated listing"""
+
+    def __init__(
+        self,
+        style: str,
+        params: Optional[Dict[str, Any]],
+        page_size: int,
+        page_param: Optional[str],
+        size_param: str,
+        max_pages: Optional[int],
+    ):
+        if style not in _PAGINATION_STYLES:
+            raise ValidationError(f"Pagination style must be one of {', '.join(_PAGINATION_STYLES)}")
+        if page_size < 1:
+            raise ValidationError("Page size must be positive")
+        self.style = style
+        self.params = dict(params or {})
+        self.page_size = page_size
+        self.page_param = page_param or style
+        self.size_param = size_param
+        self.last_index = max_pages - 1 if max_pages else None
+        self.next_index = 0
+        self.cursor: Optional[str] = None
+        self.awaiting_cursor = False
+        self.finished = False
+        self.first_item: Any = None
+
+    def prefetch_depth(self, prefetch: int) -> int:
+        """Pages to request ahead; none until the first page shows the server pages"""
+        return prefetch if self.first_item is not None else 0
+
+    def can_request(self) -> bool:
+        if self.finished or self.awaiting_cursor:
+            return False
+        return self.last_index is None or self.next_index <= self.last_index
+
+    def next_request(self) -> Dict[str, Any]:
+        query = {**self.params, self.size_param: self.page_size}
+        if self.style == "page":
+            query[self.page_param] = self.next_index + 1
+        elif self.style == "offset":
+            query[self.page_param] = self.next_index * self.page_size
+        else:
+            if self.cursor is not None:
+                query[self.page_param] = self.cursor
+            self.awaiting_cursor = True
+        self.next_index += 1
+        return query
+
+    def page_received(self, items: List[Any], result: Any) -> bool:
+        """Record a page in request order; returns whether more pages may follow"""
+        if not items:
+            self.finished = True
+            return False
+        if self.first_item is None:
+            self.first_item = items[0]
+        elif items[0] == self.first_item:
+            # The server answers every request with the first page. A whole
+            # list that is exactly one page long looks the same as a server
+            # honouring the page size but not the page parameter, so say so.
+            logger.warning(
+                f"Server repeated the first page when asked for a later {self.page_param}; "
+                f"it appears to ignore pagination, so the listing may be incomplete"
+            )
+            items.clear()
+            self.finished = True
+            return False
+
+        if self.style == "cursor":
+            self.awaiting_cursor = False
+            cursor = _next_cursor(result)
+            # A server echoing the cursor it was given would loop forever
+            self.finished = not cursor or cursor == self.cursor
+            self.cursor = cursor
+        else:
+            total_pages = _total_pages(result)
+            if total_pages:
+                bound = total_pages - 1
+                self.last_index = bound if self.last_index is None else min(self.last_index, bound)
+            # A short page is the last one; a longer one means paging was ignored
+            self.finished = len(items) != self.page_size
+        return not self.finished
+
+
+def _next_cursor(result: Any) -> Optional[str]:
+    """Cursor of the next page from a list response, if there is one"""
+    if not isinstance(result, dict):
+        return None
+    for container in (result, result.get("pagination"), result.get("meta")):
+        if isinstance(container, dict):
+            for field in _NEXT_CURSOR_FIELDS:
+                value = container.get(field)
+                if isinstance(value, (str, int)) and value != "":
+                    return str(value)
+    return None
+
+
+def _total_pages(result: Any) -> Optional[int]:
+    """Total number of pages reported by a list response, if any"""
+    if not isinstance(result, dict) or not isinstance(result.get("pagination"), dict):
+        return None
+    value = result["pagination"].get("total_pages") or result["pagination"].get("pages")
+    try:
+        return int(value) if value else None
+    except (TypeError, ValueError):
+        return None
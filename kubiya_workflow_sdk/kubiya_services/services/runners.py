@@ -108,65 +108,37 @@ class RunnerService(BaseService):
         def fetch_health(runner):
             """Fetch health status for a single runner"""
             try:
-                # Use the formatted endpoint for health check
-                endpoint = self._format_endpoint(Endpoints.RUNNER_HEALTH, runner_name=runner.get('name'))
-                response = self._get(endpoint=endpoint)
-
-                # Handle response format
-                if hasattr(response, 'json'):
-                    try:
-                        health_data = response.json()
-                    except:
-                        # If parsing fails, skip updating health
-                        return runner
-                else:
-                    health_data = response
-
-                # Initialize runner_health if not exists
-                if 'runner_health' not in runner:
-                    runner['runner_health'] = {}
-
-                # Update runner health information
-                runner['runner_health']['status'] = health_data.get('status', 'unknown')
-                runner['runner_health']['health'] = health_data.get('health', 'unknown')
-                runner['runner_health']['version'] = health_data.get('version', '')
-
-                # Update tool manager health from checks
-                for check in health_data.get('checks', []):
-                    if check.get('name') == 'tool-manager':
-                        runner['tool_manager_health'] = {
-                            'status': check.get('status'),
-                            'version': check.get('version'),
-                            'error': check.get('error', '')
-                        }
-                    elif check.get('name') == 'agent-manager':
-                        runner['agent_manager_health'] = {
-                            'status': check.get('status'),
-                            'version': check.get('version'),
-                            'error': check.get('error', '')
-                        }
+                # Pooled health-check session shared with get_runners_with_health
+                health_data = self.client.fetch_runner_health(runner.get('name'))
             except Exception:
                 # Silently fail, health status will remain as unknown
-                pass
-
+                return runner
+
+            # Initialize runner_health if not exists
+            if 'runner_health' not in runner:
+                runner['runner_health'] = {}
+
+            # Update runner health information
+            runner['runner_health']['status'] = health_data.get('status', 'unknown')
+            runner['runner_health']['health'] = health_data.get('health', 'unknown')
+            runner['runner_health']['version'] = health_data.get('version', '')
+
+            # Update tool manager health from checks
+            for check in health_data.get('checks', []):
+                if check.get('name') == 'tool-manager':
+                    runner['tool_manager_health'] = {
+                        'status': check.get('status'),
+                        'version': check.get('version'),
+                        'error': check.get('error', '')
+                    }
+                elif check.get('name') == 'agent-manager':
+                    runner['agent_manager_health'] = {
+                        'status': check.get('status'),
+                        'version': check.get('version'),
+                        'error': check.get('error', '')
+                    }
             return runner
 
-        # Use ThreadPoolExecutor for concurrent health checks
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            # Submit all health check tasks
-            future_to_runner = {
-                executor.submit(fetch_health, runner): runner
-                for runner in runners
-            }
-
-            # Collect results
-            updated_runners = []
-            for future in concurrent.futures.as_completed(future_to_runner):
-                try:
-                    updated_runner = future.result()
-                    updated_runners.append(updated_runner)
-                except Exception:
-                    # If health check fails, keep the original runner
-                    updated_runners.append(future_to_runner[future])
-
-        return updated_runners
+        # Health checks run concurrently; map keeps the runners in list order
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers(5)) as executor:
+            return list(executor.map(fetch_health, runners))
@@ -15,6 +15,7 @@ from typing import Optional, Dict, Any, List, Union
 from kubiya_workflow_sdk import capture_exception
 from kubiya_workflow_sdk.kubiya_services.constants import Endpoints
 from kubiya_workflow_sdk.kubiya_services.exceptions import SourceError, SourceNotFoundError, SourceValidationError
+from kubiya_workflow_sdk.kubiya_services.metadata_cache import SourceMetadataCache
 from kubiya_workflow_sdk.kubiya_services.services.base import BaseService
 
 logger = logging.getLogger(__name__)
@@ -211,16 +212,23 @@ class SourceService(BaseService):
         full: bool = False,
         debug: bool = False,
         fetch_metadata: bool = False,
-        max_concurrent: int = 10
+        max_concurrent: int = 10,
+        stale_ok: bool = False
     ) -> List[Dict[str, Any]]:
         """
         List all sources with optional metadata fetching
 
+        When the client has a ``metadata_cache``, metadata is read from disk for
+        every source whose ``updated_at`` is unchanged and only changed or new
+        sources are fetched.
+
         Args:
             full: Fetch full metadata for each source
             debug: Enable debug output
             fetch_metadata: Whether to fetch metadata for sources
             max_concurrent: Maximum concurrent metadata requests
+            stale_ok: Return previously cached metadata for changed sources
+                immediately and refresh them in the background
 
         Returns:
             List of source objects
@@ -247,10 +255,89 @@ class SourceService(BaseService):
 
         # Fetch metadata if requested
         if full or fetch_metadata:
-            self.__fetch_metadata_concurrent(sources, max_concurrent, debug)
+            cache = getattr(self.client, "metadata_cache", None)
+            if cache is not None:
+                self.__fetch_metadata_cached(cache, sources, max_concurrent, debug, stale_ok)
+            else:
+                self.__fetch_metadata_concurrent(sources, max_concurrent, debug)
 
         return sources
 
+    def __fetch_metadata_cached(
+        self,
+        cache: SourceMetadataCache,
+        sources: List[Dict[str, Any]],
+        max_concurrent: int,
+        debug: bool = False,
+        stale_ok: bool = False
+    ):
+        """
+        Fill source metadata from the on-disk cache, fetching only what changed
+
+        Args:
+            cache: Persistent metadata cache
+            sources: List of source objects to fill
+            max_concurrent: Maximum number of concurrent requests
+            debug: Enable debug output
+            stale_ok: Serve outdated entries now and refresh them in the background
+        """
+        namespace = cache.namespace_for(self.client.base_url, self.client.api_key)
+        cached = cache.get_many(namespace, [s['uuid'] for s in sources if s.get('uuid')])
+
+        to_fetch = []
+        to_refresh = []
+        for source in sources:
+            entry = cached.get(source.get('uuid'))
+            if entry is None:
+                to_fetch.append(source)
+                continue
+            cached_updated_at, metadata = entry
+            if cached_updated_at == (source.get('updated_at') or ''):
+                source.update(metadata)
+            elif stale_ok:
+                # Refresh a copy so the returned object is never mutated concurrently
+                to_refresh.append(dict(source))
+                source.update(metadata)
+            else:
+                to_fetch.append(source)
+
+        if debug:
+            logger.info(
+                f"Source metadata cache: {len(sources) - len(to_fetch) - len(to_refresh)} current, "
+                f"{len(to_refresh)} stale, {len(to_fetch)} to fetch"
+            )
+
+        if to_fetch:
+            fetched = self.__fetch_metadata_concurrent(to_fetch, max_concurrent, debug)
+            self.__store_metadata(cache, namespace, to_fetch, fetched)
+
+        if to_refresh:
+            def refresh():
+                try:
+                    fetched = self.__fetch_metadata_concurrent(to_refresh, max_concurrent, debug)
+                    self.__store_metadata(cache, namespace, to_refresh, fetched)
+                except Exception as e:
+                    logger.warning(f"Background source metadata refresh failed: {e}")
+
+            self._refresh_thread = threading.Thread(target=refresh, name="kubiya-source-refresh", daemon=True)
+            self._refresh_thread.start()
+
+        cache.prune(namespace, [s['uuid'] for s in sources if s.get('uuid')])
+
+    @staticmethod
+    def __store_metadata(
+        cache: SourceMetadataCache,
+        namespace: str,
+        sources: List[Dict[str, Any]],
+        fetched: Dict[str, Dict[str, Any]]
+    ):
+        """Persist freshly fetched metadata keyed by each source's list ``updated_at``"""
+        cache.put_many(namespace, [
+            (source['uuid'], source.get('updated_at') or '', fetched[source['uuid']])
+            for source in sources
+            if source.get('uuid') in fetched
+        ])
+
     def __get_metadata(
         self,
         uuid: str
@@ -276,7 +363,9 @@ class SourceService(BaseService):
         else:
             return response
 
-    def __fetch_metadata_concurrent(self, sources: List[Dict[str, Any]], max_concurrent: int, debug: bool = False):
+    def __fetch_metadata_concurrent(
+        self, sources: List[Dict[str, Any]], max_concurrent: int, debug: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Fetch metadata for sources concurrently using ThreadPoolExecutor
 
@@ -284,15 +373,20 @@ class SourceService(BaseService):
             sources: List of source objects to fetch metadata for
             max_concurrent: Maximum number of concurrent requests
             debug: Enable debug output
+
+        Returns:
+            Metadata of the successfully fetched sources, keyed by UUID
         """
         if not sources:
-            return
+            return {}
 
         # Adjust concurrency based on source count
         if max_concurrent <= 0:
             max_concurrent = 10  # Default
         if max_concurrent > len(sources):
             max_concurrent = len(sources)
+        # Stay within the client-wide concurrency limit
+        max_concurrent = self._max_workers(max_concurrent)
 
         # Progress tracking
         progress = {
@@ -300,6 +394,7 @@ class SourceService(BaseService):
             'successful': 0,
             'failed': 0,
             'error_sources': [],
+            'fetched': {},
             'lock': threading.Lock()
         }
 
@@ -314,6 +409,7 @@ class SourceService(BaseService):
                 with progress['lock']:
                     progress['completed'] += 1
                     progress['successful'] += 1
+                    progress['fetched'][sources[index]['uuid']] = metadata
                     sources[index].update(metadata)
 
                     if debug:
@@ -340,6 +436,8 @@ class SourceService(BaseService):
                 for name in progress['error_sources']:
                     logger.warning(f"  - {name}")
 
+        return progress['fetched']
+
     def scan(
         self,
         source_url: str,
@@ -1,16 +1,20 @@
 """
 Tool service for managing tools
 """
+import concurrent.futures
 import json
 import logging
 import os
 import shutil
+import threading
+import time
 import uuid
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, Iterator, List, Tuple, Union
 
 from kubiya_workflow_sdk import capture_exception
 from kubiya_workflow_sdk.kubiya_services.constants import Endpoints
 from kubiya_workflow_sdk.kubiya_services.exceptions import ToolExecutionError, ToolNotFoundError, ToolGenerationError
+from kubiya_workflow_sdk.kubiya_services.search import ToolSearchIndex
 from kubiya_workflow_sdk.kubiya_services.services.base import BaseService
 
 logger = logging.getLogger(__name__)
@@ -19,15 +23,26 @@ logger = logging.getLogger(__name__)
 class ToolService(BaseService):
     """Service for managing tools"""
 
+    # Seconds between checks of the source list for catalog changes
+    index_ttl = 60.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._search_index = ToolSearchIndex()
+        self._index_checked_at: Optional[float] = None
+        self._index_lock = threading.Lock()
+
     def list(
         self,
         source_uuid: Optional[str] = None,
+        max_concurrent: int = 10,
     ) -> Union[List[Dict[str, Any]], str]:
         """
         List tools from all sources or a specific source
 
         Args:
             source_uuid: Optional source UUID to list tools from specific source
+            max_concurrent: Maximum concurrent metadata requests
 
         Returns:
             List of tools or JSON string
@@ -36,22 +51,15 @@ class ToolService(BaseService):
             if source_uuid:
                 # Get tools from specific source
                 source = self._get_source_metadata(source_uuid)
-                tools = source.get("tools", [])
                 # Also include inline tools if available
-                tools.extend(source.get("inline_tools", []))
+                tools = _source_tools(source)
             else:
-                # Get tools from all sources
+                # Get tools from all sources, keeping the source order
                 sources = self._list_sources()
-                tools = []
-
-                for source in sources:
-                    try:
-                        metadata = self._get_source_metadata(source["uuid"])
-                        tools.extend(metadata.get("tools", []))
-                        tools.extend(metadata.get("inline_tools", []))
-                    except Exception:
-                        # Continue if one source fails
-                        continue
+                by_source = {}
+                for index, _, metadata in self._iter_source_metadata(sources, max_concurrent):
+                    by_source[index] = _source_tools(metadata)
+                tools = [tool for index in sorted(by_source) for tool in by_source[index]]
 
             return tools
 
@@ -60,87 +68,155 @@ class ToolService(BaseService):
             capture_exception(error)
             raise error
 
+    def iter_tools(
+        self,
+        source_uuid: Optional[str] = None,
+        max_concurrent: int = 10,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield tools as soon as the metadata of their source arrives
+
+        Sources are fetched concurrently and their tools are yielded in the
+        order the sources respond. Closing the generator early cancels the
+        requests that have not started yet.
+
+        Args:
+            source_uuid: Optional source UUID to list tools from specific source
+            max_concurrent: Maximum concurrent metadata requests
+
+        Yields:
+            Tool objects
+        """
+        try:
+            if source_uuid:
+                results = [(0, {"uuid": source_uuid}, self._get_source_metadata(source_uuid))]
+            else:
+                results = self._iter_source_metadata(self._list_sources(), max_concurrent)
+        except Exception as e:
+            error = ToolExecutionError(f"Failed to list tools: {str(e)}")
+            capture_exception(error)
+            raise error
+
+        for _, _, metadata in results:
+            yield from _source_tools(metadata)
+
     def search(
         self,
-        query: str
+        query: str,
+        limit: int = 10,
+        refresh: bool = False
     ) -> Union[List[Dict[str, Any]], str]:
         """
         Search for tools by query
 
+        Queries are answered from an in-memory index of the tool catalog. The
+        index is built on first use and afterwards only re-fetches metadata for
+        sources whose ``updated_at`` changed, at most once per ``index_ttl``
+        seconds.
+
         Args:
             query: Search query
+            limit: Maximum number of matches
+            refresh: Check sources for changes even if the index is still fresh
 
         Returns:
             List of matching tools with scores or JSON string
         """
         try:
-            query_lower = query.lower()
-            matches = []
-
-            # Get all sources
-            sources = self._list_sources()
+            index = self._ensure_search_index(force=refresh)
+            return index.search(query, limit=limit)
 
-            # Pre-filter sources based on name/description prefix match
-            relevant_sources = []
-            for source in sources:
-                source_name = source.get("name", "").lower()
-                source_desc = source.get("description", "").lower()
+        except Exception as e:
+            error = ToolExecutionError(f"Failed to search tools: {str(e)}")
+            capture_exception(error)
+            raise error
 
-                if (query_lower in source_name or query_lower in source_desc or
-                        any(source_name.startswith(word) or source_desc.startswith(word)
-                            for word in query_lower.split())):
-                    relevant_sources.append(source)
+    def _ensure_search_index(self, force: bool = False) -> ToolSearchIndex:
+        """Build the search index or bring it up to date with changed sources"""
+        with self._index_lock:
+            now = time.monotonic()
+            if not force and self._index_checked_at is not None and now - self._index_checked_at < self.index_ttl:
+                return self._search_index
+
+            sources = [s for s in self._list_sources() if s.get("uuid")]
+            index = self._search_index
+            changed = [
+                s for s in sources
+                if index.source_versions.get(s["uuid"]) != (s.get("updated_at") or "")
+            ]
+
+            for source_uuid in set(index.source_versions) - {s["uuid"] for s in sources}:
+                index.remove_source(source_uuid)
+
+            for _, source, metadata in self._iter_source_metadata(changed):
+                index.add_source(source, _source_tools(metadata))
+
+            if changed:
+                logger.debug(f"Tool search index: re-indexed {len(changed)} of {len(sources)} sources")
+            self._index_checked_at = now
+            return index
+
+    def _iter_source_metadata(
+        self, sources: List[Dict[str, Any]], max_concurrent: int = 10, include_failed: bool = False
+    ) -> Iterator[Tuple[int, Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """
+        Fetch source metadata concurrently, yielding results as they complete
 
-            # If no relevant sources found, search all sources
-            if not relevant_sources:
-                relevant_sources = sources
+        When the client has a ``metadata_cache``, sources whose ``updated_at``
+        is unchanged are served from disk first and fetched metadata is
+        stored for the next process. Failed sources are logged and skipped,
+        or yielded with None metadata when ``include_failed`` is set. Closing
+        the generator cancels the fetches that have not started.
 
-            # Search through relevant sources
-            for source in relevant_sources:
+        Yields:
+            (index in ``sources``, source, metadata) tuples in completion order
+        """
+        if not sources:
+            return
+
+        to_fetch = list(enumerate(sources))
+        cache = getattr(self.client, "metadata_cache", None)
+        if cache is not None:
+            namespace = cache.namespace_for(self.client.base_url, self.client.api_key)
+            cached = cache.get_many(namespace, [s["uuid"] for s in sources if s.get("uuid")])
+            to_fetch = []
+            for index, source in enumerate(sources):
+                entry = cached.get(source.get("uuid"))
+                if entry is not None and entry[0] == (source.get("updated_at") or ""):
+                    yield index, source, entry[1]
+                else:
+                    to_fetch.append((index, source))
+            if not to_fetch:
+                return
+
+        def fetch(source):
+            return self._get_source_metadata(source["uuid"])
+
+        workers = self._max_workers(min(max(1, max_concurrent), len(to_fetch)))
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = {executor.submit(fetch, source): index for index, source in to_fetch}
+            for future in concurrent.futures.as_completed(futures):
+                index = futures[future]
                 try:
-                    metadata = self._get_source_metadata(source["uuid"])
-
-                    # Search through tools
-                    for tool in metadata.get("tools", []):
-                        tool_name = tool.get("name", "").lower()
-                        tool_desc = tool.get("description", "").lower()
-
-                        # Prioritize exact matches
-                        if query_lower in tool_name or query_lower in tool_desc:
-                            distance = 0
-                        else:
-                            # Calculate Levenshtein distance for close matches
-                            name_distance = self._levenshtein_distance(tool_name, query_lower)
-                            desc_distance = self._levenshtein_distance(tool_desc, query_lower)
-                            distance = min(name_distance, desc_distance)
-
-                        if distance <= len(query_lower) // 2:
-                            matches.append({
-                                "tool": tool,
-                                "source": source,
-                                "distance": distance
-                            })
-
-                except Exception:
+                    metadata = future.result()
+                except Exception as e:
+                    logger.debug(f"Skipping source {sources[index].get('name')}: {e}")
+                    if include_failed:
+                        yield index, sources[index], None
                     continue
-
-            # Sort by distance (lower is better), then by name
-            matches.sort(key=lambda x: (x["distance"], x["tool"].get("name", "")))
-
-            # Limit to top 10 matches
-            matches = matches[:10]
-
-            return matches
-
-        except Exception as e:
-            error = ToolExecutionError(f"Failed to search tools: {str(e)}")
-            capture_exception(error)
-            raise error
+                if cache is not None:
+                    source = sources[index]
+                    cache.put(namespace, source["uuid"], source.get("updated_at") or "", metadata)
+                yield index, sources[index], metadata
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def describe(
         self,
         tool_name: str,
-        source_uuid: Optional[str] = None
+        source_uuid: Optional[str] = None,
+        max_concurrent: int = 10
     ) -> Union[Dict[str, Any], str]:
         """
         Show detailed information about a tool
@@ -148,6 +224,7 @@ class ToolService(BaseService):
         Args:
             tool_name: Name of the tool to describe
             source_uuid: Optional source UUID to search in specific source
+            max_concurrent: Maximum concurrent metadata requests when searching all sources
 
         Returns:
             Tool details or JSON string
@@ -160,49 +237,36 @@ class ToolService(BaseService):
                 # Get tool from specific source
                 source = self._get_source_metadata(source_uuid)
 
-                # Check regular tools
-                for t in source.get("tools", []):
+                # Check regular tools, then inline tools
+                for t in _source_tools(source):
                     if t.get("name") == tool_name:
                         tool = t
                         source_name = source.get("name")
                         break
-
-                # Check inline tools if not found
-                if not tool:
-                    for t in source.get("inline_tools", []):
-                        if t.get("name") == tool_name:
-                            tool = t
-                            source_name = source.get("name")
-                            break
             else:
-                # Search all sources
+                # Search all sources concurrently. The match from the earliest
+                # source in the list wins, so stop once every source before
+                # the first match known so far has answered.
                 sources = self._list_sources()
-
-                for source in sources:
-                    try:
-                        metadata = self._get_source_metadata(source["uuid"])
-
-                        # Check regular tools
-                        for t in metadata.get("tools", []):
-                            if t.get("name") == tool_name:
-                                tool = t
-                                source_name = source.get("name")
-                                break
-
-                        if tool:
-                            break
-
-                        # Check inline tools
-                        for t in metadata.get("inline_tools", []):
+                matches = self._iter_source_metadata(sources, max_concurrent, include_failed=True)
+                found: Dict[int, Tuple[Dict[str, Any], Optional[str]]] = {}
+                answered = set()
+                pending_from = 0
+                try:
+                    for index, source, metadata in matches:
+                        answered.add(index)
+                        for t in _source_tools(metadata or {}):
                             if t.get("name") == tool_name:
-                                tool = t
-                                source_name = source.get("name")
+                                found[index] = (t, source.get("name"))
                                 break
-
-                        if tool:
+                        while pending_from in answered:
+                            pending_from += 1
+                        if found and min(found) < pending_from:
                             break
-                    except Exception:
-                        continue
+                finally:
+                    matches.close()
+                if found:
+                    tool, source_name = found[min(found)]
 
             if not tool:
                 raise ToolNotFoundError(f"Tool '{tool_name}' not found")
@@ -234,26 +298,6 @@ class ToolService(BaseService):
         endpoint = self._format_endpoint(Endpoints.SOURCE_METADATA, source_uuid=source_uuid)
         return self._get(endpoint).json()
 
-    def _levenshtein_distance(self, s1: str, s2: str) -> int:
-        """Calculate Levenshtein distance between two strings"""
-        if len(s1) < len(s2):
-            s1, s2 = s2, s1
-
-        if len(s2) == 0:
-            return len(s1)
-
-        previous_row = list(range(len(s2) + 1))
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-
-        return previous_row[-1]
-
     def generate_tool(
         self,
         description: str,
@@ -457,4 +501,9 @@ class ToolService(BaseService):
                 logger.error(f"Failed to write file {full_path}: {e}")
                 continue
 
-        return files_written
\ No newline at end of file
+        return files_written
+
+
+def _source_tools(metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Regular and inline tools of a source; either field may be missing or null"""
+    return (metadata.get("tools") or []) + (metadata.get("inline_tools") or [])
@@ -2,7 +2,7 @@
 User service for managing users and groups
 """
 import logging
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, Generator, List, Union
 
 from kubiya_workflow_sdk import capture_exception
 from kubiya_workflow_sdk.kubiya_services.services.base import BaseService
@@ -55,6 +55,31 @@ class UserService(BaseService):
             capture_exception(error)
             raise error
 
+    def iter_users(self, page_size: int = 100, prefetch: int = 1) -> Generator[Dict[str, Any], None, None]:
+        """
+        Iterate over all users in the organization, page by page
+
+        The next page is fetched while the current one is consumed, and
+        breaking out of the loop stops further requests.
+
+        Args:
+            page_size: Number of users requested per page (default: 100)
+            prefetch: Number of pages fetched ahead (default: 1)
+
+        Yields:
+            User objects
+        """
+        endpoint = self._format_endpoint(Endpoints.USER_LIST)
+        users = self.paginate(endpoint, style="page", page_size=page_size, prefetch=prefetch)
+        try:
+            yield from users
+        except Exception as e:
+            error = UserError(f"Failed to list users: {str(e)}")
+            capture_exception(error)
+            raise error
+        finally:
+            users.close()
+
     def list_groups(self) -> Union[List[Dict[str, Any]], str]:
         """
         List all groups in the organization
@@ -1,9 +1,15 @@
 """
 Workflow service for managing workflows
 """
+import concurrent.futures
+import copy
 import json
 import logging
-from typing import Optional, Dict, Any, Union, Generator
+import queue
+import threading
+from typing import Optional, Dict, Any, Iterable, Union, Generator
+from kubiya_workflow_sdk.core.results import ExecutionReducer, decode_event
+from kubiya_workflow_sdk.core.types import ExecutionResult, StreamHandler
 from kubiya_workflow_sdk.kubiya_services.services.base import BaseService
 from kubiya_workflow_sdk.kubiya_services.constants import Endpoints
 from kubiya_workflow_sdk.kubiya_services.exceptions import WorkflowExecutionError
@@ -21,8 +27,9 @@ class WorkflowService(BaseService):
         workflow_definition: Union[Dict[str, Any], str],
         parameters: Optional[Dict[str, Any]] = None,
         stream: bool = True,
-        runner: Optional[str] = None
-    ) -> Union[Dict[str, Any], Generator[str, None, None]]:
+        runner: Optional[str] = None,
+        handler: Optional[StreamHandler] = None
+    ) -> Union[ExecutionResult, Generator[str, None, None]]:
         """
         Execute workflow
 
@@ -31,10 +38,12 @@ class WorkflowService(BaseService):
             parameters: Workflow parameters
             stream: Whether to stream the response
             runner: Runner to use (uses default runner if not specified)
+            handler: Stream handler called as steps start, produce output
+                and finish, and when the workflow completes
 
         Returns:
             For streaming: Generator yielding event data
-            For non-streaming: Final response data
+            For non-streaming: ExecutionResult folded from the event stream
 
         Returns:
             Workflow execution
@@ -52,33 +61,44 @@ class WorkflowService(BaseService):
         # Add parameters if provided
         if parameters: workflow_definition["parameters"] = parameters
 
-        # Use the runner from the workflow definition if specified, otherwise use default
-        default_runner = workflow_definition.pop('runner', self.client.runner)
-
-        # If a specific runner is provided, use it; otherwise, use the default
-        if not runner: runner = default_runner
+        # An explicit runner wins over the workflow definition's, which wins
+        # over the client's scheduler and finally the default runner
+        lease = None
+        if runner:
+            workflow_definition.pop('runner', None)
+        else:
+            lease = self.client.lease_runner(workflow_definition)
+            runner = lease.runner if lease else workflow_definition.pop('runner', self.client.runner)
 
         # Prepare request body - workflow fields at top level
         request_body = {**workflow_definition}  # Spread workflow fields at top level
 
         endpoint = self._format_endpoint(Endpoints.WORKFLOW_EXECUTE, runner=runner)
 
-        # Add native_sse=true for standard SSE format when streaming (same as standalone function)
-        if stream:
-            endpoint += "&native_sse=true"
+        # Add native_sse=true for standard SSE format (same as standalone function);
+        # without streaming the events are folded into the result
+        endpoint += "&native_sse=true"
 
         try:
 
-            response = self._post(endpoint=endpoint, data=request_body, stream=stream)
-            if stream:
-                # Return the generator directly to make it iterable
-                return response
-            else:
-                # For non-streaming, collect all data
-                result = []
-                for event in response:
-                    result.append(event)
-                return {"events": result}
+            try:
+                response = self._post(endpoint=endpoint, data=request_body, stream=True)
+            except Exception:
+                if lease:
+                    lease.release(failed=True)
+                raise
+            if lease:
+                lease.submitted()
+                response = lease.wrap(response)
+            if not stream or handler is not None:
+                reducer = ExecutionReducer(
+                    workflow_definition.get("name", ""), handlers=[handler] if handler else ()
+                )
+                if not stream:
+                    return reducer.fold(response)
+                response = reducer.wrap(response)
+            # Return the generator directly to make it iterable
+            return response
         except Exception as e:
             error = WorkflowExecutionError(f"Error during workflow execution: {str(e)}")
             capture_exception(error)
@@ -136,3 +156,146 @@ class WorkflowService(BaseService):
         else:
             # Direct response (dict or other)
             return response
+
+    def iter_executions(
+        self,
+        filter: str = "all",
+        page_size: int = 50,
+        prefetch: int = 1
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Iterate over workflow executions, page by page
+
+        The next page is fetched while the current one is consumed, and
+        breaking out of the loop stops further requests.
+
+        Args:
+            filter: Filter workflows (all|running|completed|failed)
+            page_size: Number of executions requested per page (default: 50)
+            prefetch: Number of pages fetched ahead (default: 1)
+
+        Yields:
+            Workflow execution objects
+        """
+        endpoint = self._format_endpoint(Endpoints.WORKFLOW_LIST, runner=self.client.runner)
+        executions = self.paginate(
+            endpoint,
+            params={"filter": filter},
+            style="offset",
+            page_size=page_size,
+            method="POST",
+            extract=lambda result: (result.get("workflows") or []) if isinstance(result, dict) else result,
+            prefetch=prefetch,
+        )
+        try:
+            yield from executions
+        except Exception as e:
+            error = WorkflowExecutionError(f"Failed to list workflow executions: {str(e)}")
+            capture_exception(error)
+            raise error
+        finally:
+            executions.close()
+
+    def execute_many(
+        self,
+        workflow_definition: Union[Dict[str, Any], str],
+        param_sets: Iterable[Dict[str, Any]],
+        concurrency: int = 8,
+        buffer_size: int = 256,
+        runner: Optional[str] = None
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Run a workflow once per parameter set, streaming the runs concurrently
+
+        Up to ``concurrency`` runs stream at the same time over the client's
+        connection pool; the next parameter set is submitted as soon as a
+        run ends, so ``param_sets`` may be a lazy iterable. Events of all
+        runs are merged into one stream through a buffer of ``buffer_size``
+        events: when the caller consumes slower than the runs produce, the
+        runs stop reading their streams until there is room again. Closing
+        the generator stops all runs.
+
+        A failing run doesn't affect the others; its error is reported in
+        its result.
+
+        Args:
+            workflow_definition: Workflow definition (dict or JSON string)
+            param_sets: Workflow parameters of each run
+            concurrency: Maximum number of runs streaming at once
+            buffer_size: Maximum number of events buffered for the caller
+            runner: Runner to use (uses default runner if not specified)
+
+        Yields:
+            ``{"run": i, "parameters": ..., "type": "event", "event": ...}`` for
+            each event of the i-th run (decoded when it is JSON), and once the
+            run ended
+            ``{"run": i, "parameters": ..., "type": "result", "result": ExecutionResult}``
+        """
+        if isinstance(workflow_definition, str):
+            try:
+                workflow_definition = json.loads(workflow_definition)
+            except json.JSONDecodeError as e:
+                error = WorkflowExecutionError(f"Invalid workflow JSON: {str(e)}")
+                capture_exception(error)
+                raise error
+
+        runs = iter(enumerate(param_sets))
+        events: queue.Queue = queue.Queue(maxsize=max(1, buffer_size))
+        cancelled = threading.Event()
+        workers = self._max_workers(concurrency)
+
+        def put(item: Dict[str, Any]) -> bool:
+            # Block while the buffer is full, unless the caller went away
+            while not cancelled.is_set():
+                try:
+                    events.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def run(index: int, parameters: Dict[str, Any]) -> None:
+            tag = {"run": index, "parameters": parameters}
+            reducer = ExecutionReducer(workflow_definition.get("name", ""))
+            reducer.result.metadata["parameters"] = parameters
+            stream = None
+            try:
+                stream = self.execute(
+                    copy.deepcopy(workflow_definition), parameters=parameters, stream=True, runner=runner
+                )
+                for item in stream:
+                    reducer.add(item)
+                    if not put({**tag, "type": "event", "event": decode_event(item)}):
+                        return
+            except Exception as e:
+                reducer.finish(e)
+            finally:
+                if hasattr(stream, "close"):
+                    stream.close()
+            put({**tag, "type": "result", "result": reducer.finish()})
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="workflow-run")
+
+        def start_next() -> bool:
+            try:
+                index, parameters = next(runs)
+            except StopIteration:
+                return False
+            executor.submit(run, index, parameters)
+            return True
+
+        active = 0
+        try:
+            while active < workers and start_next():
+                active += 1
+            while active:
+                item = events.get()
+                if item["type"] == "result":
+                    active -= 1
+                    if start_next():
+                        active += 1
+                yield item
+        finally:
+            cancelled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
@@ -0,0 +1,361 @@
+"""JSON Schema of workflow manifests and its compiled validator.
+
+``manifest_schema()`` generates the JSON Schema (draft 2020-12) of the
+manifest format accepted by the API: workflow fields, steps, executors,
+``tool_def`` bounded services and their ports. The schema can be handed to
+any JSON Schema tool.
+
+``compiled_validator()`` compiles the schema once into the source of a
+plain Python function, so validating a manifest runs no schema
+interpretation at all. Compiled validators are cached per schema version.
+They report every problem found, each with the path of the offending value.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+MANIFEST_SCHEMA_VERSION = "1"
+
+# Keys of which a step needs at least one to have something to run
+STEP_ACTION_KEYS = ("command", "run", "script", "executor", "type", "uses", "call")
+
+PathItem = Union[str, int]
+
+# Keywords that don't constrain values
+_ANNOTATIONS = {"$schema", "$id", "$defs", "title", "description", "default", "examples"}
+
+_TYPE_NAMES = {
+    "object": "an object",
+    "array": "an array",
+    "string": "a string",
+    "integer": "an integer",
+    "number": "a number",
+    "boolean": "a boolean",
+    "null": "null",
+}
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """A problem found in a manifest, at the path of the offending value."""
+
+    path: Tuple[PathItem, ...]
+    message: str
+
+    @property
+    def pointer(self) -> str:
+        """The path as a JSON pointer, e.g. ``/steps/2/executor/type``."""
+        return "".join(f"/{str(p).replace('~', '~0').replace('/', '~1')}" for p in self.path)
+
+    def __str__(self) -> str:
+        return f"{self.pointer or '/'}: {self.message}"
+
+
+def manifest_schema(version: str = MANIFEST_SCHEMA_VERSION) -> Dict[str, Any]:
+    """JSON Schema of a workflow manifest.
+
+    Raises:
+        ValueError: If the schema version is unknown
+    """
+    if version != MANIFEST_SCHEMA_VERSION:
+        raise ValueError(f"Unknown manifest schema version: {version}")
+
+    non_blank = {"type": "string", "pattern": r"\S"}
+    return {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "$id": f"https://docs.kubiya.ai/schemas/workflow-manifest/v{version}.json",
+        "title": "Kubiya workflow manifest",
+        "type": "object",
+        "required": ["name", "steps"],
+        "properties": {
+            "name": non_blank,
+            "steps": {"type": "array", "minItems": 1, "items": {"$ref": "#/$defs/step"}},
+        },
+        "$defs": {
+            "step": {
+                "type": "object",
+                "required": ["name"],
+                "anyOf": [{"required": [key]} for key in STEP_ACTION_KEYS],
+                "properties": {
+                    "name": non_blank,
+                    "depends": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": "string"}},
+                        ]
+                    },
+                    "executor": {"$ref": "#/$defs/executor"},
+                    "retry": {"$ref": "#/$defs/retry"},
+                },
+            },
+            "executor": {
+                "type": "object",
+                "required": ["type"],
+                "properties": {
+                    "type": {"type": "string"},
+                    "config": {
+                        "type": "object",
+                        "properties": {"tool_def": {"$ref": "#/$defs/tool_def"}},
+                    },
+                },
+            },
+            "tool_def": {
+                "type": "object",
+                "properties": {
+                    "with_services": {"type": "array", "items": {"$ref": "#/$defs/service"}},
+                },
+            },
+            "service": {
+                "type": "object",
+                "required": ["name", "image"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "image": {"type": "string"},
+                    "exposed_ports": {"type": "array", "items": {"$ref": "#/$defs/port"}},
+                },
+            },
+            "port": {"type": "integer", "minimum": 1, "maximum": 65535},
+            "retry": {
+                "type": "object",
+                "properties": {"max_attempts": {"type": "integer"}},
+            },
+        },
+    }
+
+
+@lru_cache(maxsize=None)
+def compiled_validator(version: str = MANIFEST_SCHEMA_VERSION) -> Callable[[Any], List[ValidationIssue]]:
+    """Validator of the manifest schema, compiled on first use of each version.
+
+    Returns:
+        Function returning the issues found in a manifest (empty if valid)
+    """
+    check = compile_schema(manifest_schema(version))
+
+    def validate(manifest: Any) -> List[ValidationIssue]:
+        issues: List[ValidationIssue] = []
+        check(manifest, (), issues)
+        return issues
+
+    return validate
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any, Tuple[PathItem, ...], List[ValidationIssue]], None]:
+    """Compile a JSON Schema into a check function.
+
+    The schema is translated to the source of one Python function, with
+    ``$ref`` definitions inlined, and the path of a value is only built
+    when an issue is reported. Supports the keywords the manifest schema
+    uses: ``type``, ``enum``, ``required``, ``properties``, ``items``,
+    ``minItems``, ``minLength``, ``pattern``, ``minimum``, ``maximum``,
+    ``anyOf`` and local ``$ref`` (not recursive).
+
+    Returns:
+        ``check(value, path, issues)``, which appends the issues found in
+        ``value`` to ``issues``; the generated source is in ``check.source``
+
+    Raises:
+        ValueError: If the schema uses another keyword or a recursive ``$ref``
+    """
+    generator = _Generator(schema.get("$defs", {}))
+    generator.emit_function("check", schema)
+    source = "\n".join(generator.lines)
+    namespace: Dict[str, Any] = {"_Issue": ValidationIssue, **generator.constants}
+    exec(compile(source, "<compiled schema>", "exec"), namespace)
+    check = namespace["check"]
+    check.source = source
+    return check
+
+
+# Keywords the schema compiler supports
+_KEYWORDS = {
+    "$ref", "type", "enum", "required", "properties", "items", "minItems",
+    "minLength", "pattern", "minimum", "maximum", "anyOf",
+}
+
+_TYPE_TESTS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool))",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+}
+
+
+class _Generator:
+    """Generates the source of check functions from schema nodes."""
+
+    def __init__(self, defs: Dict[str, Any]):
+        self.defs = defs
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {}
+        self._names = 0
+        self._refs: List[str] = []
+
+    def emit_function(self, name: str, node: Dict[str, Any]) -> None:
+        self.lines.append(f"def {name}(value, path, issues):")
+        start = len(self.lines)
+        self.emit(node, "value", [], 1)
+        if len(self.lines) == start:
+            self.lines.append("    pass")
+
+    def emit(self, node: Dict[str, Any], var: str, parts: List[str], depth: int) -> None:
+        """Emit the checks of ``node`` on the value in ``var``, at ``path + parts``."""
+        unknown = set(node) - _ANNOTATIONS - _KEYWORDS
+        if unknown:
+            raise ValueError(f"Unsupported schema keywords: {', '.join(sorted(unknown))}")
+
+        if "$ref" in node:
+            name = self._resolve(node["$ref"])
+            self._refs.append(name)
+            self.emit(self.defs[name], var, parts, depth)
+            self._refs.pop()
+
+        expected = node.get("type")
+        if expected:
+            self.line(depth, f"if not {_TYPE_TESTS[expected].format(v=var)}:")
+            self.issue(depth + 1, parts, repr(f"must be {_TYPE_NAMES[expected]}"))
+            self.line(depth, "else:")
+            depth += 1
+            start = len(self.lines)
+        if "enum" in node:
+            allowed = self.constant(tuple(node["enum"]))
+            self.line(depth, f"if {var} not in {allowed}:")
+            self.issue(depth + 1, parts, repr(f"must be one of: {', '.join(map(str, node['enum']))}"))
+        self._emit_object(node, var, parts, depth, typed=expected == "object")
+        self._emit_array(node, var, parts, depth, typed=expected == "array")
+        self._emit_string(node, var, parts, depth, typed=expected == "string")
+        self._emit_number(node, var, parts, depth, typed=expected in ("integer", "number"))
+        if "anyOf" in node:
+            self._emit_any_of(node["anyOf"], var, parts, depth)
+        if expected and len(self.lines) == start:
+            self.line(depth, "pass")
+
+    def _emit_object(self, node, var, parts, depth, typed):
+        if not ({"required", "properties"} & set(node)):
+            return
+        if not typed:
+            self.line(depth, f"if isinstance({var}, dict):")
+            depth += 1
+        for key in node.get("required", ()):
+            self.line(depth, f"if {key!r} not in {var}:")
+            self.issue(depth + 1, parts + [repr(key)], repr("is required"))
+        for key, prop in node.get("properties", {}).items():
+            child = self.name("v")
+            self.line(depth, f"if {key!r} in {var}:")
+            self.line(depth + 1, f"{child} = {var}[{key!r}]")
+            start = len(self.lines)
+            self.emit(prop, child, parts + [repr(key)], depth + 1)
+            if len(self.lines) == start:
+                self.lines.pop()
+                self.lines.pop()
+
+    def _emit_array(self, node, var, parts, depth, typed):
+        if not ({"minItems", "items"} & set(node)):
+            return
+        if not typed:
+            self.line(depth, f"if isinstance({var}, list):")
+            depth += 1
+        if "minItems" in node:
+            minimum = node["minItems"]
+            self.line(depth, f"if len({var}) < {minimum}:")
+            self.issue(depth + 1, parts, repr(f"must have at least {minimum} item{'s' if minimum != 1 else ''}"))
+        if "items" in node:
+            index, child = self.name("i"), self.name("v")
+            self.line(depth, f"for {index}, {child} in enumerate({var}):")
+            start = len(self.lines)
+            self.emit(node["items"], child, parts + [index], depth + 1)
+            if len(self.lines) == start:
+                self.line(depth + 1, "pass")
+
+    def _emit_string(self, node, var, parts, depth, typed):
+        if not ({"minLength", "pattern"} & set(node)):
+            return
+        if not typed:
+            self.line(depth, f"if isinstance({var}, str):")
+            depth += 1
+        if "minLength" in node:
+            self.line(depth, f"if len({var}) < {node['minLength']}:")
+            self.issue(depth + 1, parts, repr(f"must be at least {node['minLength']} characters long"))
+        if "pattern" in node:
+            pattern = node["pattern"]
+            search = self.constant(re.compile(pattern).search)
+            self.line(depth, f"if not {search}({var}):")
+            message = "cannot be empty" if pattern == r"\S" else f"must match {pattern}"
+            self.issue(depth + 1, parts, repr(message))
+
+    def _emit_number(self, node, var, parts, depth, typed):
+        minimum, maximum = node.get("minimum"), node.get("maximum")
+        if minimum is None and maximum is None:
+            return
+        if not typed:
+            self.line(depth, f"if {_TYPE_TESTS['number'].format(v=var)}:")
+            depth += 1
+        tests = []
+        if minimum is not None:
+            tests.append(f"{var} < {minimum!r}")
+        if maximum is not None:
+            tests.append(f"{var} > {maximum!r}")
+        self.line(depth, f"if {' or '.join(tests)}:")
+        self.issue(depth + 1, parts, f"{f'must be between {minimum} and {maximum}, got '!r} + str({var})")
+
+    def _emit_any_of(self, branches, var, parts, depth):
+        # "has one of these keys" is tested directly
+        if all(set(branch) == {"required"} and len(branch["required"]) == 1 for branch in branches):
+            keys = [branch["required"][0] for branch in branches]
+            self.line(depth, f"if isinstance({var}, dict) and not ({' or '.join(f'{k!r} in {var}' for k in keys)}):")
+            self.issue(depth + 1, parts, repr(f"needs one of: {', '.join(keys)}"))
+            return
+
+        # Other branches become functions, run until one reports no issue
+        names = []
+        for branch in branches:
+            generator = _Generator(self.defs)
+            generator._refs = list(self._refs)
+            name = self.name("_any_of")
+            generator.emit_function("branch", branch)
+            namespace: Dict[str, Any] = {"_Issue": ValidationIssue, **generator.constants}
+            exec(compile("\n".join(generator.lines), "<compiled schema>", "exec"), namespace)
+            self.constants[name] = namespace["branch"]
+            names.append(name)
+        matched = self.name("matched")
+        self.line(depth, f"{matched} = False")
+        self.line(depth, f"for _branch in ({', '.join(names)},):")
+        self.line(depth + 1, "_found = []")
+        self.line(depth + 1, f"_branch({var}, (), _found)")
+        self.line(depth + 1, "if not _found:")
+        self.line(depth + 2, f"{matched} = True")
+        self.line(depth + 2, "break")
+        self.line(depth, f"if not {matched}:")
+        self.issue(depth + 1, parts, repr("does not match any of the allowed forms"))
+
+    # Helpers
+
+    def line(self, depth: int, text: str) -> None:
+        self.lines.append("    " * depth + text)
+
+    def issue(self, depth: int, parts: List[str], message: str) -> None:
+        path = f"path + ({', '.join(parts)},)" if parts else "path"
+        self.line(depth, f"issues.append(_Issue({path}, {message}))")
+
+    def name(self, prefix: str) -> str:
+        self._names += 1
+        return f"{prefix}{self._names}"
+
+    def constant(self, value: Any) -> str:
+        name = self.name("_c")
+        self.constants[name] = value
+        return name
+
+    def _resolve(self, ref: str) -> str:
+        prefix = "#/$defs/"
+        name = ref[len(prefix):]
+        if not ref.startswith(prefix) or name not in self.defs:
+            raise ValueError(f"Unresolvable $ref: {ref}")
+        if name in self._refs:
+            raise ValueError(f"Recursive $ref is not supported: {ref}")
+        return name
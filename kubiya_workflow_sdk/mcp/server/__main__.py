@@ -65,6 +65,12 @@ def main():
         help="Host for HTTP/SSE transport (default: 0.0.0.0)"
     )
     
+    parser.add_argument(
+        "--no-metadata-cache",
+        action="store_true",
+        help="Don't keep source metadata on disk across restarts"
+    )
+    
     args = parser.parse_args()
     
     # Create server
@@ -72,7 +78,8 @@ def main():
         name=args.name,
         base_url=args.base_url,
         enable_auth=not args.no_auth,
-        default_runner=args.runner
+        default_runner=args.runner,
+        metadata_cache=not args.no_metadata_cache
     )
     
     # Log configuration
@@ -1,14 +1,20 @@
 """Core MCP Server implementation with authentication and context management."""
 
 import os
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, AsyncIterator, Set
+from dataclasses import dataclass, field
 
 from fastmcp import FastMCP
 from fastmcp.server.dependencies import get_http_headers
 
-from kubiya_workflow_sdk.client import KubiyaClient
+from kubiya_workflow_sdk.client import KubiyaClient, StreamingKubiyaClient
+from kubiya_workflow_sdk.core.cache import ResponseCache
+from kubiya_workflow_sdk.core.runner_health import RunnerHealthMonitor
+from kubiya_workflow_sdk.kubiya_services.metadata_cache import SourceMetadataCache
 from .context import WorkflowContext, IntegrationContext, SecretsContext
 from .tools import register_tools
 from .prompts import register_prompts
@@ -26,6 +32,12 @@ class ServerConfig:
     enable_auth: bool = True
     default_runner: str = "kubiya-hosted"
     cache_ttl: int = 300  # 5 minutes
+    response_cache: bool = True  # Cache read-mostly API responses per client
+    runner_health_interval: float = 30.0  # Seconds between background runner health refreshes
+    # Keep source metadata on disk across restarts (under $KUBIYA_CACHE_DIR, ~/.cache/kubiya by default)
+    metadata_cache: bool = field(
+        default_factory=lambda: os.getenv("KUBIYA_METADATA_CACHE", "true").lower() == "true"
+    )
 
 
 class KubiyaMCPServer:
@@ -47,6 +59,20 @@ class KubiyaMCPServer:
         
         # Client cache for authenticated requests
         self._client_cache: Dict[str, tuple[KubiyaClient, float]] = {}
+
+        # Background runner health monitors, one per cached client
+        self._health_monitors: Dict[str, RunnerHealthMonitor] = {}
+
+        # Streaming clients for workflow executions, one per cached client,
+        # and the number of executions using each
+        self._streaming_clients: Dict[str, StreamingKubiyaClient] = {}
+        self._streaming_in_use: Counter = Counter()
+        self._closing: Set[asyncio.Task] = set()
+        # Idle streaming clients evicted off the serving loop, closed by aclose()
+        self._retired_streaming_clients: List[StreamingKubiyaClient] = []
+
+        # On-disk source metadata cache shared by all clients, opened on first use
+        self._metadata_cache: Optional[SourceMetadataCache] = None
         
         # Initialize server components
         self._setup_server()
@@ -118,27 +144,38 @@ class KubiyaMCPServer:
         """Create or retrieve cached client."""
         import time
         
+        # Drop expired entries, so their health monitors stop with them
+        self._cleanup_cache()
+        
         # Check cache
         if api_key in self._client_cache:
-            client, created_at = self._client_cache[api_key]
-            if time.time() - created_at < self.config.cache_ttl:
-                return client
+            client, _ = self._client_cache[api_key]
+            return client
         
         # Create new client
         client = KubiyaClient(
             api_key=api_key,
             base_url=self.config.base_url,
-            runner=self.config.default_runner
+            runner=self.config.default_runner,
+            response_cache=ResponseCache() if self.config.response_cache else None,
+            metadata_cache=self._get_metadata_cache(),
         )
         
         # Cache it
         self._client_cache[api_key] = (client, time.time())
         
-        # Clean old entries
-        self._cleanup_cache()
-        
         return client
     
+    def _get_metadata_cache(self) -> Optional[SourceMetadataCache]:
+        """Open the shared source metadata cache, or None if it's disabled or can't be opened."""
+        if self._metadata_cache is None and self.config.metadata_cache:
+            try:
+                self._metadata_cache = SourceMetadataCache()
+            except Exception as e:
+                logger.warning(f"Source metadata cache disabled: {e}")
+                self.config.metadata_cache = False
+        return self._metadata_cache
+    
     def _cleanup_cache(self):
         """Remove expired cache entries."""
         import time
@@ -150,7 +187,87 @@ class KubiyaMCPServer:
         ]
         
         for key in expired_keys:
-            del self._client_cache[key]
+            self._evict_client(key)
+    
+    def _evict_client(self, api_key: str):
+        """Drop a cached client with the health monitor and streaming client tied to it."""
+        self._client_cache.pop(api_key, None)
+        monitor = self._health_monitors.pop(api_key, None)
+        if monitor is not None:
+            # Don't wait for a refresh in progress; the thread exits after it
+            monitor.stop(timeout=0)
+        streaming_client = self._streaming_clients.pop(api_key, None)
+        if streaming_client is not None and not self._streaming_in_use[streaming_client]:
+            # One still streaming is closed when its last execution finishes
+            self._retire_streaming_client(streaming_client)
+    
+    def _retire_streaming_client(self, streaming_client: StreamingKubiyaClient):
+        """Close an idle streaming client on the serving loop, or leave it to ``aclose``."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Its session belongs to the serving loop, so it can only be closed there
+            self._retired_streaming_clients.append(streaming_client)
+            return
+        task = loop.create_task(streaming_client.aclose())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+    
+    @asynccontextmanager
+    async def streaming_client(self, client: KubiyaClient) -> AsyncIterator[StreamingKubiyaClient]:
+        """Borrow the shared streaming client for a client's API key.
+        
+        Executions with the same API key share one connection pool, which is
+        closed when the client expires from the cache and on shutdown.
+        """
+        streaming_client = self._streaming_clients.get(client.api_key)
+        if streaming_client is None:
+            streaming_client = StreamingKubiyaClient(
+                api_key=client.api_key,
+                base_url=client.base_url,
+                runner=client.runner,
+                timeout=client.timeout,
+                org_name=client.org_name
+            )
+            self._streaming_clients[client.api_key] = streaming_client
+        
+        self._streaming_in_use[streaming_client] += 1
+        try:
+            yield streaming_client
+        finally:
+            self._streaming_in_use[streaming_client] -= 1
+            if not self._streaming_in_use[streaming_client]:
+                del self._streaming_in_use[streaming_client]
+                if self._streaming_clients.get(client.api_key) is not streaming_client:
+                    # Evicted while in use
+                    await streaming_client.aclose()
+    
+    def close(self):
+        """Release the cached clients and stop all health monitors.
+        
+        Streaming clients are bound to the serving event loop; ``aclose``
+        closes them there.
+        """
+        for api_key in list(self._client_cache):
+            self._evict_client(api_key)
+        for monitor in self._health_monitors.values():
+            monitor.stop(timeout=0)
+        self._health_monitors.clear()
+        if self._metadata_cache is not None:
+            self._metadata_cache.close()
+            self._metadata_cache = None
+    
+    async def aclose(self):
+        """Shut down on the serving event loop: ``close`` and close all streaming clients."""
+        self.close()
+        streaming_clients = [*self._streaming_clients.values(), *self._retired_streaming_clients]
+        self._streaming_clients.clear()
+        self._retired_streaming_clients.clear()
+        await asyncio.gather(
+            *(streaming_client.aclose() for streaming_client in streaming_clients),
+            *self._closing,
+            return_exceptions=True
+        )
     
     async def refresh_context(self, api_key: Optional[str] = None):
         """Refresh context data (runners, integrations, secrets) with health checks."""
@@ -162,9 +279,8 @@ class KubiyaMCPServer:
             check_health = os.getenv("KUBIYA_CHECK_RUNNER_HEALTH", "true").lower() == "true"
             
             if check_health:
-                # Get runners with health status and component filtering
-                runners = client.get_runners_with_health(
-                    check_health=True,
+                # Read the monitor's last snapshot instead of checking every runner now
+                runners = self._get_health_monitor(client).snapshot(
                     required_components=self.workflow_context.component_requirements
                 )
                 logger.info(
@@ -215,6 +331,20 @@ class KubiyaMCPServer:
             self.integration_context.update_integrations([])
             self.secrets_context.update_secrets([])
     
+    def _get_health_monitor(self, client: KubiyaClient) -> RunnerHealthMonitor:
+        """Get or start the background runner health monitor for a client's API key.
+
+        The monitor lives as long as the cached client: it is stopped when the
+        client expires from the cache and when the server shuts down.
+        """
+        monitor = self._health_monitors.get(client.api_key)
+        if monitor is None or not monitor.running or monitor.client is not client:
+            if monitor is not None:
+                monitor.stop(timeout=0)
+            monitor = RunnerHealthMonitor(client, interval=self.config.runner_health_interval).start()
+            self._health_monitors[client.api_key] = monitor
+        return monitor
+
     def run(self, transport: str = "stdio"):
         """Run the MCP server.
         
@@ -225,8 +355,14 @@ class KubiyaMCPServer:
         if transport in ["http", "sse"]:
             logger.info(f"Running in {transport} mode with header-based authentication")
         
-        # Run the FastMCP server
-        self.mcp.run(transport=transport)
+        # Run the FastMCP server, shutting down on its event loop
+        asyncio.run(self._serve(transport))
+    
+    async def _serve(self, transport: str):
+        try:
+            await self.mcp.run_async(transport=transport)
+        finally:
+            await self.aclose()
 
 
 def create_server(
@@ -9,8 +9,7 @@ from typing import Dict, Any, Optional, Union, List
 from datetime import datetime
 
 from kubiya_workflow_sdk.dsl import Workflow
-from kubiya_workflow_sdk.execution import validate_workflow_definition
-from kubiya_workflow_sdk.client import StreamingKubiyaClient
+from kubiya_workflow_sdk.validation import validate_workflow
 
 logger = logging.getLogger(__name__)
 
@@ -184,10 +183,11 @@ def register_tools(mcp, server):
                     workflow_def["env"][secret_name] = secret_value
             
             # Validate the workflow
-            validation_errors = validate_workflow_definition(workflow_def)
+            validation = validate_workflow(workflow_def)
+            validation_errors = validation.errors
             
             # Analyze workflow for suggestions
-            suggestions = _analyze_workflow(workflow_def, server, prefer_docker)
+            suggestions = validation.warnings + _analyze_workflow(workflow_def, server, prefer_docker)
             
             if validation_errors:
                 return {
@@ -325,12 +325,13 @@ def register_tools(mcp, server):
             
             # Dry run - just validate
             if dry_run:
-                validation_errors = validate_workflow_definition(workflow_def)
+                validation = validate_workflow(workflow_def)
                 return {
-                    "success": len(validation_errors) == 0,
+                    "success": validation.valid,
                     "type": "validation_result",
-                    "valid": len(validation_errors) == 0,
-                    "errors": validation_errors,
+                    "valid": validation.valid,
+                    "errors": validation.errors,
+                    "warnings": validation.warnings,
                     "workflow": workflow_def.get("name"),
                     "steps": len(workflow_def.get("steps", [])),
                     "runner": workflow_def.get("runner")
@@ -351,35 +352,28 @@ def register_tools(mcp, server):
             })
             
             try:
-                # Use the streaming client to execute
-                streaming_client = StreamingKubiyaClient(
-                    api_key=client.api_key,
-                    base_url=client.base_url,
-                    runner=workflow_def.get("runner", client.runner),
-                    timeout=client.timeout,
-                    org_name=client.org_name
-                )
-                
-                # Stream execution and collect events
-                async for event in streaming_client.execute_workflow_stream(workflow_def, params):
-                    event_count += 1
+                # Use the server's shared streaming client for this API key
+                async with server.streaming_client(client) as streaming_client:
+                    # Stream execution and collect events
+                    async for event in streaming_client.execute_workflow_stream(workflow_def, params):
+                        event_count += 1
                     
-                    # Enhance events with additional context
-                    if isinstance(event, dict):
-                        event["event_number"] = event_count
+                        # Enhance events with additional context
+                        if isinstance(event, dict):
+                            event["event_number"] = event_count
                         
-                        # Add step context if available
-                        if event.get("type") == "step_running":
-                            step_name = event.get("step", {}).get("name")
-                            if step_name:
-                                # Find step definition
-                                for step in workflow_def.get("steps", []):
-                                    if step.get("name") == step_name:
-                                        event["step_type"] = _get_step_type(step)
-                                        event["uses_docker"] = "executor" in step and step["executor"].get("type") == "docker"
-                                        break
+                            # Add step context if available
+                            if event.get("type") == "step_running":
+                                step_name = event.get("step", {}).get("name")
+                                if step_name:
+                                    # Find step definition
+                                    for step in workflow_def.get("steps", []):
+                                        if step.get("name") == step_name:
+                                            event["step_type"] = _get_step_type(step)
+                                            event["uses_docker"] = "executor" in step and step["executor"].get("type") == "docker"
+                                            break
                     
-                    events.append(event)
+                        events.append(event)
                 
                 # Add completion event
                 end_time = datetime.now()
@@ -16,6 +16,7 @@ from kubiya_workflow_sdk.core import (
     DEFAULT_RUNNER,
     TOOL_EXEC_TIMEOUT,
 )
+from kubiya_workflow_sdk.core.ratelimit import RateLimiter
 
 # Optional Sentry integration
 try:
@@ -80,6 +81,7 @@ class ToolExecutor:
         base_url: str = DEFAULT_API_URL,
         runner: str = DEFAULT_RUNNER,
         timeout: int = TOOL_EXEC_TIMEOUT,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         self.api_token = api_token or os.getenv("KUBIYA_API_KEY") or os.getenv("KUBIYA_API_TOKEN")
         if not self.api_token:
@@ -88,6 +90,8 @@ class ToolExecutor:
         self.base_url = base_url
         self.runner = runner
         self.timeout = timeout
+        # Pass a client's rate_limiter to share its limits with other API calls
+        self.rate_limiter = rate_limiter or RateLimiter()
         self.auth_type = AuthType.API_KEY
 
         # Setup session
@@ -152,7 +156,8 @@ class ToolExecutor:
 
         results = [None] * len(requests)
 
-        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+        max_workers = max(1, min(max_concurrent, self.rate_limiter.concurrency_limit))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all tasks
             future_to_index = {
                 executor.submit(self._execute_request, req): i for i, req in enumerate(requests)
@@ -180,9 +185,11 @@ class ToolExecutor:
             params = {"runner": request.runner}
 
             # Make request
-            response = self.session.post(
-                url, params=params, json=request.to_dict(), timeout=request.timeout
-            )
+            with self.rate_limiter.limit() as permit:
+                response = self.session.post(
+                    url, params=params, json=request.to_dict(), timeout=request.timeout
+                )
+                permit.status_code = response.status_code
 
             response.raise_for_status()
 
@@ -283,6 +290,7 @@ class AsyncToolExecutor:
         base_url: str = DEFAULT_API_URL,
         runner: str = DEFAULT_RUNNER,
         timeout: int = TOOL_EXEC_TIMEOUT,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         self.api_token = api_token or os.getenv("KUBIYA_API_KEY") or os.getenv("KUBIYA_API_TOKEN")
         if not self.api_token:
@@ -291,6 +299,7 @@ class AsyncToolExecutor:
         self.base_url = base_url
         self.runner = runner
         self.timeout = timeout
+        self.rate_limiter = rate_limiter or RateLimiter()
         self.auth_type = AuthType.API_KEY
         self.headers = {
             "Authorization": f"{self.auth_type.value} {self.api_token}",
@@ -351,7 +360,7 @@ class AsyncToolExecutor:
         )
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession() as session, self.rate_limiter.alimit() as permit:
                 url = f"{self.base_url}/api/v1/tool_templates/exec"
                 params = {"runner": request.runner}
 
@@ -362,6 +371,7 @@ class AsyncToolExecutor:
                     headers=self.headers,
                     timeout=aiohttp.ClientTimeout(total=request.timeout),
                 ) as response:
+                    permit.status_code = response.status
                     response.raise_for_status()
                     data = await response.json()
 
@@ -0,0 +1,347 @@
+"""Workflow definition validation.
+
+``validate_workflow`` checks a workflow definition in a single pass over
+its steps. The pass checks each step's structure and builds a step-name index
+and the dependency graph. The graph is then analysed in O(V + E):
+
+- ``depends`` may name any step of the workflow, including later ones
+  (forward references are normal in graph workflows);
+- dependency cycles are errors;
+- steps that can never run because they depend, directly or not, on a
+  cycle are reported as unreachable;
+- ``order`` is a topological order of the runnable steps.
+
+``validate_workflow_definition``, ``Workflow.validate`` and the MCP server
+tools all return the outcome of this one validator.
+
+``validate(manifest, mode="fast")`` checks only the manifest JSON Schema,
+with a validator compiled once per schema version (see
+``manifest_schema``).
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from kubiya_workflow_sdk.core.types import WorkflowValidationResult
+from kubiya_workflow_sdk.manifest_schema import (
+    MANIFEST_SCHEMA_VERSION,
+    STEP_ACTION_KEYS,
+    ValidationIssue,
+    compiled_validator,
+)
+
+VALIDATION_MODES = ("full", "fast")
+
+
+@dataclass
+class ValidationResult(WorkflowValidationResult):
+    """Outcome of validating a workflow definition, with its dependency graph.
+
+    Attributes:
+        step_index: Position of each step by name
+        dependencies: Known dependencies of each step by name
+        order: Runnable steps in dependency order
+        cycles: Steps of each dependency cycle, in workflow order
+        unreachable: Steps that can never run because of a cycle
+        issues: Errors with the path of the offending value (fast mode)
+    """
+
+    is_valid: bool = True
+    step_index: Dict[str, int] = field(default_factory=dict)
+    dependencies: Dict[str, List[str]] = field(default_factory=dict)
+    order: List[str] = field(default_factory=list)
+    cycles: List[List[str]] = field(default_factory=list)
+    unreachable: List[str] = field(default_factory=list)
+    issues: List[ValidationIssue] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The result as ``{"valid", "errors", "warnings"}``."""
+        return {"valid": self.valid, "errors": list(self.errors), "warnings": list(self.warnings)}
+
+
+def validate(
+    manifest: Dict[str, Any], mode: str = "full", schema_version: str = MANIFEST_SCHEMA_VERSION
+) -> ValidationResult:
+    """Validate a workflow manifest.
+
+    Modes:
+
+    - ``full``: ``validate_workflow``, including step name uniqueness and
+      dependency graph analysis.
+    - ``fast``: the compiled manifest JSON Schema only, for manifests that
+      are generated and submitted at high rates. Each error is also
+      reported in ``issues`` with the path of the offending value. Doesn't
+      check that step names are unique or that dependencies exist.
+
+    Args:
+        manifest: Workflow manifest to validate
+        mode: "full" or "fast"
+        schema_version: Manifest schema version used in fast mode
+
+    Raises:
+        ValueError: If the mode or schema version is unknown
+    """
+    if mode == "full":
+        return validate_workflow(manifest)
+    if mode != "fast":
+        raise ValueError(f"mode must be one of {', '.join(VALIDATION_MODES)}")
+    issues = compiled_validator(schema_version)(manifest)
+    return ValidationResult(is_valid=not issues, errors=[str(issue) for issue in issues], issues=issues)
+
+
+def validate_workflow(workflow: Dict[str, Any], workflow_type: Optional[str] = None) -> ValidationResult:
+    """Validate a workflow definition.
+
+    Args:
+        workflow: Workflow definition to validate
+        workflow_type: "chain" or "graph"; defaults to the definition's ``type``
+
+    Returns:
+        Validation result with errors, warnings and the dependency graph
+    """
+    result = ValidationResult()
+    _validate_workflow(workflow, workflow_type, result)
+    result.is_valid = not result.errors
+    return result
+
+
+# Private helpers
+
+def _validate_workflow(workflow: Any, workflow_type: Optional[str], result: ValidationResult) -> None:
+    errors = result.errors
+
+    # Basic structure validation
+    if not isinstance(workflow, dict):
+        errors.append("Workflow definition must be a dictionary")
+        return
+
+    # Required fields
+    name = workflow.get("name")
+    if "name" not in workflow:
+        errors.append("Workflow must have a 'name' field")
+    elif not isinstance(name, str) or not name.strip():
+        errors.append("Workflow name cannot be empty")
+
+    steps = workflow.get("steps")
+    if "steps" not in workflow:
+        errors.append("Workflow must have a 'steps' field")
+        return
+    if not isinstance(steps, list):
+        errors.append("Workflow 'steps' must be a list")
+        return
+    if not steps:
+        errors.append("Workflow must have at least one step")
+        return
+
+    chain = (workflow_type or workflow.get("type")) == "chain"
+    # Dependencies by step position, resolved once all names are known
+    depends_by_step: List[List[str]] = []
+    for i, step in enumerate(steps):
+        depends_by_step.append(_validate_step(i, step, result, chain))
+
+    _analyze_graph(steps, depends_by_step, result)
+
+
+def _validate_step(i: int, step: Any, result: ValidationResult, chain: bool) -> List[str]:
+    """Check one step and index it; returns the names it depends on."""
+    errors = result.errors
+    if not isinstance(step, dict):
+        errors.append(f"Step {i} must be a dictionary")
+        return []
+
+    # Step name validation
+    step_name = step.get("name")
+    if "name" not in step:
+        errors.append(f"Step {i} must have a 'name' field")
+    elif not isinstance(step_name, str) or not step_name.strip():
+        errors.append(f"Step {i} name cannot be empty")
+    elif step_name in result.step_index:
+        errors.append(f"Duplicate step name '{step_name}' found")
+    else:
+        result.step_index[step_name] = i
+    label = f"'{step_name}'" if isinstance(step_name, str) and step_name else str(i)
+
+    if not any(step.get(key) for key in STEP_ACTION_KEYS):
+        errors.append(f"Step {label} needs one of: {', '.join(STEP_ACTION_KEYS)}")
+
+    if "executor" in step:
+        _validate_executor(i, step["executor"], errors)
+
+    # Retry configuration
+    if "retry" in step:
+        retry = step["retry"]
+        if not isinstance(retry, dict):
+            errors.append(f"Step {label}: retry must be a dictionary")
+        elif "max_attempts" in retry and not isinstance(retry["max_attempts"], int):
+            errors.append(f"Step {label}: retry.max_attempts must be an integer")
+
+    # Dependencies are checked once all step names are known
+    depends = step.get("depends")
+    if depends is None:
+        return []
+    if isinstance(depends, str):
+        depends = [depends]
+    elif not isinstance(depends, list) or not all(isinstance(dep, str) for dep in depends):
+        errors.append(f"Step {i} depends must be a step name or a list of step names")
+        return []
+    if depends and chain:
+        result.warnings.append(f"Step {label} has explicit dependencies in chain mode")
+    return depends
+
+
+def _validate_executor(i: int, executor: Any, errors: List[str]) -> None:
+    if not isinstance(executor, dict):
+        errors.append(f"Step {i} executor must be a dictionary")
+        return
+    if "type" not in executor:
+        errors.append(f"Step {i} executor must have a 'type' field")
+        return
+    config = executor.get("config")
+    if executor["type"] != "tool" or not isinstance(config, dict):
+        return
+    tool_def = config.get("tool_def")
+    if not isinstance(tool_def, dict) or "with_services" not in tool_def:
+        return
+
+    # Validate bounded services
+    services = tool_def["with_services"]
+    if not isinstance(services, list):
+        errors.append(f"Step {i} tool_def with_services must be a list")
+        return
+    service_names = set()
+    for j, service in enumerate(services):
+        if not isinstance(service, dict):
+            errors.append(f"Step {i} service {j} must be a dictionary")
+            continue
+
+        # Required service fields
+        if "name" not in service:
+            errors.append(f"Step {i} service {j} must have a 'name' field")
+        elif service["name"] in service_names:
+            errors.append(f"Step {i} has duplicate service name '{service['name']}'")
+        else:
+            service_names.add(service["name"])
+
+        if "image" not in service:
+            errors.append(f"Step {i} service {j} must have an 'image' field")
+
+        # Validate ports
+        if "exposed_ports" in service:
+            ports = service["exposed_ports"]
+            if not isinstance(ports, list):
+                errors.append(f"Step {i} service {j} exposed_ports must be a list")
+            else:
+                for port in ports:
+                    if isinstance(port, bool) or not isinstance(port, int) or port < 1 or port > 65535:
+                        errors.append(f"Step {i} service {j} invalid port: {port}")
+
+
+def _analyze_graph(steps: List[Any], depends_by_step: List[List[str]], result: ValidationResult) -> None:
+    """Resolve dependencies, then find the run order, cycles and unreachable steps."""
+    index = result.step_index
+    names = list(index)
+    dependents: Dict[str, List[str]] = {name: [] for name in names}
+    missing: Dict[str, int] = {}
+
+    for i, depends in enumerate(depends_by_step):
+        name = steps[i].get("name") if isinstance(steps[i], dict) else None
+        if not depends:
+            if name in index and index[name] == i:
+                result.dependencies[name] = []
+            continue
+        known = []
+        for dep in depends:
+            if dep not in index:
+                result.errors.append(f"Step {i} depends on unknown step '{dep}'")
+            else:
+                known.append(dep)
+        # Steps with a duplicate or invalid name are left out of the graph
+        if name in index and index[name] == i:
+            result.dependencies[name] = known
+            missing[name] = len(known)
+            for dep in known:
+                dependents[dep].append(name)
+
+    # Kahn's algorithm: steps are runnable once all their dependencies are
+    ready = deque(name for name in names if not missing.get(name))
+    order = result.order
+    while ready:
+        name = ready.popleft()
+        order.append(name)
+        for dependent in dependents[name]:
+            missing[dependent] -= 1
+            if not missing[dependent]:
+                ready.append(dependent)
+    if len(order) == len(names):
+        return
+
+    # The steps left over are on a cycle or depend on one
+    blocked = [name for name in names if missing.get(name)]
+    on_cycle = set()
+    for component in _strongly_connected(blocked, result.dependencies):
+        if len(component) > 1 or component[0] in result.dependencies[component[0]]:
+            component.sort(key=index.__getitem__)
+            result.cycles.append(component)
+            on_cycle.update(component)
+    result.cycles.sort(key=lambda cycle: index[cycle[0]])
+    for cycle in result.cycles:
+        result.errors.append(f"Dependency cycle between steps: {', '.join(cycle)}")
+    for name in blocked:
+        if name not in on_cycle:
+            result.unreachable.append(name)
+            result.warnings.append(f"Step '{name}' can never run: it depends on a dependency cycle")
+
+
+def _strongly_connected(nodes: List[str], dependencies: Dict[str, List[str]]) -> List[List[str]]:
+    """Strongly connected components of ``nodes`` (iterative Tarjan)."""
+    members = set(nodes)
+    low: Dict[str, int] = {}
+    number: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack = set()
+    components: List[List[str]] = []
+
+    for root in nodes:
+        if root in number:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, edge = work.pop()
+            if edge == 0:
+                number[node] = low[node] = len(number)
+                stack.append(node)
+                on_stack.add(node)
+            edges = dependencies.get(node, ())
+            descended = False
+            while edge < len(edges):
+                target = edges[edge]
+                edge += 1
+                if target not in members:
+                    continue
+                if target not in number:
+                    work.append((node, edge))
+                    work.append((target, 0))
+                    descended = True
+                    break
+                if target in on_stack:
+                    low[node] = min(low[node], number[target])
+            if descended:
+                continue
+            if low[node] == number[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+    return components
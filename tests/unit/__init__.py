@@ -0,0 +1 @@
+"""Unit tests for the Kubiya Workflow SDK client and services."""
@@ -0,0 +1,12 @@
+"""Pytest configuration and fixtures for the unit tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep on-disk caches created by the code under test out of the home directory."""
+    path = tmp_path / "kubiya-cache"
+    monkeypatch.setenv("KUBIYA_CACHE_DIR", str(path))
+    return path
+
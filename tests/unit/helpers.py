@@ -0,0 +1,52 @@
+"""Fake HTTP responses and a client wired to a fake API, shared by the unit tests."""
+
+import io
+import json
+from typing import IO, Any, Callable, Dict, Optional, Union
+from unittest.mock import MagicMock
+
+import requests
+
+from kubiya_workflow_sdk.client import KubiyaClient
+
+API_KEY = "test-key"
+BASE_URL = "https://api.test"
+
+
+def json_response(
+    payload: Any = None,
+    status: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+    content: Optional[bytes] = None,
+) -> requests.Response:
+    """A response whose body is ``payload`` as JSON, or the raw ``content`` bytes."""
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response._content = content if content is not None else json.dumps(payload).encode()
+    response.raw = io.BytesIO()
+    response.url = f"{BASE_URL}/x"
+    return response
+
+
+def stream_response(body: Union[bytes, IO[bytes]], status: int = 200) -> requests.Response:
+    """A response whose body is read from the connection, as with ``stream=True``.
+
+    ``body`` is either the whole body or a file-like object to read it from.
+    """
+    response = requests.Response()
+    response.status_code = status
+    response.raw = io.BytesIO(body) if isinstance(body, bytes) else body
+    return response
+
+
+def mock_client(handler: Callable[..., Any], max_retries: Optional[int] = None, **kwargs: Any) -> KubiyaClient:
+    """A KubiyaClient whose requests are answered by ``handler(method, url, **kwargs)``.
+
+    ``handler`` may also be a list of responses, returned in order.
+    """
+    client = KubiyaClient(api_key=API_KEY, base_url=BASE_URL, **kwargs)
+    client.session.request = MagicMock(side_effect=handler)
+    if max_retries is not None:
+        client.retry_policy.max_retries = max_retries
+    return client
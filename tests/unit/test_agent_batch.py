@@ -0,0 +1,166 @@
+"""Tests for batched agent edits with optimistic concurrency."""
+
+import threading
+
+import pytest
+
+from kubiya_workflow_sdk.kubiya_services.exceptions import AgentConflictError
+from tests.unit.helpers import json_response, mock_client
+
+
+class _AgentAPI:
+    """Agent store with ETag versions that rejects stale If-Match writes."""
+
+    def __init__(self, agents, use_etags=True):
+        self.agents = {uuid: {"uuid": uuid, **agent} for uuid, agent in agents.items()}
+        self.versions = {uuid: 1 for uuid in agents}
+        self.use_etags = use_etags
+        self.requests = []
+        self.interfere = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, method, url, **kwargs):
+        uuid = url.rsplit("/", 1)[1]
+        with self.lock:
+            self.requests.append((method, uuid))
+            if uuid == "agents":
+                return json_response([dict(agent) for agent in self.agents.values()])
+            if method == "GET":
+                headers = {"ETag": f'"{self.versions[uuid]}"'} if self.use_etags else {}
+                return json_response(self.agents[uuid], headers=headers)
+
+            if self.interfere.get(uuid):
+                # Another client writes between our read and our write
+                self.interfere[uuid] -= 1
+                self.versions[uuid] += 1
+                self.agents[uuid]["tags"] = self.agents[uuid].get("tags", []) + ["other"]
+
+            if_match = kwargs["headers"].get("If-Match")
+            if if_match is not None and if_match != f'"{self.versions[uuid]}"':
+                return json_response({"error": "precondition failed"}, 412)
+            body = kwargs["json"]
+            self.agents[uuid].update(body)
+            self.versions[uuid] += 1
+            return json_response(self.agents[uuid])
+
+
+class TestAgentBatch:
+    def test_changes_are_merged_into_one_write_per_agent(self):
+        api = _AgentAPI({"a1": {"name": "one", "allowed_users": ["bob"]}, "a2": {"name": "two"}})
+        client = mock_client(api)
+
+        with client.agents.batch() as batch:
+            batch.edit("a1", add_allowed_users=["alice"], add_env_vars={"A": "1"})
+            batch.edit("a1", add_tools=["kubectl"], remove_allowed_users=["bob"])
+            batch.edit("a1", add_env_vars={"B": "2"}, remove_env_vars=["A"])
+            batch.update("a1", lambda agent: agent.update(ai_instructions="be nice"))
+            batch.edit("a2", llm_model="gpt-4o")
+
+        assert batch.result["success"]
+        assert sorted(api.requests) == [("GET", "a1"), ("GET", "a2"), ("PUT", "a1"), ("PUT", "a2")]
+        agent = api.agents["a1"]
+        assert agent["allowed_users"] == ["alice"]
+        assert agent["tools"] == ["kubectl"]
+        assert agent["environment_variables"] == {"B": "2"}
+        assert agent["ai_instructions"] == "be nice"
+        assert api.agents["a2"]["llm_model"] == "gpt-4o"
+
+    def test_concurrent_modification_is_retried_from_a_fresh_read(self):
+        api = _AgentAPI({"a1": {"name": "one", "tags": []}})
+        api.interfere["a1"] = 1
+        client = mock_client(api)
+
+        result = client.agents.batch().edit("a1", add_tools=["helm"]).commit()
+
+        assert result["success"]
+        assert api.requests == [("GET", "a1"), ("PUT", "a1"), ("GET", "a1"), ("PUT", "a1")]
+        # The other writer's change survives
+        assert api.agents["a1"]["tags"] == ["other"]
+        assert api.agents["a1"]["tools"] == ["helm"]
+
+    def test_persistent_conflicts_are_reported(self):
+        api = _AgentAPI({"a1": {"name": "one"}, "a2": {"name": "two"}})
+        api.interfere["a1"] = 10
+        client = mock_client(api)
+
+        result = client.agents.batch(max_attempts=2).edit("a1", name="x").edit("a2", name="y").commit()
+
+        assert not result["success"]
+        assert "a1" in result["failed"] and "a2" in result["updated"]
+        with pytest.raises(AgentConflictError):
+            api.interfere["a1"] = 10
+            client.agents.edit("a1", name="x")
+
+    def test_updated_at_precondition_without_etag(self):
+        api = _AgentAPI({"a1": {"name": "one", "updated_at": "2026-01-02T03:04:05Z"}}, use_etags=False)
+        client = mock_client(api)
+
+        client.agents.edit("a1", description="new")
+
+        put_headers = client.session.request.call_args_list[-1].kwargs["headers"]
+        assert put_headers["If-Unmodified-Since"] == "Fri, 02 Jan 2026 03:04:05 GMT"
+        assert api.agents["a1"]["description"] == "new"
+
+    def test_edit_without_changes_returns_the_agent_as_read(self):
+        api = _AgentAPI({"a1": {"name": "one", "description": "same"}})
+        client = mock_client(api)
+
+        agent = client.agents.edit("a1", description="same")
+
+        assert agent == {"uuid": "a1", "name": "one", "description": "same"}
+        assert api.requests == [("GET", "a1")]
+
+    def test_batch_is_discarded_on_error(self):
+        api = _AgentAPI({"a1": {"name": "one"}})
+        client = mock_client(api)
+        with pytest.raises(RuntimeError):
+            with client.agents.batch() as batch:
+                batch.edit("a1", name="x")
+                raise RuntimeError("abort")
+        assert api.requests == []
+        assert batch.result is None
+
+
+class TestAgentBulkEdit:
+    def _fleet(self, size=20):
+        return _AgentAPI({
+            f"a{i}": {"name": f"agent-{i}", "llm_model": "claude-4-sonnet" if i % 2 else "gpt-4o", "secrets": []}
+            for i in range(size)
+        })
+
+    def test_selected_agents_are_edited_concurrently(self):
+        api = self._fleet()
+        client = mock_client(api)
+
+        results = list(client.agents.bulk_edit(
+            {"llm_model": "claude-4-sonnet"}, {"llm_model": "claude-4-opus", "add_secrets": ["TOKEN"]}, concurrency=4
+        ))
+
+        assert len(results) == 10
+        assert all(r["status"] == "updated" for r in results)
+        assert results[0]["changes"]["secrets"] == {"from": [], "to": ["TOKEN"]}
+        assert sorted(a["llm_model"] for a in api.agents.values()) == ["claude-4-opus"] * 10 + ["gpt-4o"] * 10
+
+    def test_dry_run_reports_diff_without_writing(self):
+        api = self._fleet(4)
+        client = mock_client(api)
+
+        results = {r["uuid"]: r for r in client.agents.bulk_edit(lambda a: True, {"llm_model": "gpt-4o"}, dry_run=True)}
+
+        assert results["a1"]["status"] == "planned"
+        assert results["a1"]["changes"] == {"llm_model": {"from": "claude-4-sonnet", "to": "gpt-4o"}}
+        assert results["a0"]["status"] == "unchanged"
+        assert [m for m, _ in api.requests] == ["GET"]
+
+    def test_uuid_selector_and_unchanged_agents_are_not_written(self):
+        api = self._fleet(4)
+        client = mock_client(api)
+
+        results = {r["uuid"]: r for r in client.agents.bulk_edit(["a0", "a1", "missing"], {"llm_model": "gpt-4o"})}
+
+        assert results["a0"]["status"] == "unchanged"
+        assert results["a1"]["status"] == "updated"
+        assert results["missing"]["status"] == "failed"
+        assert ("PUT", "a0") not in api.requests
+        assert ("GET", "agents") not in api.requests
+
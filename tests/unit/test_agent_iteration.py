@@ -0,0 +1,92 @@
+"""Tests for lazy, paginated agent iteration."""
+
+import itertools
+from unittest.mock import MagicMock
+
+import pytest
+
+from kubiya_workflow_sdk.kubiya_services.exceptions import AgentError
+from tests.unit.helpers import json_response, mock_client
+
+
+class _AgentListAPI:
+    """Agent list endpoint that pages when ``paginate`` is set and ignores paging otherwise."""
+
+    def __init__(self, total: int, paginate: bool = True):
+        self.agents = [
+            {
+                "uuid": f"a{i}",
+                "name": f"agent-{i:03d}",
+                "description": "deploys things" if i % 10 == 0 else "",
+                "llm_model": "gpt-4o" if i % 2 else "claude-4-sonnet",
+                "integrations": ["github"] if i % 7 == 0 else [],
+                "runners": ["r1"] if i % 3 == 0 else [],
+                "sources": ["s1"],
+            }
+            for i in range(total)
+        ]
+        self.paginate = paginate
+        self.requests = []
+
+    def __call__(self, method, url, **kwargs):
+        params = {k: str(v) for k, v in kwargs["params"].items()}
+        self.requests.append(params)
+        if not self.paginate:
+            return json_response(self.agents)
+        offset, size = int(params["offset"]), int(params["limit"])
+        return json_response({"agents": self.agents[offset:offset + size]})
+
+
+class TestIterAgents:
+    def test_pages_are_fetched_lazily(self):
+        api = _AgentListAPI(total=500)
+        agents = list(itertools.islice(mock_client(api, max_retries=0).agents.iter_agents(page_size=25), 10))
+
+        assert [a["uuid"] for a in agents] == [f"a{i}" for i in range(10)]
+        # The first page and at most one prefetched page
+        assert len(api.requests) <= 2
+        assert api.requests[0] == {"limit": "25", "offset": "0"}
+
+    def test_all_pages_are_iterated(self):
+        api = _AgentListAPI(total=120)
+        agents = list(mock_client(api, max_retries=0).agents.iter_agents(page_size=50, sort_by="updated"))
+
+        assert len(agents) == 120
+        assert [r["offset"] for r in api.requests] == ["0", "50", "100"]
+        assert api.requests[0]["sort_by"] == "updated_at"
+
+    def test_server_without_paging_is_fetched_once(self):
+        api = _AgentListAPI(total=30, paginate=False)
+        assert len(list(mock_client(api, max_retries=0).agents.iter_agents(page_size=10))) == 30
+        assert len(api.requests) == 1
+
+    def test_repeated_first_page_ends_iteration(self):
+        api = _AgentListAPI(total=10, paginate=False)
+        assert len(list(mock_client(api, max_retries=0).agents.iter_agents(page_size=10))) == 10
+        # The repeated page, plus possibly one prefetched after it
+        assert 2 <= len(api.requests) <= 3
+
+    def test_filter_term_is_sent_and_applied_locally(self):
+        api = _AgentListAPI(total=50)
+        client = mock_client(api, max_retries=0)
+        uuids = {a["uuid"] for a in client.agents.iter_agents(filter_term="GitHub", page_size=20)}
+
+        assert api.requests[0]["search"] == "GitHub"
+        assert uuids == {f"a{i}" for i in range(0, 50, 7)}
+
+    def test_fetch_errors_raise_agent_error(self):
+        client = mock_client(_AgentListAPI(total=1), max_retries=0)
+        client.session.request = MagicMock(return_value=json_response({}, 500))
+        with pytest.raises(AgentError):
+            list(client.agents.iter_agents())
+
+
+class TestListAgents:
+    def test_list_filters_sorts_and_limits(self):
+        api = _AgentListAPI(total=60)
+        agents = mock_client(api, max_retries=0).agents.list(filter_term="deploys", limit=3, show_active=True)
+
+        assert [a["name"] for a in agents] == ["agent-000", "agent-030"]
+
+        agents = mock_client(api, max_retries=0).agents.list(sort_by="name", limit=5)
+        assert [a["name"] for a in agents] == [f"agent-{i:03d}" for i in range(5)]
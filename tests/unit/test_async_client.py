@@ -0,0 +1,77 @@
+"""Tests for AsyncKubiyaClient and the async BaseService helpers."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from kubiya_workflow_sdk.client import AsyncKubiyaClient
+from kubiya_workflow_sdk.core.exceptions import APIError, AuthenticationError
+
+
+def _client(handler) -> AsyncKubiyaClient:
+    return AsyncKubiyaClient(
+        api_key="test-key",
+        base_url="https://api.test",
+        transport=httpx.MockTransport(handler),
+    )
+
+
+class TestAsyncKubiyaClient:
+    """Request handling on the shared async transport."""
+
+    @pytest.mark.asyncio
+    async def test_service_helpers_share_one_pool(self):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append((request.method, request.url.path, request.headers["Authorization"]))
+            return httpx.Response(200, json={"ok": True})
+
+        async with _client(handler) as client:
+            http = client._get_http_client()
+            responses = await asyncio.gather(
+                client.agents._aget("/api/v1/agents"),
+                client.sources._aget("/api/v1/sources"),
+                client.secrets._apost("/api/v1/secrets", data={"name": "s"}),
+            )
+            assert client._get_http_client() is http
+
+        assert [r.json() for r in responses] == [{"ok": True}] * 3
+        assert sorted(m for m, _, _ in seen) == ["GET", "GET", "POST"]
+        assert all(auth == "UserKey test-key" for _, _, auth in seen)
+
+    @pytest.mark.asyncio
+    async def test_error_mapping(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/unauthorized":
+                return httpx.Response(401)
+            return httpx.Response(500, json={"error": "boom"})
+
+        async with _client(handler) as client:
+            with pytest.raises(AuthenticationError):
+                await client.make_request("GET", "/unauthorized")
+            with pytest.raises(APIError) as exc_info:
+                await client.make_request("GET", "/broken")
+
+        assert exc_info.value.status_code == 500
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_data_payloads(self):
+        body = (
+            'data: {"type": "step_running"}\n\n'
+            'data: 2:{"type": "log"}\n\n'
+            'data: {"end": true}\n\n'
+            'data: {"type": "after-end"}\n\n'
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["Accept"] == "text/event-stream"
+            return httpx.Response(200, content=body.encode())
+
+        async with _client(handler) as client:
+            stream = await client.make_request("POST", "/api/v1/workflow", data={}, stream=True)
+            events = [json.loads(event) async for event in stream]
+
+        assert events == [{"type": "step_running"}, {"type": "log"}, {"end": True}]
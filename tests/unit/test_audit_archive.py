@@ -0,0 +1,141 @@
+"""Tests for the local audit archive and AuditService.sync_to."""
+
+import json
+import os
+from urllib.parse import parse_qs, urlsplit
+
+from kubiya_workflow_sdk.kubiya_services.audit_archive import AuditArchive
+from tests.unit.helpers import json_response, mock_client
+
+
+def _item(i, day=1, **fields):
+    item = {
+        "id": f"evt-{i}",
+        "timestamp": f"2026-01-{day:02d}T10:00:{i % 60:02d}Z",
+        "category_type": "agents" if i % 2 else "workflows",
+        "action_type": "create",
+        "action_successful": i % 3 != 0,
+    }
+    item.update(fields)
+    return item
+
+
+class _AuditAPI:
+    def __init__(self, items):
+        self.items = items
+        self.fetched = 0
+        self.start_times = []
+
+    def __call__(self, method, url, **kwargs):
+        params = {k: v[0] for k, v in parse_qs(urlsplit(url).query).items()}
+        gte = json.loads(params["filter"])["timestamp"]["gte"]
+        if params["page"] == "1":
+            self.start_times.append(gte)
+        matching = sorted((i for i in self.items if i["timestamp"] >= gte), key=lambda i: i["timestamp"])
+        page, size = int(params["page"]), int(params["page_size"])
+        items = matching[(page - 1) * size:page * size]
+        self.fetched += len(items)
+        return json_response({"items": items})
+
+
+class TestAuditArchive:
+    def test_partitions_and_local_query(self, tmp_path):
+        archive = AuditArchive(str(tmp_path))
+        items = [_item(i, day=1 + i % 3) for i in range(30)]
+        items.append(_item(99, day=2, category_name="Déploiement \"prod\""))
+        assert archive.append(items) == 31
+
+        assert sorted(archive.partitions()) == ["2026-01-01", "2026-01-02", "2026-01-03"]
+        assert sorted(n for n in os.listdir(tmp_path) if not n.startswith(".")) == [
+            "2026-01-01.jsonl", "2026-01-02.jsonl", "2026-01-03.jsonl", "manifest.json"
+        ]
+
+        reopened = AuditArchive(str(tmp_path))
+        assert len(reopened) == 31
+        day2 = list(reopened.query(start_time="2026-01-02T00:00:00Z", end_time="2026-01-02T23:59:59Z"))
+        assert len(day2) == 11
+        failed_agents = list(reopened.query(category_type="agents", status="failed"))
+        assert failed_agents and all(i["category_type"] == "agents" and not i["action_successful"] for i in failed_agents)
+        assert [i["id"] for i in reopened.query(text='déploiement "PROD"')] == ["evt-99"]
+        assert list(reopened.query(action_type="delete")) == []
+        assert len(list(reopened.query(limit=5))) == 5
+
+    def test_boundary_items_are_not_stored_twice(self, tmp_path):
+        archive = AuditArchive(str(tmp_path))
+        archive.append([_item(1), _item(2)])
+        assert archive.append([_item(2), _item(3)]) == 1
+        assert AuditArchive(str(tmp_path)).append([_item(3)]) == 0
+        assert archive.cursor == "2026-01-01T10:00:03Z"
+
+    def test_sub_second_overlap_is_not_stored_twice(self, tmp_path):
+        archive = AuditArchive(str(tmp_path))
+        items = [
+            _item(1, timestamp="2026-01-01T10:00:05.300Z"),
+            _item(2, timestamp="2026-01-01T10:00:10.700Z"),
+        ]
+        archive.append(items)
+        assert archive.resume_from(overlap_seconds=5) == "2026-01-01T10:00:05Z"
+
+        # The next sync fetches everything from the rounded-down resume point again
+        assert archive.append(items) == 0
+        assert len(AuditArchive(str(tmp_path))) == 2
+
+    def test_uncommitted_bytes_are_truncated_by_the_next_writer(self, tmp_path):
+        archive = AuditArchive(str(tmp_path))
+        archive.append([_item(1)])
+        partition = tmp_path / "2026-01-01.jsonl"
+        with open(partition, "a") as f:
+            f.write('{"id": "partial"')
+
+        reader = AuditArchive(str(tmp_path))
+        assert [i["id"] for i in reader.query()] == ["evt-1"]
+        # Opening for reading leaves a concurrent writer's tail alone
+        assert partition.read_text().endswith('"partial"')
+
+        reader.append([_item(2)])
+        assert [i["id"] for i in AuditArchive(str(tmp_path)).query()] == ["evt-1", "evt-2"]
+        assert "partial" not in partition.read_text()
+
+    def test_partition_left_by_an_interrupted_writer_is_removed(self, tmp_path):
+        archive = AuditArchive(str(tmp_path))
+        archive.append([_item(1)])
+        with open(tmp_path / "2026-01-02.jsonl", "w") as f:
+            f.write('{"id": "partial"')
+
+        archive.append([_item(2, day=2)])
+
+        assert [i["id"] for i in AuditArchive(str(tmp_path)).query()] == ["evt-1", "evt-2"]
+
+    def test_stale_reader_stops_at_committed_bytes(self, tmp_path):
+        writer = AuditArchive(str(tmp_path))
+        writer.append([_item(1, category_name="Déploiement ✓")])
+        reader = AuditArchive(str(tmp_path))
+
+        writer.append([_item(2, category_name="Überprüfung ✓")])
+
+        assert [i["id"] for i in reader.query()] == ["evt-1"]
+        assert [i["id"] for i in AuditArchive(str(tmp_path)).query()] == ["evt-1", "evt-2"]
+
+    def test_writers_see_each_others_commits(self, tmp_path):
+        first, second = AuditArchive(str(tmp_path)), AuditArchive(str(tmp_path))
+        first.append([_item(1)])
+        assert second.append([_item(1), _item(2)]) == 1
+        assert len(AuditArchive(str(tmp_path))) == 2
+
+
+class TestAuditSync:
+    def test_only_the_tail_is_fetched(self, tmp_path):
+        api = _AuditAPI([_item(i) for i in range(40)])
+        client = mock_client(api)
+
+        first = client.audit.sync_to(str(tmp_path), start_time="2026-01-01T00:00:00Z", page_size=15)
+        assert first["written"] == 40 and first["total"] == 40
+
+        api.items.extend(_item(i) for i in range(40, 45))
+        api.fetched = 0
+        second = client.audit.sync_to(str(tmp_path), page_size=15)
+
+        assert api.start_times[-1] == "2026-01-01T10:00:34Z"
+        assert api.fetched == 11
+        assert second["written"] == 5 and second["total"] == 45
+        assert second["cursor"] == "2026-01-01T10:00:44Z"
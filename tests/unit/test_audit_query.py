@@ -0,0 +1,99 @@
+"""Tests for the paged audit query engine."""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from kubiya_workflow_sdk.kubiya_services.exceptions import AuditError
+from kubiya_workflow_sdk.kubiya_services.services.audit import _searchable_text
+from tests.unit.helpers import json_response, mock_client
+
+
+class _PagedAuditAPI:
+    """Serves ``total`` items in pages, recording the query parameters of each request."""
+
+    def __init__(self, total: int, delay: float = 0.0):
+        self.items = [
+            {"id": f"evt-{i}", "timestamp": "2026-01-01T00:00:00Z", "category_name": f"agent-{i}",
+             "action_successful": i % 2 == 0, "extra": {"note": "deploy" if i % 5 == 0 else "noop"}}
+            for i in range(total)
+        ]
+        self.delay = delay
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, url, **kwargs):
+        parts = urlsplit(url)
+        if not parts.path.endswith("/items"):
+            return json_response({"error": "not found"}, 404)
+        params = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        with self.lock:
+            self.requests.append(params)
+        time.sleep(self.delay)
+        page, size = int(params["page"]), int(params["page_size"])
+        return json_response({"items": self.items[(page - 1) * size:page * size]})
+
+
+class TestAuditQuery:
+    def test_pages_are_prefetched_while_consuming(self):
+        api = _PagedAuditAPI(total=250, delay=0.1)
+        results = mock_client(api, max_retries=0).audit.query(page_size=50, prefetch=4)
+
+        start = time.monotonic()
+        ids = [item["id"] for item in results]
+        elapsed = time.monotonic() - start
+
+        assert ids == [f"evt-{i}" for i in range(250)]
+        # Six sequential requests would take at least 0.6s
+        assert elapsed < 0.5
+
+    def test_filters_are_sent_to_the_api(self):
+        api = _PagedAuditAPI(total=20)
+        results = list(mock_client(api, max_retries=0).audit.query(
+            text="Deploy", status="success", category_type="agents",
+            start_time="2026-01-01T00:00:00Z", page_size=50,
+        ))
+
+        params = api.requests[0]
+        assert params["search_text"] == "Deploy"
+        assert params["status_filter"] == "success"
+        assert json.loads(params["filter"])["category_type"] == "agents"
+        assert json.loads(params["filter"])["timestamp"] == {"gte": "2026-01-01T00:00:00Z"}
+        # The fake server ignores text/status, so they are applied client-side
+        assert [item["id"] for item in results] == ["evt-0", "evt-10"]
+
+    def test_max_pages_and_early_close(self):
+        api = _PagedAuditAPI(total=1000)
+        assert len(list(mock_client(api, max_retries=0).audit.query(page_size=10, max_pages=3, prefetch=1))) == 30
+
+        results = mock_client(api, max_retries=0).audit.query(page_size=10, prefetch=1)
+        next(results)
+        results.close()
+
+    def test_describe_falls_back_to_filtered_query(self):
+        api = _PagedAuditAPI(total=300)
+        item = mock_client(api, max_retries=0).audit.describe("evt-150")
+
+        assert item["id"] == "evt-150"
+        assert json.loads(api.requests[0]["filter"])["id"] == "evt-150"
+        assert len(api.requests) <= 4
+
+    def test_invalid_status(self):
+        with pytest.raises(ValueError):
+            next(mock_client(_PagedAuditAPI(total=1), max_retries=0).audit.query(status="maybe"))
+
+    def test_page_errors_raise_audit_error(self):
+        client = mock_client(_PagedAuditAPI(total=1), max_retries=0)
+        client.session.request = MagicMock(return_value=json_response({}, 500))
+        with pytest.raises(AuditError):
+            list(client.audit.query())
+
+
+def test_searchable_text_uses_values_not_keys():
+    text = _searchable_text({"category_name": "Deploy-Bot", "nested": [{"n": 42}], "flag": True})
+    assert "deploy-bot" in text and "42" in text
+    assert "category_name" not in text
@@ -0,0 +1,98 @@
+"""Tests for gap-free, bounded-memory audit log streaming."""
+
+import json
+from datetime import datetime, timedelta, UTC
+from urllib.parse import parse_qs, urlsplit
+
+from kubiya_workflow_sdk.kubiya_services.services.audit import _AuditCursor
+from tests.unit.helpers import mock_client, stream_response
+
+BASE = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _ts(seconds: float) -> str:
+    return (BASE + timedelta(seconds=seconds)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class _FakeAuditAPI:
+    """Audit log that honours the timestamp filter, ascending sort and paging."""
+
+    def __init__(self, stream_events=None):
+        self.items = []
+        self.stream_events = stream_events
+        self.list_requests = 0
+
+    def add(self, count: int, per_second: int = 10):
+        start = len(self.items)
+        for i in range(start, start + count):
+            self.items.append({"id": f"evt-{i}", "timestamp": _ts(i // per_second), "action_type": "run"})
+
+    def __call__(self, method, url, **kwargs):
+        parts = urlsplit(url)
+        params = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        if parts.path.endswith("/stream"):
+            if self.stream_events is None:
+                return stream_response(b"not found", 404)
+            body = "".join(f"id: {i}\ndata: {json.dumps(e)}\n\n" for i, e in enumerate(self.stream_events))
+            return stream_response(body.encode())
+
+        self.list_requests += 1
+        gte = json.loads(params["filter"])["timestamp"]["gte"]
+        matching = sorted((i for i in self.items if i["timestamp"] >= gte), key=lambda i: i["timestamp"])
+        page, size = int(params["page"]), int(params["page_size"])
+        body = {"items": matching[(page - 1) * size:page * size]}
+        return stream_response(json.dumps(body).encode())
+
+
+def _take(stream, count):
+    return [next(stream) for _ in range(count)]
+
+
+class TestAuditStream:
+    def test_bursts_larger_than_a_page_are_not_dropped(self):
+        api = _FakeAuditAPI()
+        api.add(230)
+        client = mock_client(api)
+        stream = client.audit.stream(
+            start_time=_ts(0), page_size=50, poll_interval=0.01, min_poll_interval=0.01, verbose=False
+        )
+
+        first = _take(stream, 230)
+        assert [i["id"] for i in first] == [f"evt-{i}" for i in range(230)]
+        assert client.audit._audit_stream_supported is False
+
+        # Later polls re-read the overlap before the cursor without duplicating it
+        api.add(3)
+        assert [i["id"] for i in _take(stream, 3)] == ["evt-230", "evt-231", "evt-232"]
+        stream.close()
+
+    def test_uses_stream_endpoint_when_available(self):
+        events = [{"id": "a", "timestamp": _ts(1)}, {"items": [{"id": "b", "timestamp": _ts(2)}]}, {"id": "a", "timestamp": _ts(1)}]
+        api = _FakeAuditAPI(stream_events=events)
+        api.add(1, per_second=1)
+        client = mock_client(api)
+        stream = client.audit.stream(start_time=_ts(0), poll_interval=0.01, verbose=False)
+
+        assert [i["id"] for i in _take(stream, 2)] == ["a", "b"]
+        assert client.audit._audit_stream_supported is True
+        assert api.list_requests == 0
+
+        # Once the stream ends, polling resumes from the cursor
+        assert next(stream)["id"] == "evt-0"
+        stream.close()
+
+
+class TestAuditCursor:
+    def test_recent_keys_stay_bounded(self):
+        cursor = _AuditCursor(_ts(0), window=10)
+        for i in range(10000):
+            assert cursor.accept({"id": i, "timestamp": _ts(i)})
+        assert len(cursor) <= 11
+        assert cursor.timestamp == _ts(9999)
+
+    def test_duplicates_within_window_are_rejected(self):
+        cursor = _AuditCursor(_ts(0), window=60)
+        item = {"timestamp": _ts(5), "category_type": "agents", "action_type": "create"}
+        assert cursor.accept(item)
+        assert not cursor.accept(dict(item))
+        assert cursor.query_start(5) == _ts(0)
@@ -0,0 +1,219 @@
+"""Tests for the parse -> enrich/filter -> sink event pipeline."""
+
+import io
+import json
+import threading
+from unittest.mock import patch
+
+import requests
+
+from kubiya_workflow_sdk.core.pipeline import (
+    ConsoleSink,
+    EventPipeline,
+    EventSink,
+    JSONLinesSink,
+    MetricsSink,
+    StepTracker,
+    Tap,
+    TypeFilter,
+)
+from kubiya_workflow_sdk.core.sse import SSEEvent
+from kubiya_workflow_sdk.execution import ExecutionMode, LogLevel, execute_workflow_with_logging
+from tests.unit.helpers import stream_response
+
+EVENTS = [
+    {"type": "heartbeat"},
+    {"type": "step_running", "step": {"name": "build"}},
+    {"type": "log", "output": "🚀 compiling\nplain line\n✅ built"},
+    {"type": "step_finished", "step": {"name": "build"}},
+    {"type": "end", "end": True},
+]
+
+WORKFLOW = {"name": "ci", "steps": [{"name": "build", "command": "make"}]}
+
+
+class _Recorder(EventSink):
+    def __init__(self):
+        self.calls = []
+
+    def start(self, workflow):
+        self.calls.append(("start", workflow and workflow["name"]))
+
+    def handle(self, event):
+        self.calls.append(("handle", event.type, event.step))
+
+    def finish(self, error):
+        self.calls.append(("finish", error))
+
+    def close(self):
+        self.calls.append(("close",))
+
+
+class _BlockingSink(EventSink):
+    def __init__(self):
+        self.release = threading.Event()
+        self.handled = 0
+
+    def handle(self, event):
+        self.release.wait(5)
+        self.handled += 1
+
+
+def _sse_events():
+    return [SSEEvent(data=f"2:{json.dumps(event)}") for event in EVENTS] + [SSEEvent(data="[DONE]")]
+
+
+class TestEventPipeline:
+    def test_events_are_parsed_once_and_tagged(self):
+        recorder = _Recorder()
+        items = _sse_events()
+
+        with patch("json.loads", side_effect=AssertionError("parsed twice")):
+            events = list(EventPipeline(stages=[StepTracker()], sinks=[recorder]).run(items, workflow=WORKFLOW))
+
+        assert [event.index for event in events] == [1, 2, 3, 4, 5]
+        assert events[2].data is items[2].json()
+        assert events[2].raw == items[2].payload
+        assert events[2].step == "build"
+        assert events[-1].is_end
+        assert recorder.calls[0] == ("start", "ci")
+        assert recorder.calls[3] == ("handle", "log", "build")
+        assert recorder.calls[-2:] == [("finish", None), ("close",)]
+
+    def test_stages_filter_and_tap(self):
+        seen = []
+        pipeline = EventPipeline(stages=[TypeFilter(exclude={"heartbeat"}), Tap(seen.append)])
+
+        events = list(pipeline.run(EVENTS + [{"type": "after_end"}]))
+
+        assert [event.type for event in events] == ["step_running", "log", "step_finished", "end"]
+        assert seen == EVENTS[1:]
+        assert TypeFilter(include={"log"})(events[0]) is None
+
+    def test_slow_sink_does_not_block_reader(self):
+        sink = _BlockingSink()
+        pipeline = EventPipeline(sinks=[sink], buffer_size=len(EVENTS))
+
+        events = list(pipeline.process(event) for event in EVENTS)
+
+        assert len(events) == len(EVENTS) and sink.handled == 0
+        sink.release.set()
+        pipeline.close()
+        assert sink.handled == len(EVENTS)
+
+    def test_drop_overflow(self):
+        sink = _BlockingSink()
+        pipeline = EventPipeline(sinks=[sink], buffer_size=1, overflow="drop")
+
+        for _ in range(50):
+            pipeline.process({"type": "log", "output": "x"})
+
+        assert pipeline.dropped >= 48
+        sink.release.set()
+        pipeline.close()
+        assert sink.handled + pipeline.dropped == 50
+
+    def test_failing_sink_is_isolated(self):
+        class Broken(EventSink):
+            def handle(self, event):
+                raise RuntimeError("boom")
+
+        recorder = _Recorder()
+        events = list(EventPipeline(sinks=[Broken(), recorder]).run(EVENTS))
+
+        assert len(events) == len(EVENTS)
+        assert sum(call[0] == "handle" for call in recorder.calls) == len(EVENTS)
+
+    def test_stream_error_reaches_sinks(self):
+        def items():
+            yield EVENTS[0]
+            raise ConnectionError("lost")
+
+        recorder = _Recorder()
+        pipeline = EventPipeline(sinks=[recorder], background=False)
+        try:
+            list(pipeline.run(items()))
+        except ConnectionError:
+            pass
+
+        assert recorder.calls[-2][0] == "finish"
+        assert str(recorder.calls[-2][1]) == "lost"
+
+
+class TestSinks:
+    def test_json_lines_reuse_raw_payload(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+
+        list(EventPipeline(sinks=[JSONLinesSink(str(path))]).run(_sse_events() + ["not json"]))
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [record["event"] for record in records] == EVENTS
+        assert [record["index"] for record in records] == [1, 2, 3, 4, 5]
+
+    def test_metrics(self):
+        metrics = MetricsSink()
+
+        list(EventPipeline(sinks=[metrics]).run(EVENTS))
+
+        snapshot = metrics.snapshot()
+        assert snapshot["events"] == len(EVENTS)
+        assert snapshot["events_by_type"]["log"] == 1
+        assert snapshot["output_lines"] == 3
+        assert set(snapshot["step_durations"]) == {"build"}
+
+    def test_console_rendering(self):
+        out = io.StringIO()
+
+        list(EventPipeline(sinks=[ConsoleSink(LogLevel.NORMAL, stream=out)]).run(EVENTS, workflow=WORKFLOW))
+
+        text = out.getvalue()
+        assert "🚀 Executing Workflow: ci" in text
+        assert "🚀 Starting: build" in text
+        assert "📤 🚀 compiling" in text and "plain line" not in text
+        assert "✅ Completed: build" in text
+        assert "🏁 Workflow ended" in text
+        assert "💓 Heartbeat" not in text
+        assert "✅ build: finished" in text
+
+    def test_console_error_guidance(self):
+        out = io.StringIO()
+        sink = ConsoleSink("minimal", stream=out)
+
+        sink.finish(RuntimeError("401 Unauthorized"))
+
+        assert "🔑 Authentication Error!" in out.getvalue()
+        assert "📋 Error Details: 401 Unauthorized" in out.getvalue()
+
+
+class TestExecuteWorkflowWithLogging:
+    @staticmethod
+    def _fake_request(self, method, url, **kwargs):
+        body = "".join(f"data: {json.dumps(event)}\n\n" for event in EVENTS)
+        return stream_response(body.encode())
+
+    def test_logging_mode_yields_dicts_without_printing(self, capsys):
+        metrics = MetricsSink()
+        with patch.object(requests.Session, "request", self._fake_request):
+            events = list(execute_workflow_with_logging(WORKFLOW, api_key="key", sinks=[metrics]))
+
+        assert events == EVENTS
+        assert capsys.readouterr().out == ""
+        assert metrics.snapshot()["events"] == len(EVENTS)
+
+    def test_default_console_sink(self, capsys):
+        with patch.object(requests.Session, "request", self._fake_request):
+            list(execute_workflow_with_logging(WORKFLOW, api_key="key", log_level=LogLevel.MINIMAL))
+
+        out = capsys.readouterr().out
+        assert "Starting: build" in out and "Workflow Execution Complete" in out
+
+    def test_events_mode(self):
+        seen = []
+        with patch.object(requests.Session, "request", self._fake_request):
+            events = list(
+                execute_workflow_with_logging(WORKFLOW, api_key="key", mode=ExecutionMode.EVENTS, on_event=seen.append)
+            )
+
+        assert [event["_event_count"] for event in events] == [1, 2, 3, 4, 5]
+        assert seen == EVENTS
+        assert "runner" not in WORKFLOW
@@ -0,0 +1,148 @@
+"""Tests for folding workflow stream events into an ExecutionResult."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from kubiya_workflow_sdk.client import KubiyaClient
+from kubiya_workflow_sdk.core.constants import StepStatus, WorkflowStatus
+from kubiya_workflow_sdk.core.results import ExecutionReducer
+from kubiya_workflow_sdk.core.sse import SSEEvent
+from kubiya_workflow_sdk.core.types import ExecutionResult
+from tests.unit.helpers import mock_client, stream_response
+
+EVENTS = [
+    {"type": "step_running", "step": {"name": "build"}, "execution_id": "exec-1"},
+    {"type": "log", "output": "compiling\n"},
+    {"type": "log", "output": "done\n"},
+    {"type": "step_finished", "step": {"name": "build", "status": "finished"}},
+    {"type": "step_running", "step": {"name": "test"}},
+    {"type": "step_finished", "step": {"name": "test", "status": "failed", "error": "2 tests failed"}},
+    {"type": "workflow_failed", "end": True},
+]
+
+
+class _Clock:
+    """Clock advancing one second per reading."""
+
+    def __init__(self):
+        self.now = datetime(2024, 1, 1)
+
+    def __call__(self):
+        self.now += timedelta(seconds=1)
+        return self.now
+
+
+class _Handler:
+    def __init__(self):
+        self.calls = []
+
+    def on_step_start(self, step_name):
+        self.calls.append(("start", step_name))
+
+    def on_step_output(self, step_name, output):
+        self.calls.append(("output", step_name, output))
+
+    def on_step_complete(self, step_name, result):
+        self.calls.append(("complete", step_name, result.status))
+
+    def on_workflow_complete(self, result):
+        self.calls.append(("workflow", result.status))
+
+
+def _sse(events) -> bytes:
+    return "".join(f"data: {json.dumps(event)}\n\n" for event in events).encode()
+
+
+def _client(events) -> KubiyaClient:
+    return mock_client(lambda method, url, **kwargs: stream_response(_sse(events)), max_retries=0)
+
+
+class TestExecutionReducer:
+    def test_folds_steps_output_and_status(self):
+        reducer = ExecutionReducer("ci", clock=_Clock())
+        result = reducer.fold(EVENTS)
+
+        assert result.execution_id == "exec-1"
+        assert result.status == WorkflowStatus.FAILED
+        assert [step.step_name for step in result.steps] == ["build", "test"]
+        build, test = reducer.step("build"), reducer.step("test")
+        assert build.status == StepStatus.COMPLETED
+        assert build.outputs["output"] == "compiling\ndone\n"
+        assert build.duration_seconds > 0
+        assert test.status == StepStatus.FAILED and test.error == "2 tests failed"
+        assert result.steps_completed == result.steps_total == 2
+        assert result.metadata["events"] == len(EVENTS)
+        assert result.duration_seconds > 0
+
+    def test_result_is_live_while_streaming(self):
+        reducer = ExecutionReducer("ci")
+        reducer.add(json.dumps(EVENTS[0]))
+        reducer.add(SSEEvent(data=json.dumps(EVENTS[1])))
+
+        assert reducer.result.status == WorkflowStatus.RUNNING
+        assert reducer.step("build").status == StepStatus.RUNNING
+        assert reducer.output("build") == "compiling\n"
+        assert reducer.step("test") is None
+
+    def test_handlers_are_called(self):
+        handler = _Handler()
+        ExecutionReducer("ci", handlers=[handler]).fold(EVENTS)
+
+        assert handler.calls == [
+            ("start", "build"),
+            ("output", "build", "compiling\n"),
+            ("output", "build", "done\n"),
+            ("complete", "build", StepStatus.COMPLETED),
+            ("start", "test"),
+            ("complete", "test", StepStatus.FAILED),
+            ("workflow", WorkflowStatus.FAILED),
+        ]
+
+    def test_partial_handlers_and_failing_handlers(self):
+        class OnlyComplete:
+            def on_workflow_complete(self, result):
+                raise RuntimeError("boom")
+
+        result = ExecutionReducer("ci", handlers=[OnlyComplete()]).fold(EVENTS[:4])
+        assert result.status == WorkflowStatus.COMPLETED
+
+    def test_stream_error_fails_open_steps(self):
+        def events():
+            yield EVENTS[0]
+            raise ConnectionError("dropped")
+
+        reducer = ExecutionReducer("ci")
+        with pytest.raises(ConnectionError):
+            reducer.fold(events())
+
+        assert reducer.result.status == WorkflowStatus.FAILED
+        assert reducer.result.errors == ["dropped"]
+        assert reducer.step("build").status == StepStatus.FAILED
+
+
+class TestExecuteWorkflowResult:
+    def test_non_streaming_returns_execution_result(self):
+        client = _client(EVENTS)
+        handler = _Handler()
+
+        result = client.execute_workflow({"name": "ci", "steps": []}, stream=False, handler=handler)
+
+        assert isinstance(result, ExecutionResult)
+        assert result.workflow_name == "ci" and result.status == WorkflowStatus.FAILED
+        assert "native_sse=true" in client.session.request.call_args.kwargs["url"]
+        assert handler.calls[-1] == ("workflow", WorkflowStatus.FAILED)
+
+    def test_streaming_with_handler_yields_events(self):
+        client = _client(EVENTS[:4])
+        handler = _Handler()
+
+        events = list(client.execute_workflow({"name": "ci", "steps": []}, handler=handler))
+
+        assert len(events) == 4
+        assert handler.calls[-1] == ("workflow", WorkflowStatus.COMPLETED)
+
+    def test_workflow_service_non_streaming(self):
+        result = _client(EVENTS[:4]).workflows.execute({"name": "ci"}, stream=False)
+        assert result.is_success and result.steps[0].step_name == "build"
@@ -0,0 +1,174 @@
+"""Tests for the generic paginated iterator on BaseService."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from kubiya_workflow_sdk.client import AsyncKubiyaClient
+from kubiya_workflow_sdk.kubiya_services.exceptions import UserError, ValidationError
+from tests.unit.helpers import json_response, mock_client
+
+
+class _ListAPI:
+    """Serves ``total`` items by page number, offset or cursor, recording each request."""
+
+    def __init__(self, total: int, delay: float = 0.0):
+        self.items = [{"id": i} for i in range(total)]
+        self.delay = delay
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def page(self, params) -> dict:
+        size = int(params["limit"])
+        if "page" in params:
+            start = (int(params["page"]) - 1) * size
+        elif "offset" in params:
+            start = int(params["offset"])
+        else:
+            start = int(params.get("cursor", 0))
+        body = {"items": self.items[start:start + size]}
+        if start + size < len(self.items):
+            body["next_cursor"] = str(start + size)
+        return body
+
+    def __call__(self, method, url, **kwargs):
+        params = kwargs.get("params") or kwargs.get("json") or {}
+        with self.lock:
+            self.requests.append((method, dict(params)))
+        time.sleep(self.delay)
+        return json_response(self.page(params))
+
+
+class TestPaginate:
+    @pytest.mark.parametrize("style", ["page", "offset", "cursor"])
+    def test_all_items_in_order(self, style):
+        api = _ListAPI(total=95)
+        items = list(mock_client(api, max_retries=0).users.paginate("/api/v1/things", style=style, page_size=10))
+
+        assert [item["id"] for item in items] == list(range(95))
+        # Ten pages, plus at most one prefetched past the end
+        assert 10 <= len(api.requests) <= 11
+
+    def test_params_and_page_numbers(self):
+        api = _ListAPI(total=25)
+        client = mock_client(api, max_retries=0)
+        list(client.users.paginate("/api/v1/things", params={"q": "x"}, page_size=10, prefetch=0))
+
+        assert [params for _, params in api.requests] == [
+            {"q": "x", "limit": 10, "page": 1},
+            {"q": "x", "limit": 10, "page": 2},
+            {"q": "x", "limit": 10, "page": 3},
+        ]
+
+    def test_next_page_is_fetched_while_consuming(self):
+        api = _ListAPI(total=50, delay=0.1)
+        start = time.monotonic()
+        for _ in mock_client(api, max_retries=0).users.paginate("/api/v1/things", style="cursor", page_size=10):
+            time.sleep(0.02)
+        elapsed = time.monotonic() - start
+
+        # Sequentially: five 0.1s requests plus 50 * 0.02s of consumer work
+        assert elapsed < 1.3
+
+    def test_break_stops_fetching(self):
+        api = _ListAPI(total=10000)
+        for item in mock_client(api, max_retries=0).users.paginate("/api/v1/things", page_size=100, prefetch=2):
+            if item["id"] == 150:
+                break
+        time.sleep(0.05)
+        assert len(api.requests) <= 5
+
+    def test_total_pages_and_max_pages(self):
+        api = _ListAPI(total=100)
+        api.page = lambda params: {"items": [{"id": params["page"]}], "pagination": {"total_pages": 3}}
+        items = list(mock_client(api, max_retries=0).users.paginate("/api/v1/things", page_size=1, prefetch=0))
+        assert [item["id"] for item in items] == [1, 2, 3]
+
+        api = _ListAPI(total=100)
+        client = mock_client(api, max_retries=0)
+        assert len(list(client.users.paginate("/api/v1/things", page_size=10, max_pages=2))) == 20
+
+    def test_server_ignoring_pagination(self, caplog):
+        api = _ListAPI(total=10)
+        api.page = lambda params: {"items": api.items}
+        assert len(list(mock_client(api, max_retries=0).users.paginate("/api/v1/things", page_size=10))) == 10
+        assert "ignore pagination" in caplog.text
+
+    @pytest.mark.parametrize("prefetch", [1, 3])
+    def test_whole_list_is_fetched_once(self, prefetch):
+        api = _ListAPI(total=250, delay=0.05)
+        api.page = lambda params: {"items": api.items}
+        client = mock_client(api, max_retries=0)
+        items = list(client.users.paginate("/api/v1/things", style="offset", prefetch=prefetch))
+
+        assert len(items) == 250
+        assert [params for _, params in api.requests] == [{"limit": 100, "offset": 0}]
+
+    def test_post_sends_paging_in_body(self):
+        api = _ListAPI(total=30)
+        api.page = lambda params: {"workflows": api.items[params["offset"]:params["offset"] + params["limit"]]}
+        executions = list(mock_client(api, max_retries=0).workflows.iter_executions(filter="failed", page_size=20))
+
+        assert len(executions) == 30
+        assert api.requests[0] == ("POST", {"filter": "failed", "limit": 20, "offset": 0})
+
+    def test_invalid_style(self):
+        with pytest.raises(ValidationError):
+            next(mock_client(_ListAPI(total=1), max_retries=0).users.paginate("/api/v1/things", style="token"))
+
+
+class TestIterUsers:
+    def test_users_are_paged(self):
+        api = _ListAPI(total=250)
+        users = list(mock_client(api, max_retries=0).users.iter_users(page_size=100))
+
+        assert len(users) == 250
+        assert sorted(params["page"] for _, params in api.requests)[:3] == [1, 2, 3]
+
+    def test_errors_raise_user_error(self):
+        client = mock_client(_ListAPI(total=1), max_retries=0)
+        client.session.request = MagicMock(return_value=json_response({}, 500))
+        with pytest.raises(UserError):
+            list(client.users.iter_users())
+
+
+class TestAsyncPaginate:
+    @pytest.mark.asyncio
+    async def test_cursor_pages_on_async_client(self):
+        api = _ListAPI(total=35)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            params = dict(request.url.params)
+            api.requests.append(params)
+            return httpx.Response(200, json=api.page(params))
+
+        async with AsyncKubiyaClient(
+            api_key="test-key", base_url="https://api.test", transport=httpx.MockTransport(handler)
+        ) as client:
+            items = [item async for item in client.users.apaginate("/api/v1/things", style="cursor", page_size=10)]
+
+        assert [item["id"] for item in items] == list(range(35))
+        assert [params.get("cursor") for params in api.requests] == [None, "10", "20", "30"]
+
+    @pytest.mark.asyncio
+    async def test_closing_cancels_prefetched_pages(self):
+        started = []
+
+        async def slow(*args, **kwargs):
+            started.append(kwargs["params"]["page"])
+            if kwargs["params"]["page"] > 1:
+                await asyncio.sleep(10)
+            return httpx.Response(200, json={"items": [{"id": 1}, {"id": 2}]})
+
+        client = AsyncKubiyaClient(api_key="test-key", base_url="https://api.test")
+        client.users._aget = slow
+        pages = client.users.apaginate("/api/v1/things", page_size=2, prefetch=2)
+        assert (await pages.__anext__())["id"] == 1
+        # Prefetching starts once the first page arrived
+        await asyncio.sleep(0)
+        await pages.aclose()
+        assert started == [1, 2, 3]
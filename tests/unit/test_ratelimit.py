@@ -0,0 +1,127 @@
+"""Tests for the client-wide rate limiter and AIMD concurrency limit."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from kubiya_workflow_sdk.client import AsyncKubiyaClient, KubiyaClient
+from kubiya_workflow_sdk.core.exceptions import APIError
+from kubiya_workflow_sdk.core.ratelimit import AIMDLimiter, RateLimiter, TokenBucket
+from tests.unit.helpers import json_response, mock_client
+
+
+class TestTokenBucket:
+    def test_reservations_past_burst_must_wait(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        delays = [bucket.reserve() for _ in range(4)]
+
+        assert delays[:2] == [0.0, 0.0]
+        assert 0.05 < delays[2] < delays[3] <= 0.2
+
+
+class TestAIMDLimiter:
+    def test_multiplicative_decrease_and_additive_increase(self):
+        limiter = AIMDLimiter(initial_limit=8, min_limit=1, max_limit=16)
+
+        assert limiter.try_acquire()
+        limiter.release(overloaded=True)
+        assert limiter.limit == 4
+
+        for _ in range(40):
+            limiter.try_acquire()
+            limiter.release()
+        assert 4 < limiter.limit <= 16
+
+    def test_threads_never_exceed_limit(self):
+        limiter = AIMDLimiter(initial_limit=3, max_limit=3)
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            limiter.acquire()
+            with lock:
+                peak.append(limiter.in_flight)
+            time.sleep(0.01)
+            limiter.release()
+
+        threads = [threading.Thread(target=work) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) <= 3 and limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_async_acquire_waits_for_slot(self):
+        limiter = AIMDLimiter(initial_limit=1, max_limit=1)
+        assert limiter.try_acquire()
+
+        waiter = asyncio.ensure_future(limiter.aacquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done() and limiter.waiting == 1
+
+        limiter.release()
+        await asyncio.wait_for(waiter, 1)
+        assert limiter.in_flight == 1
+
+
+class TestRateLimiter:
+    def test_server_errors_do_not_raise_limits(self):
+        limiter = RateLimiter(rate=100, initial_concurrency=8)
+        limiter.release(429)
+        limit, rate = limiter.concurrency_limit, limiter.bucket.rate
+
+        for status in (500, 502, 504, None) * 10:
+            limiter.release(status)
+
+        metrics = limiter.metrics()
+        assert metrics["concurrency_limit"] == limit and metrics["rate"] == rate
+        assert metrics["errors"] == 40 and metrics["throttled"] == 1
+
+        limiter.release(200)
+        assert limiter.bucket.rate > rate
+
+
+class TestClientIntegration:
+    def test_sync_requests_pass_through_limiter(self):
+        limiter = RateLimiter(initial_concurrency=8)
+        client = mock_client([json_response({}, 429)], max_retries=0, rate_limiter=limiter)
+
+        with pytest.raises(APIError):
+            client.make_request("GET", "/api/v1/agents")
+
+        metrics = limiter.metrics()
+        assert metrics["requests"] == 1 and metrics["throttled"] == 1
+        assert metrics["concurrency_limit"] == 4
+        assert metrics["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_requests_pass_through_limiter(self):
+        limiter = RateLimiter(rate=1000)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={})
+
+        async with AsyncKubiyaClient(
+            api_key="test-key",
+            base_url="https://api.test",
+            transport=httpx.MockTransport(handler),
+            rate_limiter=limiter,
+        ) as client:
+            await asyncio.gather(*(client.agents._aget("/api/v1/agents") for _ in range(5)))
+
+        metrics = limiter.metrics()
+        assert metrics["requests"] == 5 and metrics["throttled"] == 0
+        assert metrics["rate"] == 1000
+
+    def test_bulk_operations_respect_concurrency_limit(self):
+        limiter = RateLimiter(initial_concurrency=2, max_concurrency=2)
+        client = KubiyaClient(api_key="test-key", base_url="https://api.test", rate_limiter=limiter)
+
+        assert client.sources._max_workers(10) == 2
+        assert client.runners._max_workers(1) == 1
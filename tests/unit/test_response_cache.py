@@ -0,0 +1,76 @@
+"""Tests for the opt-in response cache in KubiyaClient.make_request."""
+
+import time
+
+from kubiya_workflow_sdk.core.cache import ResponseCache
+from tests.unit.helpers import json_response, mock_client
+
+
+class TestResponseCache:
+    def test_fresh_entries_are_served_locally(self):
+        cache = ResponseCache()
+        client = mock_client([json_response(content=b'[{"name": "a"}]')], response_cache=cache)
+
+        first = client.make_request("GET", "/api/v1/agents")
+        second = client.make_request("GET", "/api/v1/agents")
+
+        assert second.json() == first.json() == [{"name": "a"}]
+        assert second.headers["X-Kubiya-Cache"] == "hit"
+        assert client.session.request.call_count == 1
+        assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    def test_params_are_part_of_the_key(self):
+        cache = ResponseCache()
+        client = mock_client([json_response([]), json_response([])], response_cache=cache)
+
+        client.make_request("GET", "/api/v2/integrations", params={"full": "true"})
+        client.make_request("GET", "/api/v2/integrations", params={"full": "false"})
+
+        assert client.session.request.call_count == 2
+
+    def test_stale_entry_is_revalidated_with_etag(self):
+        cache = ResponseCache(ttls={"/api/v1/sources": 0.01})
+        client = mock_client(
+            [json_response(content=b'["s"]', headers={"ETag": '"v1"'}), json_response([], 304)], response_cache=cache
+        )
+
+        client.make_request("GET", "/api/v1/sources")
+        time.sleep(0.02)
+        response = client.make_request("GET", "/api/v1/sources")
+
+        assert response.json() == ["s"]
+        conditional = client.session.request.call_args_list[1].kwargs["headers"]
+        assert conditional["If-None-Match"] == '"v1"'
+        assert cache.stats()["revalidations"] == 1
+
+    def test_mutation_invalidates_resource_and_collection(self):
+        cache = ResponseCache()
+        client = mock_client([json_response([]) for _ in range(4)], response_cache=cache)
+
+        client.make_request("GET", "/api/v1/agents")
+        client.make_request("GET", "/api/v1/sources/abc/metadata")
+        client.make_request("PUT", "/api/v1/agents/123", data={"name": "x"})
+
+        assert cache.stats()["entries"] == 1
+        assert cache.stats()["invalidations"] == 1
+
+    def test_uncached_endpoints_bypass_cache(self):
+        cache = ResponseCache()
+        client = mock_client([json_response([]), json_response([])], response_cache=cache)
+
+        client.make_request("GET", "/api/v1/users")
+        client.make_request("GET", "/api/v1/users")
+
+        assert client.session.request.call_count == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction_by_size(self):
+        cache = ResponseCache(ttls={"/r/*": 60}, max_bytes=10)
+
+        cache.store("a", "https://api.test/r/a", 200, {}, b"x" * 4)
+        cache.store("b", "https://api.test/r/b", 200, {}, b"x" * 4)
+        cache.get("a")
+        cache.store("c", "https://api.test/r/c", 200, {}, b"x" * 4)
+
+        assert cache.get("b") is None and cache.get("a") is not None
+        assert cache.stats()["evictions"] == 1 and cache.stats()["bytes"] == 8
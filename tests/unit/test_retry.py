@@ -0,0 +1,84 @@
+"""Tests for the request retry policy and its integration with KubiyaClient."""
+
+from unittest.mock import patch
+
+import pytest
+
+from kubiya_workflow_sdk.core.exceptions import APIError
+from kubiya_workflow_sdk.core.retry import RequestRetryPolicy, RetryBudget
+from tests.unit.helpers import json_response, mock_client
+
+
+class TestRequestRetryPolicy:
+    """Retry decisions and backoff."""
+
+    def test_idempotent_methods_retry_on_server_errors(self):
+        policy = RequestRetryPolicy(budget=None)
+
+        assert policy.should_retry("GET", 0, status_code=500)
+        assert policy.should_retry("DELETE", 0, error=True)
+        assert not policy.should_retry("GET", 0, status_code=404)
+        assert not policy.should_retry("GET", policy.max_retries, status_code=500)
+
+    def test_mutating_methods_only_retry_when_not_processed(self):
+        policy = RequestRetryPolicy(budget=None)
+
+        assert not policy.should_retry("POST", 0, status_code=500)
+        assert not policy.should_retry("POST", 0, error=True)
+        assert policy.should_retry("POST", 0, status_code=503)
+        assert policy.should_retry("PATCH", 0, status_code=429)
+        assert policy.should_retry("POST", 0, connect_failed=True, error=True)
+
+    def test_idempotency_key_added_once_for_mutating_calls(self):
+        policy = RequestRetryPolicy()
+
+        headers = policy.prepare_headers("POST", {})
+        assert headers["Idempotency-Key"]
+        assert policy.prepare_headers("POST", headers) is headers
+        assert "Idempotency-Key" not in policy.prepare_headers("GET", {})
+
+    def test_backoff_is_jittered_and_honours_retry_after(self):
+        policy = RequestRetryPolicy(backoff_initial=1.0, backoff_max=4.0)
+
+        delays = [policy.backoff(5) for _ in range(50)]
+        assert all(0 <= d <= 4.0 for d in delays) and len(set(delays)) > 1
+        assert policy.backoff(0, "2") == 2.0
+        assert policy.backoff(0, "600") == policy.retry_after_max
+
+    def test_budget_caps_retries(self):
+        budget = RetryBudget(ratio=0.5, min_retries=1, window=60)
+        for _ in range(4):
+            budget.record_request()
+
+        assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+
+
+class TestClientRetries:
+    """KubiyaClient applies the policy per request."""
+
+    @patch("kubiya_workflow_sdk.client.time.sleep")
+    def test_post_is_not_replayed_on_server_error(self, sleep):
+        client = mock_client([json_response({}, 500), json_response({})])
+
+        with pytest.raises(APIError):
+            client.make_request("POST", "/api/v1/workflow", data={})
+
+        assert client.session.request.call_count == 1
+
+    @patch("kubiya_workflow_sdk.client.time.sleep")
+    def test_throttled_post_is_retried_with_same_idempotency_key(self, sleep):
+        client = mock_client([json_response({}, 429, {"Retry-After": "1"}), json_response({})])
+
+        response = client.make_request("POST", "/api/v1/workflow", data={})
+
+        assert response.status_code == 200
+        keys = {call.kwargs["headers"]["Idempotency-Key"] for call in client.session.request.call_args_list}
+        assert len(keys) == 1
+        sleep.assert_called_once_with(1.0)
+
+    @patch("kubiya_workflow_sdk.client.time.sleep")
+    def test_get_is_retried_until_success(self, sleep):
+        client = mock_client([json_response({}, 502), json_response({}, 503), json_response({})])
+
+        assert client.make_request("GET", "/api/v1/agents").status_code == 200
+        assert client.session.request.call_count == 3
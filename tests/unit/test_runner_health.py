@@ -0,0 +1,185 @@
+"""Tests for runner health evaluation and the background health monitor."""
+
+import gc
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from kubiya_workflow_sdk.client import KubiyaClient
+from kubiya_workflow_sdk.core.runner_health import RunnerHealthMonitor, evaluate_runner_health
+from tests.unit.helpers import json_response, mock_client
+
+
+def _health(healthy=True, agent_manager="0.1.17"):
+    return {
+        "health": "true" if healthy else "false",
+        "status": "ok" if healthy else "degraded",
+        "checks": [{"name": "agent-manager", "status": "ok", "version": agent_manager}],
+    }
+
+
+class _RunnerAPI:
+    """Runners list on the main session and per-runner health on the health session."""
+
+    def __init__(self, runners):
+        self.health = dict(runners)
+        self.list_fails = False
+        self.health_calls = 0
+        self.lock = threading.Lock()
+
+    def list_runners(self, method, url, **kwargs):
+        if self.list_fails:
+            return json_response({"error": "down"}, 500)
+        return json_response([{"name": name, "capabilities": ["x"]} for name in self.health])
+
+    def runner_health(self, url, timeout=None):
+        name = url.rsplit("/", 2)[-2]
+        with self.lock:
+            self.health_calls += 1
+        health = self.health[name]
+        if health is None:
+            raise requests.ConnectionError("unreachable")
+        return json_response(health)
+
+
+def _client(api) -> KubiyaClient:
+    client = mock_client(api.list_runners, max_retries=0)
+    client._get_health_session().get = MagicMock(side_effect=api.runner_health)
+    return client
+
+
+class TestRunnerHealth:
+    def test_get_runners_with_health_reuses_one_session(self):
+        api = _RunnerAPI({"a": _health(), "b": _health(agent_manager="0.1.0"), "c": None})
+        client = _client(api)
+        session = client._get_health_session()
+
+        runners = client.get_runners_with_health(required_components={"agent-manager": "0.1.17"})
+        client.get_runners_with_health()
+
+        assert client._get_health_session() is session
+        assert api.health_calls == 6
+        by_name = {r["name"]: r for r in runners}
+        assert by_name["a"]["is_healthy"] and by_name["a"]["meets_requirements"]
+        assert by_name["b"]["is_healthy"] and not by_name["b"]["meets_requirements"]
+        assert by_name["c"]["health_status"] == "error" and not by_name["c"]["is_healthy"]
+        assert "capabilities" not in by_name["a"]
+
+    def test_evaluate_without_requirements(self):
+        runner = evaluate_runner_health({"name": "a"}, _health(healthy=False))
+        assert runner["health_status"] == "degraded"
+        assert runner["meets_requirements"] is True
+
+
+class TestRunnerHealthMonitor:
+    def test_snapshot_is_served_from_memory(self):
+        api = _RunnerAPI({"a": _health(), "b": _health()})
+        monitor = RunnerHealthMonitor(_client(api))
+
+        assert [r["name"] for r in monitor.snapshot()] == ["a", "b"]
+        calls = api.health_calls
+        monitor.snapshot()
+        strict = monitor.snapshot(required_components={"agent-manager": "9.9.9"})
+
+        assert api.health_calls == calls
+        assert not any(r["meets_requirements"] for r in strict)
+        assert monitor.get("a")["is_healthy"]
+
+    def test_subscribers_see_only_changes(self):
+        api = _RunnerAPI({"a": _health(), "b": _health()})
+        monitor = RunnerHealthMonitor(_client(api))
+        changes = []
+        unsubscribe = monitor.subscribe(lambda name, old, new: changes.append((name, old is None, new is None)))
+
+        monitor.refresh()
+        assert changes == [("a", True, False), ("b", True, False)]
+
+        changes.clear()
+        monitor.refresh()
+        assert changes == []
+
+        api.health["b"] = None
+        del api.health["a"]
+        monitor.refresh()
+        assert changes == [("a", False, True), ("b", False, False)]
+
+        unsubscribe()
+        api.health["b"] = _health()
+        monitor.refresh()
+        assert len(changes) == 2
+
+    def test_listing_failure_keeps_last_snapshot(self):
+        api = _RunnerAPI({"a": _health()})
+        monitor = RunnerHealthMonitor(_client(api))
+        monitor.refresh()
+
+        api.list_fails = True
+        assert [r["name"] for r in monitor.refresh()] == ["a"]
+        assert monitor.last_error is not None
+
+    def test_background_refresh_notifies_subscribers(self):
+        api = _RunnerAPI({"a": _health()})
+        changed = threading.Event()
+
+        with RunnerHealthMonitor(_client(api), interval=0.02) as monitor:
+            assert monitor.snapshot(timeout=5)[0]["is_healthy"]
+            monitor.subscribe(lambda name, old, new: changed.set())
+            api.health["a"] = _health(healthy=False)
+            assert changed.wait(5)
+            assert not monitor.get("a")["is_healthy"]
+
+        assert not monitor.running
+
+    def test_abandoned_monitor_stops(self):
+        api = _RunnerAPI({"a": _health()})
+        monitor = RunnerHealthMonitor(_client(api), interval=0.02).start()
+        thread = monitor._thread
+        monitor.snapshot(timeout=5)
+
+        del monitor
+        gc.collect()
+        thread.join(2)
+        assert not thread.is_alive()
+
+
+class TestServerHealthMonitors:
+    def _server(self):
+        pytest.importorskip("fastmcp")
+        from kubiya_workflow_sdk.mcp.server.core import KubiyaMCPServer, ServerConfig
+
+        server = KubiyaMCPServer(ServerConfig(runner_health_interval=0.02, metadata_cache=False))
+        api = _RunnerAPI({"a": _health()})
+        server._create_client = lambda api_key, create=server._create_client: self._mocked(create(api_key), api)
+        return server
+
+    @staticmethod
+    def _mocked(client, api):
+        client.session.request = MagicMock(side_effect=api.list_runners)
+        client._get_health_session().get = MagicMock(side_effect=api.runner_health)
+        return client
+
+    def test_monitor_is_stopped_with_its_expired_client(self):
+        server = self._server()
+        client = server.get_client("key")
+        monitor = server._get_health_monitor(client)
+        assert monitor.snapshot(timeout=5)[0]["name"] == "a"
+
+        server._client_cache["key"] = (client, 0)
+        fresh = server.get_client("key")
+
+        assert fresh is not client
+        assert not monitor.running
+        assert "key" not in server._health_monitors
+        assert server._get_health_monitor(fresh).client is fresh
+        server.close()
+
+    def test_close_stops_all_monitors(self):
+        server = self._server()
+        monitors = [server._get_health_monitor(server.get_client(key)) for key in ("a", "b")]
+
+        server.close()
+
+        assert not any(monitor.running for monitor in monitors)
+        assert server._health_monitors == {} and server._client_cache == {}
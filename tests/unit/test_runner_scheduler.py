@@ -0,0 +1,149 @@
+"""Tests for runner selection and load balancing of workflow submissions."""
+
+from collections import Counter
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+
+from kubiya_workflow_sdk.core.scheduler import RunnerScheduler
+from tests.unit.helpers import mock_client, stream_response
+
+
+class _Monitor:
+    """Stand-in for RunnerHealthMonitor serving a fixed snapshot."""
+
+    def __init__(self, runners):
+        self.runners = runners
+        self.requirements = []
+
+    def snapshot(self, required_components=None):
+        self.requirements.append(required_components)
+        return [
+            {"name": name, "is_healthy": healthy, "meets_requirements": meets}
+            for name, (healthy, meets) in self.runners.items()
+        ]
+
+
+def _sse_response(*args, **kwargs) -> requests.Response:
+    return stream_response(b'data: {"type": "workflow_complete"}\n\n')
+
+
+class TestRunnerScheduler:
+    def test_only_eligible_runners_are_candidates(self):
+        monitor = _Monitor({"a": (True, True), "b": (False, False), "c": (True, False)})
+        scheduler = RunnerScheduler(monitor, required_components={"agent-manager": "0.1.17"})
+
+        assert scheduler.candidates() == ["a"]
+        assert scheduler.select() == "a"
+        assert monitor.requirements[-1] == {"agent-manager": "0.1.17"}
+
+    def test_least_loaded_spreads_in_flight_work(self):
+        scheduler = RunnerScheduler(runners=["a", "b", "c"], policy="least_loaded")
+        leases = [scheduler.lease() for _ in range(6)]
+
+        assert Counter(lease.runner for lease in leases) == {"a": 2, "b": 2, "c": 2}
+        for lease in leases[:2]:
+            lease.release()
+        assert {name: s["in_flight"] for name, s in scheduler.stats().items()} == {"a": 1, "b": 1, "c": 2}
+
+    def test_slow_runners_get_less_work(self):
+        scheduler = RunnerScheduler(runners=["fast", "slow"], policy="least_loaded")
+        scheduler.record_latency("fast", 0.1)
+        scheduler.record_latency("slow", 1.0)
+        leases = [scheduler.lease() for _ in range(10)]
+
+        assert Counter(lease.runner for lease in leases)["fast"] >= 8
+
+    def test_power_of_two_avoids_the_worst_runner(self):
+        scheduler = RunnerScheduler(runners=["a", "b", "c", "d"], seed=7)
+        scheduler.record_latency("a", 10.0)
+        for runner in "bcd":
+            scheduler.record_latency(runner, 0.1)
+
+        picks = Counter(scheduler.select() for _ in range(200))
+        assert picks["a"] == 0
+        assert set(picks) == {"b", "c", "d"}
+
+    def test_sticky_by_workflow_name(self):
+        monitor = _Monitor({"a": (True, True), "b": (True, True), "c": (True, True)})
+        scheduler = RunnerScheduler(monitor, policy="sticky")
+        names = [f"workflow-{i}" for i in range(30)]
+        before = {name: scheduler.select(name) for name in names}
+
+        assert before == {name: scheduler.select(name) for name in names}
+        assert len(set(before.values())) == 3
+
+        # Only workflows of the removed runner move
+        monitor.runners["b"] = (False, True)
+        after = {name: scheduler.select(name) for name in names}
+        assert all(after[n] == before[n] for n in names if before[n] != "b")
+        assert "b" not in after.values()
+
+    def test_failed_stream_is_penalised(self):
+        scheduler = RunnerScheduler(runners=["a"], failure_penalty=3.0)
+        lease = scheduler.lease()
+
+        def events():
+            yield 1
+            raise ConnectionError("dropped")
+
+        with pytest.raises(ConnectionError):
+            list(lease.wrap(events()))
+        assert scheduler.stats()["a"] == {"in_flight": 0, "latency": 3.0, "submissions": 1, "failures": 1}
+
+    def test_no_eligible_runner(self):
+        scheduler = RunnerScheduler(_Monitor({"a": (False, False)}))
+        assert scheduler.lease(default="kubiya-hosted").runner == "kubiya-hosted"
+        with pytest.raises(ValueError):
+            scheduler.lease()
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            RunnerScheduler(runners=["a"], policy="random")
+
+
+class TestScheduledSubmission:
+    def _client(self, scheduler):
+        client = mock_client(_sse_response, runner_scheduler=scheduler)
+        return client
+
+    def _runner(self, client):
+        url = client.session.request.call_args.kwargs["url"]
+        return parse_qs(urlsplit(url).query)["runner"][0]
+
+    def test_execute_workflow_uses_the_scheduler(self):
+        scheduler = RunnerScheduler(runners=["r1", "r2"], policy="least_loaded")
+        client = self._client(scheduler)
+
+        events = client.execute_workflow({"name": "deploy", "steps": []})
+        assert self._runner(client) == "r1"
+        assert scheduler.stats()["r1"]["in_flight"] == 1
+        assert scheduler.stats()["r1"]["latency"] is not None
+
+        # The second submission goes to the idle runner while the first streams
+        client.execute_workflow({"name": "deploy", "steps": []})
+        assert self._runner(client) == "r2"
+
+        list(events)
+        assert scheduler.stats()["r1"]["in_flight"] == 0
+
+    def test_explicit_runner_bypasses_the_scheduler(self):
+        scheduler = RunnerScheduler(runners=["r1"])
+        client = self._client(scheduler)
+
+        client.execute_workflow({"name": "deploy", "runner": "pinned"}, stream=False)
+        assert self._runner(client) == "pinned"
+
+        client.workflows.execute({"name": "deploy"}, runner="other", stream=False)
+        assert self._runner(client) == "other"
+        assert scheduler.stats() == {}
+
+    def test_workflow_service_uses_the_scheduler(self):
+        scheduler = RunnerScheduler(runners=["r1"])
+        client = self._client(scheduler)
+
+        result = client.workflows.execute({"name": "deploy"}, stream=False)
+        assert self._runner(client) == "r1"
+        assert result.is_success
+        assert scheduler.stats()["r1"]["in_flight"] == 0
@@ -0,0 +1,113 @@
+"""Tests for the persistent source metadata cache used by SourceService.list and ToolService."""
+
+import pytest
+
+from kubiya_workflow_sdk.client import KubiyaClient
+from kubiya_workflow_sdk.kubiya_services.metadata_cache import SourceMetadataCache
+from tests.unit.helpers import json_response, mock_client
+
+
+class _FakeAPI:
+    """Serves a source list and per-source metadata, counting metadata requests."""
+
+    def __init__(self, versions):
+        self.versions = dict(versions)
+        self.metadata_requests = []
+
+    def __call__(self, method, url, **kwargs):
+        path = url.split("https://api.test", 1)[1]
+        if path == "/api/v1/sources":
+            return json_response([
+                {"uuid": uuid, "name": uuid, "url": "https://git/x", "updated_at": version}
+                for uuid, version in self.versions.items()
+            ])
+        uuid = path.split("/")[4]
+        self.metadata_requests.append(uuid)
+        return json_response({"tools": [{"name": f"{uuid}-{self.versions[uuid]}"}]})
+
+
+def _tool_names(sources):
+    return sorted(tool["name"] for source in sources for tool in source["tools"])
+
+
+def _client(api: _FakeAPI, cache_path: str) -> KubiyaClient:
+    return mock_client(api, metadata_cache=SourceMetadataCache(cache_path))
+
+
+class TestSourceMetadataCache:
+    def test_unchanged_sources_are_read_from_disk(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        api = _FakeAPI({"a": "1", "b": "1", "c": "1"})
+
+        first = _client(api, path).sources.list(full=True)
+        assert sorted(api.metadata_requests) == ["a", "b", "c"]
+
+        # A new process with the same cache file only fetches the changed source
+        api.metadata_requests.clear()
+        api.versions["b"] = "2"
+        second = _client(api, path).sources.list(full=True)
+
+        assert api.metadata_requests == ["b"]
+        assert _tool_names(first) == ["a-1", "b-1", "c-1"]
+        assert _tool_names(second) == ["a-1", "b-2", "c-1"]
+
+    def test_stale_ok_refreshes_in_background(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        api = _FakeAPI({"a": "1", "b": "1"})
+        _client(api, path).sources.list(full=True)
+
+        api.metadata_requests.clear()
+        api.versions["a"] = "2"
+        client = _client(api, path)
+        sources = client.sources.list(full=True, stale_ok=True)
+        client.sources._refresh_thread.join(5)
+
+        assert _tool_names(sources) == ["a-1", "b-1"]
+        assert api.metadata_requests == ["a"]
+        assert _tool_names(_client(api, path).sources.list(full=True)) == ["a-2", "b-1"]
+
+    def test_namespaces_and_pruning(self, tmp_path):
+        cache = SourceMetadataCache(str(tmp_path / "cache.db"))
+        ns1 = cache.namespace_for("https://api.test", "key-1")
+        ns2 = cache.namespace_for("https://api.test", "key-2")
+
+        cache.put(ns1, "a", "1", {"tools": []})
+        cache.put(ns1, "b", "1", {"tools": []})
+        cache.put(ns2, "a", "1", {"tools": [{"name": "other"}]})
+
+        assert cache.prune(ns1, ["a"]) == 1
+        assert set(cache.get_many(ns1, ["a", "b"])) == {"a"}
+        assert cache.get_many(ns2, ["a"])["a"] == ("1", {"tools": [{"name": "other"}]})
+
+    def test_tool_catalog_reuses_unchanged_sources(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        api = _FakeAPI({"a": "1", "b": "1"})
+        assert [t["name"] for t in _client(api, path).tools.list()] == ["a-1", "b-1"]
+
+        api.metadata_requests.clear()
+        api.versions["b"] = "2"
+        assert [m["tool"]["name"] for m in _client(api, path).tools.search("b-2")][:1] == ["b-2"]
+        assert api.metadata_requests == ["b"]
+
+
+class TestServerMetadataCache:
+    def _server(self, **config):
+        pytest.importorskip("fastmcp")
+        from kubiya_workflow_sdk.mcp.server.core import KubiyaMCPServer, ServerConfig
+
+        return KubiyaMCPServer(ServerConfig(**config))
+
+    def test_clients_share_the_default_cache(self, cache_dir):
+        server = self._server()
+
+        first, second = server.get_client("key-1"), server.get_client("key-2")
+
+        assert first.metadata_cache is second.metadata_cache
+        assert first.metadata_cache.path == str(cache_dir / "source_metadata.db")
+        server.close()
+
+    def test_disabled_by_environment(self, cache_dir, monkeypatch):
+        monkeypatch.setenv("KUBIYA_METADATA_CACHE", "false")
+
+        assert self._server().get_client("key").metadata_cache is None
+        assert not (cache_dir / "source_metadata.db").exists()
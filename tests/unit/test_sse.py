@@ -0,0 +1,104 @@
+"""Tests for the incremental SSE decoder and the streaming paths that use it."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from kubiya_workflow_sdk.client import KubiyaClient
+from kubiya_workflow_sdk.core.sse import SSEDecoder, SSEEvent, iter_sse_events
+from tests.unit.helpers import mock_client
+
+
+def _split(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestSSEDecoder:
+    """Framing, field handling and chunk boundaries."""
+
+    STREAM = (
+        ": keep-alive\n"
+        "\n"
+        "id: 1\n"
+        "event: step\n"
+        'data: {"a":\n'
+        'data:  "é"}\n'
+        "\n"
+        "retry: 1500\r\n"
+        "data: 2:{\"type\": \"log\"}\r\n"
+        "\r\n"
+        "event: end\n"
+        "\n"
+    ).encode("utf-8")
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+    def test_events_survive_any_chunk_boundary(self, chunk_size):
+        decoder = SSEDecoder()
+        events = list(iter_sse_events(_split(self.STREAM, chunk_size), decoder))
+
+        assert [(e.event, e.id, e.data) for e in events] == [
+            ("step", "1", '{"a":\n "é"}'),
+            ("message", None, '2:{"type": "log"}'),
+            ("end", None, ""),
+        ]
+        assert events[0].json() == {"a": "é"}
+        assert events[1].prefix == "2" and events[1].json() == {"type": "log"}
+        assert decoder.last_event_id == "1"
+        assert decoder.retry == 1500
+
+    def test_bare_json_lines_and_unterminated_tail(self):
+        events = list(iter_sse_events([b'{"x": 1}\n', b"data: tail"]))
+
+        assert events[0].bare and events[0].json() == {"x": 1}
+        assert events[1].data == "tail" and not events[1].bare
+
+    def test_json_is_parsed_once(self):
+        event = SSEEvent(data='d:{"finishReason": "stop"}')
+
+        assert event.is_end
+        assert event.json() is event.json()
+        assert SSEEvent(data="not json").json() is None
+        assert SSEEvent(data=" [DONE]").is_done
+
+
+class TestSyncStream:
+    """KubiyaClient stream handling on top of the decoder."""
+
+    @staticmethod
+    def _response(body: bytes, chunk_size: int = 5):
+        response = MagicMock()
+        response.iter_content.return_value = iter(_split(body, chunk_size))
+        return response
+
+    def test_handle_stream_yields_each_event_once(self):
+        body = (
+            'data: 2:{"type": "log"}\n\n'
+            "data: plain text\n\n"
+            'data: {"type": "heartbeat"}\n\n'
+            'data: d:{"finishReason": "stop"}\n\n'
+            'data: {"type": "after-end"}\n\n'
+        ).encode()
+        client = KubiyaClient(api_key="test-key", base_url="https://api.test")
+        response = self._response(body)
+
+        events = list(client._handle_stream(response))
+
+        assert events == ['{"type": "log"}', "plain text", '{"type": "heartbeat"}', '{"finishReason": "stop"}']
+        assert json.loads(events[0]) == {"type": "log"}
+        response.close.assert_called_once()
+
+    def test_execute_workflow_events_yields_typed_events(self):
+        body = (
+            'id: 7\nevent: step\ndata: {"step": "a"}\n\n'
+            "data: [DONE]\n\n"
+            'data: {"step": "never"}\n\n'
+        ).encode()
+        response = self._response(body)
+        response.status_code = 200
+        client = mock_client([response])
+
+        events = list(client.execute_workflow_events({"name": "wf", "steps": []}))
+
+        assert [(e.event, e.id, e.json()) for e in events] == [("step", "7", {"step": "a"})]
+        assert client.session.request.call_args.kwargs["stream"] is True
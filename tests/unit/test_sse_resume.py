@@ -0,0 +1,186 @@
+"""Resumable streams against a local stub SSE server that drops connections."""
+
+import json
+import random
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from kubiya_workflow_sdk.client import AsyncKubiyaClient, KubiyaClient, StreamingKubiyaClient
+from kubiya_workflow_sdk.core.exceptions import WorkflowExecutionError
+
+TOTAL_EVENTS = 40
+
+
+class _StubSSEHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        server = self.server
+        last_event_id = self.headers.get("Last-Event-ID")
+        server.resume_ids.append(last_event_id)
+        server.idempotency_keys.append(self.headers.get("Idempotency-Key"))
+
+        # Replay a few already-delivered events to exercise de-duplication
+        start = 0
+        if last_event_id is not None:
+            start = max(0, int(last_event_id) + 1 - server.replay)
+
+        parts = ["retry: 5\n\n"] if server.with_ids else []
+        for seq in range(start, TOTAL_EVENTS):
+            event_id = f"id: {seq}\n" if server.with_ids else ""
+            parts.append(f'{event_id}data: 2:{{"seq": {seq}}}\n\n')
+        parts.append('data: d:{"finishReason": "stop"}\n\n')
+        chunks = [part.encode() for part in parts]
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        cut_at = None
+        if server.cuts_left > 0:
+            server.cuts_left -= 1
+            # Cut mid-chunk somewhere after the first event carrying data
+            cut_at = server.rng.randint(2 if server.with_ids else 1, len(chunks) - 1)
+
+        for index, chunk in enumerate(chunks):
+            if index == cut_at:
+                partial = chunk[: server.rng.randint(0, len(chunk) - 1)]
+                self.wfile.write(f"{len(chunk):x}\r\n".encode() + partial)
+                self.wfile.flush()
+                self.connection.shutdown(socket.SHUT_RDWR)
+                self.close_connection = True
+                return
+            self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+@pytest.fixture
+def sse_server():
+    servers = []
+
+    def start(cuts: int = 3, seed: int = 0, with_ids: bool = True, replay: int = 3):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _StubSSEHandler)
+        server.daemon_threads = True
+        server.cuts_left = cuts
+        server.rng = random.Random(seed)
+        server.with_ids = with_ids
+        server.replay = replay
+        server.resume_ids = []
+        server.idempotency_keys = []
+        threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        servers.append(server)
+        return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _sequence(items):
+    return [item["seq"] for item in items if "seq" in item]
+
+
+class TestResumableStreams:
+    """Each client resumes with Last-Event-ID and yields every event once."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_sync_client_resumes(self, sse_server, seed):
+        server, url = sse_server(seed=seed)
+        client = KubiyaClient(api_key="test-key", base_url=url)
+
+        events = [json.loads(e) for e in client.execute_workflow({"name": "wf", "steps": []}, stream=True)]
+
+        assert _sequence(events) == list(range(TOTAL_EVENTS))
+        assert events[-1] == {"finishReason": "stop"}
+        assert len(server.resume_ids) == 4
+        assert server.resume_ids[0] is None and all(server.resume_ids[1:])
+
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.asyncio
+    async def test_streaming_client_resumes(self, sse_server, seed):
+        server, url = sse_server(seed=seed)
+
+        async with StreamingKubiyaClient(api_key="test-key", base_url=url) as client:
+            events = [e async for e in client.execute_workflow_stream({"name": "wf", "steps": []})]
+
+        assert _sequence(events) == list(range(TOTAL_EVENTS))
+        assert len(server.resume_ids) == 4
+
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.asyncio
+    async def test_async_client_resumes(self, sse_server, seed):
+        server, url = sse_server(seed=seed)
+
+        async with AsyncKubiyaClient(api_key="test-key", base_url=url) as client:
+            stream = await client.make_request("POST", "/api/v1/workflow", data={}, stream=True)
+            events = [json.loads(e) async for e in stream]
+
+        assert _sequence(events) == list(range(TOTAL_EVENTS))
+        assert len(server.resume_ids) == 4
+
+    def test_stream_without_ids_is_not_resumed(self, sse_server):
+        server, url = sse_server(cuts=1, with_ids=False)
+        client = KubiyaClient(api_key="test-key", base_url=url)
+
+        with pytest.raises(WorkflowExecutionError):
+            list(client.execute_workflow({"name": "wf", "steps": []}, stream=True))
+
+        assert server.resume_ids == [None]
+
+    def test_reconnects_are_bounded(self, sse_server):
+        server, url = sse_server(cuts=100)
+        client = KubiyaClient(api_key="test-key", base_url=url)
+
+        with pytest.raises(WorkflowExecutionError):
+            list(client.execute_workflow({"name": "wf", "steps": []}, stream=True))
+
+        assert 1 < len(server.resume_ids) < 100
+
+
+class TestResumeKeepsIdempotencyKey:
+    """A resumed stream re-sends the request with the key of the original one."""
+
+    @staticmethod
+    def _assert_one_key(server):
+        assert len(server.idempotency_keys) == 4
+        assert server.idempotency_keys[0] and len(set(server.idempotency_keys)) == 1
+
+    def test_make_request(self, sse_server):
+        server, url = sse_server()
+        list(KubiyaClient(api_key="test-key", base_url=url).execute_workflow({"name": "wf", "steps": []}))
+        self._assert_one_key(server)
+
+    def test_execute_workflow_events(self, sse_server):
+        server, url = sse_server()
+        list(KubiyaClient(api_key="test-key", base_url=url).execute_workflow_events({"name": "wf", "steps": []}))
+        self._assert_one_key(server)
+
+    def test_stream_events(self, sse_server):
+        server, url = sse_server()
+        list(KubiyaClient(api_key="test-key", base_url=url).stream_events("POST", "/api/v1/workflow", data={}))
+        self._assert_one_key(server)
+
+    @pytest.mark.asyncio
+    async def test_streaming_client(self, sse_server):
+        server, url = sse_server()
+        async with StreamingKubiyaClient(api_key="test-key", base_url=url) as client:
+            [e async for e in client.execute_workflow_stream({"name": "wf", "steps": []})]
+        self._assert_one_key(server)
+
+    @pytest.mark.asyncio
+    async def test_async_client(self, sse_server):
+        server, url = sse_server()
+        async with AsyncKubiyaClient(api_key="test-key", base_url=url) as client:
+            [e async for e in await client.make_request("POST", "/api/v1/workflow", data={}, stream=True)]
+        self._assert_one_key(server)
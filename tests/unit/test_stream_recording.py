@@ -0,0 +1,139 @@
+"""Tests for recording raw event streams and replaying them through the clients."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from kubiya_workflow_sdk.client import KubiyaClient, StreamingKubiyaClient
+from kubiya_workflow_sdk.core.recording import Recording, ReplayAdapter, ReplaySession, StreamRecorder
+from kubiya_workflow_sdk.execution import ExecutionMode, execute_workflow_with_logging
+from tests.unit.helpers import mock_client, stream_response
+
+EVENTS = [
+    {"type": "step_running", "step": {"name": "build"}},
+    {"type": "log", "output": "compiling"},
+    {"type": "step_finished", "step": {"name": "build", "status": "finished"}},
+    {"type": "end", "end": True},
+]
+
+STREAM = "".join(f"id: {i}\ndata: {json.dumps(event)}\n\n" for i, event in enumerate(EVENTS)).encode()
+
+WORKFLOW = {"name": "ci", "steps": [{"name": "build", "command": "make"}]}
+
+
+class _Clock:
+    def __init__(self, step):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def _recording(chunk_size=7, delay=0.25):
+    recording = Recording(metadata={"workflow": "ci"})
+    for i in range(0, len(STREAM), chunk_size):
+        recording.chunks.append((delay, STREAM[i : i + chunk_size]))
+    return recording
+
+
+def _live_response(*args, **kwargs):
+    return stream_response(STREAM)
+
+
+def _live_client():
+    return mock_client(_live_response)
+
+
+def _replay_client(recording, **kwargs):
+    client = KubiyaClient(api_key="test-key", base_url="https://api.test")
+    adapter = ReplayAdapter(recording, **kwargs)
+    client.session.mount(client.base_url, adapter)
+    return client, adapter
+
+
+class TestRecordingFormat:
+    @pytest.mark.parametrize("name", ["run.ksse", "run.ksse.gz"])
+    def test_save_and_load(self, tmp_path, name):
+        recording = _recording()
+        recording.chunks.append((3600.5, b"x" * 70_000))
+        path = str(tmp_path / name)
+
+        recording.save(path)
+        loaded = Recording.load(path)
+
+        assert loaded == recording
+        assert loaded.duration == pytest.approx(recording.duration)
+        assert loaded.size == len(STREAM) + 70_000
+
+    def test_compact(self, tmp_path):
+        path = tmp_path / "run.ksse"
+        _recording(chunk_size=64).save(str(path))
+        assert path.stat().st_size < len(STREAM) + 64
+
+    def test_rejects_other_files(self):
+        with pytest.raises(ValueError):
+            Recording.from_bytes(b"data: {}\n\n")
+
+    def test_recorder_times_chunks(self):
+        recorder = StreamRecorder(clock=_Clock(0.5))
+        assert list(recorder.wrap([b"a", b"b"])) == [b"a", b"b"]
+        assert recorder.recording.chunks == [(0.5, b"a"), (0.5, b"b")]
+
+    def test_empty_stream_is_a_valid_recording(self):
+        buffer = io.BytesIO()
+        StreamRecorder(buffer, metadata={"workflow": "ci"}).close()
+        assert Recording.from_bytes(buffer.getvalue()) == Recording(metadata={"workflow": "ci"})
+
+
+class TestRecordAndReplay:
+    def test_sync_record_then_replay(self, tmp_path):
+        path = str(tmp_path / "run.ksse")
+
+        recorded = list(_live_client().execute_workflow(dict(WORKFLOW), record=path))
+        recording = Recording.load(path)
+        replayed = list(_replay_client(recording, speed=0)[0].execute_workflow(dict(WORKFLOW)))
+
+        assert recording.data == STREAM
+        assert recording.metadata["workflow"] == "ci"
+        assert replayed == recorded == [json.dumps(event) for event in EVENTS]
+
+    def test_replay_speed(self):
+        sleeps = []
+        client, adapter = _replay_client(_recording(delay=0.25), speed=5, sleep=sleeps.append)
+
+        events = [event.json() for event in client.execute_workflow_events(dict(WORKFLOW))]
+
+        assert events == EVENTS
+        assert sleeps and all(delay == pytest.approx(0.05) for delay in sleeps)
+        assert "native_sse=true" in adapter.requests[0].url
+
+    def test_execute_workflow_with_logging_records(self, tmp_path):
+        path = str(tmp_path / "run.ksse")
+        with patch.object(requests.Session, "request", _live_response):
+            events = list(execute_workflow_with_logging(WORKFLOW, api_key="key", sinks=[], record=path))
+
+        assert events == EVENTS
+        assert Recording.load(path).data == STREAM
+
+    @pytest.mark.asyncio
+    async def test_streaming_client_replay_and_record(self):
+        session = ReplaySession(_recording(), speed=0)
+        recorder = StreamRecorder()
+
+        async with StreamingKubiyaClient(api_key="key", session=session) as client:
+            events = [
+                e
+                async for e in client.execute_workflow_with_logging(
+                    dict(WORKFLOW), mode=ExecutionMode.EVENTS, record=recorder
+                )
+            ]
+
+        assert [{k: v for k, v in e.items() if not k.startswith("_")} for e in events] == EVENTS
+        assert not session.closed
+        assert recorder.closed and recorder.recording.data == STREAM
+        assert recorder.recording.metadata["workflow"] == "ci"
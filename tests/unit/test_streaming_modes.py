@@ -0,0 +1,201 @@
+"""Enhanced execution modes on a shared StreamingKubiyaClient, against a local stub server."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from kubiya_workflow_sdk.client import StreamingKubiyaClient
+from kubiya_workflow_sdk.core.exceptions import WorkflowValidationError
+from kubiya_workflow_sdk.core.pipeline import MetricsSink
+from kubiya_workflow_sdk.execution import (
+    ExecutionMode,
+    LogLevel,
+    _format_log_event,
+    execute_workflow_with_validation,
+)
+
+EVENTS = [
+    {"type": "heartbeat"},
+    {"type": "step_running", "step": {"name": "build"}},
+    {"type": "log", "output": "✅ built"},
+    {"type": "step_finished", "step": {"name": "build", "status": "finished", "output": "artifact"}},
+    {"type": "end", "end": True},
+]
+
+WORKFLOW = {"name": "ci", "steps": [{"name": "build", "command": "make"}]}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.server.requests += 1
+        body = "".join(f"data: {json.dumps(event)}\n\n" for event in EVENTS).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestStreamingClientModes:
+    @pytest.mark.asyncio
+    async def test_concurrent_executions_share_one_pool(self, base_url):
+        async with StreamingKubiyaClient(api_key="key", base_url=base_url) as client:
+            session = client._session
+
+            async def run():
+                return [e async for e in client.execute_workflow_with_logging(WORKFLOW, mode=ExecutionMode.EVENTS)]
+
+            results = await asyncio.gather(*(run() for _ in range(20)))
+            assert client._session is session
+
+        assert client._session is None
+        for events in results:
+            assert [event["type"] for event in events] == [event["type"] for event in EVENTS]
+            assert [event["_event_count"] for event in events] == [1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_raw_mode_yields_payload_strings(self, base_url):
+        client = StreamingKubiyaClient(api_key="key", base_url=base_url)
+        try:
+            events = [e async for e in client.execute_workflow_with_logging(WORKFLOW, mode="raw")]
+        finally:
+            await client.aclose()
+
+        assert [json.loads(event) for event in events] == EVENTS
+
+    @pytest.mark.asyncio
+    async def test_logging_mode_uses_sinks(self, base_url, capsys):
+        metrics = MetricsSink()
+        seen = []
+        async with StreamingKubiyaClient(api_key="key", base_url=base_url) as client:
+            events = [
+                e
+                async for e in client.execute_workflow_with_logging(WORKFLOW, on_event=seen.append, sinks=[metrics])
+            ]
+
+        assert events == EVENTS == seen
+        assert metrics.snapshot()["events"] == len(EVENTS)
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.asyncio
+    async def test_invalid_workflow_is_rejected(self, base_url):
+        async with StreamingKubiyaClient(api_key="key", base_url=base_url) as client:
+            with pytest.raises(WorkflowValidationError):
+                async for _ in client.execute_workflow_with_logging({"name": "ci", "steps": []}):
+                    pass
+
+
+class TestExecuteWorkflowWithValidation:
+    @pytest.mark.asyncio
+    async def test_events_with_shared_client(self, base_url):
+        async with StreamingKubiyaClient(api_key="key", base_url=base_url) as client:
+            events = [e async for e in execute_workflow_with_validation(WORKFLOW, {}, client=client)]
+
+        types = [event["type"] for event in events]
+        assert types[:2] == ["execution_started", "validation_passed"]
+        assert "step_started" in types and "step_output" in types
+        assert types[-3:] == ["step_progress", "raw_event", "workflow_completed"]
+        assert events[-1]["outputs"] == {"build": "artifact"}
+
+    @pytest.mark.asyncio
+    async def test_own_client_from_api_token(self, base_url):
+        events = [
+            e
+            async for e in execute_workflow_with_validation(
+                WORKFLOW, {}, mode=ExecutionMode.LOGGING, api_token="key", base_url=base_url
+            )
+        ]
+
+        messages = [event.get("message") for event in events if event["type"] == "log_event"]
+        assert messages == ["Starting: build", "✅ built", "Completed: build", "Workflow ended"]
+        assert events[-1]["type"] == "workflow_completed"
+
+
+def test_format_log_event_levels():
+    assert _format_log_event({"type": "heartbeat"}, LogLevel.NORMAL) is None
+    assert _format_log_event({"type": "heartbeat"}, LogLevel.VERBOSE)["message"] == "Heartbeat"
+    assert _format_log_event({"output": "plain"}, LogLevel.MINIMAL) is None
+    error = _format_log_event({"error": "boom"}, LogLevel.DEBUG)
+    assert error["level"] == "error" and error["data"] == {"error": "boom"}
+
+
+class TestServerStreamingClients:
+    def _server(self, base_url):
+        pytest.importorskip("fastmcp")
+        from kubiya_workflow_sdk.mcp.server.core import KubiyaMCPServer, ServerConfig
+
+        return KubiyaMCPServer(ServerConfig(base_url=base_url, metadata_cache=False))
+
+    async def _run(self, streaming_client):
+        return [e async for e in streaming_client.execute_workflow_stream(dict(WORKFLOW))]
+
+    @pytest.mark.asyncio
+    async def test_one_client_per_api_key(self, base_url):
+        server = self._server(base_url)
+        client = server.get_client("key")
+
+        async with server.streaming_client(client) as first:
+            await self._run(first)
+            session = first._session
+        async with server.streaming_client(server.get_client("key")) as second:
+            await self._run(second)
+        async with server.streaming_client(server.get_client("other")) as other:
+            pass
+
+        assert second is first and second._session is session and other is not first
+        await server.aclose()
+        assert first._session is None and server._streaming_clients == {}
+
+    @pytest.mark.asyncio
+    async def test_evicted_client_is_closed_when_idle(self, base_url):
+        server = self._server(base_url)
+        client = server.get_client("key")
+
+        async with server.streaming_client(client) as streaming_client:
+            await self._run(streaming_client)
+            server._client_cache["key"] = (client, 0)
+            server.get_client("key")
+            # Still streaming: the session stays open until the execution finishes
+            assert streaming_client._session is not None and not streaming_client._session.closed
+        assert streaming_client._session is None
+
+        async with server.streaming_client(client) as idle:
+            await self._run(idle)
+        assert idle is not streaming_client
+        server._client_cache["key"] = (client, 0)
+        server.get_client("key")
+        await server.aclose()
+        assert idle._session is None
+
+    @pytest.mark.asyncio
+    async def test_close_off_the_loop_leaves_sessions_to_aclose(self, base_url):
+        server = self._server(base_url)
+        async with server.streaming_client(server.get_client("key")) as streaming_client:
+            await self._run(streaming_client)
+        session = streaming_client._session
+
+        await asyncio.to_thread(server.close)
+        assert not session.closed
+
+        await server.aclose()
+        assert session.closed and streaming_client._session is None
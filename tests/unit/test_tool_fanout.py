@@ -0,0 +1,97 @@
+"""Tests for the concurrent source fan-out of ToolService.list, iter_tools and describe."""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from kubiya_workflow_sdk.kubiya_services.exceptions import ToolNotFoundError
+from tests.unit.helpers import json_response, mock_client
+
+
+class _SlowAPI:
+    """Serves sources whose metadata requests take a per-source delay."""
+
+    def __init__(self, delays, metadata=None):
+        self.delays = delays
+        self.metadata = metadata or {}
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, url, **kwargs):
+        path = url.split("https://api.test", 1)[1]
+        if path == "/api/v1/sources":
+            return json_response([{"uuid": uuid, "name": uuid} for uuid in self.delays])
+        uuid = path.split("/")[4]
+        with self.lock:
+            self.requested.append(uuid)
+        if self.delays[uuid] is None:
+            raise requests.exceptions.ConnectionError("boom")
+        time.sleep(self.delays[uuid])
+        if uuid in self.metadata:
+            return json_response(self.metadata[uuid])
+        return json_response({"tools": [{"name": f"{uuid}-tool"}], "inline_tools": [{"name": f"{uuid}-inline"}]})
+
+
+class TestToolFanOut:
+    def test_list_fetches_concurrently_in_source_order(self):
+        api = _SlowAPI({f"s{i}": 0.2 for i in range(5)})
+        start = time.monotonic()
+        tools = mock_client(api).tools.list()
+        elapsed = time.monotonic() - start
+
+        assert [t["name"] for t in tools][:4] == ["s0-tool", "s0-inline", "s1-tool", "s1-inline"]
+        assert len(tools) == 10
+        assert elapsed < 0.8
+
+    def test_list_skips_failed_sources(self):
+        api = _SlowAPI({"ok": 0, "broken": None})
+        client = mock_client(api)
+        client.retry_policy.max_retries = 0
+        assert [t["name"] for t in client.tools.list()] == ["ok-tool", "ok-inline"]
+
+    def test_iter_tools_yields_fast_sources_first(self):
+        api = _SlowAPI({"slow": 0.5, "fast": 0})
+        tools = mock_client(api).tools.iter_tools()
+        assert next(tools)["name"] == "fast-tool"
+        tools.close()
+
+    def test_describe_stops_after_match(self):
+        delays = {"target": 0}
+        delays.update({f"slow{i}": 0.3 for i in range(20)})
+        api = _SlowAPI(delays)
+
+        result = mock_client(api).tools.describe("target-inline", max_concurrent=2)
+
+        assert result == {"tool": {"name": "target-inline"}, "source_name": "target"}
+        assert len(api.requested) < len(delays)
+
+    def test_describe_prefers_the_earliest_source(self):
+        metadata = {uuid: {"tools": [{"name": "shared", "from": uuid}]} for uuid in ("first", "second", "third")}
+        api = _SlowAPI({"broken": None, "first": 0.3, "second": 0, "third": 0}, metadata)
+        client = mock_client(api)
+        client.retry_policy.max_retries = 0
+
+        result = client.tools.describe("shared")
+
+        assert result == {"tool": {"name": "shared", "from": "first"}, "source_name": "first"}
+
+    def test_describe_not_found(self):
+        api = _SlowAPI({"a": 0, "b": 0})
+        with pytest.raises(ToolNotFoundError):
+            mock_client(api).tools.describe("missing")
+
+    def test_null_tool_fields(self):
+        metadata = {
+            "no-inline": {"tools": [{"name": "no-inline-tool"}], "inline_tools": None},
+            "no-tools": {"tools": None, "inline_tools": [{"name": "no-tools-inline"}]},
+        }
+        client = mock_client(_SlowAPI({"no-inline": 0, "no-tools": 0}, metadata))
+
+        assert [t["name"] for t in client.tools.list()] == ["no-inline-tool", "no-tools-inline"]
+        assert [t["name"] for t in client.tools.list(source_uuid="no-tools")] == ["no-tools-inline"]
+        assert sorted(t["name"] for t in client.tools.iter_tools()) == ["no-inline-tool", "no-tools-inline"]
+        assert client.tools.describe("no-tools-inline")["source_name"] == "no-tools"
+        assert client.tools.describe("no-inline-tool", source_uuid="no-inline")["source_name"] is None
+        assert {m["tool"]["name"] for m in client.tools.search("inline")} >= {"no-tools-inline"}
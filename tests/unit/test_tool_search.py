@@ -0,0 +1,87 @@
+"""Tests for the tool search index and ToolService.search."""
+
+from kubiya_workflow_sdk.kubiya_services.search import ToolSearchIndex
+from tests.unit.helpers import json_response, mock_client
+
+
+def _source(uuid, updated_at="1"):
+    return {"uuid": uuid, "name": uuid, "updated_at": updated_at}
+
+
+def _index():
+    index = ToolSearchIndex()
+    index.add_source(_source("k8s"), [
+        {"name": "kubectl_restart_deployment", "description": "Restart a Kubernetes deployment"},
+        {"name": "kubectl_get_pods", "description": "List pods in a namespace", "args": [{"name": "namespace"}]},
+    ])
+    index.add_source(_source("aws"), [
+        {"name": "s3_list_buckets", "description": "List S3 buckets in the account"},
+        {"name": "ec2_describe_instance", "description": "Describe an EC2 instance"},
+    ])
+    return index
+
+
+def _names(results):
+    return [r["tool"]["name"] for r in results]
+
+
+class TestToolSearchIndex:
+    def test_ranks_name_matches_first(self):
+        results = _index().search("restart deployment")
+        assert _names(results)[0] == "kubectl_restart_deployment"
+        assert results[0]["distance"] == 0
+        assert results[0]["source"]["uuid"] == "k8s"
+
+    def test_prefix_and_typo_queries_match(self):
+        index = _index()
+        assert _names(index.search("bucket"))[0] == "s3_list_buckets"
+        fuzzy = index.search("deploymnet")
+        assert _names(fuzzy)[0] == "kubectl_restart_deployment"
+        assert fuzzy[0]["distance"] == 1
+
+    def test_replacing_and_removing_sources(self):
+        index = _index()
+        index.add_source(_source("aws", "2"), [{"name": "lambda_invoke", "description": "Invoke a function"}])
+        assert index.search("buckets") == []
+        assert _names(index.search("lambda")) == ["lambda_invoke"]
+        assert index.source_versions["aws"] == "2"
+
+        index.remove_source("aws")
+        assert index.search("lambda") == []
+        assert len(index) == 2
+
+    def test_limit_and_empty_query(self):
+        index = _index()
+        assert len(index.search("list", limit=1)) == 1
+        assert index.search("the") == []
+
+
+class TestToolServiceSearch:
+    def test_index_is_refreshed_incrementally(self):
+        versions = {"a": "1", "b": "1"}
+        metadata_requests = []
+
+        def api(method, url, **kwargs):
+            path = url.split("https://api.test", 1)[1]
+            if path == "/api/v1/sources":
+                return json_response([_source(uuid, v) for uuid, v in versions.items()])
+            uuid = path.split("/")[4]
+            metadata_requests.append(uuid)
+            return json_response({"tools": [{"name": f"tool_{uuid}_v{versions[uuid]}"}]})
+
+        client = mock_client(api)
+
+        assert _names(client.tools.search("tool_a_v1"))[0] == "tool_a_v1"
+        assert sorted(metadata_requests) == ["a", "b"]
+
+        # Within the index TTL the source list is not fetched again
+        calls = client.session.request.call_count
+        client.tools.search("tool")
+        assert client.session.request.call_count == calls
+
+        metadata_requests.clear()
+        versions["b"] = "2"
+        del versions["a"]
+        results = client.tools.search("tool", refresh=True)
+        assert metadata_requests == ["b"]
+        assert _names(results) == ["tool_b_v2"]
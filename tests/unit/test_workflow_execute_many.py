@@ -0,0 +1,128 @@
+"""Tests for concurrent parameterised workflow runs."""
+
+import json
+import threading
+import time
+from collections import defaultdict
+
+import requests
+
+from kubiya_workflow_sdk.core.constants import WorkflowStatus
+from tests.unit.helpers import mock_client, stream_response
+
+
+class _EventSource:
+    """Raw stream producing SSE events lazily and counting them."""
+
+    def __init__(self, events, delay=0.0, endless=False):
+        self.events = list(events)
+        self.delay = delay
+        self.endless = endless
+        self.produced = 0
+
+    def read(self, *args, **kwargs):
+        if self.delay:
+            time.sleep(self.delay)
+        if self.endless:
+            event = {"type": "log", "output": f"line {self.produced}"}
+        elif self.produced < len(self.events):
+            event = self.events[self.produced]
+        else:
+            return b""
+        self.produced += 1
+        return f"data: {json.dumps(event)}\n\n".encode()
+
+    def close(self):
+        pass
+
+
+class _WorkflowAPI:
+    def __init__(self, delay=0.0, endless=False):
+        self.delay = delay
+        self.endless = endless
+        self.sources = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, method, url, **kwargs):
+        region = kwargs["json"]["parameters"]["region"]
+        if region == "broken":
+            raise requests.ConnectionError("bad region")
+        events = [
+            {"type": "step_running", "step": {"name": "deploy"}, "execution_id": f"exec-{region}"},
+            {"type": "step_finished", "step": {"name": "deploy", "status": "finished"}},
+            {"type": "workflow_complete", "end": True},
+        ]
+        source = _EventSource(events, delay=self.delay, endless=self.endless)
+        with self.lock:
+            self.sources.append(source)
+        return stream_response(source)
+
+
+WORKFLOW = {"name": "deploy", "steps": [{"name": "deploy", "command": "echo"}]}
+
+
+class TestExecuteMany:
+    def test_events_are_tagged_and_runs_summarised(self):
+        api = _WorkflowAPI()
+        regions = [{"region": f"r{i}"} for i in range(12)]
+
+        items = list(mock_client(api, max_retries=0).workflows.execute_many(WORKFLOW, regions, concurrency=4))
+
+        events = defaultdict(list)
+        results = {}
+        for item in items:
+            if item["type"] == "event":
+                events[item["run"]].append(item["event"]["type"])
+            else:
+                results[item["run"]] = item["result"]
+
+        assert sorted(results) == list(range(12))
+        assert all(types == ["step_running", "step_finished", "workflow_complete"] for types in events.values())
+        assert results[3].status == WorkflowStatus.COMPLETED
+        assert results[3].execution_id == "exec-r3"
+        assert results[3].metadata["parameters"] == {"region": "r3"}
+        assert results[3].duration_seconds is not None
+
+    def test_failed_run_does_not_stop_the_others(self):
+        api = _WorkflowAPI()
+        params = [{"region": "a"}, {"region": "broken"}, {"region": "b"}]
+
+        results = {
+            item["run"]: item["result"]
+            for item in mock_client(api, max_retries=0).workflows.execute_many(WORKFLOW, params, concurrency=2)
+            if item["type"] == "result"
+        }
+
+        assert results[1].status == WorkflowStatus.FAILED and results[1].errors
+        assert results[0].is_success and results[2].is_success
+
+    def test_concurrency_is_bounded_and_params_are_pulled_lazily(self):
+        api = _WorkflowAPI(delay=0.01)
+        pulled = []
+
+        def param_sets():
+            for i in range(10):
+                pulled.append(i)
+                yield {"region": f"r{i}"}
+
+        runs = mock_client(api, max_retries=0).workflows.execute_many(WORKFLOW, param_sets(), concurrency=3)
+        next(runs)
+        assert len(pulled) <= 4
+        assert sum(1 for item in runs if item["type"] == "result") == 10
+
+    def test_slow_consumer_applies_backpressure(self):
+        api = _WorkflowAPI(endless=True)
+        runs = mock_client(api, max_retries=0).workflows.execute_many(
+            WORKFLOW, [{"region": "a"}, {"region": "b"}], concurrency=2, buffer_size=5
+        )
+
+        for _ in range(10):
+            next(runs)
+            time.sleep(0.01)
+        produced = sum(source.produced for source in api.sources)
+        runs.close()
+
+        # Consumed events, the buffer and one pending event per run
+        assert produced <= 10 + 5 + 2 + 2
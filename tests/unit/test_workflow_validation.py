@@ -0,0 +1,153 @@
+"""Tests for the single-pass workflow validator."""
+
+import pytest
+
+from kubiya_workflow_sdk.dsl import Workflow
+from kubiya_workflow_sdk.execution import validate_workflow_definition
+from kubiya_workflow_sdk.manifest_schema import compiled_validator, manifest_schema
+from kubiya_workflow_sdk.validation import validate, validate_workflow
+
+
+def _workflow(*steps, **fields):
+    return {"name": "wf", "steps": list(steps), **fields}
+
+
+def _step(name, *depends, **fields):
+    step = {"name": name, "command": "echo", **fields}
+    if depends:
+        step["depends"] = list(depends)
+    return step
+
+
+class TestValidateWorkflow:
+    def test_forward_references_are_allowed(self):
+        result = validate_workflow(_workflow(_step("deploy", "build"), _step("build")))
+
+        assert result.valid and result.is_valid
+        assert result.order == ["build", "deploy"]
+        assert result.step_index == {"deploy": 0, "build": 1}
+        assert result.dependencies["deploy"] == ["build"]
+
+    def test_unknown_dependency(self):
+        result = validate_workflow(_workflow(_step("a", "missing")))
+        assert result.errors == ["Step 0 depends on unknown step 'missing'"]
+
+    def test_cycles_and_unreachable_steps(self):
+        result = validate_workflow(_workflow(
+            _step("a"),
+            _step("b", "c"),
+            _step("c", "b", "a"),
+            _step("d", "c"),
+            _step("e", "e"),
+        ))
+
+        assert not result.is_valid
+        assert result.cycles == [["b", "c"], ["e"]]
+        assert result.unreachable == ["d"]
+        assert result.order == ["a"]
+        assert any("b, c" in error for error in result.errors)
+        assert any("'d'" in warning for warning in result.warnings)
+
+    def test_large_workflow(self):
+        steps = [_step(f"s{i}", f"s{i + 1}") for i in range(9_999)] + [_step("s9999", "s0")]
+
+        result = validate_workflow(_workflow(*steps))
+
+        assert len(result.cycles) == 1 and len(result.cycles[0]) == 10_000
+        steps[-1].pop("depends")
+        assert validate_workflow(_workflow(*steps)).order[0] == "s9999"
+
+    def test_structure_errors(self):
+        result = validate_workflow(_workflow(
+            _step("a", retry="3"),
+            {"name": "a", "command": "echo"},
+            {"name": "b"},
+            {
+                "name": "c",
+                "executor": {
+                    "type": "tool",
+                    "config": {"tool_def": {"with_services": [{"name": "db", "exposed_ports": [0]}]}},
+                },
+            },
+        ))
+
+        assert "Step 'a': retry must be a dictionary" in result.errors
+        assert "Duplicate step name 'a' found" in result.errors
+        assert any(error.startswith("Step 'b' needs one of") for error in result.errors)
+        assert "Step 3 service 0 must have an 'image' field" in result.errors
+        assert "Step 3 service 0 invalid port: 0" in result.errors
+
+    def test_chain_dependencies_warn(self):
+        result = validate_workflow(_workflow(_step("a"), _step("b", "a"), type="chain"))
+        assert result.valid and result.warnings == ["Step 'b' has explicit dependencies in chain mode"]
+
+
+class TestCallersShareTheValidator:
+    def test_validate_workflow_definition(self):
+        assert validate_workflow_definition(_workflow(_step("deploy", "build"), _step("build"))) == []
+        assert validate_workflow_definition({"steps": []}) == [
+            "Workflow must have a 'name' field",
+            "Workflow must have at least one step",
+        ]
+
+    def test_dsl_workflow(self):
+        wf = Workflow("wf").type("graph")
+        wf.data["steps"] = [_step("a", "b"), _step("b", "a")]
+
+        result = wf.validate()
+
+        assert result["valid"] is False
+        assert result["errors"] == validate_workflow(wf.data).errors
+
+
+class TestFastValidation:
+    MANIFEST = {
+        "name": " ",
+        "steps": [
+            {"name": "a", "command": "echo", "depends": 3},
+            {"name": "b"},
+            {
+                "name": "c",
+                "executor": {
+                    "type": "tool",
+                    "config": {"tool_def": {"with_services": [{"name": "db", "exposed_ports": [0, True, 80]}]}},
+                },
+                "retry": "3",
+            },
+        ],
+    }
+
+    def test_errors_have_paths(self):
+        result = validate(self.MANIFEST, mode="fast")
+
+        services = ("steps", 2, "executor", "config", "tool_def", "with_services", 0)
+        assert [(issue.path, issue.message) for issue in result.issues] == [
+            (("name",), "cannot be empty"),
+            (("steps", 0, "depends"), "does not match any of the allowed forms"),
+            (("steps", 1), "needs one of: command, run, script, executor, type, uses, call"),
+            (services + ("image",), "is required"),
+            (services + ("exposed_ports", 0), "must be between 1 and 65535, got 0"),
+            (services + ("exposed_ports", 1), "must be an integer"),
+            (("steps", 2, "retry"), "must be an object"),
+        ]
+        assert not result.is_valid
+        assert result.errors[0] == "/name: cannot be empty"
+
+    def test_valid_manifest(self):
+        result = validate(_workflow(_step("a"), _step("b", "a")), mode="fast")
+        assert result.valid and result.issues == []
+
+    def test_validator_is_compiled_once_per_version(self):
+        assert compiled_validator() is compiled_validator()
+        with pytest.raises(ValueError):
+            compiled_validator("0")
+        with pytest.raises(ValueError):
+            validate({}, mode="strict")
+
+    def test_schema_agrees_with_jsonschema(self):
+        jsonschema = pytest.importorskip("jsonschema")
+        validator = jsonschema.Draft202012Validator(manifest_schema())
+        validator.check_schema(manifest_schema())
+
+        assert len(list(validator.iter_errors(self.MANIFEST))) == len(validate(self.MANIFEST, mode="fast").issues)
+        assert validator.is_valid(_workflow(_step("a")))